@@ -46,10 +46,11 @@ __all__ = [
 
 import copy
 import io
+import json
 import pathlib
 import re
 import unittest
-from typing import Union
+from typing import List, Tuple, Union
 
 from music21 import common
 from music21 import environment
@@ -95,6 +96,50 @@ reChord = re.compile('[.*?]')  # non greedy
 reAbcVersion = re.compile(r'^%abc-((\d+)\.(\d+)\.?(\d+)?)')
 reDirective = re.compile(r'^%%([a-z\-]+)\s+([^\s]+)(.*)')
 
+# a note event: a pitch letter, or decorations and accidentals that may precede
+# one, then any register, numbers, and slashes.  Decoration letters
+# (HLMOPSTuv, and the K and k tokenized on their own) never begin as pitches;
+# after a decoration, w, h, and N do not count as pitches either.
+_abcNotePattern = (r"(?:[^\W\d_HLMOPSTuvKk]"
+                   + r"|[~^=_HLOPST][.~^=_HLMOPSTuv\d,/']*[^\W\d_HLMOPSTuvwhN]?)"
+                   + r"[\d,/']*")
+reAbcNote = re.compile(_abcNotePattern)
+
+# the master pattern for ABCHandler.tokenize(); alternatives are tried in order
+# at each position, and characters matched by none of them are skipped
+reAbcToken = re.compile('|'.join([
+    r'(?P<comment>%[^\n]*)',
+    # upper case letters (checked again after matching) or w, then a colon,
+    # but not a repeat bar (e.g. dAG FED:|2)
+    r'(?P<metadata>(?:[A-Zw]|(?![\x00-\x7f])[^\W\d_]):(?=[^|])[^\n]*)',
+    r'(?P<bar>:\|[12]|:\||::|\|[\]|:12]|\[[|12]|[|:])',
+    r'(?P<tuplet>\(\d(?::\d?(?::\d?)?)?)',
+    # a broken rhythm does not take the final character of the string
+    r'(?P<brokenRhythm>[<>](?:[<>](?=[\s\S]))*)',
+    r'(?P<exclaim>![^!]{0,18}!)',
+    r'(?P<slurStart>\((?=\D))',
+    r'(?P<parenStop>\))',
+    r'(?P<tie>-)',
+    r'(?P<chordSymbol>"[^"]*"?)',
+    r'(?P<chord>\[[^\]]*\]?)',
+    r'(?P<single>[.u{}vKkM])',
+    f'(?P<note>{_abcNotePattern})',
+]))
+
+# note events that are not (yet) supported or are the result of errors in
+# encoded files; these are dropped by ABCHandler.tokenize()
+# v is up bow; might be: "^Segno"v which also should be dropped
+# H is fermata
+# . dot may be staccato, but should be attached to pitch
+_abcSkippedNoteEvents = frozenset([
+    'w', 'u', 'v', 'v.', 'h', 'H', 'vk',
+    'uk', 'U', '~',
+    '.', '=', 'V', 'S', 's',
+    'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
+    'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
+    'l', 'L', 'R',
+    'y', 'T', 't', 'x', 'Z'])
+
 
 # ------------------------------------------------------------------------------
 class ABCTokenException(exceptions21.Music21Exception):
@@ -119,10 +164,10 @@ class ABCToken(prebase.ProtoM21Object):
 
     The multi-pass procedure is conducted by an ABCHandler object.
     The ABCHandler.tokenize() method breaks the data stream into
-    ABCToken objects. The :meth:`~music21.abcFormat.ABCHandler.tokenProcess` method first
-    calls the :meth:`~music21.abcFormat.ABCToken.preParse` method on each token,
-    then does contextual
-    adjustments to all tokens, then calls :meth:`~music21.abcFormat.ABCToken.parse` on all tokens.
+    ABCToken objects. The :meth:`~music21.abcFormat.ABCHandler.tokenProcess` method
+    then walks the tokens once, calling the :meth:`~music21.abcFormat.ABCToken.preParse`
+    method on each token, then doing contextual
+    adjustments, then calling :meth:`~music21.abcFormat.ABCToken.parse`.
 
     The source ABC string itself is stored in self.src
 
@@ -1805,6 +1850,10 @@ class ABCHandler:
         This may be called separately from process(), in the case
         that pre/post parse processing is not needed.
 
+        The string is scanned in a single pass with the compiled
+        pattern `reAbcToken`, whose alternatives give, in order of precedence,
+        each kind of token; characters that begin no token (such as spaces)
+        are skipped.
 
         >>> abch = abcFormat.ABCHandler()
         >>> abch.tokens
@@ -1832,356 +1881,137 @@ class ABCHandler:
         >>> abch.tokenize('(6::2f')
         >>> abch.tokens
         [<music21.abcFormat.ABCTuplet '(6::2'>, <music21.abcFormat.ABCNote 'f'>]
+
+        Chord symbols are joined to the following note or chord, and
+        decorations and accidentals to the following pitch:
+
+        >>> abch = abcFormat.ABCHandler()
+        >>> abch.tokenize('"Am"~^c\\'2 | [CE]>!crescendo(!.d')
+        >>> abch.tokens
+        [<music21.abcFormat.ABCNote '"Am"~^c\\'2'>, <music21.abcFormat.ABCBar '|'>,
+         <music21.abcFormat.ABCChord '[CE]'>, <music21.abcFormat.ABCBrokenRhythmMarker '>'>,
+         <music21.abcFormat.ABCCrescStart '!'>, <music21.abcFormat.ABCStaccato '.'>,
+         <music21.abcFormat.ABCNote 'd'>]
         '''
-        currentIndex = -1
-        collect = []
-        lastIndex = len(strSrc) - 1
-        skipAhead = 0
+        tokens = self.tokens
+        search = reAbcToken.search
         # noinspection SpellCheckingInspection
         accidentalsAndDecorations = '.~^=_HLMOPSTuv'
         accidentals = '^=_'
+        exclaimDict = {'!crescendo(!': ABCCrescStart,
+                       '!crescendo)!': ABCParenStop,
+                       '!diminuendo(!': ABCDimStart,
+                       '!diminuendo)!': ABCParenStop,
+                       }
+        singleDict = {'.': ABCStaccato,
+                      'u': ABCUpbow,
+                      '{': ABCGraceStart,
+                      '}': ABCGraceStop,
+                      'v': ABCDownbow,
+                      'K': ABCAccent,
+                      'k': ABCStraccent,
+                      'M': ABCTenuto,
+                      }
 
         activeChordSymbol = ''  # accumulate, then prepend
         accidentalized = {}
         accidental = None
         abcPitch = None  # ABC substring defining any pitch within the current token
         isFirstComment = True
+        propagation = self._accidentalPropagation()
 
-        while currentIndex < lastIndex:
-            currentIndex += 1
-            currentIndex += skipAhead
-            skipAhead = 0
-            if currentIndex > lastIndex:
+        currentIndex = 0
+        while True:
+            m = search(strSrc, currentIndex)
+            if m is None:
                 break
-
-            q = self._getLinearContext(strSrc, currentIndex)
-            unused_cPrev, c, cNext, cNextNext = q
-            # cPrevNotSpace, cPrev, c, cNext, cNextNotSpace, cNextNext = q
-
-            # comment lines, also encoding defs
-            if c == '%':
-                skipAhead = self._getNextLineBreak(strSrc, currentIndex) - (currentIndex + 1)
-                commentLine = strSrc[currentIndex:currentIndex + skipAhead + 1]
-                if isFirstComment:
-                    isFirstComment = False
-                    verMats = reAbcVersion.match(commentLine)
-                    if verMats:
-                        abcMajor = int(verMats.group(2))
-                        abcMinor = int(verMats.group(3))
-                        if verMats.group(4):
-                            abcPatch = int(verMats.group(4))
-                        else:
-                            abcPatch = 0
-                        verTuple = (abcMajor, abcMinor, abcPatch)
-                        self.abcVersion = verTuple
-                dirMats = reDirective.match(commentLine)
-                if dirMats:
-                    var = dirMats.group(1)
-                    val = dirMats.group(2)
-                    self.abcDirectives[var] = val
-                # environLocal.printDebug(['got comment:', repr(strSrc[i:j + 1])])
-                continue
-
-            # metadata: capital letter, with next char as ':'
-            # or w: (lyric defs)
-            # some meta data might have bar symbols, for example
-            # need to not misinterpret repeat bars as meta
-            # e.g. dAG FED:|2 dAG FGA| this is incorrect, but can avoid by
-            # looking for a leading pipe
-
-            if (((c.isalpha() and c.isupper()) or c in 'w')
-                    and cNext is not None
-                    and cNext == ':'
-                    and cNextNext is not None
-                    and cNextNext not in '|'):
-                # collect until end of line; add one to get line break
-                j = self._getNextLineBreak(strSrc, currentIndex)
-                skipAhead = j - (currentIndex + 1)
-                collect = strSrc[currentIndex:j].strip()
-                # environLocal.printDebug(['got metadata:', repr(''.join(collect))])
-                # print('Skipped %d, collected %r, currentIndex %d, new index %d' % (
-                #    skipAhead, collect, currentIndex, j))
-
-                self.tokens.append(ABCMetadata(collect))
-                continue
-
-            # get bars: if not a space and not alphanumeric
-            if not c.isspace() and not c.isalnum() and c not in ('~', '('):
-                matchBars = False
-                for barIndex in range(len(ABC_BARS)):
-                    # first of bars tuple is symbol to match
-                    # three possible sizes of bar indications: 3, 2, 1
-                    barTokenArchetype = ABC_BARS[barIndex][0]
-                    if len(barTokenArchetype) == 3:
-                        if cNextNext is not None and (c + cNext + cNextNext == barTokenArchetype):
-                            skipAhead = 2
-                            matchBars = True
-                            break
-                    elif cNext is not None and (len(barTokenArchetype) == 2):
-                        if c + cNext == barTokenArchetype:
-                            skipAhead = 1
-                            matchBars = True
-                            break
-                    elif len(barTokenArchetype) == 1:
-                        if c == barTokenArchetype:
-                            skipAhead = 0
-                            matchBars = True
-                            break
-                if matchBars is True:
-                    accidentalized = {}
-                    accidental = None
-                    j = currentIndex + skipAhead + 1
-                    collect = strSrc[currentIndex:j]
-                    # filter and replace with 2 tokens if necessary
-                    for tokenSub in self.barlineTokenFilter(collect):
-                        self.tokens.append(tokenSub)
-                    # environLocal.printDebug(['got bars:', repr(collect)])
-                    # if collect == '::':
-                    #     # create a start and and an end
-                    #     self.tokens.append(ABCBar(':|'))
-                    #     self.tokens.append(ABCBar('|:'))
-                    # else:
-                    #     self.tokens.append(ABCBar(collect))
+            currentIndex = m.end()
+            kind = m.lastgroup
+            collect = m.group()
+
+            if kind == 'metadata':
+                c = collect[0]
+                if c == 'w' or c.isupper():
+                    tokens.append(ABCMetadata(collect.strip()))
                     continue
-
-            # get tuplet indicators: (2, (3, (p:q:r or (3::
-            if c == '(' and cNext is not None and cNext.isdigit():
-                skipAhead = 1
-                j = currentIndex + skipAhead + 1  # always two characters
-                unused1, possibleColon, qChar, unused2 = self._getLinearContext(strSrc, j)
-                if possibleColon == ':':
-                    j += 1
-                    skipAhead += 1
-                    if qChar is not None and qChar.isdigit():
-                        j += 1
-                        skipAhead += 1
-                    unused1, possibleColon, rChar, unused2 = self._getLinearContext(strSrc, j)
-                    if possibleColon == ':':
-                        j += 1  # include the r characters
-                        skipAhead += 1
-                        if rChar is not None and rChar.isdigit():
-                            j += 1
-                            skipAhead += 1
-
-                collect = strSrc[currentIndex:j]
-                # environLocal.printDebug(['got tuplet start:', repr(collect)])
-                self.tokens.append(ABCTuplet(collect))
-                continue
-
-            # get broken rhythm modifiers: < or >, >>, up to <<<
-            if c in '<>':
-                j = currentIndex + 1
-                while j < lastIndex and strSrc[j] in '<>':
-                    j += 1
-                collect = strSrc[currentIndex:j]
-                # environLocal.printDebug(['got bidrectional rhythm mod:', repr(collect)])
-                self.tokens.append(ABCBrokenRhythmMarker(collect))
-                skipAhead = j - (currentIndex + 1)
-                continue
-
-            # get dynamics. skip over the open paren to avoid confusion.
-            # NB: Nested crescendos are not an issue (not proper grammar).
-            if c == '!':
-                exclaimDict = {'!crescendo(!': ABCCrescStart,
-                               '!crescendo)!': ABCParenStop,
-                               '!diminuendo(!': ABCDimStart,
-                               '!diminuendo)!': ABCParenStop,
-                               }
-                j = currentIndex + 1
-                while j < currentIndex + 20:  # a reasonable upper bound
-                    if strSrc[j] == '!':
-                        if strSrc[currentIndex:j + 1] in exclaimDict:
-                            exclaimClass = exclaimDict[strSrc[currentIndex:j + 1]]
-                            exclaimObject = exclaimClass(c)
-                            self.tokens.append(exclaimObject)
-                            skipAhead = j - currentIndex  # not + 1
-                            break
-                        # NB: We're currently skipping over all other '!' expressions
-                        else:
-                            skipAhead = j - currentIndex  # not + 1
-                            break
-                    j += 1
-                # not found, continue...
-                continue
-
-            # get slurs, ensuring that they're not confused for tuplets
-            if c == '(' and cNext is not None and not cNext.isdigit():
-                self.tokens.append(ABCSlurStart(c))
-                continue
-
-            # get slur/tuplet ending; treat it as a general parenthesis stop
-            if c == ')':
-                self.tokens.append(ABCParenStop(c))
-                continue
-
-            # get ties between two notes
-            if c == '-':
-                self.tokens.append(ABCTie(c))
-                continue
-
-            # get chord symbols / guitar chords; collected and joined with
-            # chord or notes
-            if c == '"':
-                j = currentIndex + 1
-                while j < lastIndex and strSrc[j] not in '"':
-                    j += 1
-                j += 1  # need character that caused break
-                # there may be more than one chord symbol: need to accumulate
-                activeChordSymbol += strSrc[currentIndex:j]
-                # environLocal.printDebug(['got chord symbol:', repr(activeChordSymbol)])
-                skipAhead = j - (currentIndex + 1)
-                continue
-
-            # get chords
-            if c == '[':
-                j = currentIndex + 1
-                while j < lastIndex and strSrc[j] not in ']':
-                    j += 1
-                j += 1  # need character that caused break
-                # prepend chord symbol
-                if activeChordSymbol != '':
-                    collect = activeChordSymbol + strSrc[currentIndex:j]
-                    activeChordSymbol = ''  # reset
+                # a lower case letter outside ASCII: the start of a note event
+                m = reAbcNote.match(strSrc, m.start())
+                currentIndex = m.end()
+                kind = 'note'
+                collect = m.group()
+
+            # the start of a note event: alpha, decoration, or accidental
+            # From the 2.2 draft standard, we see the following "decorations"
+            # defined:
+            #     .       staccato mark
+            #     ~       Irish roll
+            #     H       fermata
+            #     L       accent or emphasis
+            #     M       lower mordent
+            #     O       coda
+            #     P       upper mordent
+            #     S       segno
+            #     T       trill
+            #     u       up-bow
+            #     v       down-bow
+            #
+            # Accidentals are these:
+            #     ^       sharp
+            #     ^^      double-sharp
+            #     =       natural
+            #     _       flat
+            #     __      double-flat
+            if kind == 'note':
+                c = collect[0]
+                if c not in accidentalsAndDecorations:
+                    abcPitch = c
+                    rest = collect[1:]
                 else:
-                    collect = strSrc[currentIndex:j]
-
-                # environLocal.printDebug(['got chord:', repr(collect)])
-                self.tokens.append(ABCChord(collect))
-                skipAhead = j - (currentIndex + 1)
-                # TODO: Chords need to be aware of accidentals too.
-                # Also what happens to prefixes and suffixes attached to chords,
-                # like ties.
-                continue
-
-            if c == '.':
-                self.tokens.append(ABCStaccato(c))
-                continue
-
-            if c == 'u':
-                self.tokens.append(ABCUpbow(c))
-                continue
-
-            if c == '{':
-                self.tokens.append(ABCGraceStart(c))
-                continue
-
-            if c == '}':
-                self.tokens.append(ABCGraceStop(c))
-                continue
-
-            if c == 'v':
-                self.tokens.append(ABCDownbow(c))
-                continue
-
-            if c == 'K':
-                self.tokens.append(ABCAccent(c))
-                continue
-
-            if c == 'k':
-                self.tokens.append(ABCStraccent(c))
-                continue
-
-            if c == 'M':
-                self.tokens.append(ABCTenuto(c))
-                continue
+                    if c in accidentals:
+                        accidental = c
+                    # decorations and/or accidentals may precede note names;
+                    # an accidental following one of them is added to the accidental
+                    lastIndex = len(collect) - 1
+                    rest = ''
+                    for j in range(1, lastIndex + 1):
+                        ch = collect[j]
+                        if ch in accidentalsAndDecorations:
+                            if j < lastIndex and collect[j + 1] in accidentals:
+                                accidental = (accidental or '') + collect[j + 1]
+                        elif ch in ',\'':  # Register (octave) modification
+                            abcPitch = (abcPitch or '') + ch
+                        elif ch.isalpha():
+                            abcPitch = ch
+                            rest = collect[j + 1:]
+                            break
+                if ',' in rest or '\'' in rest:
+                    abcPitch += ''.join(ch for ch in rest if ch in ',\'')
 
-            # get the start of a note event: alpha, decoration, or accidental
-            if c.isalpha() or c in '~^=_':
-                # condition where we start with an alpha that is not an alpha
-                # that comes before a pitch indication
-                # From the 2.2 draft standard, we see the following "decorations"
-                # defined:
-                #     .       staccato mark
-                #     ~       Irish roll
-                #     H       fermata
-                #     L       accent or emphasis
-                #     M       lower mordent
-                #     O       coda
-                #     P       upper mordent
-                #     S       segno
-                #     T       trill
-                #     u       up-bow
-                #     v       down-bow
-                #
-                # Accidentals are these:
-                #     ^       sharp
-                #     ^^      double-sharp
-                #     =       natural
-                #     _       flat
-                #     __      double-flat
-                foundPitchAlpha = c.isalpha() and c not in accidentalsAndDecorations
-                if foundPitchAlpha:
-                    abcPitch = c
-                if c in accidentals:
-                    accidental = c
-                j = currentIndex + 1
-
-                while j <= lastIndex:
-                    # if we have not found pitch alpha
-                    # decorations and/or accidentals may precede note names
-                    if not foundPitchAlpha and strSrc[j] in accidentalsAndDecorations:
-                        j += 1
-                        if strSrc[j] in accidentals:
-                            accidental += strSrc[j]
-                        continue
-                    # only allow one pitch alpha to be a continue condition
-                    elif (not foundPitchAlpha and strSrc[j].isalpha()
-                          # noinspection SpellCheckingInspection
-                          and strSrc[j] not in '~wuvhHLTSN'):
-                        foundPitchAlpha = True
-                        abcPitch = strSrc[j]
-                        j += 1
-                        continue
-                    # continue conditions after alpha:
-                    # , register modification (, ') or number, rhythm indication
-                    # number, /,
-                    elif strSrc[j].isdigit() or strSrc[j] in ',/,\'':
-                        if strSrc[j] in ',\'':  # Register (octave) modification
-                            abcPitch += strSrc[j]
-                        j += 1
-                        continue
-                    else:  # space, all else: break
-                        break
                 # prepend chord symbol
                 if activeChordSymbol != '':
-                    collect = activeChordSymbol + strSrc[currentIndex:j]
+                    collect = activeChordSymbol + collect
                     activeChordSymbol = ''  # reset
-                else:
-                    collect = strSrc[currentIndex:j]
-                # environLocal.printDebug(['got note event:', repr(collect)])
 
                 # NOTE: skipping a number of articulations and other markers
                 # not yet supported
-                # some collections here are not yet supported; others may be
-                # the result of errors in encoded files
-                # v is up bow; might be: "^Segno"v which also should be dropped
-                # H is fermata
-                # . dot may be staccato, but should be attached to pitch
-                if collect in ('w', 'u', 'v', 'v.', 'h', 'H', 'vk',
-                               'uk', 'U', '~',
-                               '.', '=', 'V', 'v.', 'S', 's',
-                               'i', 'I', 'ui', 'u.', 'Q', 'Hy', 'Hx',
-                               'r', 'm', 'M', 'n', 'N', 'o', 'O', 'P',
-                               'l', 'L', 'R',
-                               'y', 'T', 't', 'x', 'Z'):
+                if collect in _abcSkippedNoteEvents:
                     pass
                 # these are bad chords, or other problematic notations like
                 # "D.C."x
-                elif (collect.startswith('"')
+                elif (collect[0] == '"'
                       and (collect[-1] in ('u', 'v', 'k', 'K', 'Q', '.',
                                            'y', 'T', 'w', 'h', 'x')
                            or collect.endswith('v.'))):
                     pass
-                elif collect.startswith('x') or collect.startswith('H') or collect.startswith('Z'):
+                elif collect[0] in ('x', 'H', 'Z'):
                     pass
                 # not sure what =20 refers to
-                elif len(collect) > 1 and collect.startswith('=') and collect[1].isdigit():
+                elif len(collect) > 1 and collect[0] == '=' and collect[1].isdigit():
                     pass
                 # only let valid collect strings be parsed
                 elif abcPitch:
                     pitchClass = abcPitch[0].upper()
                     carriedAccidental = None
-                    propagation = self._accidentalPropagation()
                     if accidental:
                         # Remember the active accidentals in the measure
                         if propagation == 'octave':
@@ -2194,30 +2024,95 @@ class ABCHandler:
                             carriedAccidental = accidentalized[pitchClass]
                         elif propagation == 'octave' and abcPitch in accidentalized:
                             carriedAccidental = accidentalized[abcPitch]
-                    self.tokens.append(ABCNote(collect, carriedAccidental=carriedAccidental))
+                    tokens.append(ABCNote(collect, carriedAccidental=carriedAccidental))
                 else:
-                    self.tokens.append(ABCNote(collect))
+                    tokens.append(ABCNote(collect))
 
-                skipAhead = j - (currentIndex + 1)
-                continue
-            # look for white space: can be used to determine beam groups
-            # no action: normal continuation of 1 char
-            pass
+            elif kind == 'bar':
+                accidentalized = {}
+                accidental = None
+                # filter and replace with 2 tokens if necessary
+                tokens.extend(self.barlineTokenFilter(collect))
+
+            # get chord symbols / guitar chords; collected and joined with
+            # chord or notes; there may be more than one chord symbol
+            elif kind == 'chordSymbol':
+                activeChordSymbol += collect
+
+            elif kind == 'single':
+                tokens.append(singleDict[collect](collect))
+
+            elif kind == 'chord':
+                # prepend chord symbol
+                if activeChordSymbol != '':
+                    collect = activeChordSymbol + collect
+                    activeChordSymbol = ''  # reset
+                tokens.append(ABCChord(collect))
+                # TODO: Chords need to be aware of accidentals too.
+                # Also what happens to prefixes and suffixes attached to chords,
+                # like ties.
+
+            # get tuplet indicators: (2, (3, (p:q:r or (3::
+            elif kind == 'tuplet':
+                tokens.append(ABCTuplet(collect))
+
+            # get slurs, ensuring that they're not confused for tuplets
+            elif kind == 'slurStart':
+                tokens.append(ABCSlurStart(collect))
+
+            # get slur/tuplet ending; treat it as a general parenthesis stop
+            elif kind == 'parenStop':
+                tokens.append(ABCParenStop(collect))
+
+            # get ties between two notes
+            elif kind == 'tie':
+                tokens.append(ABCTie(collect))
+
+            # get broken rhythm modifiers: < or >, >>, up to <<<
+            elif kind == 'brokenRhythm':
+                tokens.append(ABCBrokenRhythmMarker(collect))
+
+            # get dynamics.
+            # NB: Nested crescendos are not an issue (not proper grammar).
+            elif kind == 'exclaim':
+                # NB: We're currently skipping over all other '!' expressions
+                if collect in exclaimDict:
+                    tokens.append(exclaimDict[collect]('!'))
+
+            # comment lines, also encoding defs
+            elif kind == 'comment':
+                if isFirstComment:
+                    isFirstComment = False
+                    verMats = reAbcVersion.match(collect)
+                    if verMats:
+                        abcMajor = int(verMats.group(2))
+                        abcMinor = int(verMats.group(3))
+                        if verMats.group(4):
+                            abcPatch = int(verMats.group(4))
+                        else:
+                            abcPatch = 0
+                        verTuple = (abcMajor, abcMinor, abcPatch)
+                        self.abcVersion = verTuple
+                dirMats = reDirective.match(collect)
+                if dirMats:
+                    var = dirMats.group(1)
+                    val = dirMats.group(2)
+                    self.abcDirectives[var] = val
+                propagation = self._accidentalPropagation()
 
     def tokenProcess(self):
         '''
-        Process all token objects. First, calls preParse(), then
-        does context assignments, then calls parse().
+        Process all token objects in a single pass. Each token is
+        preParsed, then given its context from the tokens before it,
+        then parsed. Notes and chords are parsed only once the following
+        token has been seen, since a broken rhythm marker changes the note
+        before it.
         '''
         # need a key object to get altered pitches
         from music21 import key
 
-        # pre-parse : call on objects that need preliminary processing
-        # metadata, for example, is parsed
-        # lastTimeSignature = None
-        for t in self.tokens:
-            # environLocal.printDebug(['tokenProcess: calling preParse()', t.src])
-            t.preParse()
+        tokens = self.tokens
+        lastTokenIndex = len(tokens) - 1
 
         # context: iterate through tokens, supplying contextual data
         # as necessary to appropriate objects
@@ -2234,15 +2129,60 @@ class ABCHandler:
         lastTenutoToken = None
         lastGraceToken = None
         lastNoteToken = None
+        unparsedNoteToken = None
 
-        for i in range(len(self.tokens)):
-            # get context of tokens
-            q = self._getLinearContext(self.tokens, i)
-            tPrev, t, tNext, unused_tNextNext = q
-            # tPrevNotSpace, tPrev, t, tNext, tNextNotSpace, tNextNext = q
+        for i, t in enumerate(tokens):
+            # pre-parse : call on objects that need preliminary processing
+            # metadata, for example, is parsed
+            t.preParse()
             # environLocal.printDebug(['tokenProcess: calling parse()', t])
 
-            if isinstance(t, ABCMetadata):
+            # ABCChord inherits ABCNote, thus getting note is enough for both
+            if isinstance(t, ABCNote):
+                if lastDefaultQL is None:
+                    tPrev = tokens[i - 1] if i > 0 else None
+                    tNext = tokens[i + 1] if i < lastTokenIndex else None
+                    raise ABCHandlerException(
+                        'no active default note length provided for note processing. '
+                        + 'tPrev: %s, t: %s, tNext: %s' % (tPrev, t, tNext))
+                t.activeDefaultQuarterLength = lastDefaultQL
+                t.activeKeySignature = lastKeySignature
+                t.applicableSpanners = self.activeSpanners[:]  # fast copy of a list
+                # ends ties one note after they begin
+                if lastTieToken is not None:
+                    t.tie = 'stop'
+                    lastTieToken = None
+                if lastStaccToken is not None:
+                    t.articulations.append('staccato')
+                    lastStaccToken = None
+                if lastUpToken is not None:
+                    t.articulations.append('upbow')
+                    lastUpToken = None
+                if lastDownToken is not None:
+                    t.articulations.append('downbow')
+                    lastDownToken = None
+                if lastAccToken is not None:
+                    t.articulations.append('accent')
+                    lastAccToken = None
+                if lastStrAccToken is not None:
+                    t.articulations.append('strongaccent')
+                    lastStrAccToken = None
+                if lastTenutoToken is not None:
+                    t.articulations.append('tenuto')
+                    lastTenutoToken = None
+                if lastGraceToken is not None:
+                    t.inGrace = True
+                if lastTupletToken is None:
+                    pass
+                elif lastTupletToken.noteCount == 0:
+                    lastTupletToken = None  # clear, no longer needed
+                else:
+                    lastTupletToken.noteCount -= 1  # decrement
+                    # add a reference to the note
+                    t.activeTuplet = lastTupletToken.tupletObj
+                lastNoteToken = t
+
+            elif isinstance(t, ABCMetadata):
                 if t.isMeter():
                     lastTimeSignatureObj = t.getTimeSignatureObject()
                 # restart matching conditions; match meter twice ok
@@ -2259,9 +2199,11 @@ class ABCHandler:
                     # in case they aren't closed.
                     self.activeParens = []
                     self.activeSpanners = []
-                continue
+
             # broken rhythms need to be applied to previous and next notes
-            if isinstance(t, ABCBrokenRhythmMarker):
+            elif isinstance(t, ABCBrokenRhythmMarker):
+                tPrev = tokens[i - 1] if i > 0 else None
+                tNext = tokens[i + 1] if i < lastTokenIndex else None
                 if (isinstance(tPrev, ABCNote)
                         and isinstance(tNext, ABCNote)):
                     # environLocal.printDebug(['tokenProcess: got broken rhythm marker', t.src])
@@ -2273,7 +2215,7 @@ class ABCHandler:
                          + f'({t.src}) not positioned between two notes or chords'])
 
             # need to update tuplets with currently active meter
-            if isinstance(t, ABCTuplet):
+            elif isinstance(t, ABCTuplet):
                 t.updateRatio(lastTimeSignatureObj)
                 # set number of notes that will be altered
                 # might need to do this with ql values, or look ahead to nxt
@@ -2283,17 +2225,18 @@ class ABCHandler:
                 self.activeParens.append('Tuplet')
 
             # notes within slur marks need to be added to the spanner
-            if isinstance(t, ABCSlurStart):
+            elif isinstance(t, ABCSlurStart):
                 t.fillSlur()
                 self.activeSpanners.append(t.slurObj)
                 self.activeParens.append('Slur')
+
             elif isinstance(t, ABCParenStop):
                 if self.activeParens:
                     p = self.activeParens.pop()
                     if p in ('Slur', 'Crescendo', 'Diminuendo'):
                         self.activeSpanners.pop()
 
-            if isinstance(t, ABCTie):
+            elif isinstance(t, ABCTie):
                 # tPrev is usually an ABCNote but may be a GraceStop.
                 if lastNoteToken and lastNoteToken.tie == 'stop':
                     lastNoteToken.tie = 'continue'
@@ -2301,87 +2244,52 @@ class ABCHandler:
                     lastNoteToken.tie = 'start'
                 lastTieToken = t
 
-            if isinstance(t, ABCStaccato):
+            elif isinstance(t, ABCStaccato):
                 lastStaccToken = t
 
-            if isinstance(t, ABCUpbow):
+            elif isinstance(t, ABCUpbow):
                 lastUpToken = t
 
-            if isinstance(t, ABCDownbow):
+            elif isinstance(t, ABCDownbow):
                 lastDownToken = t
 
-            if isinstance(t, ABCAccent):
+            elif isinstance(t, ABCAccent):
                 lastAccToken = t
 
-            if isinstance(t, ABCStraccent):
+            elif isinstance(t, ABCStraccent):
                 lastStrAccToken = t
 
-            if isinstance(t, ABCTenuto):
+            elif isinstance(t, ABCTenuto):
                 lastTenutoToken = t
 
-            if isinstance(t, ABCCrescStart):
+            elif isinstance(t, ABCCrescStart):
                 t.fillCresc()
                 self.activeSpanners.append(t.crescObj)
                 self.activeParens.append('Crescendo')
 
-            if isinstance(t, ABCDimStart):
+            elif isinstance(t, ABCDimStart):
                 t.fillDim()
                 self.activeSpanners.append(t.dimObj)
                 self.activeParens.append('Diminuendo')
 
-            if isinstance(t, ABCGraceStart):
+            elif isinstance(t, ABCGraceStart):
                 lastGraceToken = t
 
-            if isinstance(t, ABCGraceStop):
+            elif isinstance(t, ABCGraceStop):
                 lastGraceToken = None
 
-            # ABCChord inherits ABCNote, thus getting note is enough for both
-            if isinstance(t, (ABCNote, ABCChord)):
-                if lastDefaultQL is None:
-                    raise ABCHandlerException(
-                        'no active default note length provided for note processing. '
-                        + 'tPrev: %s, t: %s, tNext: %s' % (tPrev, t, tNext))
-                t.activeDefaultQuarterLength = lastDefaultQL
-                t.activeKeySignature = lastKeySignature
-                t.applicableSpanners = self.activeSpanners[:]  # fast copy of a list
-                # ends ties one note after they begin
-                if lastTieToken is not None:
-                    t.tie = 'stop'
-                    lastTieToken = None
-                if lastStaccToken is not None:
-                    t.articulations.append('staccato')
-                    lastStaccToken = None
-                if lastUpToken is not None:
-                    t.articulations.append('upbow')
-                    lastUpToken = None
-                if lastDownToken is not None:
-                    t.articulations.append('downbow')
-                    lastDownToken = None
-                if lastAccToken is not None:
-                    t.articulations.append('accent')
-                    lastAccToken = None
-                if lastStrAccToken is not None:
-                    t.articulations.append('strongaccent')
-                    lastStrAccToken = None
-                if lastTenutoToken is not None:
-                    t.articulations.append('tenuto')
-                    lastTenutoToken = None
-                if lastGraceToken is not None:
-                    t.inGrace = True
-                if lastTupletToken is None:
-                    pass
-                elif lastTupletToken.noteCount == 0:
-                    lastTupletToken = None  # clear, no longer needed
-                else:
-                    lastTupletToken.noteCount -= 1  # decrement
-                    # add a reference to the note
-                    t.activeTuplet = lastTupletToken.tupletObj
-                lastNoteToken = t
+            # parse : call methods to set attributes and parse abc string;
+            # the previous note is now complete.
+            if unparsedNoteToken is not None:
+                unparsedNoteToken.parse()
+                unparsedNoteToken = None
+            if t is lastNoteToken:
+                unparsedNoteToken = t
+            else:
+                t.parse()
 
-        # parse : call methods to set attributes and parse abc string
-        for t in self.tokens:
-            # environLocal.printDebug(['tokenProcess: calling parse()', t])
-            t.parse()
+        if unparsedNoteToken is not None:
+            unparsedNoteToken.parse()
 
     def process(self, strSrc):
         self.tokens = []
@@ -3011,9 +2919,115 @@ def mergeLeadingMetaData(barHandlers):
 
     return mergedHandlers
 
+
 # ------------------------------------------------------------------------------
+# Reference number indices, so that single works can be read from large files
+
+def buildReferenceNumberIndex(data: bytes) -> List[Tuple[str, int, int]]:
+    r'''
+    Given the bytes of an ABC file, return a list with a tuple for each
+    reference number definition (X: line) in it, in order, of the line
+    (without spaces or trailing whitespace), and the positions in `data` where
+    the line starts and where the work ends: at the next X: line or the end.
+
+    Line endings can be '\n', '\r\n', or '\r', as when reading a file as text.
+
+    >>> data = b'%abc-2.1\nX:1\nT:One\nabc|\n\nX: 2\r\nT:Two\r\ncde|\r\n'
+    >>> abcFormat.buildReferenceNumberIndex(data)
+    [('X:1', 9, 25), ('X:2', 25, 44)]
+    >>> data[9:25]
+    b'X:1\nT:One\nabc|\n\n'
+    '''
+    index = []
+    pos = 0
+    for line in data.splitlines(keepends=True):
+        # the same test as extractReferenceNumber; the line can only be
+        # decoded if it is one, as a file that is not utf-8 could not be read
+        if b'X:' in line:
+            lineStr = line.decode('utf-8', 'replace').rstrip('\r\n')
+            if lineStr.strip().startswith('X:'):
+                if index:
+                    index[-1] = (index[-1][0], index[-1][1], pos)
+                index.append((lineStr.replace(' ', '').rstrip(), pos, len(data)))
+        pos += len(line)
+    return index
+
+
+def getReferenceNumberIndexFp(fp) -> pathlib.Path:
+    '''
+    Return the path of the file, in the scratch directory with the pickled
+    versions of parsed files, where the reference number index of the ABC file
+    at `fp` is stored.
+
+    >>> fp = abcFormat.getReferenceNumberIndexFp('/tmp/tunebook.abc')
+    >>> fp.name
+    'm21-...-abcIndex-....json'
+    '''
+    from music21 import _version
+    fp = common.cleanpath(fp, returnPathlib=True)
+    directory = environLocal.getRootTempDir()
+    baseName = '-'.join(['m21', _version.__version__, 'abcIndex', common.getMd5(str(fp))])
+    return directory / (baseName + '.json')
+
+
+def getReferenceNumberIndex(fp) -> List[Tuple[str, int, int]]:
+    '''
+    Return the index made by :func:`buildReferenceNumberIndex` for the ABC file
+    at `fp`.  The index is stored in the scratch directory
+    (see :func:`getReferenceNumberIndexFp`), and is read from there afterwards,
+    unless the modification time or size of the file has changed, when the
+    index is built again.
+
+    >>> fp = common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc'
+    >>> index = abcFormat.getReferenceNumberIndex(fp)
+    >>> len(index)
+    554
+    >>> index[499]
+    ('X:500', 221197, 221663)
+    '''
+    fp = common.cleanpath(fp, returnPathlib=True)
+    stat = fp.stat()
+    indexFp = getReferenceNumberIndexFp(fp)
+    try:
+        with open(indexFp, encoding='utf-8') as f:
+            stored = json.load(f)
+        if stored['mtime'] == stat.st_mtime_ns and stored['size'] == stat.st_size:
+            return [tuple(entry) for entry in stored['index']]
+    except (OSError, ValueError, KeyError, TypeError):
+        pass  # no index yet, or an unreadable one: build it again
+
+    with open(fp, 'rb') as f:
+        index = buildReferenceNumberIndex(f.read())
+    try:
+        with open(indexFp, 'w', encoding='utf-8') as f:
+            json.dump({'mtime': stat.st_mtime_ns, 'size': stat.st_size, 'index': index}, f)
+    except OSError:  # pragma: no cover
+        environLocal.printDebug(['cannot store ABC reference number index', indexFp])
+    return index
+
+
+def _referenceNumberMatches(line, number):
+    '''
+    Return True if the X: `line` (without spaces) of an index defines the
+    reference number `number`, as :meth:`ABCFile.extractReferenceNumber` finds
+    it, which also matches numbers like X:0490 when 490 is asked for.
+
+    >>> abcFormat._referenceNumberMatches('X:0490', 490)
+    True
+    >>> abcFormat._referenceNumberMatches('X:12a', '12a')
+    True
+    >>> abcFormat._referenceNumberMatches('X:12a', 12)
+    False
+    '''
+    if line == 'X:%s' % number:
+        return True
+    try:
+        return int(line.replace('X:', '')) == int(number)
+    except (TypeError, ValueError):
+        return False
 
 
+# ------------------------------------------------------------------------------
 class ABCFile(prebase.ProtoM21Object):
     '''
     ABC File or String access
@@ -3060,9 +3074,51 @@ class ABCFile(prebase.ProtoM21Object):
         which processes all tokens.
 
         If `number` is given, a work number will be extracted if possible.
+        If the file was opened from a path, only that work is read from it
+        (see :meth:`readReferenceNumber`).
         '''
+        if number is not None and self.filename is not None:
+            return self.readstr(self.readReferenceNumber(number), number)
         return self.readstr(self.file.read(), number)
 
+    def readReferenceNumber(self, number):
+        '''
+        Read only the work with reference number `number` from the file
+        opened from a path, using the index of the file's reference numbers
+        from :func:`getReferenceNumberIndex`, and return it as a string, the same
+        string that :meth:`extractReferenceNumber` returns.
+
+        >>> fp = common.getSourceFilePath() / 'corpus' / 'essenFolksong' / 'han1.abc'
+        >>> af = abcFormat.ABCFile()
+        >>> af.open(fp)
+        >>> print(af.readReferenceNumber(500))
+        X:500
+        T: Fang fengzheng
+        ...
+        >>> af.readReferenceNumber(5000)
+        Traceback (most recent call last):
+        music21.abcFormat.ABCFileException: cannot find requested
+            reference number in source file: 5000
+        >>> af.close()
+        '''
+        index = getReferenceNumberIndex(self.filename)
+        for i, (line, start, end) in enumerate(index):
+            if _referenceNumberMatches(line, number):
+                break
+        else:
+            raise ABCFileException(
+                'cannot find requested reference number in source file: %s' % number)
+
+        with open(self.filename, 'rb') as f:
+            f.seek(start)
+            strSrc = f.read(end - start).decode('utf-8')
+        # as when reading the file as text, and splitting and joining lines
+        strSrc = strSrc.replace('\r\n', '\n').replace('\r', '\n')
+        if i < len(index) - 1 and strSrc.endswith('\n'):
+            # the line ending before the next X: line is not kept
+            strSrc = strSrc[:-1]
+        return strSrc
+
     def extractReferenceNumber(self, strSrc, number):
         '''
         Extract a single reference number from many defined in a file.
@@ -3214,6 +3270,23 @@ class Test(unittest.TestCase):
             handler.tokenize(tf)
             handler.tokenProcess()
 
+    def testTokenProcessBrokenRhythmAndAccidentals(self):
+        # notes are parsed in the same pass as their context is set, so a
+        # broken rhythm marker must still change the note before it
+        ah = ABCHandler()
+        ah.process('%abc-2.1\nX:1\nM:4/4\nL:1/8\nK:C\n^f>f (3"G"Hc2-c/ c<_e e|f2')
+        notes = [t for t in ah.tokens if isinstance(t, ABCNote)]
+        self.assertEqual([n.src for n in notes],
+                         ['^f', 'f', '"G"Hc2', 'c/', 'c', '_e', 'e', 'f2'])
+        self.assertEqual([n.quarterLength for n in notes],
+                         [0.75, 0.25, 1.0, 0.25, 0.25, 0.75, 0.5, 1.0])
+        self.assertEqual([n.pitchName for n in notes],
+                         ['F#5', 'F#5', 'C5', 'C5', 'C5', 'E-5', 'E-5', 'F5'])
+        self.assertEqual(notes[2].chordSymbols, ['"G"'])
+        self.assertEqual(notes[2].tie, 'start')
+        self.assertEqual(notes[3].tie, 'stop')
+        self.assertIsNotNone(notes[2].activeTuplet)
+
     def testNoteParse(self):
         from music21 import key
 
@@ -3605,6 +3678,32 @@ class Test(unittest.TestCase):
         ah.process(testFiles.guineapigTest)
         self.assertEqual(len(ah), 105)
 
+    def testReferenceNumberIndex(self):
+        import os
+        from music21.abcFormat import testFiles
+        fp = environLocal.getTempFile('.abc', returnPathlib=True)
+        fp.write_bytes(testFiles.mysteryReel.encode('utf-8') + b'\r\n'
+                       + testFiles.theAleWifesDaughter.encode('utf-8'))
+        af = ABCFile()
+        af.open(fp)
+        strSrc = af.file.read()
+        for number in (254, '254', 1):
+            self.assertEqual(af.readReferenceNumber(number),
+                             af.extractReferenceNumber(strSrc, number))
+        self.assertEqual(len(af.read(number=254)), len(af.readstr(strSrc, number=254)))
+        af.close()
+
+        # the index is stored, and built again when the file changes
+        indexFp = getReferenceNumberIndexFp(fp)
+        self.assertTrue(indexFp.exists())
+        self.assertEqual([line for line, unused_start, unused_end
+                          in getReferenceNumberIndex(fp)], ['X:254', 'X:1'])
+        fp.write_bytes(testFiles.fyrareprisarn.encode('utf-8'))
+        self.assertEqual([line for line, unused_start, unused_end
+                          in getReferenceNumberIndex(fp)], ['X:1'])
+        os.remove(indexFp)
+        os.remove(fp)
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
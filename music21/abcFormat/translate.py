@@ -50,13 +50,34 @@ _abcArticulationsToM21 = {
 }
 
 
-def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None):
+def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None, measureRange=None):
     '''
     Handler conversion of a single Part of a multi-part score.
     Results are added into the provided inputM21 object
     or a newly created Part object
 
     The part object is then returned.
+
+    If `measureRange` is a tuple of (start, end) measure numbers (either
+    may be None), only the measures in that range are translated into
+    music21 objects.  Meter, key, and tempo changes from the measures
+    skipped at the start are carried over to the first measure kept.
+
+    >>> abcStr = 'M:3/4\\nL:1/4\\nK:G\\nG | ABc |\\nM:2/4\\nK:F\\nde | fg | a2 |]'
+    >>> ah = abcFormat.ABCHandler()
+    >>> junk = ah.process(abcStr)
+    >>> p = abcFormat.translate.abcToStreamPart(ah, measureRange=(3, None))
+    >>> [m.number for m in p.getElementsByClass('Measure')]
+    [3, 4]
+    >>> m3 = p.getElementsByClass('Measure')[0]
+    >>> m3.offset
+    0.0
+    >>> m3.timeSignature
+    <music21.meter.TimeSignature 2/4>
+    >>> m3.keySignature
+    <music21.key.Key of F major>
+    >>> [n.nameWithOctave for n in p.flat.notes]
+    ['F5', 'G5', 'A5']
     '''
     from music21 import abcFormat
 
@@ -96,6 +117,12 @@ def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None):
 
     barCount = 0
     measureNumber = 1
+    if useMeasures and measureRange is not None:
+        rangeStart, rangeEnd = measureRange
+    else:
+        rangeStart = rangeEnd = None
+    # metadata tokens from measures skipped before the start of measureRange
+    skippedMetadata = {}
     # merged handler are ABCHandlerBar objects, defining attributes for barlines
 
     for mh in mergedHandlers:
@@ -103,6 +130,29 @@ def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None):
         # environLocal.printDebug(['abcToStreamPart', 'handler', 'left:', mh.leftBarToken,
         #    'right:', mh.rightBarToken, 'len(mh)', len(mh)])
 
+        # the first bar must always be parsed to see if it is a pickup;
+        # every later bar can be numbered before it is translated.
+        if (useMeasures and barCount >= 1
+                and (rangeStart is not None or rangeEnd is not None)):
+            if rangeEnd is not None and measureNumber > rangeEnd:
+                break
+            if rangeStart is not None and measureNumber < rangeStart:
+                for t in mh.tokens:
+                    if isinstance(t, abcFormat.ABCMetadata):
+                        if t.isMeter() or t.isKey() or t.isTempo():
+                            skippedMetadata[t.tag] = t
+                if mh.hasNotes():
+                    barCount += 1
+                    measureNumber += 1
+                continue
+            if skippedMetadata:
+                # restate anything not already given by this bar
+                definedTags = {t.tag for t in mh.tokens
+                               if isinstance(t, abcFormat.ABCMetadata)}
+                mh.tokens = [t for tag, t in skippedMetadata.items()
+                             if tag not in definedTags] + mh.tokens
+                skippedMetadata = {}
+
         if useMeasures and mh.hasNotes():
             # environLocal.printDebug(['abcToStreamPart', 'useMeasures',
             #    useMeasures, 'mh.hasNotes()', mh.hasNotes()])
@@ -186,12 +236,25 @@ def abcToStreamPart(abcHandler, inputM21=None, spannerBundle=None):
             else:
                 dst.number = measureNumber
                 measureNumber += 1
+            if (barCount == 1 and rangeStart is not None
+                    and dst.number < rangeStart):
+                # a first bar before the range is only parsed for numbering
+                for t in mh.tokens:
+                    if isinstance(t, abcFormat.ABCMetadata):
+                        if t.isMeter() or t.isKey() or t.isTempo():
+                            skippedMetadata[t.tag] = t
+                continue
             p.coreAppend(dst)
 
     try:
         reBar(p, inPlace=True)
     except (ABCTranslateException, meter.MeterException, ZeroDivisionError):
         pass
+    if rangeEnd is not None:
+        # reBar may have split an overfull bar, pushing the last bars past the range
+        for m in list(p.getElementsByClass('Measure')):
+            if m.number > rangeEnd:
+                p.remove(m)
     # clefs are not typically defined, but if so, are set to the first measure
     # following the meta data, or in the open stream
     if not clefSet and not p.recurse().getElementsByClass('Clef'):
@@ -332,8 +395,9 @@ def parseTokens(mh, dst, p, useMeasures):
             for span in t.applicableSpanners:
                 span.addSpannedElements(n)
 
+            # in place, so that spanners get the grace note that is in the stream
             if t.inGrace:
-                n = n.getGrace()
+                n.getGrace(inPlace=True)
 
             n.articulations = []
             while any(t.articulations):
@@ -356,7 +420,7 @@ def parseTokens(mh, dst, p, useMeasures):
     return postTransposition, clefSet
 
 
-def abcToStreamScore(abcHandler, inputM21=None):
+def abcToStreamScore(abcHandler, inputM21=None, measureRange=None, parts=None):
     '''
     Given an abcHandler object, build into a
     multi-part :class:`~music21.stream.Score` with metadata.
@@ -366,6 +430,22 @@ def abcToStreamScore(abcHandler, inputM21=None):
     if the optional parameter inputM21 is given a music21 Stream subclass, it will use that object
     as the outermost object.  However, inner parts will
     always be made :class:`~music21.stream.Part` objects.
+
+    `measureRange` is passed to :func:`abcToStreamPart`.  If `parts` is
+    given, only the voices matching one of its entries (a zero-based index, a
+    voice id, or a voice name) are translated.
+
+    >>> abcStr = ('M:6/8\\nL:1/8\\nK:G\\nV:1 name="Whistle" ' +
+    ...     'snm="wh"\\nB3 A3 | G6 | B3 A3 | G6 ||\\nV:2 name="violin" ' +
+    ...     'snm="v"\\nBdB AcA | GAG D3 | BdB AcA | GAG D6 ||\\nV:3 name="Bass" ' +
+    ...     'snm="b" clef=bass\\nD3 D3 | D6 | D3 D3 | D6 ||')
+    >>> ah = abcFormat.ABCHandler()
+    >>> junk = ah.process(abcStr)
+    >>> s = abcFormat.translate.abcToStreamScore(ah, parts=['violin', '3'])
+    >>> len(s.parts)
+    2
+    >>> [n.name for n in s.parts[0].flat.notes][:3]
+    ['B', 'D', 'B']
     '''
     from music21 import abcFormat
     from music21 import metadata
@@ -423,8 +503,10 @@ def abcToStreamScore(abcHandler, inputM21=None):
     # token list
 
     partList = []
-    for partHandler in partHandlers:
-        p = abcToStreamPart(partHandler)
+    for i, partHandler in enumerate(partHandlers):
+        if parts is not None and not abcPartIsSelected(partHandler, i, parts):
+            continue
+        p = abcToStreamPart(partHandler, measureRange=measureRange)
         partList.append(p)
 
     for p in partList:
@@ -433,11 +515,60 @@ def abcToStreamScore(abcHandler, inputM21=None):
     return s
 
 
-def abcToStreamOpus(abcHandler, inputM21=None, number=None):
+def abcPartIsSelected(partHandler, partIndex, parts):
+    '''
+    Return True if the voice held in `partHandler`, the `partIndex`-th
+    voice of the tune, is named in `parts`: either by its index, by the
+    id given after "V:", or by its name="..." attribute.
+
+    >>> ah = abcFormat.ABCHandler()
+    >>> junk = ah.process('L:1/4\\nK:C\\nV:T1 name="Tenor"\\nC D E F |')
+    >>> abcFormat.translate.abcPartIsSelected(ah, 0, [0])
+    True
+    >>> abcFormat.translate.abcPartIsSelected(ah, 0, ['T1'])
+    True
+    >>> abcFormat.translate.abcPartIsSelected(ah, 0, ['Tenor'])
+    True
+    >>> abcFormat.translate.abcPartIsSelected(ah, 0, [1, 'Bass'])
+    False
+    '''
+    from music21 import abcFormat
+
+    if partIndex in parts:
+        return True
+    for t in partHandler.tokens:
+        if isinstance(t, abcFormat.ABCMetadata) and t.isVoice():
+            voiceData = t.data.strip()
+            voiceId = voiceData.split()[0] if voiceData else ''
+            nameMatch = re.search(r'(?:name|nm)="([^"]*)"', voiceData)
+            voiceName = nameMatch.group(1).strip() if nameMatch else None
+            for selection in parts:
+                if isinstance(selection, str) and selection in (voiceId, voiceName):
+                    return True
+    return False
+
+
+def abcToStreamOpus(abcHandler, inputM21=None, number=None, measureRange=None, parts=None,
+                    *, parallel=False):
     '''Convert a multi-work stream into one or more complete works packed into a an Opus Stream.
 
     If a `number` argument is given, and a work is defined by
     that number, that work is returned.
+
+    `measureRange` and `parts` are passed to :func:`abcToStreamScore` for each work.
+
+    If `parallel` is True, the works are translated in separate processes
+    with :func:`~music21.common.runParallel` (one process per CPU, less one),
+    each sending back its Score frozen with :mod:`~music21.freezeThaw`.
+    The Opus has the same works, in the same order, as when translating
+    them one after another, which is still done if there is only one CPU.
+
+    >>> from music21.abcFormat import testFiles
+    >>> ah = abcFormat.ABCHandler()
+    >>> ah.process(testFiles.theAleWifesDaughter + '\\n' + testFiles.mysteryReel)
+    >>> op = abcFormat.translate.abcToStreamOpus(ah, parallel=True)
+    >>> [sc.metadata.title for sc in op.scores]
+    ["The Ale Wife's Daughter", 'Mystery Reel']
     '''
     if inputM21 is None:
         opus = stream.Opus()
@@ -451,25 +582,58 @@ def abcToStreamOpus(abcHandler, inputM21=None, number=None):
         abcDict = abcHandler.splitByReferenceNumber()
         if number is not None and number in abcDict:
             # get number from dictionary; set to new score
-            opus = abcToStreamScore(abcDict[number])  # return a score, not an opus
+            opus = abcToStreamScore(abcDict[number],  # return a score, not an opus
+                                    measureRange=measureRange, parts=parts)
         else:  # build entire opus into an opus stream
             scoreList = []
-            for key in sorted(abcDict.keys()):
-                # do not need to set work number, as that will be gathered
-                # with meta data in abcToStreamScore
-                try:
-                    scoreList.append(abcToStreamScore(abcDict[key]))
-                except IndexError:
-                    environLocal.warn("Failure for piece number %d" % key)
+            if parallel:
+                # the handlers of each work are sent to the processes already
+                # split and processed
+                from music21 import converter
+                keys = sorted(abcDict.keys())
+                frozenScores = common.runParallel(
+                    [(abcDict[key], measureRange, parts) for key in keys],
+                    _abcToFrozenScore,
+                    unpackIterable=True)
+                for key, frozenScore in zip(keys, frozenScores):
+                    if frozenScore is None:
+                        environLocal.warn("Failure for piece number %d" % key)
+                    else:
+                        scoreList.append(converter.thawStr(frozenScore))
+            else:
+                for key in sorted(abcDict.keys()):
+                    # do not need to set work number, as that will be gathered
+                    # with meta data in abcToStreamScore
+                    try:
+                        scoreList.append(abcToStreamScore(abcDict[key],
+                                                          measureRange=measureRange,
+                                                          parts=parts))
+                    except IndexError:
+                        environLocal.warn("Failure for piece number %d" % key)
             for scoreDocument in scoreList:
                 opus.coreAppend(scoreDocument, setActiveSite=False)
             opus.coreElementsChanged()
 
     else:  # just return single entry in opus object
-        opus.append(abcToStreamScore(abcHandler))
+        opus.append(abcToStreamScore(abcHandler, measureRange=measureRange, parts=parts))
     return opus
 
 
+def _abcToFrozenScore(abcHandler, measureRange=None, parts=None):
+    '''
+    Translate the handler of one work with :func:`abcToStreamScore` and return
+    the Score frozen into a pickle string, or None if the work cannot be
+    translated.  Run in a separate process by :func:`abcToStreamOpus`.
+    '''
+    from music21 import freezeThaw
+    try:
+        sc = abcToStreamScore(abcHandler, measureRange=measureRange, parts=parts)
+    except IndexError:
+        return None
+    # the Score is not used again in this process, so it can be changed
+    return freezeThaw.StreamFreezer(sc, fastButUnsafe=True).writeStr(fmt='pickle')
+
+
 # noinspection SpellCheckingInspection
 def reBar(music21Part, *, inPlace=False):
     """
@@ -1058,6 +1222,39 @@ class Test(unittest.TestCase):
         ties = [n.tie.type for n in notes.flat.notesAndRests]
         self.assertListEqual(ties, ['start', 'continue', 'stop'])
 
+    def testGraceNoteInSlur(self):
+        from music21 import converter
+        s = converter.parse('L:1/4\n({g}A B) c d|', format='abc')
+        notes = list(s.recurse().notes)
+        sl = s.recurse().getElementsByClass('Slur')[0]
+        self.assertIs(sl.getFirst(), notes[0])
+        self.assertTrue(sl.getFirst().duration.isGrace)
+        self.assertIs(sl.getLast(), notes[2])
+
+    def testMeasureRangeAndParts(self):
+        from music21 import converter
+        from music21 import corpus
+        fp = corpus.getWork('essenFolksong/altdeu10.abc')
+        full = converter.parse(fp, number=1, forceSource=True)
+        # these bars overflow their meter, so they are split by reBar
+        s = converter.parse(fp, number=1, measureRange=(2, 4))
+        measuresFull = full.parts[0].measures(2, 4).getElementsByClass('Measure')
+        measuresRange = s.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in measuresRange], [2, 3, 4])
+        self.assertEqual([n.nameWithOctave for n in measuresFull.flat.notes],
+                         [n.nameWithOctave for n in measuresRange.flat.notes])
+
+        abcStr = ('X:1\nM:2/4\nL:1/4\nK:C\nV:1\nc d | e f | g a |]\n'
+                  + 'V:2\nC D | E F | G A |]\n')
+        full = converter.parse(abcStr, format='abc', forceSource=True)
+        s = converter.parse(abcStr, format='abc', measureRange=(None, 1), parts=[1])
+        self.assertEqual(len(s.parts), 1)
+        measuresFull = full.parts[1].getElementsByClass('Measure')[:2]
+        measuresRange = s.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in measuresFull], [m.number for m in measuresRange])
+        self.assertEqual([n.nameWithOctave for m in measuresRange for n in m.notes],
+                         ['C4', 'D4', 'E4', 'F4'])
+
     def xtestMergeScores(self):
         from music21 import corpus
         unused = corpus.parse('josquin/laDeplorationDeLaMorteDeJohannesOckeghem')
@@ -2374,17 +2374,19 @@ class Music21Object(prebase.ProtoM21Object):
             offset = foundOffset
             atEnd = 0
 
-        if self.duration is not None and self.duration.isGrace:
+        # a Stream is never a grace note, and its duration might need all of its
+        # elements (for instance, parsing the measures of a lazily parsed Part)
+        if not self.isStream and self.duration is not None and self.duration.isGrace:
             isNotGrace = 0
         else:
             isNotGrace = 1
 
-        if (useSite is not False
-                and self.sites.hasSiteId(id(useSite))):
-            insertIndex = self.sites.siteDict[id(useSite)].globalSiteIndex
-        elif self.activeSite is not None:
-            insertIndex = self.sites.siteDict[id(self.activeSite)].globalSiteIndex
-        else:
+        insertIndex = None
+        if useSite is not False:
+            insertIndex = self.sites.getGlobalSiteIndex(id(useSite))
+        if insertIndex is None and self.activeSite is not None:
+            insertIndex = self.sites.getGlobalSiteIndex(id(self.activeSite))
+        if insertIndex is None:
             insertIndex = 0
 
         return SortTuple(atEnd, offset, self.priority,
@@ -2427,14 +2429,26 @@ class Music21Object(prebase.ProtoM21Object):
         trigger called whenever sites need to be informed of a change
         in the parameters of this object.
 
-        `changedInformation` is not used now, but it can be a dictionary
-        of what has changed.
+        `changedInformation` can be a dictionary of what has changed; if
+        it says that only the priority or the duration has changed, then sites keep
+        the cached information that does not depend on it (for instance,
+        `.flat` does not depend on either).
 
         subclass this to do very interesting things.
         '''
+        changed = None
+        if changedInformation:
+            changedThing = changedInformation.get(
+                'changedElement', changedInformation.get('changedAttribute'))
+            if changedThing == 'priority':
+                changed = ('sortOrder',)
+            elif changedThing == 'duration':
+                # a grace duration changes the sort order.
+                changed = ('durations', 'sortOrder')
+
         for s in self.sites.get():
             if hasattr(s, 'coreElementsChanged'):
-                s.coreElementsChanged(updateIsFlat=False, keepIndex=True)
+                s.coreElementsChanged(updateIsFlat=False, keepIndex=True, changed=changed)
 
     def _getPriority(self):
         return self._priority
@@ -232,7 +232,7 @@ class Chord(note.NotRest):
 
         durationKeyword = self._add_core_or_init(notes, useDuration=durationKeyword)
 
-        if all(isinstance(n, int) for n in notes):
+        if notes and all(isinstance(n, int) for n in notes):
             self.simplifyEnharmonics(inPlace=True)
 
         if durationKeyword is not None:
@@ -514,6 +514,10 @@ class Converter:
 
         Will load from a pickle unless forceSource is True
         Will store as a pickle unless storePickle is False
+
+        Pickles are neither loaded nor stored if the keyword `lazy` is True,
+        since they have all of the elements of the Stream made already, or if
+        the keywords `measureRange` or `parts` are given, since they hold the whole file.
         '''
         from music21 import freezeThaw
         fp = common.cleanpath(fp, returnPathlib=True)
@@ -521,6 +525,12 @@ class Converter:
             raise ConverterFileException('no such file exists: %s' % fp)
         useFormat = format
 
+        if (keywords.get('lazy', False)
+                or keywords.get('measureRange', None) is not None
+                or keywords.get('parts', None) is not None):
+            forceSource = True
+            storePickle = False
+
         if useFormat is None:
             useFormat = self.getFormatFromFileExtension(fp)
 
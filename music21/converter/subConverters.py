@@ -644,22 +644,39 @@ class ConverterHumdrum(SubConverter):
                 {1.8333} <music21.note.Note D>
         '''
         from music21 import humdrum
-        self.data = humdrum.parseData(humdrumString)
+        self.data = humdrum.parseData(humdrumString,
+                                      lazy=self.keywords.get('lazy', False),
+                                      measureRange=self.keywords.get('measureRange', None),
+                                      parts=self.keywords.get('parts', None),
+                                      parallel=self.keywords.get('parallel', False),
+                                      incremental=self.keywords.get('incremental', False))
         # self.data.stream.makeNotation()
 
         self.stream = self.data.stream
         return self.data
 
-    def parseFile(self, filepath, number=None):
+    def parseFile(self, filepath, number=None, **keywords):
         '''
         Open Humdrum data from a file path.
 
         Calls humdrum.parseFile on filepath.
 
-        Number is ignored here.
+        Number is ignored here.  If the keyword `lazy` is True, the spines are
+        only parsed when a part is first used, and the keywords `measureRange`
+        and `parts` limit which measures and spines are parsed (see
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.parseNonOpus`).
+        If `parallel` is True, the works of a multi-work file are parsed in
+        separate processes.  If `incremental` is True, the file is read and
+        parsed a measure at a time (see
+        :meth:`~music21.humdrum.spineParser.HumdrumDataCollection.iterMeasures`).
         '''
         from music21 import humdrum
-        self.data = humdrum.parseFile(filepath)
+        self.data = humdrum.parseFile(filepath,
+                                      lazy=self.keywords.get('lazy', False),
+                                      measureRange=self.keywords.get('measureRange', None),
+                                      parts=self.keywords.get('parts', None),
+                                      parallel=self.keywords.get('parallel', False),
+                                      incremental=self.keywords.get('incremental', False))
         # self.data.stream.makeNotation()
 
         self.stream = self.data.stream
@@ -832,19 +849,41 @@ class ConverterMusicXML(SubConverter):
     def parseData(self, xmlString, number=None):
         '''
         Open MusicXML data from a string.
+
+        If the keyword `incremental` was given as True, the data is parsed
+        a measure at a time, using less memory
+        (see :meth:`~music21.musicxml.xmlToM21.MusicXMLImporter.iterMeasuresFromFile`).
+        If the keyword `parallel` was given as True, the parts are parsed in
+        separate processes
+        (see :meth:`~music21.musicxml.xmlToM21.MusicXMLImporter.parsePartsParallel`).
+        If the keyword `lazy` was given as True, the measures of each part are
+        only parsed when the part is first used
+        (see :meth:`~music21.musicxml.xmlToM21.MusicXMLImporter.xmlRootToScore`).
+        The keywords `measureRange` and `parts` choose the measures and parts
+        to parse (see :meth:`~music21.musicxml.xmlToM21.MusicXMLImporter.readFile`).
         '''
         from music21.musicxml import xmlToM21
 
         c = xmlToM21.MusicXMLImporter()
         c.xmlText = xmlString
-        c.parseXMLText()
+        c.parseXMLText(incremental=self.keywords.get('incremental', False),
+                       parallel=self.keywords.get('parallel', False),
+                       lazy=self.keywords.get('lazy', False),
+                       measureRange=self.keywords.get('measureRange', None),
+                       parts=self.keywords.get('parts', None))
         self.stream = c.stream
 
-    def parseFile(self, fp, number=None):
+    def parseFile(self, fp, number=None, **keywords):
         '''
         Open from a file path; check to see if there is a pickled
         version available and up to date; if so, open that, otherwise
         open source.
+
+        If the keyword `incremental` is True, the file is parsed a measure
+        at a time, using less memory.  If the keyword `parallel` is True,
+        the parts are parsed in separate processes.  If the keyword `lazy` is True,
+        the measures of each part are only parsed when the part is first used.
+        The keywords `measureRange` and `parts` choose the measures and parts to parse.
         '''
         # return fp to load, if pickle needs to be written, fp pickle
         # this should be able to work on a .mxl file, as all we are doing
@@ -853,6 +892,11 @@ class ConverterMusicXML(SubConverter):
         from music21.musicxml import xmlToM21
 
         c = xmlToM21.MusicXMLImporter()
+        incremental = self.keywords.get('incremental', False)
+        parallel = self.keywords.get('parallel', False)
+        lazy = self.keywords.get('lazy', False)
+        measureRange = self.keywords.get('measureRange', None)
+        parts = self.keywords.get('parts', None)
 
         if isinstance(fp, pathlib.Path):
             fp = str(fp)  # remove in Py3.6
@@ -862,9 +906,11 @@ class ConverterMusicXML(SubConverter):
         if arch.isArchive():
             archData = arch.getData()
             c.xmlText = archData
-            c.parseXMLText()
+            c.parseXMLText(incremental=incremental, parallel=parallel, lazy=lazy,
+                           measureRange=measureRange, parts=parts)
         else:  # its a file path or a raw musicxml string
-            c.readFile(fp)
+            c.readFile(fp, incremental=incremental, parallel=parallel, lazy=lazy,
+                       measureRange=measureRange, parts=parts)
 
         # movement titles can be stored in more than one place in musicxml
         # manually insert file name as a movementName title if no titles are defined
@@ -949,8 +995,17 @@ class ConverterMusicXML(SubConverter):
             defaults.author = ''
 
         generalExporter = m21ToXml.GeneralObjectExporter(obj)
-        dataBytes = generalExporter.parse()
-        fp = self.writeDataStream(fp, dataBytes)
+        if keywords.get('incremental', False):
+            # write each measure as it is exported rather than building the whole tree
+            if fp is None:
+                fp = self.getTemporaryFile()
+            else:
+                fp = common.cleanpath(fp)
+            with open(fp, 'wb') as f:
+                generalExporter.writeIncremental(f)
+        else:
+            dataBytes = generalExporter.parse()
+            fp = self.writeDataStream(fp, dataBytes)
 
         if subformats is not None and 'png' in subformats:
             defaults.title = savedDefaultTitle
@@ -993,7 +1048,7 @@ class ConverterMidi(SubConverter):
         Calls midi.translate.midiStringToStream.
         '''
         from music21.midi import translate as midiTranslate
-        self.stream = midiTranslate.midiStringToStream(strData)
+        self.stream = midiTranslate.midiStringToStream(strData, **self.keywords)
 
     def parseFile(self, fp, number=None, **keywords):
         '''
@@ -1005,10 +1060,13 @@ class ConverterMidi(SubConverter):
         midiTranslate.midiFilePathToStream(fp, self.stream, **keywords)
 
     def write(self, obj, fmt, fp=None, subformats=None, **keywords):  # pragma: no cover
+        from music21 import base
         from music21.midi import translate as midiTranslate
         if fp is None:
             fp = self.getTemporaryFile()
-        mf = midiTranslate.music21ObjectToMidiFile(obj)
+        # the bytes are the same either way, but arrays are faster to make
+        asArrays = 'numpy' not in base._missingImport
+        mf = midiTranslate.music21ObjectToMidiFile(obj, asArrays=asArrays)
         mf.open(fp, 'wb')  # write binary
         mf.write()
         mf.close()
@@ -1031,20 +1089,32 @@ class ConverterABC(SubConverter):
         If more than one work is defined in the ABC data, a
         :class:`~music21.stream.Opus` object will be returned;
         otherwise, a :class:`~music21.stream.Score` is returned.
+
+        The `measureRange` and `parts` keywords, if given to the converter,
+        limit translation to those measures and voices.  If `parallel` is True,
+        the works of an Opus are translated in separate processes.
         '''
         from music21 import abcFormat
         af = abcFormat.ABCFile()
         # do not need to call open or close
         abcHandler = af.readstr(strData, number=number)
+        measureRange = self.keywords.get('measureRange', None)
+        parts = self.keywords.get('parts', None)
+        parallel = self.keywords.get('parallel', False)
         # set to stream
         if abcHandler.definesReferenceNumbers():
             # this creates an Opus object, not a Score object
             self.stream = abcFormat.translate.abcToStreamOpus(abcHandler,
-                                                              number=number)
+                                                              number=number,
+                                                              measureRange=measureRange,
+                                                              parts=parts,
+                                                              parallel=parallel)
         else:  # just one work
-            abcFormat.translate.abcToStreamScore(abcHandler, self.stream)
+            abcFormat.translate.abcToStreamScore(abcHandler, self.stream,
+                                                 measureRange=measureRange,
+                                                 parts=parts)
 
-    def parseFile(self, fp, number=None):
+    def parseFile(self, fp, number=None, **keywords):
         '''
         Get ABC data from a file path. If more than one work is defined in the ABC
         data, a  :class:`~music21.stream.Opus` object will be returned;
@@ -1052,6 +1122,11 @@ class ConverterABC(SubConverter):
 
         If `number` is provided, and this ABC file defines multiple works
         with a X: tag, just the specified work will be returned.
+
+        If `measureRange` (a tuple of start and end measure numbers) or
+        `parts` (a list of voice indices, ids, or names) are given, only
+        those measures and voices are translated.  If `parallel` is True,
+        the works of an Opus are translated in separate processes.
         '''
         # environLocal.printDebug(['ConverterABC.parseFile: got number', number])
         from music21 import abcFormat
@@ -1061,6 +1136,9 @@ class ConverterABC(SubConverter):
         # returns a handler instance of parse tokens
         abcHandler = af.read(number=number)
         af.close()
+        measureRange = keywords.get('measureRange', self.keywords.get('measureRange', None))
+        parts = keywords.get('parts', self.keywords.get('parts', None))
+        parallel = keywords.get('parallel', self.keywords.get('parallel', False))
 
         # only create opus if multiple ref numbers
         # are defined; if a number is given an opus will no be created
@@ -1068,10 +1146,15 @@ class ConverterABC(SubConverter):
             # this creates a Score or Opus object, depending on if a number
             # is given
             self.stream = abcFormat.translate.abcToStreamOpus(abcHandler,
-                                                              number=number)
+                                                              number=number,
+                                                              measureRange=measureRange,
+                                                              parts=parts,
+                                                              parallel=parallel)
         # just get a single work
         else:
-            abcFormat.translate.abcToStreamScore(abcHandler, self.stream)
+            abcFormat.translate.abcToStreamScore(abcHandler, self.stream,
+                                                 measureRange=measureRange,
+                                                 parts=parts)
 
 
 class ConverterRomanText(SubConverter):
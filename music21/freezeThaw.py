@@ -193,6 +193,22 @@ class StreamFreezer(StreamFreezeThawBase):
     >>> len(s2.parts[0].measure(7).notes) == 6
     True
 
+    Trees that have been made with `.asTimespans()` or `.asTree()` and are
+    still cached on the Stream are saved with it in the pickle format, so
+    they do not need to be made again after thawing:
+
+    >>> noteTree = c.asTimespans(classList=(note.Note,))
+    >>> sf = freezeThaw.StreamFreezer(c)
+    >>> data = sf.writeStr(fmt='pickle')
+    >>> st = freezeThaw.StreamThawer()
+    >>> st.openStr(data)
+    >>> s2 = st.stream
+    >>> s2.coreCachedTrees()
+    {('timespanTree', (<class 'music21.note.Note'>,), True):
+        <TimespanTree {804} (0.0 to 326.0) <music21.stream.Score ...>>}
+    >>> s2.asTimespans(classList=(note.Note,))[0].element is s2.parts[0].recurse().notes[0]
+    True
+
     JSONPickle is also an acceptable way of Freezing streams.  Especially
     for going to music21j in Javascript:
 
@@ -215,15 +231,22 @@ class StreamFreezer(StreamFreezeThawBase):
         self.streamIds = streamIds
 
         self.subStreamFreezers = {}  # this will keep track of sub freezers for spanners
-        #
+        # trees cached on the stream, saved with it when pickling;
+        # they must be gathered before the cache is cleared.
+        self.cachedTrees = {}
 
         if streamObj is not None and fastButUnsafe is False:
             # deepcopy necessary because we mangle sites in the objects
             # before serialization
-            self.stream = copy.deepcopy(streamObj)
+            memo = {}
+            self.stream = copy.deepcopy(streamObj, memo)
             # self.stream = streamObj
+            # copying the trees with the same memo makes them refer to the copied elements
+            for key, cachedTree in streamObj.coreCachedTrees().items():
+                self.cachedTrees[key] = copy.deepcopy(cachedTree, memo)
         elif streamObj is not None:
             self.stream = streamObj
+            self.cachedTrees = streamObj.coreCachedTrees()
 
     def packStream(self, streamObj=None):
         '''
@@ -662,6 +685,7 @@ class StreamFreezer(StreamFreezeThawBase):
             # a negative protocol value will get the highest protocol;
             # this is generally desirable
             # packStream() returns a storage dictionary
+            storage['trees'] = self.cachedTrees
             pickleString = pickle.dumps(storage, protocol=pickle.HIGHEST_PROTOCOL)
             if zipType == 'zlib':
                 pickleString = zlib.compress(pickleString)
@@ -697,6 +721,7 @@ class StreamFreezer(StreamFreezeThawBase):
         storage = self.packStream(self.stream)
 
         if fmt == 'pickle':
+            storage['trees'] = self.cachedTrees
             out = pickle.dumps(storage, protocol=-1)
         elif fmt == 'jsonpickle':
             import jsonpickle
@@ -899,6 +924,12 @@ class StreamThawer(StreamFreezeThawBase):
         streamObj = storage['stream']
 
         self.teardownSerializationScaffold(streamObj)
+        cachedTrees = storage.get('trees')
+        if cachedTrees:
+            # sort now, so that sorting on first use does not clear the trees from the cache
+            if streamObj.autoSort:
+                streamObj.sort()
+            streamObj._cache.update(cachedTrees)
         return streamObj
 
     def parseOpenFmt(self, storage):
@@ -1064,6 +1095,38 @@ class Test(unittest.TestCase):
         s = st.stream
         self.assertEqual(len(s.parts[0].measure(7).notes), 6)
 
+    def testFreezeThawCachedTrees(self):
+        from music21 import converter
+        from music21 import corpus
+        from music21 import note
+        c = corpus.parse('bwv66.6')
+        elementTree = c.asTree(flatten=True)
+        noteTree = c.asTimespans(classList=(note.Note,))
+        # unsafe freezing must keep the trees too.
+        for fastButUnsafe in (False, True):
+            fp = converter.freeze(c, fastButUnsafe=fastButUnsafe)
+            s = converter.thaw(fp)
+            os.remove(fp)
+            self.assertEqual(len(s.coreCachedTrees()), 2)
+            noteTree2 = s.asTimespans(classList=(note.Note,))
+            self.assertEqual(len(noteTree2), len(noteTree))
+            self.assertIs(noteTree2.source, s)
+            allNotes = s.recurse().notes
+            self.assertEqual([ts.element.nameWithOctave for ts in noteTree2],
+                             [ts.element.nameWithOctave for ts in noteTree])
+            self.assertEqual([ts.offset for ts in noteTree2], [ts.offset for ts in noteTree])
+            self.assertTrue(all(ts.element.activeSite is ts.parentage[0] for ts in noteTree2))
+            self.assertEqual(sorted(id(ts.element) for ts in noteTree2),
+                             sorted(id(n) for n in allNotes))
+            self.assertEqual(len(s.asTree(flatten=True)), len(elementTree))
+            # and the trees are made anew once the stream changes.
+            s.parts[0].measure(1).insert(0, note.Note('C'))
+            self.assertEqual(s.coreCachedTrees(), {})
+            self.assertEqual(len(s.asTimespans(classList=(note.Note,))), len(noteTree) + 1)
+            c = corpus.parse('bwv66.6')
+            c.asTree(flatten=True)
+            c.asTimespans(classList=(note.Note,))
+
     def x_testSimplePickle(self):
         from music21 import freezeThaw
         from music21 import corpus
@@ -159,22 +159,26 @@ from music21.humdrum import spineParser
 from music21.humdrum import testFiles
 
 
-def parseFile(filename):
+def parseFile(filename, lazy=False, measureRange=None, parts=None, parallel=False,
+              incremental=False):
     '''
     shortcut to :class:`~music21.humdrum.spineParser.HumdrumFile`.
     Most users will call `converter.parse()` instead.
     '''
     hf = spineParser.HumdrumFile(filename)
-    hf.parseFilename()
+    hf.parseFilename(lazy=lazy, measureRange=measureRange, parts=parts, parallel=parallel,
+                     incremental=incremental)
     return hf
 
 
-def parseData(data):
+def parseData(data, lazy=False, measureRange=None, parts=None, parallel=False,
+              incremental=False):
     '''
     shortcut to :class:`~music21.humdrum.spineParser.HumdrumDataCollection`.
     Most users will call `converter.parse()` instead.
     '''
     hdf = spineParser.HumdrumDataCollection(data)
-    hdf.parse()
+    hdf.parse(lazy=lazy, measureRange=measureRange, parts=parts, parallel=parallel,
+              incremental=incremental)
     return hdf
 
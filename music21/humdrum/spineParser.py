@@ -44,6 +44,7 @@ SpineParsing consists of several steps.
 * Measures are searched for elements with voice groups and Voice objects are created
 '''
 import copy
+import itertools
 import math
 import pathlib
 import re
@@ -145,7 +146,8 @@ class HumdrumDataCollection:
         self.dataStream = dataStream
         self.stream = None
 
-    def parse(self):
+    def parse(self, lazy=False, measureRange=None, parts=None, parallel=False,
+              incremental=False):
         '''
         Parse a list (dataStream) of lines into a HumdrumSpineCollection
         (which contains HumdrumSpines)
@@ -155,25 +157,91 @@ class HumdrumDataCollection:
         if dataStream is None, look for it in self.dataStream.  If that's None too,
         return an exception.
 
+        If `lazy` is True, the music of a (non-opus) data collection is not made
+        until it is first needed; see :meth:`parseNonOpus`.  `measureRange` and
+        `parts` limit the music that is made; see :meth:`linesInMeasureRange` and
+        :meth:`removeUnselectedSpines`.  If `parallel` is True, the works of an
+        opus are parsed in separate processes; see :meth:`parseOpusDataCollections`.
+
+        If `incremental` is True (and `lazy` is not), the lines are parsed one
+        at a time and the music is made a measure at a time with
+        :meth:`iterMeasures`, which uses less memory and stops reading at the end
+        of `measureRange`; the dataStream can then be an open file.  Opuses and
+        files that split a spine that is already split cannot be parsed that
+        way, so they are parsed again from the start as if `incremental` were False.
         '''
         dataStream = self.dataStream
         if dataStream is None:
             raise HumdrumException('Need a list of lines (dataStream) to parse!')
+        if incremental and not lazy:
+            try:
+                for unused_measure in self.iterMeasures(dataStream,
+                                                        measureRange=measureRange,
+                                                        parts=parts):
+                    pass
+                return
+            except HumdrumException as he:
+                environLocal.printDebug(['parsing the whole file at once:', he])
+            if not isinstance(dataStream, list):  # an open file
+                dataStream.seek(0)
+                dataStream = dataStream.readlines()
+                self.dataStream = dataStream
 
         hasOpus, dataCollections = self.determineIfDataStreamIsOpus(dataStream)
         if hasOpus is True:  # Palestrina data collection, maybe others
-            return self.parseOpusDataCollections(dataCollections)
+            return self.parseOpusDataCollections(dataCollections,
+                                                 measureRange=measureRange,
+                                                 parts=parts,
+                                                 parallel=parallel)
         else:
-            return self.parseNonOpus(dataStream)
+            return self.parseNonOpus(dataStream, lazy=lazy,
+                                     measureRange=measureRange, parts=parts)
 
-    def parseNonOpus(self, dataStream):
+    def parseNonOpus(self, dataStream, lazy=False, measureRange=None, parts=None):
         '''
         The main parse function for non-opus data collections.
+
+        If `lazy` is True, the spines are found and the metadata is read, but
+        each \*\*kern Part of the Score is left empty until its elements are
+        first used; then the music of all the spines is made at once, and the
+        global comments and references are put into the Score.
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(humdrum.testFiles.sousaStars)
+        >>> hdc.parse(lazy=True)
+        >>> s = hdc.stream
+        >>> s.metadata.title
+        'Stars and Strips Forever March'
+        >>> [p.id for p in s.parts]
+        ['spine_1', 'spine_0']
+        >>> s.parts[0].hasDeferredElements
+        True
+        >>> s.parts[0].measure(1).notes[0]
+        <music21.chord.Chord E-4 E-5>
+        >>> s.parts[0].hasDeferredElements
+        False
+
+        If `measureRange` is given, only the lines needed for those measures are
+        parsed, and if `parts` is given, only the spines of those parts are
+        made into music21 objects:
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(humdrum.testFiles.sousaStars)
+        >>> hdc.parse(measureRange=(3, 4), parts=[0])
+        >>> s = hdc.stream
+        >>> [p.id for p in s.parts]
+        ['spine_1']
+        >>> [m.number for m in s.parts[0].getElementsByClass('Measure')]
+        [3, 4]
+        >>> s.parts[0].measure(3).timeSignature
+        <music21.meter.TimeSignature 2/2>
         '''
         self.stream = stream.Score()
 
         self.maxSpines = 0
 
+        firstMeasureNumber = None
+        if measureRange is not None:
+            dataStream, firstMeasureNumber = self.linesInMeasureRange(dataStream, measureRange)
+
         # parse global comments and figure out the maximum number of spines we will have
 
         self.parsePositionInStream = 0
@@ -184,7 +252,14 @@ class HumdrumDataCollection:
             raise HumdrumException('getEventListFromDataStream failed: did not parse entire file')
         self.parseProtoSpinesAndEventCollections()
         self.spineCollection = self.createHumdrumSpines()
+        if parts is not None:
+            self.removeUnselectedSpines(parts)
+        if lazy:
+            self.deferMusic21Streams(firstMeasureNumber)
+            return
         self.spineCollection.createMusic21Streams()
+        if firstMeasureNumber is not None:
+            self.trimMeasuresToRange(firstMeasureNumber)
         self.insertGlobalEvents()
         for thisSpine in self.spineCollection:
             thisSpine.stream.id = 'spine_' + str(thisSpine.id)
@@ -194,6 +269,536 @@ class HumdrumDataCollection:
 
         self.parseMetadata()
 
+    def iterMeasures(self, dataStream=None, measureRange=None, parts=None):
+        r'''
+        Parse the lines of `dataStream` (by default `self.dataStream`; it can
+        also be an open file) one at a time, and yield each Measure of the
+        \*\*kern Parts as soon as it has been made and put into its Part.
+
+        The spine paths are followed as each line is read.  At each barline
+        (after the first), the events that the spines got since the barline
+        before are made into music21 objects and moved into their measures,
+        and then thrown away, so that the lines, ProtoSpines and SpineEvents
+        of the whole file are never in memory at once.  If `measureRange` is
+        given, no lines are read after its last measure.  `parts` selects the
+        parts as in :meth:`parseNonOpus`; part indices count only the spines
+        that start at the first line.
+
+        Once the generator is exhausted, `self.stream` is the complete Score,
+        the same as what :meth:`parseNonOpus` makes (except that a pickup is
+        only called measure 0 if it is followed by measure 1).  Until then the
+        Parts are not in the Score, and if `measureRange` is given, the first
+        measure does not have its number yet.
+
+        A HumdrumException is raised when the file turns out to be an opus, or
+        when a spine that is already split is split again, since the measures
+        made so far could not then be the same as those :meth:`parseNonOpus` makes.
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(humdrum.testFiles.sousaStars)
+        >>> for m in hdc.iterMeasures(measureRange=(None, 2)):
+        ...     print(m.activeSite.id, m.number, len(m.notes), len(hdc.stream.parts))
+        spine_1 1 3 0
+        spine_0 1 3 0
+        spine_1 2 3 0
+        spine_0 2 2 0
+        >>> hdc.stream.parts[0]
+        <music21.stream.Part spine_1>
+        >>> hdc.stream.metadata.title
+        'Stars and Strips Forever March'
+        '''
+        if dataStream is None:
+            dataStream = self.dataStream
+        if measureRange is not None:
+            lineTuples = self.iterLinesInMeasureRange(dataStream, measureRange, stopAtEnd=True)
+        else:
+            lineTuples = ((line, None) for line in dataStream)
+
+        self.stream = stream.Score()
+        self.maxSpines = 0
+        spineCollection = SpineCollection()
+        self.spineCollection = spineCollection
+        currentSpineList = common.defaultlist(lambda: None)
+        spinesWithEvents = {}  # an ordered set
+        carriedMeasures = {}
+        spineOffsets = {}
+        spineParts = {}
+        partIndices = {}
+        selectedSpines = {}
+        pendingGlobalEvents = []
+        firstMeasureNumber = None
+
+        def topSpine(thisSpine):
+            while thisSpine.parentSpine is not None:
+                thisSpine = thisSpine.parentSpine
+            return thisSpine
+
+        def isSelected(thisSpine):
+            thisSpine = topSpine(thisSpine)
+            if parts is None or thisSpine.spineType != 'kern':
+                return True
+            if thisSpine not in selectedSpines:
+                selectedSpines[thisSpine] = (partIndices.get(thisSpine, -1) in parts
+                                             or 'spine_' + str(thisSpine.id) in parts)
+            return selectedSpines[thisSpine]
+
+        def makeMeasures(hasMeasureOne=False, isLast=False):
+            chunkSpines = set()
+            for thisSpine in itertools.chain(spinesWithEvents, carriedMeasures):
+                while thisSpine is not None and thisSpine not in chunkSpines:
+                    chunkSpines.add(thisSpine)
+                    thisSpine = thisSpine.parentSpine
+            chunkCollection = SpineCollection()
+            chunkCollection.spines = sorted(
+                (thisSpine for thisSpine in chunkSpines if isSelected(thisSpine)),
+                key=lambda thisSpine: thisSpine.id)
+            chunkCollection.reclassSpines()
+            for thisSpine in chunkCollection.spines:
+                if thisSpine in carriedMeasures:
+                    thisSpine.stream.coreAppend(carriedMeasures.pop(thisSpine))
+            carriedMeasures.clear()
+            chunkCollection.parseMusic21()
+            # the measure begun by the last barline goes with the next events
+            for thisSpine in chunkCollection.spines:
+                lastContainer = thisSpine.lastContainer
+                spineElements = thisSpine.stream._elements
+                if (not isLast
+                        and thisSpine.eventList
+                        and thisSpine.eventList[-1].contents.startswith('=')
+                        and spineElements
+                        and spineElements[-1] is lastContainer):
+                    thisSpine.stream.remove(lastContainer)
+                    carriedMeasures[thisSpine] = lastContainer
+            chunkCollection.performInsertions()
+            chunkCollection.moveObjectsToMeasures(hasMeasureOne=hasMeasureOne)
+            chunkCollection.moveDynamicsAndLyricsToStreams()
+            chunkCollection.makeVoices()
+
+            topSpines = [thisSpine for thisSpine in chunkCollection.spines
+                         if thisSpine.parentSpine is None]
+            if pendingGlobalEvents:
+                positionDict = {}
+                for thisSpine in topSpines:
+                    spineOffset = spineOffsets.get(thisSpine, 0.0)
+                    for el in thisSpine.stream.flat:
+                        if (hasattr(el, 'humdrumPosition')
+                                and el.humdrumPosition not in positionDict):
+                            positionDict[el.humdrumPosition] = (spineOffset + el.offset,
+                                                                el.priority)
+                stillPending = []
+                for globalPosition, numberInARow, el in pendingGlobalEvents:
+                    laterPositions = [i for i in positionDict if i > globalPosition]
+                    if not laterPositions:
+                        stillPending.append((globalPosition, numberInARow, el))
+                        continue
+                    insertOffset, priority = positionDict[min(laterPositions)]
+                    # hopefully not more than 20 events in a row...
+                    el.priority = priority - 40 + numberInARow
+                    self.stream.coreInsert(insertOffset, el)
+                if len(stillPending) < len(pendingGlobalEvents):
+                    self.stream.coreElementsChanged()
+                pendingGlobalEvents[:] = stillPending
+
+            measures = []
+            # in the order of the Parts in the Score
+            for thisSpine in reversed(topSpines):
+                spineOffset = spineOffsets.get(thisSpine, 0.0)
+                spineStream = thisSpine.stream
+                spineOffsets[thisSpine] = spineOffset + spineStream.highestTime
+                if thisSpine.spineType != 'kern':
+                    continue
+                if thisSpine not in spineParts:
+                    spineParts[thisSpine] = spineStream.__class__(id='spine_' + str(thisSpine.id))
+                part = spineParts[thisSpine]
+                for el in spineStream._elements:
+                    part.coreInsert(spineOffset + spineStream.elementOffset(el), el)
+                    if isinstance(el, stream.Measure):
+                        measures.append(el)
+                for el in spineStream._endElements:
+                    part.coreStoreAtEnd(el)
+                part.coreElementsChanged()
+
+            activeSpines = set(currentSpineList)
+            for thisSpine in chunkSpines:
+                thisSpine.eventList = []
+                thisSpine.stream = thisSpine.stream.__class__()
+                # forget the splits that have been merged back
+                for insertPoint, childSpines in list(thisSpine.childSpineInsertPoints.items()):
+                    if not activeSpines.intersection(childSpines):
+                        del thisSpine.childSpineInsertPoints[insertPoint]
+            spinesWithEvents.clear()
+            return measures
+
+        position = 0
+        numberOfGlobalEventsInARow = 0
+        barlinesSeen = 0
+        workFinished = False
+        for line, measureNumber in lineTuples:
+            line = line.rstrip()
+            if line == '':
+                continue  # technically forbidden by Humdrum but the source of so many errors!
+            if firstMeasureNumber is None:
+                firstMeasureNumber = measureNumber
+            if line.startswith('!!'):
+                numberOfGlobalEventsInARow += 1
+                if line.startswith('!!!'):
+                    event = GlobalReferenceLine(position, line)
+                    el = GlobalReference(event.code, event.value)
+                else:
+                    el = GlobalComment(GlobalCommentLine(position, line).value)
+                pendingGlobalEvents.append((position, numberOfGlobalEventsInARow, el))
+                position += 1
+                continue
+            numberOfGlobalEventsInARow = 0
+            if workFinished:
+                raise HumdrumException('A Humdrum opus cannot be parsed a measure at a time '
+                                       + f'(line {position})')
+
+            thisLine = SpineLine(position, line)
+            if thisLine.numSpines > self.maxSpines:
+                self.maxSpines = thisLine.numSpines
+            lineEvents = []
+            spinePathData = False
+            for j, contents in enumerate(thisLine.spineData):
+                thisEvent = SpineEvent(contents, position)
+                thisEvent.protoSpineId = j
+                if contents in spinePathIndicators:
+                    spinePathData = True
+                    if (contents == '*^'
+                            and currentSpineList[j] is not None
+                            and currentSpineList[j].parentSpine is not None):
+                        raise HumdrumException(
+                            'A split of a spine that is already split cannot be parsed '
+                            + f'a measure at a time (line {position})')
+                lineEvents.append(thisEvent)
+            isFirstLine = not spineCollection.spines
+            currentSpineList = self.addEventsToSpines(spineCollection, currentSpineList,
+                                                      lineEvents, position, spinePathData)
+            for thisEvent in lineEvents:
+                # spine ids are their indices in spineCollection.spines
+                spinesWithEvents[spineCollection.spines[thisEvent.protoSpineId]] = True
+            if isFirstLine and parts is not None:
+                # part indices count from the right, like the Parts in the Score
+                partIndex = 0
+                for thisSpine in reversed(currentSpineList):
+                    if thisSpine is not None and thisSpine.spineType == 'kern':
+                        partIndices[thisSpine] = partIndex
+                        partIndex += 1
+            position += 1
+
+            if all(contents.startswith('=') for contents in thisLine.spineData):
+                barlinesSeen += 1
+                # the first measure is made with everything before it
+                if barlinesSeen > 1:
+                    match = re.match(r'=+(\d+)', thisLine.spineData[0])
+                    yield from makeMeasures(
+                        hasMeasureOne=match is not None and int(match.group(1)) == 1)
+            elif spinePathData and not any(currentSpineList):
+                workFinished = True
+
+        yield from makeMeasures(isLast=True)
+
+        for el in pendingGlobalEvents:
+            self.stream.coreAppend(el[2])
+        if pendingGlobalEvents:
+            self.stream.coreElementsChanged()
+
+        spineCollection.spines = [thisSpine for thisSpine in spineCollection.spines
+                                  if isSelected(thisSpine)]
+        for thisSpine, part in spineParts.items():
+            thisSpine.stream = part
+        if firstMeasureNumber is not None:
+            self.trimMeasuresToRange(firstMeasureNumber)
+        for thisSpine in spineCollection:
+            thisSpine.stream.id = 'spine_' + str(thisSpine.id)
+        for thisSpine in spineCollection:
+            if thisSpine.parentSpine is None and thisSpine.spineType == 'kern':
+                self.stream.insert(thisSpine.stream)
+
+        self.parseMetadata()
+
+    def deferMusic21Streams(self, firstMeasureNumber=None):
+        '''
+        Put an empty Part into self.stream for each \*\*kern spine that is not a
+        sub-spine, which makes the music of all the spines (and inserts the
+        global events into self.stream) the first time that the elements of
+        any of them are used.  The metadata is read from the global references
+        first, so that it can be used before the Parts are loaded.
+
+        Called by :meth:`parseNonOpus` when parsing lazily.  `firstMeasureNumber`
+        is passed to :meth:`trimMeasuresToRange` once the music is made.  As each
+        Part is loaded, the elements of its spine's stream are moved into it and
+        it becomes the stream of the spine.
+        '''
+        md = metadata.Metadata()
+        self.stream.metadata = md
+        for event in self.eventList:
+            if event.isSpineLine is False and event.isReference is True:
+                GlobalReference(event.code, event.value).updateMetadata(md)
+
+        spineCollection = self.spineCollection
+        unloadedSpines = {}  # by part id
+
+        def loader(part):
+            nonlocal spineCollection
+            isFirstLoad = spineCollection is not None
+            if isFirstLoad:
+                spineCollection.createMusic21Streams()
+                if firstMeasureNumber is not None:
+                    self.trimMeasuresToRange(firstMeasureNumber)
+                for thisSpine in spineCollection:
+                    if thisSpine.parentSpine is None and thisSpine.spineType == 'kern':
+                        unloadedSpines['spine_' + str(thisSpine.id)] = thisSpine
+                spineCollection = None
+            # move the elements, so that they are only in the Part, and let the
+            # Part be the stream of the spine from now on
+            thisSpine = unloadedSpines.pop(part.id)
+            spineStream = thisSpine.stream
+            for el in spineStream._elements:
+                part.coreInsert(spineStream.elementOffset(el), el)
+                el.sites.remove(spineStream)
+            for el in spineStream._endElements:
+                part.coreStoreAtEnd(el)
+                el.sites.remove(spineStream)
+            part.coreElementsChanged()
+            thisSpine.stream = part
+            # last, since inserting into the Score can load the other Parts
+            if isFirstLoad:
+                self.insertGlobalEvents()
+                # as in parseMetadata(), the references read into the
+                # metadata are not kept in the Score
+                md = metadata.Metadata()
+                grToRemove = [gr for gr in self.stream.getElementsByClass('GlobalReference')
+                              if gr.updateMetadata(md)]
+                if grToRemove:
+                    self.stream.remove(grToRemove)
+
+        for thisSpine in spineCollection:
+            if thisSpine.parentSpine is None and thisSpine.spineType == 'kern':
+                part = stream.Part(id='spine_' + str(thisSpine.id))
+                part.coreDeferElements(loader)
+                self.stream.coreInsert(0.0, part)
+        self.stream.coreElementsChanged()
+
+    @staticmethod
+    def linesInMeasureRange(dataStream, measureRange):
+        '''
+        Given a list of lines and a tuple of (start, end) measure numbers (either
+        of which can be None), return a tuple of the lines needed to make just
+        the measures in that range and the number of the first measure that
+        they will make.
+
+        Global comments and references and all interpretations are kept, so
+        that the spines and any clef, key, or meter changes before the start
+        are still known.  Data records, local comments, and barlines outside of
+        the range are dropped; after the range only changes to the spine paths
+        are kept.  A barline without a number starts a measure that is never
+        in the range, as music21 does not number it either.
+
+        >>> lines = ['**kern', '*M2/4', '4c', '=1', '2d', '=2', '*M3/4', '2.e',
+        ...          '=3', '2.f', '=4', '2.g', '*-']
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection
+        >>> hdc.linesInMeasureRange(lines, (2, 3))
+        (['**kern', '*M2/4', '=2', '*M3/4', '2.e', '=3', '2.f', '*-'], 2)
+
+        The numbers are the ones that a full parse would give the measures:
+        notes before the first barline are a pickup (measure 0) if there is
+        a measure 1, otherwise they are measure 1.  Without those notes and
+        without a measure 1, the first measure is called measure 1.
+
+        >>> hdc.linesInMeasureRange(lines, (None, 1))
+        (['**kern', '*M2/4', '4c', '=1', '2d', '*-'], 0)
+        >>> hdc.linesInMeasureRange(['**kern', '=49', '1c', '=50', '1d', '=51', '1e'], (1, 50))
+        (['**kern', '=49', '1c', '=50', '1d'], 1)
+
+        A file without numbered barlines cannot be split:
+
+        >>> hdc.linesInMeasureRange(['**kern', '4c', '=', '4d', '*-'], (2, 2))
+        (['**kern', '4c', '=', '4d', '*-'], None)
+
+        >>> hdc.linesInMeasureRange(['**kern', '=1', '4c', '=:|!', '4d', '=2', '4e', '=='],
+        ...                         (1, 2))
+        (['**kern', '=1', '4c', '=:|!', '=2', '4e', '=='], 1)
+        '''
+        keptLines = []
+        firstMeasureNumber = None
+        for line, measureNumber in HumdrumDataCollection.iterLinesInMeasureRange(
+                dataStream, measureRange):
+            keptLines.append(line)
+            if firstMeasureNumber is None:
+                firstMeasureNumber = measureNumber
+        return (keptLines, firstMeasureNumber)
+
+    @staticmethod
+    def iterLinesInMeasureRange(dataStream, measureRange, stopAtEnd=False):
+        '''
+        Yield the lines of `dataStream` that :meth:`linesInMeasureRange` keeps, each
+        in a tuple with the number that the measure it is in will have, or None
+        if the line is not part of the music of a measure in the range (such as
+        an interpretation or a local comment).
+
+        If `stopAtEnd` is True, no more lines are read once the range is over,
+        so the spines are not terminated.  `dataStream` can be an open file: the
+        lines are only read ahead as far as measure 1 (or to the end, if there
+        is no measure 1).
+
+        >>> lines = ['**kern', '*M2/4', '4c', '=1', '2d', '=2', '*M3/4', '2.e',
+        ...          '=3', '2.f', '=4', '2.g', '*-']
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection
+        >>> list(hdc.iterLinesInMeasureRange(lines, (None, 1), stopAtEnd=True))
+        [('**kern', None), ('*M2/4', None), ('4c', 0), ('=1', 1), ('2d', 1)]
+        '''
+        start, end = measureRange
+
+        def inRange(number):
+            if number is None:
+                return False
+            if start is not None and number < start:
+                return False
+            if end is not None and number > end:
+                return False
+            return True
+
+        dataStream = iter(dataStream)
+        readLines = []
+        firstBarNumber = None
+        hasMeasureOne = False
+        hasPickupNotes = False
+        for line in dataStream:
+            readLines.append(line)
+            match = re.match(r'=+(\d+)', line)
+            if match:
+                barNumber = int(match.group(1))
+                if firstBarNumber is None:
+                    firstBarNumber = barNumber
+                if barNumber == 1:
+                    hasMeasureOne = True
+                    break
+            elif firstBarNumber is None and line.strip() and line[0] not in '*!=':
+                hasPickupNotes = True
+        if firstBarNumber is None:
+            for line in readLines:
+                yield (line, None)
+            return
+        # the first barline is called measure 1 if nothing comes before it
+        renumberedBar = None
+        if not hasMeasureOne and not hasPickupNotes:
+            renumberedBar = firstBarNumber
+
+        currentNumber = 1 if hasPickupNotes and not hasMeasureOne else 0
+        pastEnd = False
+        for line in itertools.chain(readLines, dataStream):
+            contents = line.rstrip()
+            if contents == '' or contents.startswith('!!'):
+                yield (line, None)
+                continue
+            spineData = re.split('\t+', contents)
+            firstSpine = spineData[0]
+            if firstSpine.startswith('*'):
+                if pastEnd:
+                    # only the spine paths are needed after the end
+                    spineData = [tandem if tandem in spinePathIndicators else '*'
+                                 for tandem in spineData]
+                    if all(tandem == '*' for tandem in spineData):
+                        continue
+                    line = '\t'.join(spineData)
+                yield (line, None)
+                continue
+            if firstSpine.startswith('='):
+                match = re.match(r'=+(\d+)', firstSpine)
+                if match:
+                    currentNumber = int(match.group(1))
+                    if currentNumber == renumberedBar:
+                        currentNumber = 1
+                        renumberedBar = None
+                    pastEnd = end is not None and currentNumber > end
+                    if pastEnd and stopAtEnd:
+                        return
+                else:
+                    # only keep the barline itself, to end the measure before it
+                    if inRange(currentNumber):
+                        yield (line, None)
+                    currentNumber = None
+                    continue
+            if inRange(currentNumber):
+                if firstSpine.startswith('!'):
+                    yield (line, None)
+                else:
+                    yield (line, currentNumber)
+
+    def removeUnselectedSpines(self, parts):
+        '''
+        Remove from self.spineCollection the \*\*kern spines (and their
+        sub-spines) that are not in `parts`, a list of part indices (in the
+        order that the parts appear in the Score) or part ids such as
+        "spine_3", so that their music is never made.
+
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection(humdrum.testFiles.sousaStars)
+        >>> hdc.maxSpines = 0
+        >>> unused = hdc.parseEventListFromDataStream()
+        >>> unused = hdc.parseProtoSpinesAndEventCollections()
+        >>> hdc.spineCollection = hdc.createHumdrumSpines()
+        >>> hdc.spineCollection.spines
+        [Spine: 0 [parent of: 3 4 5 6  ], Spine: 1 [parent of: 7 8  ], Spine: 2,
+         Spine: 3 [child of: 0], Spine: 4 [child of: 0], Spine: 5 [child of: 0],
+         Spine: 6 [child of: 0], Spine: 7 [child of: 1], Spine: 8 [child of: 1]]
+
+        The \*\*dynam spine 2 is kept:
+
+        >>> hdc.removeUnselectedSpines(['spine_0'])
+        >>> hdc.spineCollection.spines
+        [Spine: 0 [parent of: 3 4 5 6  ], Spine: 2, Spine: 3 [child of: 0],
+         Spine: 4 [child of: 0], Spine: 5 [child of: 0], Spine: 6 [child of: 0]]
+        '''
+        removedSpines = set()
+        partIndex = 0
+        for thisSpine in self.spineCollection:
+            if thisSpine.parentSpine is not None or thisSpine.spineType != 'kern':
+                continue
+            if partIndex not in parts and 'spine_' + str(thisSpine.id) not in parts:
+                removedSpines.add(thisSpine)
+            partIndex += 1
+
+        def topSpine(thisSpine):
+            while thisSpine.parentSpine is not None:
+                thisSpine = thisSpine.parentSpine
+            return thisSpine
+
+        self.spineCollection.spines = [thisSpine for thisSpine in self.spineCollection.spines
+                                       if topSpine(thisSpine) not in removedSpines]
+
+    def trimMeasuresToRange(self, firstMeasureNumber):
+        '''
+        After parsing the lines from :meth:`linesInMeasureRange`, give the first
+        Measure of each \*\*kern spine its real number (moveElementsIntoMeasures
+        would call it measure 1), and keep only the last of each kind of
+        clef, key, meter, or tempo that were collected at its start from the
+        measures that were skipped.  Unnumbered measures whose notes were
+        skipped are removed.
+        '''
+        for thisSpine in self.spineCollection:
+            if thisSpine.parentSpine is not None or thisSpine.spineType != 'kern':
+                continue
+            measures = thisSpine.stream.getElementsByClass('Measure')
+            if not measures:
+                continue
+            for m in list(measures)[1:]:
+                if m.number == 0 and not m.recurse().notesAndRests:
+                    thisSpine.stream.remove(m)
+            m = measures[0]
+            m.number = firstMeasureNumber
+            if firstMeasureNumber != 0:
+                m.paddingLeft = 0.0
+            lastOfClass = {}
+            duplicates = []
+            for el in m.getElementsByClass(
+                    ('Clef', 'KeySignature', 'TimeSignature', 'MetronomeMark')
+            ).getElementsByOffset(0.0):
+                if el.__class__ in lastOfClass:
+                    duplicates.append(lastOfClass[el.__class__])
+                lastOfClass[el.__class__] = el
+            for el in duplicates:
+                m.remove(el)
+
     # noinspection SpellCheckingInspection
     def determineIfDataStreamIsOpus(self, dataStream=None):
         r'''
@@ -296,11 +901,19 @@ class HumdrumDataCollection:
                 + 'possibly multiple **tags without closing information. Or a *tandem tag '
                 + 'accidentally encoded as a **spine tag.')
 
-    def parseOpusDataCollections(self, dataCollections):
+    def parseOpusDataCollections(self, dataCollections, measureRange=None, parts=None,
+                                 parallel=False):
         '''
         take a dataCollection from `determineIfDataStreamIsOpus`
         and set self.stream to be an Opus instead.
 
+        `measureRange` and `parts` are used for each section.
+
+        If `parallel` is True, each section is parsed in a separate process
+        with :func:`~music21.common.runParallel`, and sent back frozen with
+        :mod:`~music21.freezeThaw`.  The Opus is the same as when the sections
+        are parsed one after another, which is still done if there is only one CPU.
+
 
         >>> mps = humdrum.testFiles.multipartSanctus
         >>> hdc = humdrum.spineParser.HumdrumDataCollection(mps)
@@ -314,12 +927,27 @@ class HumdrumDataCollection:
         <music21.stream.Score section_1>
         <music21.stream.Score section_2>
         <music21.stream.Score section_3>
-        '''
+
+        >>> op = hdc.parseOpusDataCollections(dataCollections, parallel=True)
+        >>> [sc.id for sc in op.scores]
+        ['section_1', 'section_2', 'section_3']
+        '''
+        if parallel:
+            from music21 import converter
+            frozenScores = common.runParallel(
+                [(dc, measureRange, parts) for dc in dataCollections],
+                _dataCollectionToFrozenScore,
+                unpackIterable=True)
+            scores = [converter.thawStr(frozenScore) for frozenScore in frozenScores]
+        else:
+            scores = []
+            for dc in dataCollections:
+                hdc = HumdrumDataCollection(dc)
+                hdc.parse(measureRange=measureRange, parts=parts)
+                scores.append(hdc.stream)
+
         opus = stream.Opus()
-        for i, dc in enumerate(dataCollections):
-            hdc = HumdrumDataCollection(dc)
-            hdc.parse()
-            sc = hdc.stream
+        for i, sc in enumerate(scores):
             sc.id = 'section_' + str(i + 1)
             sc.metadata.number = i + 1
             opus.append(sc)
@@ -566,113 +1194,140 @@ class HumdrumDataCollection:
 
         # go through the event collections line by line
         for i in range(self.fileLength):
-            thisEventCollection = eventCollections[i]
-            for j in range(maxSpines):
-                thisEvent = protoSpines[j].eventList[i]
-
-                if thisEvent is None:  # nothing there
-                    continue
-
-                currentSpine = currentSpineList[j]
-                if currentSpine is None:
-                    # first event after a None = new spine because
-                    # Humdrum does not require *+ at the beginning
-                    currentSpine = spineCollection.addSpine()
-                    currentSpine.insertPoint = i
-                    currentSpineList[j] = currentSpine
-
-                currentSpine.append(thisEvent)
-                # currentSpine.id is always unique in a spineCollection
-                thisEvent.protoSpineId = currentSpine.id
+            lineEvents = [protoSpines[j].eventList[i] for j in range(maxSpines)]
+            currentSpineList = self.addEventsToSpines(spineCollection,
+                                                      currentSpineList,
+                                                      lineEvents,
+                                                      i,
+                                                      eventCollections[i].spinePathData)
+        return spineCollection
 
-            # check for spinePathData
-            if thisEventCollection.spinePathData is False:
+    @staticmethod
+    def addEventsToSpines(spineCollection, currentSpineList, lineEvents, position,
+                          spinePathData=False):
+        '''
+        Append the SpineEvents of one line (`lineEvents`, with None wherever
+        there is no event) to the HumdrumSpines of `spineCollection` that are
+        in `currentSpineList`, the active spines from left to right,
+        making a new spine where there is none yet, and return the list of
+        spines that are active after the line.  If `spinePathData` is True,
+        the spine path indicators of the line are followed.
+
+        Used by :meth:`createHumdrumSpines` for every line of a file, and by
+        :meth:`iterMeasures` as each line is read.
+
+        >>> SE = humdrum.spineParser.SpineEvent
+        >>> hdc = humdrum.spineParser.HumdrumDataCollection
+        >>> sc = humdrum.spineParser.SpineCollection()
+        >>> spineList = common.defaultlist(lambda: None)
+        >>> spineList = hdc.addEventsToSpines(sc, spineList, [SE('**kern'), SE('**dynam')], 0)
+        >>> spineList = hdc.addEventsToSpines(sc, spineList, [SE('*^'), SE('*')], 1, True)
+        >>> spineList
+        [Spine: 2 [child of: 0], Spine: 3 [child of: 0], Spine: 1]
+        '''
+        numColumns = max(len(lineEvents), len(currentSpineList))
+        for j, thisEvent in enumerate(lineEvents):
+            if thisEvent is None:  # nothing there
                 continue
 
-            # note that nothing else can happen in an eventCollection
-            # except spine path data if any spine has spine path data.
-            # thus, this is illegal.  The C#4 will be ignored:
-            # *x     *x     C#4
-
-            newSpineList = common.defaultlist(lambda: None)
-            mergerActive = False
-            exchangeActive = False
-            for j in range(maxSpines):
-                thisEvent = protoSpines[j].eventList[i]
-                currentSpine = currentSpineList[j]
-
-                if thisEvent is None and currentSpine is not None:
-                    # should this happen?
-                    newSpineList.append(currentSpine)
-                elif thisEvent is None:
-                    continue
-                elif thisEvent.contents == '*-':  # terminate spine
-                    currentSpine.endingPosition = i
-                elif thisEvent.contents == '*^':  # split spine assume they are voices
-                    newSpine1 = spineCollection.addSpine(streamClass=stream.Voice)
-                    newSpine1.insertPoint = i + 1
-                    newSpine1.parentSpine = currentSpine
-                    newSpine1.isFirstVoice = True
-                    newSpine2 = spineCollection.addSpine(streamClass=stream.Voice)
-                    newSpine2.insertPoint = i + 1
-                    newSpine2.parentSpine = currentSpine
-                    currentSpine.endingPosition = i  # will be overridden if merged
-                    currentSpine.childSpines.append(newSpine1)
-                    currentSpine.childSpines.append(newSpine2)
-
-                    currentSpine.childSpineInsertPoints[i] = (newSpine1, newSpine2)
-                    newSpineList.append(newSpine1)
-                    newSpineList.append(newSpine2)
-                elif thisEvent.contents == '*v':
-                    # merge spine -- n.b. we allow non-adjacent
-                    # lines to be merged. this is incorrect
-                    # per humdrum syntax, but is easily done.
-                    if mergerActive is False:
-                        # assume that previous spine continues
-                        if currentSpine.parentSpine is not None:
-                            mergerActive = currentSpine.parentSpine
-                        else:
-                            mergerActive = True
-                        currentSpine.endingPosition = i
+            currentSpine = currentSpineList[j]
+            if currentSpine is None:
+                # first event after a None = new spine because
+                # Humdrum does not require *+ at the beginning
+                currentSpine = spineCollection.addSpine()
+                currentSpine.insertPoint = position
+                currentSpineList[j] = currentSpine
+
+            currentSpine.append(thisEvent)
+            # currentSpine.id is always unique in a spineCollection
+            thisEvent.protoSpineId = currentSpine.id
+
+        # check for spinePathData
+        if spinePathData is False:
+            return currentSpineList
+
+        # note that nothing else can happen in an eventCollection
+        # except spine path data if any spine has spine path data.
+        # thus, this is illegal.  The C#4 will be ignored:
+        # *x     *x     C#4
+
+        newSpineList = common.defaultlist(lambda: None)
+        mergerActive = False
+        exchangeActive = False
+        for j in range(numColumns):
+            thisEvent = lineEvents[j] if j < len(lineEvents) else None
+            currentSpine = currentSpineList[j]
+
+            if thisEvent is None and currentSpine is not None:
+                # should this happen?
+                newSpineList.append(currentSpine)
+            elif thisEvent is None:
+                continue
+            elif thisEvent.contents == '*-':  # terminate spine
+                currentSpine.endingPosition = position
+            elif thisEvent.contents == '*^':  # split spine assume they are voices
+                newSpine1 = spineCollection.addSpine(streamClass=stream.Voice)
+                newSpine1.insertPoint = position + 1
+                newSpine1.parentSpine = currentSpine
+                newSpine1.isFirstVoice = True
+                newSpine2 = spineCollection.addSpine(streamClass=stream.Voice)
+                newSpine2.insertPoint = position + 1
+                newSpine2.parentSpine = currentSpine
+                currentSpine.endingPosition = position  # will be overridden if merged
+                currentSpine.childSpines.append(newSpine1)
+                currentSpine.childSpines.append(newSpine2)
+
+                currentSpine.childSpineInsertPoints[position] = (newSpine1, newSpine2)
+                newSpineList.append(newSpine1)
+                newSpineList.append(newSpine2)
+            elif thisEvent.contents == '*v':
+                # merge spine -- n.b. we allow non-adjacent
+                # lines to be merged. this is incorrect
+                # per humdrum syntax, but is easily done.
+                if mergerActive is False:
+                    # assume that previous spine continues
+                    if currentSpine.parentSpine is not None:
+                        mergerActive = currentSpine.parentSpine
                     else:
-                        # if second merger code is not found then
-                        # a one-to-one spine 'merge' occurs
-                        currentSpine.endingPosition = i
-                        # merge back to parent if possible:
-                        if currentSpine.parentSpine is not None:
-                            newSpineList.append(currentSpine.parentSpine)
-                        # or merge back to other spine's parent:
-                        elif mergerActive is not True:  # other spine parent set
-                            newSpineList.append(mergerActive)
-                        # or make a new spine...
-                        else:
-                            s = spineCollection.addSpine(streamClass=stream.Part)
-                            s.insertPoint = i
-                            newSpineList.append(s)
+                        mergerActive = True
+                    currentSpine.endingPosition = position
+                else:
+                    # if second merger code is not found then
+                    # a one-to-one spine 'merge' occurs
+                    currentSpine.endingPosition = position
+                    # merge back to parent if possible:
+                    if currentSpine.parentSpine is not None:
+                        newSpineList.append(currentSpine.parentSpine)
+                    # or merge back to other spine's parent:
+                    elif mergerActive is not True:  # other spine parent set
+                        newSpineList.append(mergerActive)
+                    # or make a new spine...
+                    else:
+                        s = spineCollection.addSpine(streamClass=stream.Part)
+                        s.insertPoint = position
+                        newSpineList.append(s)
 
-                        mergerActive = False
+                    mergerActive = False
 
-                elif thisEvent.contents == '*x':  # exchange spine
-                    if exchangeActive is False:
-                        exchangeActive = currentSpine
-                    else:
-                        # if second exchange is not found, then both
-                        # lines disappear and exception is raised
-                        # n.b. we allow more than one PAIR of exchanges
-                        # in a line so long as the first
-                        # is totally finished by the time the second happens
-                        newSpineList.append(currentSpine)
-                        newSpineList.append(exchangeActive)
-                        exchangeActive = False
-                else:  # null processing code '*'
+            elif thisEvent.contents == '*x':  # exchange spine
+                if exchangeActive is False:
+                    exchangeActive = currentSpine
+                else:
+                    # if second exchange is not found, then both
+                    # lines disappear and exception is raised
+                    # n.b. we allow more than one PAIR of exchanges
+                    # in a line so long as the first
+                    # is totally finished by the time the second happens
                     newSpineList.append(currentSpine)
+                    newSpineList.append(exchangeActive)
+                    exchangeActive = False
+            else:  # null processing code '*'
+                newSpineList.append(currentSpine)
 
-            if exchangeActive is not False:
-                raise HumdrumException('ProtoSpine found with unpaired exchange instruction '
-                                       + 'at line %d [%s]' % (i, thisEventCollection.events))
-            currentSpineList = newSpineList
-
-        return spineCollection
+        if exchangeActive is not False:
+            raise HumdrumException('ProtoSpine found with unpaired exchange instruction '
+                                   + 'at line %d [%s]' % (position, lineEvents))
+        return newSpineList
 
     def insertGlobalEvents(self):
         '''
@@ -725,8 +1380,10 @@ class HumdrumDataCollection:
         if insertList:
             self.stream.coreElementsChanged()
 
+        # after the other global events, even if the Parts are already in the Score
+        appendOffset = max((offset for offset, unused_el in insertList), default=0.0)
         for el in appendList:
-            self.stream.coreAppend(el)
+            self.stream.coreInsert(appendOffset, el)
 
         if appendList:
             self.stream.coreElementsChanged()
@@ -786,7 +1443,8 @@ class HumdrumFile(HumdrumDataCollection):
         super().__init__()
         self.filename = filename
 
-    def parseFilename(self, filename=None):
+    def parseFilename(self, filename=None, lazy=False, measureRange=None, parts=None,
+                      parallel=False, incremental=False):
         if filename is None:
             filename = self.filename
         if filename is None:
@@ -795,18 +1453,40 @@ class HumdrumFile(HumdrumDataCollection):
         if isinstance(filename, pathlib.Path):
             filename = str(filename)
         with open(filename, encoding='latin-1') as humFH:
-            self.eventList = self.parseFileHandle(humFH)
+            self.parseFileHandle(humFH, lazy=lazy, measureRange=measureRange, parts=parts,
+                                 parallel=parallel, incremental=incremental)
         # might raise IOError
 
-    def parseFileHandle(self, fileHandle):
+    def parseFileHandle(self, fileHandle, lazy=False, measureRange=None, parts=None,
+                        parallel=False, incremental=False):
         '''
         takes a fileHandle and returns a HumdrumCollection by calling parse()
+
+        If `incremental` is True, the lines are read from the fileHandle
+        as they are parsed; see :meth:`~HumdrumDataCollection.iterMeasures`.
         '''
+        if incremental and not lazy:
+            self.dataStream = fileHandle
+            return self.parse(measureRange=measureRange, parts=parts, incremental=True)
         spineDataCollection = []
         for line in fileHandle:
             spineDataCollection.append(line)
         self.dataStream = spineDataCollection
-        return self.parse()
+        return self.parse(lazy=lazy, measureRange=measureRange, parts=parts,
+                          parallel=parallel)
+
+
+def _dataCollectionToFrozenScore(dataCollection, measureRange=None, parts=None):
+    '''
+    Parse the lines of one section of an opus and return its Score frozen
+    into a pickle string.  Run in a separate process by
+    :meth:`HumdrumDataCollection.parseOpusDataCollections`.
+    '''
+    from music21 import freezeThaw
+    hdc = HumdrumDataCollection(dataCollection)
+    hdc.parse(measureRange=measureRange, parts=parts)
+    # the Score is not used again in this process, so it can be changed
+    return freezeThaw.StreamFreezer(hdc.stream, fastButUnsafe=True).writeStr(fmt='pickle')
 
 
 class HumdrumLine:
@@ -1056,6 +1736,8 @@ class HumdrumSpine:
         self.parsed = False
         self.measuresMoved = False
         self.insertionsDone = False
+        self.lastContainer = None
+        self.staves = None
 
         self._spineCollection = None
         self._spineType = None
@@ -1154,12 +1836,18 @@ class HumdrumSpine:
 
     spineType = property(_getSpineType, _setSpineType)
 
-    def moveElementsIntoMeasures(self, streamIn):
+    def moveElementsIntoMeasures(self, streamIn, fixFirstMeasure=True, hasMeasureOne=False):
         '''
         takes a parsed stream and moves the elements inside the
         measures.  Works with pickup measures, etc. Does not
         automatically create ties, etc...
 
+        If `fixFirstMeasure` is False, as for the later measures of a spine
+        when the spine is parsed a few measures at a time, the elements at
+        the start are not moved into the first measure and it is never taken
+        to be a pickup.  `hasMeasureOne` says that a measure 1 comes after
+        the elements of `streamIn`, so that a pickup measure is measure 0.
+
         Why not just use Stream.makeMeasures()? because
         humdrum measures contain extra information about barlines
         etc. and pickups are explicitly defined.
@@ -1203,7 +1891,6 @@ class HumdrumSpine:
         currentMeasure.number = 0
         currentMeasureNumber = 0
         currentMeasureOffset = 0
-        hasMeasureOne = False
         for el in streamIn:
             if 'Stream' in el.classes:
                 if currentMeasureNumber != 0 or currentMeasure:
@@ -1227,6 +1914,8 @@ class HumdrumSpine:
         streamOut.coreElementsChanged()
         if currentMeasure:
             streamOut.append(currentMeasure)
+        if not fixFirstMeasure:
+            return streamOut
 
         # move beginning stuff (Clefs, KeySig, etc.) to first measure...
         measureElements = streamOut.getElementsByClass('Measure')
@@ -1256,8 +1945,13 @@ class HumdrumSpine:
         Dummy method that pushes all these objects to HumdrumSpine.stream
         as ElementWrappers.  Should be overridden in
         specific Spine subclasses.
+
+        The state of the parse is kept on the spine, so that if parse is
+        called again after new events replace the eventList, it goes on
+        from where it stopped, as :meth:`HumdrumDataCollection.iterMeasures` does.
         '''
-        lastContainer = hdStringToMeasure('=0')
+        if not self.parsed:
+            self.lastContainer = hdStringToMeasure('=0')
 
         for event in self.eventList:
             eventC = str(event.contents)
@@ -1269,8 +1963,8 @@ class HumdrumSpine:
                 if eventC not in spinePathIndicators:
                     thisObject = MiscTandem(eventC)
             elif eventC.startswith('='):
-                lastContainer = hdStringToMeasure(eventC, lastContainer)
-                thisObject = lastContainer
+                self.lastContainer = hdStringToMeasure(eventC, self.lastContainer)
+                thisObject = self.lastContainer
             elif eventC.startswith('!'):
                 thisObject = SpineComment(eventC)
             else:
@@ -1281,6 +1975,7 @@ class HumdrumSpine:
             if thisObject is not None:
                 self.stream.coreAppend(thisObject)
         self.stream.coreElementsChanged()
+        self.parsed = True
 
 
 class KernSpine(HumdrumSpine):
@@ -1300,12 +1995,13 @@ class KernSpine(HumdrumSpine):
         self.desiredTupletDuration = 0.0
 
     def parse(self):
-        self.lastContainer = hdStringToMeasure('=0')
-        self.inTuplet = False
-        self.lastNote = None
-        self.currentBeamNumbers = 0
-        self.currentTupletDuration = 0.0
-        self.desiredTupletDuration = 0.0
+        if not self.parsed:
+            self.lastContainer = hdStringToMeasure('=0')
+            self.inTuplet = False
+            self.lastNote = None
+            self.currentBeamNumbers = 0
+            self.currentTupletDuration = 0.0
+            self.desiredTupletDuration = 0.0
 
         for event in self.eventList:
             # event is a SpineEvent object
@@ -1346,6 +2042,7 @@ class KernSpine(HumdrumSpine):
                 # traceback... environLocal.printDebug()
 
         self.stream.coreElementsChanged()
+        self.parsed = True
         # still to be done later... move things before first measure to first measure!
 
     def processNoteEvent(self, eventC):
@@ -1439,7 +2136,9 @@ class DynamSpine(HumdrumSpine):
     '''
 
     def parse(self):
-        thisContainer = None
+        # the measure that dynamics are put in is only added to the stream
+        # at the next barline
+        thisContainer = self.lastContainer
         for event in self.eventList:
             eventC = str(event.contents)  # is str already; just so Eclipse gives the right tools
             thisObject = None
@@ -1474,6 +2173,8 @@ class DynamSpine(HumdrumSpine):
                     thisContainer.coreAppend(thisObject)
 
         self.stream.coreElementsChanged()
+        self.lastContainer = thisContainer
+        self.parsed = True
 
 # END HUMDRUM SPINES
 
@@ -1825,10 +2526,12 @@ class SpineCollection:
         # print(positionDict)
         return positionDict
 
-    def moveObjectsToMeasures(self):
+    def moveObjectsToMeasures(self, hasMeasureOne=False):
         '''
         run moveElementsIntoMeasures for each HumdrumSpine
-        that is not a sub-spine.
+        that is not a sub-spine.  If the measures of a spine have already
+        been moved, its stream is taken to hold the measures that come next;
+        `hasMeasureOne` is passed on for the others.
 
         Also fixes up the tuplets using duration.TupletFixer
         '''
@@ -1836,7 +2539,10 @@ class SpineCollection:
 
         for thisSpine in self.spines:
             if thisSpine.parentSpine is None:
-                thisSpine.stream = thisSpine.moveElementsIntoMeasures(thisSpine.stream)
+                thisSpine.stream = thisSpine.moveElementsIntoMeasures(
+                    thisSpine.stream,
+                    fixFirstMeasure=not thisSpine.measuresMoved,
+                    hasMeasureOne=hasMeasureOne)
 
                 # fix tuplet groups
                 for m in thisSpine.stream.getElementsByClass('Measure'):
@@ -1851,7 +2557,8 @@ class SpineCollection:
         '''
         move :samp:`**dynam` and :samp:`**lyrics/**text` information to the appropriate staff.
 
-        Assumes that :samp:`*staff` is consistent through the spine.
+        Assumes that :samp:`*staff` is consistent through the spine; the staves
+        of the first :samp:`*staff` found are remembered in `thisSpine.staves`.
         '''
         kernStreams = {}
         for thisSpine in self.spines:
@@ -1859,12 +2566,14 @@ class SpineCollection:
                 continue
             if thisSpine.spineType != 'kern':
                 continue
-            for tandem in thisSpine.stream.getElementsByClass('MiscTandem'):
-                if not tandem.tandem.startswith('*staff'):
-                    continue
-                staffInfo = int(tandem.tandem[6:])  # single staff
+            if thisSpine.staves is None:
+                for tandem in thisSpine.stream.getElementsByClass('MiscTandem'):
+                    if not tandem.tandem.startswith('*staff'):
+                        continue
+                    thisSpine.staves = [int(tandem.tandem[6:])]  # single staff
+                    break
+            for staffInfo in thisSpine.staves or ():
                 kernStreams[staffInfo] = thisSpine.stream
-                break
 
         for thisSpine in self.spines:
             if thisSpine.parentSpine is not None:
@@ -1872,18 +2581,21 @@ class SpineCollection:
             if thisSpine.spineType == 'kern':
                 continue
 
-            stavesAppliedTo = []
             prioritiesToSearch = {}
-            for tandem in thisSpine.stream.recurse().getElementsByClass('MiscTandem'):
-                if tandem.tandem.startswith('*staff'):
-                    staffInfo = tandem.tandem[6:]  # could be multiple staves
-                    stavesAppliedTo = [int(x) for x in staffInfo.split('/')]
-                    break
+            if thisSpine.staves is None:
+                for tandem in thisSpine.stream.recurse().getElementsByClass('MiscTandem'):
+                    if tandem.tandem.startswith('*staff'):
+                        staffInfo = tandem.tandem[6:]  # could be multiple staves
+                        thisSpine.staves = [int(x) for x in staffInfo.split('/')]
+                        break
+            stavesAppliedTo = thisSpine.staves or []
             if thisSpine.spineType == 'dynam':
                 for dynamic in thisSpine.stream.flat:
                     if 'Dynamic' in dynamic.classes:
                         prioritiesToSearch[dynamic.humdrumPosition] = dynamic
                 for applyStaff in stavesAppliedTo:
+                    if applyStaff not in kernStreams:  # part not selected
+                        continue
                     applyStream = kernStreams[applyStaff]
                     for el in applyStream.recurse():
                         if el.priority not in prioritiesToSearch:
@@ -1901,6 +2613,8 @@ class SpineCollection:
                     if 'ElementWrapper' in text.classes:
                         prioritiesToSearch[text.humdrumPosition] = text.obj
                 for applyStaff in stavesAppliedTo:
+                    if applyStaff not in kernStreams:  # part not selected
+                        continue
                     applyStream = kernStreams[applyStaff]
                     for el in applyStream.recurse():
                         if el.priority in prioritiesToSearch:
@@ -2869,6 +3583,125 @@ class Test(unittest.TestCase):
         self.assertIsNotNone(md.composer)
         self.assertIn('Palestrina', md.composer)
 
+    def testLazyParse(self):
+        from music21 import converter
+        from music21 import corpus
+        fp = corpus.getWork('palestrina/agnus_0')[0]
+        s1 = converter.parse(fp, forceSource=True)
+        s2 = converter.parse(fp, lazy=True)
+        self.assertEqual(s1.metadata.composer, s2.metadata.composer)
+        self.assertEqual([p.id for p in s1.parts], [p.id for p in s2.parts])
+        self.assertTrue(all(p.hasDeferredElements for p in s2.parts))
+
+        notes1 = [(n.offset, n.nameWithOctave) for n in s1.parts[-1].flat.notes]
+        notes2 = [(n.offset, n.nameWithOctave) for n in s2.parts[-1].flat.notes]
+        self.assertEqual(notes1, notes2)
+        self.assertFalse(s2.parts[-1].hasDeferredElements)
+        self.assertEqual(s1.highestTime, s2.highestTime)
+        self.assertEqual(len(list(s1.recurse())), len(list(s2.recurse())))
+        # the elements were moved into the Part, not copied
+        for m in s2.parts[-1].getElementsByClass('Measure'):
+            self.assertEqual(m.sites.get(excludeNone=True), [s2.parts[-1]])
+
+    def testMeasureRangeAndParts(self):
+        from music21 import converter
+        from music21 import corpus
+        fp = corpus.getWork('bach/bwv277.krn')
+        s1 = converter.parse(fp, forceSource=True)
+        s2 = converter.parse(fp, measureRange=(3, 6), parts=[1])
+        self.assertEqual([p.id for p in s2.parts], [s1.parts[1].id])
+
+        measures1 = s1.parts[1].measures(3, 6).getElementsByClass('Measure')
+        measures2 = s2.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in measures1], [m.number for m in measures2])
+        self.assertEqual([n.nameWithOctave for n in measures1.flat.notes],
+                         [n.nameWithOctave for n in measures2.flat.notes])
+        self.assertEqual(measures2[0].offset, 0.0)
+        self.assertEqual(measures2[0].clef.name,
+                         s1.parts[1].recurse().getElementsByClass('Clef')[0].name)
+
+    def testIncrementalParse(self):
+        from music21 import converter
+        from music21 import corpus
+        fp = corpus.getWork('bach/bwv277.krn')
+        s1 = converter.parse(fp, forceSource=True)
+        s2 = converter.parse(fp, forceSource=True, incremental=True)
+        self.assertEqual(s1.metadata.title, s2.metadata.title)
+        self.assertEqual([p.id for p in s1.parts], [p.id for p in s2.parts])
+        for p1, p2 in zip(s1.parts, s2.parts):
+            measures1 = p1.getElementsByClass('Measure')
+            measures2 = p2.getElementsByClass('Measure')
+            self.assertEqual([(m.number, m.offset) for m in measures1],
+                             [(m.number, m.offset) for m in measures2])
+            self.assertEqual([(n.offset, n.nameWithOctave) for n in p1.flat.notes],
+                             [(n.offset, n.nameWithOctave) for n in p2.flat.notes])
+
+        s3 = converter.parse(fp, forceSource=True, incremental=True,
+                             measureRange=(3, 6), parts=[1])
+        measures1 = s1.parts[1].measures(3, 6).getElementsByClass('Measure')
+        measures3 = s3.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in measures1], [m.number for m in measures3])
+        self.assertEqual([n.nameWithOctave for n in measures1.flat.notes],
+                         [n.nameWithOctave for n in measures3.flat.notes])
+
+    def testIncrementalParseOpus(self):
+        hdc = HumdrumDataCollection(testFiles.multipartSanctus)
+        with self.assertRaises(HumdrumException):
+            for unused_measure in hdc.iterMeasures():
+                pass
+
+        # parse() parses the whole opus instead
+        op1 = HumdrumDataCollection(testFiles.multipartSanctus)
+        op1.parse()
+        op2 = HumdrumDataCollection(testFiles.multipartSanctus)
+        op2.parse(incremental=True)
+        self.assertIsInstance(op2.stream, stream.Opus)
+        self.assertEqual([[n.nameWithOctave for n in sc.flat.notes] for sc in op1.stream.scores],
+                         [[n.nameWithOctave for n in sc.flat.notes] for sc in op2.stream.scores])
+
+    def testParseOpusParallel(self):
+        from music21.common import parallel as commonParallel
+        # the workers cannot pickle classes from __main__
+        from music21.humdrum import spineParser
+
+        def sectionNotes(op):
+            return [[(n.offset, n.nameWithOctave, n.quarterLength) for n in sc.flat.notes]
+                    for sc in op.scores]
+
+        op1 = spineParser.HumdrumDataCollection(testFiles.multipartSanctus)
+        op1.parse()
+
+        # force worker processes even on a machine with one CPU
+        oldCpus = commonParallel.cpus
+        commonParallel.cpus = lambda: 2
+        try:
+            op2 = spineParser.HumdrumDataCollection(testFiles.multipartSanctus)
+            op2.parse(parallel=True)
+        finally:
+            commonParallel.cpus = oldCpus
+
+        self.assertIsInstance(op2.stream, stream.Opus)
+        self.assertEqual([sc.id for sc in op1.stream.scores],
+                         [sc.id for sc in op2.stream.scores])
+        self.assertEqual(sectionNotes(op1.stream), sectionNotes(op2.stream))
+        self.assertEqual([len(sc.recurse()) for sc in op1.stream.scores],
+                         [len(sc.recurse()) for sc in op2.stream.scores])
+
+    def testIncrementalParseNestedSplit(self):
+        hdc = HumdrumDataCollection(testFiles.strangeWTCOpening)
+        with self.assertRaises(HumdrumException):
+            for unused_measure in hdc.iterMeasures():
+                pass
+
+        # parse() parses the whole file instead
+        hdc1 = HumdrumDataCollection(testFiles.strangeWTCOpening)
+        hdc1.parse()
+        hdc2 = HumdrumDataCollection(testFiles.strangeWTCOpening)
+        hdc2.parse(incremental=True)
+        for p1, p2 in zip(hdc1.stream.parts, hdc2.stream.parts):
+            self.assertEqual([(n.offset, n.nameWithOctave) for n in p1.flat.notes],
+                             [(n.offset, n.nameWithOctave) for n in p2.flat.notes])
+
     def testFlavors(self):
         prevFlavor = flavors['JRP']
         flavors['JRP'] = False
@@ -24,13 +24,14 @@ library from 2001 see
 http://groups.google.com/group/alt.sources/msg/0c5fc523e050c35e
 '''
 __all__ = ['translate', 'realtime', 'percussion',
-           'MidiEvent', 'MidiFile', 'MidiTrack', 'MidiException',
+           'MidiEvent', 'MidiFile', 'MidiTrack', 'MidiTrackArray', 'MidiException',
            'DeltaTime',
            'MetaEvents', 'ChannelVoiceMessages', 'ChannelModeMessages',
            'SysExEvents'
            ]
 
 import io
+import mmap
 import re
 import os
 import string
@@ -68,6 +69,18 @@ class MidiException(exceptions21.Music21Exception):
 
 
 # ------------------------------------------------------------------------------
+def _importNumpy():
+    '''
+    Return the numpy module, for MidiTrackArray, or raise a MidiException
+    if it is not installed.
+    '''
+    from music21 import base
+    if 'numpy' in base._missingImport:
+        raise MidiException('Cannot use MidiTrackArray without numpy installed')
+    import numpy
+    return numpy
+
+
 def charToBinary(char):
     '''
     Convert a char into its binary representation. Useful for debugging.
@@ -215,6 +228,35 @@ def getVariableLengthNumber(midiBytes):
     raise MidiException('did not find the end of the number!')
 
 
+def getVariableLengthNumberAt(data, pos=0, end=None):
+    r'''
+    Read a variable length number, as in :func:`getVariableLengthNumber`, from
+    position `pos` of a bytes-like object `data` (bytes, memoryview, mmap...)
+    without copying it, and return the number and the position just after it.
+
+    >>> midi.getVariableLengthNumberAt(b'xx\xff\x7fy', 2)
+    (16383, 4)
+    >>> midi.getVariableLengthNumberAt(memoryview(b'A-u'))
+    (65, 1)
+
+    The number cannot run past `end`:
+
+    >>> midi.getVariableLengthNumberAt(b'\xff\x7f', 0, 1)
+    Traceback (most recent call last):
+    IndexError: index out of range
+    '''
+    if end is None:
+        end = len(data)
+    summation = 0
+    while pos < end:
+        x = data[pos]
+        pos += 1
+        summation = (summation << 7) + (x & 0x7F)
+        if not x & 0x80:
+            return summation, pos
+    raise IndexError('index out of range')
+
+
 def getNumbersAsList(midiBytes):
     r'''
     Translate each char into a number, return in a list.
@@ -414,6 +456,17 @@ class SysExEvents(_ContainsEnum):
 
 METAEVENT_MARKER = 0xFF
 
+# for looking up event types by value while reading, faster than calling the Enum
+_channelVoiceMessagesByValue = {e.value: e for e in ChannelVoiceMessages}
+_channelModeMessagesByValue = {e.value: e for e in ChannelModeMessages}
+_metaEventsByValue = {e.value: e for e in MetaEvents}
+_sysExEventsByValue = {e.value: e for e in SysExEvents}
+
+# chunk id and length, for b'MThd' and b'MTrk' chunks
+_chunkHeaderStruct = struct.Struct('>4sL')
+# format, number of tracks, and division, after the MThd chunk header
+_fileHeaderStruct = struct.Struct('>HHH')
+
 # ------------------------------------------------------------------------------
 
 
@@ -792,47 +845,61 @@ class MidiEvent:
         if len(midiBytes) < 2:
             raise ValueError(f'length of {midiBytes!r} must be at least 2')
 
-        byte0 = midiBytes[0]
-        byte1 = midiBytes[1]
+        pos = self._readChannelVoiceMessageAt(midiBytes[0], midiBytes, 1, len(midiBytes))
+        return midiBytes[pos:]
+
+    def _readChannelVoiceMessageAt(self, statusByte: int, data, pos: int, end: int) -> int:
+        '''
+        Set the type, channel, and data of this ChannelVoiceMessage from its
+        `statusByte` and the data bytes that start at `data[pos]`, and return
+        the position after them.
+        '''
+        # x, y, and z define characteristics of the first two chars
+        # for x: The left nybble (4 bits) contains the actual command, and the right nibble
+        # contains the midi channel number on which the command will be executed.
+        byte1 = data[pos]
         byte2 = 0
-        if len(midiBytes) > 2:  # very likely, but may be translating in pieces
-            byte2 = midiBytes[2]
+        if pos + 1 < end:  # very likely, but may be translating in pieces
+            byte2 = data[pos + 1]
 
-        msgNybble: int = byte0 & 0xF0  # 0x80, 0x90, 0xA0 ... 0xE0
-        channelNybble: int = byte0 & 0x0F  # 0-15
+        msgNybble: int = statusByte & 0xF0  # 0x80, 0x90, 0xA0 ... 0xE0
+        channelNybble: int = statusByte & 0x0F  # 0-15
 
         self.channel = channelNybble + 1
-        self.type = ChannelVoiceMessages(msgNybble)
+        msgType = _channelVoiceMessagesByValue.get(msgNybble)
+        if msgType is None:
+            raise ValueError(f'{msgNybble!r} is not a valid ChannelVoiceMessages')
+        self.type = msgType
 
         # environLocal.printDebug(['MidiEvent.read()', self.type])
-        if self.type in (ChannelVoiceMessages.PROGRAM_CHANGE,
-                         ChannelVoiceMessages.CHANNEL_KEY_PRESSURE):
+        if msgType in (ChannelVoiceMessages.PROGRAM_CHANGE,
+                       ChannelVoiceMessages.CHANNEL_KEY_PRESSURE):
             if byte1 > 127:
                 raise MidiException(
-                    f'Cannot have a {self.type!r} followed by a byte > 127: {byte1}')
-            self.data = byte1
-            return midiBytes[2:]
-        elif self.type == ChannelVoiceMessages.CONTROLLER_CHANGE:
+                    f'Cannot have a {msgType!r} followed by a byte > 127: {byte1}')
+            self.parameter1 = byte1
+            return pos + 1
+        elif msgType == ChannelVoiceMessages.CONTROLLER_CHANGE:
             specificDataSet = False
-            if ChannelModeMessages.hasValue(byte1):
-                self.type = ChannelModeMessages(byte1)
-                if self.type == ChannelModeMessages.LOCAL_CONTROL:
+            modeType = _channelModeMessagesByValue.get(byte1)
+            if modeType is not None:
+                self.type = modeType
+                if modeType == ChannelModeMessages.LOCAL_CONTROL:
                     specificDataSet = True
-                    self.data = (midiBytes[2] == 0x7F)
-                elif self.type == ChannelModeMessages.MONO_MODE_ON:
+                    self.data = (data[pos + 1] == 0x7F)
+                elif modeType == ChannelModeMessages.MONO_MODE_ON:
                     specificDataSet = True
                     # see http://midi.teragonaudio.com/tech/midispec/mono.htm
-                    self.data = midiBytes[2]
+                    self.data = data[pos + 1]
             if not specificDataSet:
                 self.parameter1 = byte1  # this is the controller id
                 self.parameter2 = byte2  # this is the controller value
-            return midiBytes[3:]
         else:
             # NOTE_ON and NOTE_OFF
             # next two bytes:  pitch, velocity
-            self.pitch = byte1
-            self.velocity = byte2
-            return midiBytes[3:]
+            self.parameter1 = byte1
+            self.parameter2 = byte2
+        return min(pos + 2, end)
 
     def read(self, midiBytes):
         r'''
@@ -857,69 +924,101 @@ class MidiEvent:
         >>> (0x9F & 0x0F) + 1  # getting the channel
         16
         '''
-        if len(midiBytes) < 2:
+        pos = self.readAt(midiBytes, 0)
+        return midiBytes[pos:]
+
+    def readAt(self, data, pos: int = 0, end: Optional[int] = None) -> int:
+        r'''
+        Read this event from a bytes-like object `data` (bytes, memoryview, mmap...),
+        starting at position `pos` and stopping before `end` (default, the end of
+        the data), and return the position just after the event.
+
+        Unlike :meth:`read`, this does not copy the rest of the data, so a whole
+        track can be read in one pass; only the data of meta and system exclusive
+        events is copied out.
+
+        >>> trackData = midi.intsToHexBytes([0x00, 0x90, 60, 120, 0x00, 0xFF, 0x03, 5])
+        >>> trackData += b'piano'
+        >>> mt = midi.MidiTrack(1)
+        >>> me1 = midi.MidiEvent(mt)
+        >>> me1.readAt(trackData, 1)
+        4
+        >>> me1
+        <MidiEvent NOTE_ON, t=0, track=1, channel=1, pitch=60, velocity=120>
+
+        >>> me2 = midi.MidiEvent(mt)
+        >>> me2.readAt(memoryview(trackData), 5)
+        13
+        >>> me2
+        <MidiEvent SEQUENCE_TRACK_NAME, t=0, track=1, channel=None, data=b'piano'>
+
+        A data byte where a status byte should be uses the last status byte
+        ("running status"):
+
+        >>> me3 = midi.MidiEvent(mt)
+        >>> me3.lastStatusByte = me1.lastStatusByte
+        >>> me3.readAt(midi.intsToHexBytes([62, 0]))
+        2
+        >>> me3
+        <MidiEvent NOTE_ON, t=0, track=1, channel=1, pitch=62, velocity=0>
+        '''
+        if end is None:
+            end = len(data)
+        if end - pos < 2:
             # often what we have here are null events:
             # the string is simply: 0x00
             environLocal.printDebug(
-                ['MidiEvent.read(): got bad data string', repr(midiBytes)])
-            return b''
+                ['MidiEvent.read(): got bad data string', repr(bytes(data[pos:end]))])
+            return end
 
         # x, y, and z define characteristics of the first two chars
         # for x: The left nybble (4 bits) contains the actual command, and the right nibble
         # contains the midi channel number on which the command will be executed.
-        byte0: int = midiBytes[0]  # extracting a single val from a byte makes it an int
+        byte0: int = data[pos]  # extracting a single val from a byte makes it an int
 
         # detect running status: if the status byte is less than 0x80, its
         # not a status byte, but a data byte
         if byte0 < 0x80:
             # environLocal.printDebug(['MidiEvent.read(): found running status even data',
             # 'self.lastStatusByte:', self.lastStatusByte])
-
             if self.lastStatusByte is not None:
-                rsb = bytes([self.lastStatusByte])
+                byte0 = self.lastStatusByte
             else:  # provide a default
-                rsb = b'\x90'
-            # add the running status byte to the front of the string
-            # and process as before
-            midiBytes = rsb + midiBytes
-            byte0 = midiBytes[0]
+                byte0 = 0x90
+            # the data bytes start right here
+            dataPos = pos
         else:
             # store last status byte
-            self.lastStatusByte = midiBytes[0]
+            self.lastStatusByte = byte0
+            dataPos = pos + 1
 
         msgType: int = byte0 & 0xF0  # bitwise and to derive message type w/o channel
 
-        byte1: int = midiBytes[1]
-
-        # environLocal.printDebug([
-        #    'MidiEvent.read(): trying to parse a MIDI event, looking at first two chars:',
-        #    'hex(byte0)', hex(byte0), 'hex(byte[1])', hex(byte[1]),])
-
-        if ChannelVoiceMessages.hasValue(msgType):
+        if msgType in _channelVoiceMessagesByValue:
             # NOTE_ON and NOTE_OFF and PROGRAM_CHANGE, PITCH_BEND, etc.
-            return self.parseChannelVoiceMessage(midiBytes)
+            return self._readChannelVoiceMessageAt(byte0, data, dataPos, end)
 
-        elif SysExEvents.hasValue(byte0):
-            self.type = SysExEvents(byte0)
-            length, midiBytesAfterLength = getVariableLengthNumber(midiBytes[1:])
-            self.data = midiBytesAfterLength[:length]
-            return midiBytesAfterLength[length:]
+        elif byte0 in _sysExEventsByValue:
+            self.type = _sysExEventsByValue[byte0]
+            length, dataPos = getVariableLengthNumberAt(data, dataPos, end)
+            self.data = bytes(data[dataPos:min(dataPos + length, end)])
+            return min(dataPos + length, end)
 
         # SEQUENCE_TRACK_NAME and other MetaEvents are here
         elif byte0 == METAEVENT_MARKER:  # 0xFF
-            if not MetaEvents.hasValue(byte1):
+            byte1: int = data[dataPos]
+            if byte1 not in _metaEventsByValue:
                 environLocal.printDebug(['unknown meta event: FF %02X' % byte1])
                 sys.stdout.flush()
                 raise MidiException('Unknown midi event type: FF %02X' % byte1)
-            self.type = MetaEvents(byte1)
-            length, midiBytesAfterLength = getVariableLengthNumber(midiBytes[2:])
-            self.data = midiBytesAfterLength[:length]
-            # return remainder
-            return midiBytesAfterLength[length:]
+            self.type = _metaEventsByValue[byte1]
+            length, dataPos = getVariableLengthNumberAt(data, dataPos + 1, end)
+            self.data = bytes(data[dataPos:min(dataPos + length, end)])
+            return min(dataPos + length, end)
         else:
             # an uncaught message
             environLocal.printDebug(['got unknown midi event type', hex(byte0),
-                                     'hex(midiBytes[1])', hex(midiBytes[1])])
+                                     'hex(midiBytes[1])', hex(data[dataPos])])
             raise MidiException(f'Unknown midi event type {hex(byte0)}')
 
     def getBytes(self):
@@ -1155,6 +1254,21 @@ class DeltaTime(MidiEvent):
         self.time, newBytes = getVariableLengthNumber(oldBytes)
         return self.time, newBytes
 
+    def readAt(self, data, pos: int = 0, end: Optional[int] = None) -> int:
+        r'''
+        Read the time from position `pos` of a bytes-like object `data` without
+        copying it, and return the position after the time.
+
+        >>> mt = midi.MidiTrack(1)
+        >>> dt = midi.DeltaTime(mt)
+        >>> dt.readAt(b'\x90<x\x82hello', 3)
+        5
+        >>> dt.time
+        360
+        '''
+        self.time, pos = getVariableLengthNumberAt(data, pos, end)
+        return pos
+
     def getBytes(self) -> bytes:
         r'''
         Convert the time integer into a set of bytes.
@@ -1265,54 +1379,71 @@ class MidiTrack(prebase.ProtoM21Object):
         :class:`~music21.midi.DeltaTime`
         and :class:`~music21.midi.MidiEvent` objects.
         '''
-        if not midiBytes[:4] == self.headerId:
+        pos = self.readAt(midiBytes, 0)
+        return midiBytes[pos:]  # remainder string after extracting track data
+
+    def readAt(self, data, pos: int = 0) -> int:
+        r'''
+        Read the track that starts at position `pos` of a bytes-like object
+        `data` (such as a memoryview or mmap of a whole MIDI file) and return the
+        position after it.  The events are read in place; only the track's
+        own `.data` is copied.
+
+        >>> fileData = b'junkMTrk\x00\x00\x00\x04\x00\xff/\x00MTrk'
+        >>> mt = midi.MidiTrack(1)
+        >>> mt.readAt(memoryview(fileData), 4)
+        16
+        >>> mt.events
+        [<MidiEvent DeltaTime, t=0, track=1, channel=None>,
+         <MidiEvent END_OF_TRACK, t=0, track=1, channel=None, data=b''>]
+        '''
+        if not data[pos:pos + 4] == self.headerId:
             raise MidiException('badly formed midi string: missing leading MTrk')
         # get the 4 chars after the MTrk encoding
-        length, midiBytes = getNumber(midiBytes[4:], 4)
+        unused_chunkId, length = _chunkHeaderStruct.unpack_from(data, pos)
         # environLocal.printDebug(['MidiTrack.read(): got chunk size', length])
 
         # all event data is in the track str
-        trackData = midiBytes[:length]
-        self.data = trackData
+        start = pos + 8
+        end = min(start + length, len(data))
+        self.data = bytes(data[start:end])
+        self.processDataToEvents(data, start, end)
+        return end
 
-        remainder = midiBytes[length:]
-        self.processDataToEvents(trackData)
-        return remainder  # remainder string after extracting track data
-
-    def processDataToEvents(self, trackData: bytes = b''):
+    def processDataToEvents(self, trackData=b'', start: int = 0, end: Optional[int] = None):
         '''
         Populate .events with trackData.  Called by .read()
+
+        `trackData` can be any bytes-like object; if `start` or `end` are given,
+        only the events between those positions are read.
         '''
-        time = 0  # a running counter of ticks
-        previousMidiEvent = None
-        while trackData:
+        if end is None:
+            end = len(trackData)
+        pos = start
+        events = self.events
+        lastStatusByte = None
+        while pos < end:
             # shave off the time stamp from the event
             delta_t = DeltaTime(track=self)
-            # return extracted time, as well as remaining bytes
-            dt, trackDataCandidate = delta_t.read(trackData)
-            # this is the offset that this event happens at, in ticks
-            timeCandidate = time + dt
+            # return position after the time
+            eventPos = delta_t.readAt(trackData, pos, end)
 
             # pass self to event, set this MidiTrack as the track for this event
             midiEvent = MidiEvent(track=self)
-            if previousMidiEvent is not None:  # set the last status byte
-                midiEvent.lastStatusByte = previousMidiEvent.lastStatusByte
+            midiEvent.lastStatusByte = lastStatusByte
             # some midi events may raise errors; simply skip for now
             try:
-                trackDataCandidate = midiEvent.read(trackDataCandidate)
+                pos = midiEvent.readAt(trackData, eventPos, end)
             except MidiException:
                 # assume that trackData, after delta extraction, is still correct
                 # environLocal.printDebug(['forced to skip event; delta_t:', delta_t])
-                # set to result after taking delta time
-                trackData = trackDataCandidate
+                # continue from the position after taking delta time
+                pos = eventPos
                 continue
-            # only set after trying to read, which may raise exception
-            time = timeCandidate
-            trackData = trackDataCandidate  # remainder bytes
             # only append if we get this far
-            self.events.append(delta_t)
-            self.events.append(midiEvent)
-            previousMidiEvent = midiEvent
+            events.append(delta_t)
+            events.append(midiEvent)
+            lastStatusByte = midiEvent.lastStatusByte
 
     def getBytes(self):
         r'''
@@ -1464,6 +1595,337 @@ class MidiTrack(prebase.ProtoM21Object):
         return post
 
 
+class MidiTrackArray(prebase.ProtoM21Object):
+    r'''
+    A compact alternative to :class:`MidiTrack` that stores its events in a
+    NumPy structured array, `.events`, with one row per event (there are no
+    DeltaTime rows) instead of a MidiEvent and a DeltaTime object per event.
+    Requires NumPy.
+
+    The fields of each row are:
+
+    * `tick`: the time of the event in ticks from the start of the track
+    * `type`: the status byte without the channel for channel messages
+      (the :class:`ChannelVoiceMessages` value; channel mode messages are
+      CONTROLLER_CHANGE), 0xFF for meta events, or the :class:`SysExEvents` value
+    * `channel`: the channel, 1-16, or 0 for meta and system exclusive events
+    * `data1`: the first data byte (the pitch of a note, the controller
+      of a controller change, the program of a program change),
+      or the :class:`MetaEvents` value of a meta event
+    * `data2`: the second data byte (the velocity of a note), or 0
+    * `payload`: the index in the list `.payloads` of the bytes of a meta or
+      system exclusive event, or -1
+
+    Read it from the data of a track, as with :meth:`MidiTrack.read`:
+
+    >>> mta = midi.MidiTrackArray(3)
+    >>> mta.read(b'MTrk\x00\x00\x00\x16\x00\xff\x03\x00\x00'
+    ...          + b'\xe0\x00@\x00\x90CZ\x88\x00\x80C\x00\x88\x00\xff/\x00')
+    b''
+    >>> mta
+    <music21.midi.MidiTrackArray 3 -- 5 events>
+    >>> mta.events.dtype.names
+    ('tick', 'type', 'channel', 'data1', 'data2', 'payload')
+    >>> mta.events['tick']
+    array([   0,    0,    0, 1024, 2048])
+    >>> [hex(t) for t in mta.events['type']]
+    ['0xff', '0xe0', '0x90', '0x80', '0xff']
+    >>> mta.events['data1']
+    array([ 3,  0, 67, 67, 47], dtype=uint8)
+    >>> mta.payloads
+    [b'', b'']
+    >>> mta.hasNotes()
+    True
+
+    It writes the same events (though not any running status) back as bytes
+    without making MidiEvent objects:
+
+    >>> mta.getBytes()
+    b'MTrk\x00\x00\x00\x16\x00\xff\x03\x00\x00\xe0\x00@\x00\x90CZ\x88\x00\x80C\x00\x88\x00\xff/\x00'
+
+    MidiEvents (with their times) are made only when asked for:
+
+    >>> mta.getTimedEvents(types=(midi.ChannelVoiceMessages.NOTE_ON,))
+    [(0, <MidiEvent NOTE_ON, t=0, track=3, channel=1, pitch=67, velocity=90>)]
+    >>> mta.toMidiTrack()
+    <music21.midi.MidiTrack 3 -- 10 events>
+
+    `midi.translate.midiTracksToStreams` can use MidiTrackArrays
+    in place of MidiTracks.
+    '''
+    headerId = b'MTrk'
+    dtype = [('tick', 'i8'), ('type', 'u1'), ('channel', 'u1'),
+             ('data1', 'u1'), ('data2', 'u1'), ('payload', 'i4')]
+
+    def __init__(self, index=0):
+        numpy = _importNumpy()
+        self.index = index
+        self.events = numpy.zeros(0, dtype=self.dtype)
+        self.payloads = []
+
+    def _reprInternal(self):
+        return '%d -- %d events' % (self.index, len(self.events))
+
+    @classmethod
+    def fromMidiTrack(cls, mt):
+        '''
+        Return a MidiTrackArray with the events of the MidiTrack `mt`.
+
+        >>> mt = midi.MidiTrack(2)
+        >>> noteOn = midi.MidiEvent(mt, type=midi.ChannelVoiceMessages.NOTE_ON, channel=3)
+        >>> noteOn.pitch = 60
+        >>> noteOn.velocity = 20
+        >>> mt.events = [midi.DeltaTime(mt, time=10), noteOn]
+        >>> mta = midi.MidiTrackArray.fromMidiTrack(mt)
+        >>> mta.events
+        array([(10, 144, 3, 60, 20, -1)],
+              dtype=[('tick', '<i8'), ('type', 'u1'), ('channel', 'u1'),
+                     ('data1', 'u1'), ('data2', 'u1'), ('payload', '<i4')])
+        '''
+        mta = cls(mt.index)
+        mta.read(mt.getBytes())
+        return mta
+
+    def read(self, midiBytes):
+        '''
+        Read the events of a track from bytes that start with b'MTrk', and
+        return the bytes after the track, as :meth:`MidiTrack.read` does.
+        '''
+        pos = self.readAt(midiBytes, 0)
+        return midiBytes[pos:]
+
+    def readAt(self, data, pos: int = 0) -> int:
+        '''
+        Read the track that starts at position `pos` of a bytes-like object `data`
+        and return the position after it, as :meth:`MidiTrack.readAt` does.
+
+        The events are read as :meth:`MidiTrack.processDataToEvents` reads them,
+        skipping the same unknown events, but straight into the arrays.
+        Events with too few bytes to read are left out.
+        '''
+        if not data[pos:pos + 4] == self.headerId:
+            raise MidiException('badly formed midi string: missing leading MTrk')
+        unused_chunkId, length = _chunkHeaderStruct.unpack_from(data, pos)
+        start = pos + 8
+        end = min(start + length, len(data))
+
+        numpy = _importNumpy()
+        ticks = []
+        types = []
+        channels = []
+        data1s = []
+        data2s = []
+        payloadIndices = []
+        payloads = []
+
+        tick = 0
+        lastStatusByte = None
+        pos = start
+        while pos < end:
+            delta, eventPos = getVariableLengthNumberAt(data, pos, end)
+            if end - eventPos < 2:
+                # a null event
+                break
+            statusByte = data[eventPos]
+            if statusByte < 0x80:  # running status
+                newLastStatusByte = lastStatusByte
+                statusByte = lastStatusByte if lastStatusByte is not None else 0x90
+                dataPos = eventPos
+            else:
+                newLastStatusByte = statusByte
+                dataPos = eventPos + 1
+
+            msgType = statusByte & 0xF0
+            if msgType != 0xF0:  # ChannelVoiceMessages
+                byte1 = data[dataPos]
+                if msgType in (0xC0, 0xD0):  # PROGRAM_CHANGE, CHANNEL_KEY_PRESSURE
+                    if byte1 > 127:
+                        pos = eventPos  # skip, as MidiTrack does
+                        continue
+                    byte2 = 0
+                    pos = dataPos + 1
+                else:
+                    byte2 = data[dataPos + 1] if dataPos + 1 < end else 0
+                    pos = min(dataPos + 2, end)
+                channel = (statusByte & 0x0F) + 1
+                payloadIndex = -1
+            else:
+                if statusByte in _sysExEventsByValue:
+                    msgType = statusByte
+                    byte1 = 0
+                    length, dataPos = getVariableLengthNumberAt(data, dataPos, end)
+                elif statusByte == METAEVENT_MARKER:
+                    msgType = statusByte
+                    byte1 = data[dataPos]
+                    if byte1 not in _metaEventsByValue:
+                        pos = eventPos
+                        continue
+                    length, dataPos = getVariableLengthNumberAt(data, dataPos + 1, end)
+                else:
+                    pos = eventPos
+                    continue
+                pos = min(dataPos + length, end)
+                byte2 = 0
+                channel = 0
+                payloadIndex = len(payloads)
+                payloads.append(bytes(data[dataPos:pos]))
+
+            tick += delta
+            lastStatusByte = newLastStatusByte
+            ticks.append(tick)
+            types.append(msgType)
+            channels.append(channel)
+            data1s.append(byte1)
+            data2s.append(byte2)
+            payloadIndices.append(payloadIndex)
+
+        events = numpy.zeros(len(ticks), dtype=self.dtype)
+        events['tick'] = ticks
+        events['type'] = types
+        events['channel'] = channels
+        events['data1'] = data1s
+        events['data2'] = data2s
+        events['payload'] = payloadIndices
+        self.events = events
+        self.payloads = payloads
+        return end
+
+    def getBytes(self):
+        r'''
+        Return the bytes of a MIDI track with the events in `.events`,
+        as :meth:`MidiTrack.getBytes` does, without making MidiEvent objects.
+
+        >>> mta = midi.MidiTrackArray(1)
+        >>> mta.getBytes()
+        b'MTrk\x00\x00\x00\x00'
+        '''
+        events = self.events
+        payloads = self.payloads
+        midiBytes = bytearray()
+        previousTick = 0
+        for tick, msgType, channel, byte1, byte2, payloadIndex in zip(
+                events['tick'].tolist(),
+                events['type'].tolist(),
+                events['channel'].tolist(),
+                events['data1'].tolist(),
+                events['data2'].tolist(),
+                events['payload'].tolist()):
+            midiBytes += putVariableLengthNumber(tick - previousTick)
+            previousTick = tick
+            if msgType < 0xF0:
+                if msgType in (0xC0, 0xD0):
+                    midiBytes += bytes([msgType + channel - 1, byte1])
+                else:
+                    midiBytes += bytes([msgType + channel - 1, byte1, byte2])
+            else:
+                payload = payloads[payloadIndex] if payloadIndex >= 0 else b''
+                if msgType == METAEVENT_MARKER:
+                    midiBytes += bytes([METAEVENT_MARKER, byte1])
+                else:
+                    midiBytes.append(msgType)
+                midiBytes += putVariableLengthNumber(len(payload))
+                midiBytes += payload
+        return self.headerId + putNumber(len(midiBytes), 4) + bytes(midiBytes)
+
+    def hasNotes(self):
+        '''
+        Return True/False if this track has any note-ons defined, as
+        :meth:`MidiTrack.hasNotes` does.
+
+        >>> midi.MidiTrackArray(1).hasNotes()
+        False
+        '''
+        events = self.events
+        return bool(((events['type'] == ChannelVoiceMessages.NOTE_ON)
+                     & (events['data2'] != 0)).any())
+
+    def getTimedEvents(self, types=None):
+        r'''
+        Return a list of tuples of (tick, MidiEvent), making a MidiEvent for
+        each row of `.events`, or only for those whose `type` is in `types`
+        (for meta events, `types` can have :class:`MetaEvents` values, which
+        select by `data1`).  These are the same as the events that
+        :meth:`MidiTrack.read` would make, with their times.
+
+        >>> mta = midi.MidiTrackArray(1)
+        >>> mta.read(b'MTrk\x00\x00\x00\x0c\x00\xc2\x05\x00\xff\x03\x04oboe')
+        b''
+        >>> mta.getTimedEvents()
+        [(0, <MidiEvent PROGRAM_CHANGE, t=0, track=1, channel=3, data=5>),
+         (0, <MidiEvent SEQUENCE_TRACK_NAME, t=0, track=1, channel=None, data=b'oboe'>)]
+        >>> mta.getTimedEvents(types=(midi.MetaEvents.SEQUENCE_TRACK_NAME,))
+        [(0, <MidiEvent SEQUENCE_TRACK_NAME, t=0, track=1, channel=None, data=b'oboe'>)]
+        '''
+        events = self.events
+        if types is not None:
+            channelTypes = [t for t in types if not isinstance(t, MetaEvents)]
+            metaTypes = [t for t in types if isinstance(t, MetaEvents)]
+            numpy = _importNumpy()
+            selected = numpy.isin(events['type'], channelTypes)
+            if metaTypes:
+                selected |= ((events['type'] == METAEVENT_MARKER)
+                             & numpy.isin(events['data1'], metaTypes))
+            events = events[selected]
+
+        timedEvents = []
+        payloads = self.payloads
+        for tick, msgType, channel, byte1, byte2, payloadIndex in zip(
+                events['tick'].tolist(),
+                events['type'].tolist(),
+                events['channel'].tolist(),
+                events['data1'].tolist(),
+                events['data2'].tolist(),
+                events['payload'].tolist()):
+            me = MidiEvent(track=self)
+            if msgType < 0xF0:
+                me.channel = channel
+                me.type = _channelVoiceMessagesByValue[msgType]
+                modeType = None
+                if msgType == ChannelVoiceMessages.CONTROLLER_CHANGE:
+                    modeType = _channelModeMessagesByValue.get(byte1)
+                if modeType is not None:
+                    me.type = modeType
+                if modeType == ChannelModeMessages.LOCAL_CONTROL:
+                    me.data = (byte2 == 0x7F)
+                elif modeType == ChannelModeMessages.MONO_MODE_ON:
+                    me.data = byte2
+                elif msgType in (0xC0, 0xD0):
+                    me.parameter1 = byte1
+                else:
+                    me.parameter1 = byte1
+                    me.parameter2 = byte2
+            elif msgType == METAEVENT_MARKER:
+                me.type = _metaEventsByValue[byte1]
+                me.data = payloads[payloadIndex]
+            else:
+                me.type = _sysExEventsByValue[msgType]
+                me.data = payloads[payloadIndex]
+            timedEvents.append((tick, me))
+        return timedEvents
+
+    def toMidiTrack(self):
+        r'''
+        Return a :class:`MidiTrack` with the events of this track, with
+        DeltaTimes between them.
+
+        >>> mta = midi.MidiTrackArray(1)
+        >>> mta.read(b'MTrk\x00\x00\x00\x04\x00\xff/\x00')
+        b''
+        >>> mta.toMidiTrack().events
+        [<MidiEvent DeltaTime, t=0, track=1, channel=None>,
+         <MidiEvent END_OF_TRACK, t=0, track=1, channel=None, data=b''>]
+        '''
+        mt = MidiTrack(self.index)
+        previousTick = 0
+        for tick, me in self.getTimedEvents():
+            mt.events.append(DeltaTime(mt, time=tick - previousTick))
+            me.track = mt
+            mt.events.append(me)
+            previousTick = tick
+        mt.data = self.getBytes()[8:]
+        return mt
+
+
 class MidiFile(prebase.ProtoM21Object):
     '''
     Low-level MIDI file writing, emulating methods from normal Python files.
@@ -1545,37 +2007,75 @@ class MidiFile(prebase.ProtoM21Object):
         '''
         self.file.close()
 
-    def read(self):
+    def read(self, asArrays=False):
         '''
         Read and parse MIDI data stored in a file.
-        '''
-        self.readstr(self.file.read())
 
-    def readstr(self, midiBytes):
+        A file on disk is memory-mapped and read in place, from its start,
+        rather than read into memory first.
+
+        If `asArrays` is True, the tracks are read as :class:`MidiTrackArray` objects.
         '''
+        try:
+            mapped = mmap.mmap(self.file.fileno(), 0, access=mmap.ACCESS_READ)
+        except (AttributeError, OSError, ValueError, io.UnsupportedOperation):
+            # a file-like object without a file, or an empty file
+            self.readstr(self.file.read(), asArrays=asArrays)
+            return
+        try:
+            self.readstr(mapped, asArrays=asArrays)
+        finally:
+            try:
+                mapped.close()
+            except BufferError:  # pragma: no cover
+                pass  # still referenced from a traceback; closed when collected
+
+    def readstr(self, midiBytes, asArrays=False):
+        r'''
         Read and parse MIDI data as a bytes, putting the
         data in `.ticksPerQuarterNote` and a list of
         `MidiTrack` objects in the attribute `.tracks`.
 
-        The name readstr is a carryover from Python 2.  It works on bytes objects, not strings
+        The name readstr is a carryover from Python 2.  It works on bytes objects, not strings.
+        Any other bytes-like object, such as a memoryview or mmap, can be
+        given; the data is read in place without being copied.
+
+        If `asArrays` is True, the tracks are compact :class:`MidiTrackArray`
+        objects, which keep their events in NumPy arrays, instead of MidiTracks.
+        They can be written back with :meth:`writestr` as well.
+
+        >>> midiBytes = (b'MThd\x00\x00\x00\x06\x00\x01\x00\x01\x04\x00'
+        ...              + b'MTrk\x00\x00\x00\x0c\x00\x90<d\x88\x00<\x00\x00\xff/\x00')
+        >>> mf = midi.MidiFile()
+        >>> mf.readstr(midiBytes, asArrays=True)
+        >>> mf.tracks
+        [<music21.midi.MidiTrackArray 0 -- 3 events>]
+        >>> mf.tracks[0].events['data2']
+        array([100,   0,   0], dtype=uint8)
+
+        The running status of the second note is written out in full:
+
+        >>> mf.writestr()[-13:]
+        b'\x00\x90<d\x88\x00\x90<\x00\x00\xff/\x00'
         '''
-        if not midiBytes[:4] == b'MThd':
-            raise MidiException('badly formatted midi bytes, got: %s' % midiBytes[:20])
+        with memoryview(midiBytes) as midiView:
+            self._readView(midiView, MidiTrackArray if asArrays else MidiTrack)
 
-        # we step through the str src, chopping off characters as we go
-        # and reassigning to str
-        length, midiBytes = getNumber(midiBytes[4:], 4)
+    def _readView(self, midiView, trackClass=None):
+        if trackClass is None:
+            trackClass = MidiTrack
+        if not midiView[:4] == b'MThd':
+            raise MidiException('badly formatted midi bytes, got: %s' % bytes(midiView[:20]))
+
+        unused_chunkId, length = _chunkHeaderStruct.unpack_from(midiView, 0)
         if length != 6:
             raise MidiException('badly formatted midi bytes')
 
-        midiFormatType, midiBytes = getNumber(midiBytes, 2)
+        midiFormatType, numTracks, division = _fileHeaderStruct.unpack_from(midiView, 8)
         self.format = midiFormatType
         if midiFormatType not in (0, 1):
             raise MidiException('cannot handle midi file format: %s' % format)
 
-        numTracks, midiBytes = getNumber(midiBytes, 2)
-        division, midiBytes = getNumber(midiBytes, 2)
-
         # very few midi files seem to define ticksPerSecond
         if division & 0x8000:
             framesPerSecond = -((division >> 8) | -0x80)
@@ -1592,9 +2092,10 @@ class MidiFile(prebase.ProtoM21Object):
         # 'with specified number of tracks:', numTracks, 'ticksPerSecond:', self.ticksPerSecond,
         # 'ticksPerQuarterNote:', self.ticksPerQuarterNote])
 
+        pos = 14
         for i in range(numTracks):
-            trk = MidiTrack(i)  # sets the MidiTrack index parameters
-            midiBytes = trk.read(midiBytes)  # pass all the remaining bytes, reassigning
+            trk = trackClass(i)  # sets the MidiTrack index parameters
+            pos = trk.readAt(midiView, pos)  # read in place, moving to the next track
             self.tracks.append(trk)
 
     def write(self):
@@ -1941,6 +2442,28 @@ class Test(unittest.TestCase):
         #    print(n, n.quarterLength)
         # s.show()
 
+    def testMidiTrackArray(self):
+        dirLib = common.getSourceFilePath() / 'midi' / 'testPrimitive'
+        # test09 uses running status; test12 has channel mode messages
+        for fileName in ('test09.mid', 'test12.mid'):
+            with open(dirLib / fileName, 'rb') as f:
+                midiBytes = f.read()
+            mf = MidiFile()
+            mf.readstr(midiBytes)
+            mfArrays = MidiFile()
+            mfArrays.readstr(midiBytes, asArrays=True)
+            self.assertEqual(len(mf.tracks), len(mfArrays.tracks))
+            for mt, mta in zip(mf.tracks, mfArrays.tracks):
+                self.assertIsInstance(mta, MidiTrackArray)
+                self.assertEqual(mt.hasNotes(), mta.hasNotes())
+                self.assertEqual([repr(e) for e in mt.events],
+                                 [repr(e) for e in mta.toMidiTrack().events])
+                # bytes round-trip to the same events
+                mtaAgain = MidiTrackArray(mta.index)
+                mtaAgain.read(mta.getBytes())
+                self.assertEqual(mta.events.tolist(), mtaAgain.events.tolist())
+                self.assertEqual(mta.payloads, mtaAgain.payloads)
+
 
 # ------------------------------------------------------------------------------
 # define presented order in documentation
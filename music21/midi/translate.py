@@ -230,24 +230,27 @@ def getEndEvents(mt=None, channel=1):
 # Multi-object conversion
 
 
-def music21ObjectToMidiFile(music21Object):
+def music21ObjectToMidiFile(music21Object, *, asArrays=False):
     '''
     Either calls streamToMidiFile on the music21Object or
     puts a copy of that object into a Stream (so as
     not to change activeSites, etc.) and calls streamToMidiFile on
     that object.
+
+    If `asArrays` is True, the tracks are made in bulk as
+    :class:`~music21.midi.MidiTrackArray` objects (see streamToMidiFile).
     '''
     classes = music21Object.classes
     if 'Stream' in classes:
         if music21Object.atSoundingPitch is False:
             music21Object = music21Object.toSoundingPitch()
 
-        return streamToMidiFile(music21Object)
+        return streamToMidiFile(music21Object, asArrays=asArrays)
     else:
         m21ObjectCopy = copy.deepcopy(music21Object)
         s = stream.Stream()
         s.insert(0, m21ObjectCopy)
-        return streamToMidiFile(s)
+        return streamToMidiFile(s, asArrays=asArrays)
 
 
 # ------------------------------------------------------------------------------
@@ -681,6 +684,98 @@ def instrumentToMidiEvents(inputM21,
 # ------------------------------------------------------------------------------
 # Meta events
 
+def eventsInTickRange(notes, metaEvents, tickRange):
+    '''
+    Given the `notes` from :func:`getNotesFromEvents` and the `metaEvents`
+    from :func:`getMetaEvents`, return those in `tickRange`, a tuple of a first
+    tick and a tick to stop before (None for the end), with their times moved
+    so that the first tick is 0.  Notes are kept if they start in the range.
+    The last TimeSignature, KeySignature, MetronomeMark and Instrument before
+    the range are kept at 0.
+
+    >>> mt = midi.MidiTrack(1)
+    >>> noteOn = midi.MidiEvent(mt, type=midi.ChannelVoiceMessages.NOTE_ON)
+    >>> noteOff = midi.MidiEvent(mt, type=midi.ChannelVoiceMessages.NOTE_OFF)
+    >>> notes = [((0, noteOn), (100, noteOff)), ((200, noteOn), (300, noteOff))]
+    >>> metaEvents = [(0, meter.TimeSignature('3/4')), (0, tempo.MetronomeMark(number=60)),
+    ...               (100, meter.TimeSignature('2/4'))]
+    >>> notes, metaEvents = midi.translate.eventsInTickRange(notes, metaEvents, (150, None))
+    >>> [(on[0], off[0]) for on, off in notes]
+    [(50, 150)]
+    >>> metaEvents
+    [(0, <music21.tempo.MetronomeMark larghetto Quarter=60>),
+     (0, <music21.meter.TimeSignature 2/4>)]
+    '''
+    startTick, endTick = tickRange
+    notesInRange = []
+    for (t, e), (tOff, eOff) in notes:
+        if t < startTick or (endTick is not None and t >= endTick):
+            continue
+        notesInRange.append(((t - startTick, e), (tOff - startTick, eOff)))
+
+    lastBeforeStart = {}
+    metaEventsInRange = []
+    for t, obj in metaEvents:
+        if t < startTick:
+            for className in ('TimeSignature', 'KeySignature', 'MetronomeMark', 'Instrument'):
+                if className in obj.classes:
+                    lastBeforeStart.pop(className, None)  # keep them in order
+                    lastBeforeStart[className] = obj
+                    break
+        elif endTick is None or t < endTick:
+            metaEventsInRange.append((t - startTick, obj))
+    return notesInRange, [(0, obj) for obj in lastBeforeStart.values()] + metaEventsInRange
+
+
+def measureRangeToTickRange(midiTracks, ticksPerQuarter, measureRange):
+    '''
+    Return the tickRange for :func:`eventsInTickRange` of `measureRange`, a tuple
+    of the first and last measure numbers (None for the start or the end).
+    MIDI files have no measures, so they are counted from 1 at tick 0 using
+    the time signatures in any of `midiTracks` (4/4 before the first one).
+
+    >>> mt = midi.MidiTrack(1)
+    >>> midi.translate.measureRangeToTickRange([mt], 1024, (3, 4))
+    (8192, 16384)
+    >>> mt.events = midi.translate.timeSignatureToMidiEvents(meter.TimeSignature('3/4'))
+    >>> midi.translate.measureRangeToTickRange([mt], 1024, (3, None))
+    (6144, None)
+    >>> midi.translate.measureRangeToTickRange([mt], 1024, (None, 2))
+    (0, 6144)
+    '''
+    from music21.midi import MetaEvents
+
+    timeSignatureChanges = []
+    for mt in midiTracks:
+        for t, e in _getTimeForEventsOfTypes(mt, (MetaEvents.TIME_SIGNATURE,)):
+            if e.type == MetaEvents.TIME_SIGNATURE:
+                timeSignatureChanges.append((t, midiEventsToTimeSignature(e)))
+    timeSignatureChanges.sort(key=lambda tAndTs: tAndTs[0])
+
+    numberStart, numberEnd = measureRange
+    if numberStart is None:
+        numberStart = 1
+    barTicks = 4 * ticksPerQuarter
+    tsIndex = 0
+    tick = 0
+    number = 1
+    startTick = 0
+    while True:
+        while (tsIndex < len(timeSignatureChanges)
+               and timeSignatureChanges[tsIndex][0] <= tick):
+            ts = timeSignatureChanges[tsIndex][1]
+            barTicks = int(round(ts.barDuration.quarterLength * ticksPerQuarter))
+            tsIndex += 1
+        if number == numberStart:
+            startTick = tick
+        if number >= numberStart and numberEnd is None:
+            return (startTick, None)
+        if numberEnd is not None and number > numberEnd:
+            return (startTick, tick)
+        tick += barTicks
+        number += 1
+
+
 def midiEventsToInstrument(eventList):
     '''
     Convert a single MIDI event into a music21 Instrument object.
@@ -1162,6 +1257,81 @@ def streamToPackets(s: stream.Stream,
     return packetsByOffset
 
 
+def _allocateChannel(start, end, centShift, initChannel, channelsDynamic,
+                     channelEvents, centShiftChannelEvents):
+    '''
+    Find the channel for a note sounding from tick `start` to tick `end` with a
+    pitch bend of `centShift` cents (or None), as :func:`assignPacketsToChannels`
+    does for each note-on, and record the note in `channelEvents` (a dict whose
+    keys are (start, stop, channel) and whose values are the lists of the cent
+    shifts sounding in that span) and `centShiftChannelEvents` (the set of keys
+    of `channelEvents` with cent shifts).
+
+    The note stays in `initChannel` unless it overlaps a note with a different
+    pitch bend, when it moves to the first of `channelsDynamic` that
+    no overlapping note needs.  Returns a tuple of the channel and whether the
+    note was moved.
+
+    >>> channelEvents = {}
+    >>> centShiftChannelEvents = set()
+    >>> alloc = midi.translate._allocateChannel
+    >>> alloc(0, 1024, None, 1, [3, 4], channelEvents, centShiftChannelEvents)
+    (1, False)
+    >>> alloc(0, 1024, 50, 1, [3, 4], channelEvents, centShiftChannelEvents)
+    (3, True)
+    >>> alloc(512, 2048, None, 1, [3, 4], channelEvents, centShiftChannelEvents)
+    (4, True)
+    >>> alloc(1024, 2048, -50, 1, [3, 4], channelEvents, centShiftChannelEvents)
+    (3, True)
+    >>> channelEvents
+    {(0, 1024, 1): [], (0, 1024, 3): [50], (512, 2048, 4): [], (1024, 2048, 3): [-50]}
+
+    Raises a TranslateException if there are no free channels:
+
+    >>> alloc(0, 2048, 25, 1, [3, 4], channelEvents, centShiftChannelEvents)
+    Traceback (most recent call last):
+    music21.midi.translate.TranslateException: no unused channels available
+        for microtone/instrument assignment
+    '''
+    # find the channels of all past notes that are sounding and have a
+    # pitch bend, or all that are sounding if this note has a pitch bend;
+    # a note without a pitch bend need only look at the notes with one.
+    channelExclude = set()  # channels that cannot be used
+    for key in (channelEvents if centShift else centShiftChannelEvents):
+        otherStart, otherStop, usedChannel = key
+        # if offset (start time) is in this range of a found event
+        # or if any start or stop is within this span
+        if ((start <= otherStart < end)
+                or (start < otherStop < end)
+                or (otherStart <= start < otherStop)
+                or (otherStart < end < otherStop)):
+            channelExclude.add(usedChannel)
+
+    ch = initChannel
+    if channelExclude:
+        ch = None
+        # iterate in order over all channels: lower will be added first
+        for x in channelsDynamic:
+            if x not in channelExclude:
+                ch = x
+                break
+        if ch is None:
+            raise TranslateException(
+                'no unused channels available for microtone/instrument assignment')
+
+    # key includes channel, so that durations can span once in each channel
+    key = (start, end, ch)
+    if key not in channelEvents:
+        # need to count multiple instances of events on the same
+        # span and in the same channel (fine if all have the same pitch bend
+        channelEvents[key] = []
+    # always add the cent shift if it is not None
+    if centShift:
+        channelEvents[key].append(centShift)
+        centShiftChannelEvents.add(key)
+    return ch, bool(channelExclude)
+
+
 def assignPacketsToChannels(
         packets,
         channelByInstrument=None,
@@ -1197,6 +1367,7 @@ def assignPacketsToChannels(
 
     # allChannels = list(range(1, 10)) + list(range(11, 17))  # all but 10
     uniqueChannelEvents = {}  # dict of (start, stop, usedChannel) : channel
+    centShiftChannelEvents = set()  # the keys of those with a cent shift
     post = []
     usedTracks = []
 
@@ -1242,51 +1413,15 @@ def assignPacketsToChannels(
         # if necessary, add pitch change at start of Note,
         # cancel pitch change at end
         o = p['offset']
-        oEnd = p['offset'] + p['duration']
-
-        channelExclude = []  # channels that cannot be used
         centShift = p['centShift']  # may be None
-
-        # environLocal.printDebug(['\n\n', 'offset', o, 'oEnd', oEnd, 'centShift', centShift])
-
-        # iterate through all past events/channels, and find all
-        # that are active and have a pitch bend
-        for key in uniqueChannelEvents:
-            start, stop, usedChannel = key
-            # if offset (start time) is in this range of a found event
-            # or if any start or stop is within this span
-            # if o >= start and o < stop:  # found an offset that is used
-
-            if ((o <= start < oEnd)
-                    or (o < stop < oEnd)
-                    or (start <= o < stop)
-                    or (start < oEnd < stop)):
-                # if there is a cent shift active in the already used channel
-                # environLocal.printDebug(['matchedOffset overlap'])
-                centShiftList = uniqueChannelEvents[key]
-                if centShiftList:
-                    # only add if unique
-                    if usedChannel not in channelExclude:
-                        channelExclude.append(usedChannel)
-                # or if this event has shift, then we can exclude
-                # the channel already used without a shift
-                elif centShift:
-                    if usedChannel not in channelExclude:
-                        channelExclude.append(usedChannel)
-                        # cannot break early w/o sorting
-
-        # if no channels are excluded, get a new channel
-        # environLocal.printDebug(['post process channelExclude', channelExclude])
-        if channelExclude:  # only change if necessary
-            ch = None
-            # iterate in order over all channels: lower will be added first
-            for x in channelsDynamic:
-                if x not in channelExclude:
-                    ch = x
-                    break
-            if ch is None:
-                raise TranslateException(
-                    'no unused channels available for microtone/instrument assignment')
+        ch, channelChanged = _allocateChannel(o,
+                                              o + p['duration'],
+                                              centShift,
+                                              p['initChannel'],
+                                              channelsDynamic,
+                                              uniqueChannelEvents,
+                                              centShiftChannelEvents)
+        if channelChanged:  # only change if necessary
             p['midiEvent'].channel = ch
             # change channel of note off; this is used above to turn off bend
             p['midiEvent'].correspondingEvent.channel = ch
@@ -1309,7 +1444,6 @@ def assignPacketsToChannels(
                 post.append(pgmChangePacket)
 
         else:  # use the existing channel
-            ch = p['midiEvent'].channel
             # always set corresponding event to the same channel
             p['midiEvent'].correspondingEvent.channel = ch
 
@@ -1331,15 +1465,6 @@ def assignPacketsToChannels(
             # environLocal.printDebug(['adding pitch bend', me])
             # removal of pitch bend will happen above with note off
 
-        # key includes channel, so that durations can span once in each channel
-        key = (p['offset'], p['offset'] + p['duration'], ch)
-        if key not in uniqueChannelEvents:
-            # need to count multiple instances of events on the same
-            # span and in the same channel (fine if all have the same pitch bend
-            uniqueChannelEvents[key] = []
-        # always add the cent shift if it is not None
-        if centShift:
-            uniqueChannelEvents[key].append(centShift)
         post.append(p)  # add packet/ done after ch change or bend addition
         # environLocal.printDebug(['uniqueChannelEvents', uniqueChannelEvents])
 
@@ -1494,7 +1619,14 @@ def getTimeForEvents(
 ) -> List[Tuple[int, 'music21.midi.MidiEvent']]:
     '''
     Get a list of tuples of (tickTime, MidiEvent) from the events with time deltas.
+
+    `mt` can also be a :class:`~music21.midi.MidiTrackArray`, which has the times
+    already; a MidiEvent is made for each of its events.
     '''
+    from music21 import midi as midiModule
+    if isinstance(mt, midiModule.MidiTrackArray):
+        return mt.getTimedEvents()
+
     # get an abs start time for each event, discard deltas
     events = []
     currentTime = 0
@@ -1542,6 +1674,19 @@ def getTimeForEvents(
     return events
 
 
+def _getTimeForEventsOfTypes(mt, types):
+    '''
+    Like :func:`getTimeForEvents`, but if `mt` is a MidiTrackArray only
+    makes MidiEvents for events of `types`, which are all the other events
+    would be used for.  MidiTracks already have all their MidiEvents, so
+    it returns all of them.
+    '''
+    from music21 import midi as midiModule
+    if isinstance(mt, midiModule.MidiTrackArray):
+        return mt.getTimedEvents(types=types)
+    return getTimeForEvents(mt)
+
+
 def getNotesFromEvents(
     events: List[Tuple[int, 'music21.midi.MidiEvent']]
 ) -> List[Tuple[Tuple[int, 'music21.midi.MidiEvent'], Tuple[int, 'music21.midi.MidiEvent']]]:
@@ -1576,6 +1721,188 @@ def getNotesFromEvents(
     return notes
 
 
+def getNoteArrayFromEvents(events):
+    r'''
+    Pair the note-ons and note-offs in `events`, a NumPy array in the form of
+    :attr:`~music21.midi.MidiTrackArray.events`, all at once, and return a
+    NumPy structured array with a row for each note, in the order of the note-ons,
+    with the fields `onTick`, `offTick`, `pitch`, `velocity`, and `channel`.
+    Requires NumPy.
+
+    The notes are the same as those of :func:`getNotesFromEvents`: each note-on
+    (with a velocity) ends at the next note-on or note-off of the same
+    pitch and channel, unless that event already ended another note.
+
+    >>> mta = midi.MidiTrackArray(1)
+    >>> mta.read(b'MTrk\x00\x00\x00\x18\x00\x90<d\x00\x90@d\x83`\x80<\x00\x00\x90<Z'
+    ...          + b'\x83`@\x00\x00<\x00')
+    b''
+    >>> notes = midi.translate.getNoteArrayFromEvents(mta.events)
+    >>> notes.dtype.names
+    ('onTick', 'offTick', 'pitch', 'velocity', 'channel')
+    >>> notes.tolist()
+    [(0, 480, 60, 100, 1), (0, 960, 64, 100, 1), (480, 960, 60, 90, 1)]
+    '''
+    from music21 import base
+    if 'numpy' in base._missingImport:
+        raise TranslateException('Cannot run getNoteArrayFromEvents without numpy installed')
+    import numpy
+    from music21.midi import ChannelVoiceMessages
+
+    types = events['type']
+    noteEvents = events[(types == ChannelVoiceMessages.NOTE_ON)
+                        | (types == ChannelVoiceMessages.NOTE_OFF)]
+    isNoteOn = ((noteEvents['type'] == ChannelVoiceMessages.NOTE_ON)
+                & (noteEvents['data2'] != 0))
+
+    # put the events of each channel and pitch together, in order
+    order = numpy.lexsort((numpy.arange(len(noteEvents)),
+                           noteEvents['data1'],
+                           noteEvents['channel']))
+    keys = noteEvents['channel'][order].astype(numpy.int32) * 128 + noteEvents['data1'][order]
+    startsNote = isNoteOn[order]
+    sameKeyAsNext = numpy.zeros(len(order), dtype=bool)
+    sameKeyAsNext[:-1] = keys[:-1] == keys[1:]
+    # a note-on is ended by the next event of its pitch and channel, so in a run of
+    # note-ons, every other one (counting from the first) starts a note
+    followsNoteOn = numpy.zeros(len(order), dtype=bool)
+    followsNoteOn[1:] = startsNote[:-1] & sameKeyAsNext[:-1]
+    positions = numpy.arange(len(order))
+    runStarts = numpy.maximum.accumulate(
+        numpy.where(startsNote & ~followsNoteOn, positions, 0)) if len(order) else positions
+    isPaired = startsNote & sameKeyAsNext & ((positions - runStarts) % 2 == 0)
+
+    onIndices = order[isPaired]
+    offIndices = order[numpy.nonzero(isPaired)[0] + 1]
+    inOrder = numpy.argsort(onIndices, kind='stable')
+    onEvents = noteEvents[onIndices[inOrder]]
+    offEvents = noteEvents[offIndices[inOrder]]
+
+    notes = numpy.zeros(len(onEvents), dtype=[('onTick', 'i8'), ('offTick', 'i8'),
+                                              ('pitch', 'u1'), ('velocity', 'u1'),
+                                              ('channel', 'u1')])
+    notes['onTick'] = onEvents['tick']
+    notes['offTick'] = offEvents['tick']
+    notes['pitch'] = onEvents['data1']
+    notes['velocity'] = onEvents['data2']
+    notes['channel'] = onEvents['channel']
+    return notes
+
+
+def _noteEventsToArray(events):
+    '''
+    Return the note-on and note-off events of `events`, a list of (tick, MidiEvent)
+    tuples from :func:`getTimeForEvents`, as a NumPy array in the form
+    of :attr:`~music21.midi.MidiTrackArray.events`.
+    '''
+    import numpy
+    from music21 import midi as midiModule
+
+    noteTypes = (midiModule.ChannelVoiceMessages.NOTE_ON,
+                 midiModule.ChannelVoiceMessages.NOTE_OFF)
+    rows = [(t, e.type, e.channel or 0, e.pitch, e.velocity or 0, -1)
+            for t, e in events if e.type in noteTypes]
+    return numpy.array(rows, dtype=midiModule.MidiTrackArray.dtype)
+
+
+def quantizeQuarterLengths(quarterLengths, quarterLengthDivisors=None):
+    '''
+    Snap each of a NumPy array of (positive) `quarterLengths` to the nearest
+    multiple of one over one of the `quarterLengthDivisors`, all at once, and
+    return a NumPy array of the quantized values and a list of the signed
+    errors, rounded to 7 places.  These are the same as the offsets or
+    quarterLengths and the quantization errors that
+    :meth:`~music21.stream.Stream.quantize` sets.  Requires NumPy.
+
+    >>> import numpy
+    >>> values, errors = midi.translate.quantizeQuarterLengths(
+    ...     numpy.array([0.1, 0.49, 0.9, 1.49, 1.76]), [4])
+    >>> values.tolist()
+    [0.0, 0.5, 1.0, 1.5, 1.75]
+    >>> errors
+    [0.1, -0.01, -0.1, -0.01, 0.01]
+
+    The default divisors are `defaults.quantizationQuarterLengthDivisors`:
+
+    >>> values, errors = midi.translate.quantizeQuarterLengths(numpy.array([0.3, 0.8]))
+    >>> values
+    array([0.33333333, 0.75      ])
+    '''
+    from music21 import base
+    if 'numpy' in base._missingImport:
+        raise TranslateException('Cannot run quantizeQuarterLengths without numpy installed')
+    import numpy
+
+    if quarterLengthDivisors is None:
+        quarterLengthDivisors = defaults.quantizationQuarterLengthDivisors
+
+    # the same float operations as common.nearestMultiple, for each divisor,
+    # keeping the first of the (error, match, signedError) tuples in sorted order
+    bestErrors = bestMatches = bestSignedErrors = None
+    for div in quarterLengthDivisors:
+        unit = 1 / div
+        mult = numpy.floor(quarterLengths / float(unit))
+        halfUnit = unit / 2.0
+        matchLow = unit * mult
+        matchHigh = unit * (mult + 1)
+        isLow = (matchLow <= quarterLengths) & (quarterLengths <= matchLow + halfUnit)
+        matches = numpy.where(isLow, matchLow, matchHigh)
+        errors = numpy.array([round(e, 7) for e in numpy.where(
+            isLow, quarterLengths - matchLow, matchHigh - quarterLengths).tolist()])
+        signedErrors = numpy.array([round(e, 7) for e in numpy.where(
+            isLow, quarterLengths - matchLow, quarterLengths - matchHigh).tolist()])
+        if bestErrors is None:
+            bestErrors, bestMatches, bestSignedErrors = errors, matches, signedErrors
+            continue
+        isBetter = ((errors < bestErrors)
+                    | ((errors == bestErrors)
+                       & ((matches < bestMatches)
+                          | ((matches == bestMatches) & (signedErrors < bestSignedErrors)))))
+        bestErrors = numpy.where(isBetter, errors, bestErrors)
+        bestMatches = numpy.where(isBetter, matches, bestMatches)
+        bestSignedErrors = numpy.where(isBetter, signedErrors, bestSignedErrors)
+    return bestMatches, bestSignedErrors.tolist()
+
+
+def _gatherChords(onTicks, offTicks, ticksPerQuarter):
+    '''
+    Given the on and off ticks of notes, in order, return a list of lists
+    of the indices of the notes to make into a Note (one index) or Chord, and
+    whether voices are needed, because notes start together but end apart.
+    '''
+    groups = []
+    gathered = set()  # indices already put into chords
+    voicesRequired = False
+    # can set a tolerance for chordSubbing; here at 1/16th of a quarter
+    chunkTolerance = ticksPerQuarter / 16
+    numNotes = len(onTicks)
+    for i in range(numNotes):
+        if i in gathered:
+            continue
+        t = onTicks[i]
+        tOff = offTicks[i]
+        chordIndices = None
+        # go through all following notes, looking for other notes that start
+        # within a certain small time window to make into a chord; if we find a
+        # note with a different end time but the same start time, it needs
+        # a different voice
+        for j in range(i + 1, numNotes):
+            if abs(onTicks[j] - t) <= chunkTolerance:
+                # isolate case where end time is not w/n tolerance
+                if abs(offTicks[j] - tOff) > chunkTolerance:
+                    voicesRequired = True
+                    continue
+                if chordIndices is None:  # start a new one
+                    chordIndices = [i]
+                    gathered.add(i)
+                chordIndices.append(j)
+                gathered.add(j)
+            else:  # no more matches; assuming chord tones are contiguous
+                break
+        groups.append(chordIndices if chordIndices is not None else [i])
+    return groups, voicesRequired
+
+
 def getMetaEvents(events):
     from music21.midi import MetaEvents, ChannelVoiceMessages
 
@@ -1610,9 +1937,21 @@ def midiTrackToStream(mt,
                       ticksPerQuarter=None,
                       quantizePost=True,
                       inputM21=None,
+                      tickRange=None,
                       **keywords):
     '''
-    Note that quantization takes place in stream.py since it's useful not just for MIDI.
+    Make the Notes, Chords, and meta events (such as TimeSignatures) of
+    the MidiTrack or MidiTrackArray `mt` and put them into a Stream.
+
+    With NumPy installed, note-ons and note-offs are paired and offsets and durations
+    are quantized on arrays (see :func:`getNoteArrayFromEvents` and
+    :func:`quantizeQuarterLengths`), with the same results as
+    :meth:`~music21.stream.Stream.quantize`, and the Notes and Chords are made last.
+    Without it, quantization takes place in stream.py.
+
+    If `tickRange` is a tuple of a first tick and a tick to stop before (or None),
+    only the notes that start in it are made, moved so that the first tick is at 0;
+    see :func:`eventsInTickRange`.
 
     >>> import os
     >>> fp = common.getSourceFilePath() / 'midi' / 'testPrimitive' / 'test05.mid'
@@ -1631,6 +1970,8 @@ def midiTrackToStream(mt,
     '''
     # environLocal.printDebug(['midiTrackToStream(): got midi track: events',
     # len(mt.events), 'ticksPerQuarter', ticksPerQuarter])
+    from music21 import base
+    from music21 import midi as midiModule
 
     if inputM21 is None:
         s = stream.Stream()
@@ -1639,121 +1980,133 @@ def midiTrackToStream(mt,
 
     if ticksPerQuarter is None:
         ticksPerQuarter = defaults.ticksPerQuarter
+    quarterLengthDivisors = keywords.get('quarterLengthDivisors', None)
 
     # get events without DeltaTimes
-    events = getTimeForEvents(mt)
-
-    # need to build chords and notes
-    notes = getNotesFromEvents(events)
+    if isinstance(mt, midiModule.MidiTrackArray):
+        # only the meta events are needed as MidiEvents
+        events = mt.getTimedEvents(types=(midiModule.ChannelVoiceMessages.PROGRAM_CHANGE,
+                                          midiModule.MetaEvents.TIME_SIGNATURE,
+                                          midiModule.MetaEvents.KEY_SIGNATURE,
+                                          midiModule.MetaEvents.SET_TEMPO))
+    else:
+        events = getTimeForEvents(mt)
     metaEvents = getMetaEvents(events)
 
-    # first create meta events
-    for t, obj in metaEvents:
-        # environLocal.printDebug(['insert midi meta event:', t, obj])
-        s.coreInsert(t / ticksPerQuarter, obj)
-    s.coreElementsChanged()
-    # environLocal.printDebug([
-    #    'midiTrackToStream(): found notes ready for Stream import', len(notes)])
+    # need to build chords and notes; with numpy, note-ons and note-offs are
+    # paired, and times are quantized, with arrays, and Notes and Chords are made last
+    useArrays = 'numpy' not in base._missingImport
+    if useArrays:
+        import numpy
+        if isinstance(mt, midiModule.MidiTrackArray):
+            noteArray = getNoteArrayFromEvents(mt.events)
+        else:
+            noteArray = getNoteArrayFromEvents(_noteEventsToArray(events))
+        if tickRange is not None:
+            startTick, endTick = tickRange
+            inRange = noteArray['onTick'] >= startTick
+            if endTick is not None:
+                inRange &= noteArray['onTick'] < endTick
+            noteArray = noteArray[inRange]
+            noteArray['onTick'] -= startTick
+            noteArray['offTick'] -= startTick
+            unused_notes, metaEvents = eventsInTickRange([], metaEvents, tickRange)
+        onTicks = noteArray['onTick'].tolist()
+        offTicks = noteArray['offTick'].tolist()
+    else:  # pragma: no cover
+        notes = getNotesFromEvents(events)
+        if tickRange is not None:
+            notes, metaEvents = eventsInTickRange(notes, metaEvents, tickRange)
+        onTicks = [on[0] for on, unused_off in notes]
+        offTicks = [off[0] for unused_on, off in notes]
 
     # collect notes with similar start times into chords
-    # create a composite list of both notes and chords
-    # composite = []
-    chordSub = None
-    i = 0
-    iGathered = []  # store a lost of indexes of gathered values put into chords
-    voicesRequired = False
-    if len(notes) > 1:
-        # environLocal.printDebug(['\n', 'midiTrackToStream(): notes', notes])
-        while i < len(notes):
-            if i in iGathered:
-                i += 1
-                continue
-            # look at each note; get on time and event
-            on, off = notes[i]
-            t, unused_e = on
-            tOff, unused_eOff = off
-            # environLocal.printDebug(['on, off', on, off, 'i', i, 'len(notes)', len(notes)])
-
-            # go through all following notes; if there is only 1 note, this will
-            # not execute;
-            # looking for other events that start within a certain small time
-            # window to make into a chord
-            # if we find a note with a different end time but same start
-            # time, through into a different voice
-            for j in range(i + 1, len(notes)):
-                # look at each on time event
-                onSub, offSub = notes[j]
-                tSub, unused_eSub = onSub
-                tOffSub, unused_eOffSub = offSub
-
-                # can set a tolerance for chordSubbing; here at 1/16th
-                # of a quarter
-                chunkTolerance = ticksPerQuarter / 16
-                if abs(tSub - t) <= chunkTolerance:
-                    # isolate case where end time is not w/n tolerance
-                    if abs(tOffSub - tOff) > chunkTolerance:
-                        # need to store this as requiring movement to a diff
-                        # voice
-                        voicesRequired = True
-                        continue
-                    if chordSub is None:  # start a new one
-                        chordSub = [notes[i]]
-                        iGathered.append(i)
-                    chordSub.append(notes[j])
-                    iGathered.append(j)
-                    continue  # keep looping through events to see
-                    # if we can add more elements to this chord group
-                else:  # no more matches; assuming chordSub tones are contiguous
-                    break
-            # this comparison must be outside of j loop, as the case where we
-            # have the last note in a list of notes and the j loop does not
-            # execute; chordSub will be None
-            if chordSub is not None:
-                # composite.append(chordSub)
-                # create a chord here
-                c = chord.Chord()
-                midiEventsToChord(chordSub, ticksPerQuarter, c)
-                o = notes[i][0][0] / float(ticksPerQuarter)
-                c.midiTickStart = notes[i][0][0]
-
-                s.coreInsert(o, c)
-                # iSkip = len(chordSub)  # amount of accumulated chords
-                chordSub = None
-            else:  # just append the note, chordSub is None
-                # composite.append(notes[i])
-                # create a note here
-                n = note.Note()
-                midiEventsToNote(notes[i], ticksPerQuarter, n)
-                # the time is the first value in the first pair
-                # need to round, as floating point error is likely
-                o = notes[i][0][0] / float(ticksPerQuarter)
-                n.midiTickStart = notes[i][0][0]
-
-                s.coreInsert(o, n)
-                # iSkip = 1
-            # break  # exit secondary loop
-            i += 1
+    groups, voicesRequired = _gatherChords(onTicks, offTicks, ticksPerQuarter)
+    # environLocal.printDebug([
+    #    'midiTrackToStream(): found notes ready for Stream import', len(notes)])
 
-    elif len(notes) == 1:  # rare case of just one note
-        n = note.Note()
-        midiEventsToNote(notes[0], ticksPerQuarter, n)
-        # the time is the first value in the first pair
-        # need to round, as floating point error is likely
-        o = notes[0][0][0] / float(ticksPerQuarter)
-        n.midiTickStart = notes[i][0][0]
-        s.coreInsert(o, n)
-
-    s.coreElementsChanged()
-    # quantize to nearest 16th
-    if quantizePost:
-        if 'quarterLengthDivisors' in keywords:
-            quarterLengthDivisors = keywords['quarterLengthDivisors']
-        else:
-            quarterLengthDivisors = None
-        s.quantize(quarterLengthDivisors=quarterLengthDivisors,
-                   processOffsets=True,
-                   processDurations=True,
-                   inPlace=True)
+    if not useArrays:  # pragma: no cover
+        s.insertMany((t / ticksPerQuarter, obj) for t, obj in metaEvents)
+        offsetsAndElements = []  # inserted at once, in order, so that s stays sorted
+        for group in groups:
+            if len(group) == 1:
+                el = note.Note()
+                midiEventsToNote(notes[group[0]], ticksPerQuarter, el)
+            else:
+                el = chord.Chord()
+                midiEventsToChord([notes[i] for i in group], ticksPerQuarter, el)
+            el.midiTickStart = onTicks[group[0]]
+            offsetsAndElements.append((onTicks[group[0]] / float(ticksPerQuarter), el))
+        s.insertMany(offsetsAndElements)
+        # quantize to nearest 16th
+        if quantizePost:
+            s.quantize(quarterLengthDivisors=quarterLengthDivisors,
+                       processOffsets=True,
+                       processDurations=True,
+                       inPlace=True)
+    else:
+        # first create meta events
+        metaOffsets = numpy.array([t / float(ticksPerQuarter) for t, unused_obj in metaEvents])
+        metaErrors = [0] * len(metaEvents)
+        if quantizePost and metaEvents:
+            metaOffsets, metaErrors = quantizeQuarterLengths(metaOffsets, quarterLengthDivisors)
+        for (unused_t, obj), error in zip(metaEvents, metaErrors):
+            if error != 0:
+                obj.editorial.offsetQuantizationError = error
+        s.insertMany(zip(metaOffsets.tolist(), (obj for unused_t, obj in metaEvents)))
+
+        # the offset is the first note's on time; the duration of a Chord runs from
+        # the last note's on time to the first note's off time
+        firstIndices = [group[0] for group in groups]
+        lastIndices = [group[-1] for group in groups]
+        startTicks = noteArray['onTick'][firstIndices]
+        durationTicks = noteArray['offTick'][firstIndices] - noteArray['onTick'][lastIndices]
+        offsets = startTicks / float(ticksPerQuarter)
+        # zero durations probably should not happen; for now, substitute 1
+        quarterLengths = numpy.where(durationTicks != 0,
+                                     durationTicks / float(ticksPerQuarter),
+                                     1.0)
+        offsetErrors = durationErrors = [0] * len(groups)
+        # quantize to nearest 16th
+        if quantizePost and groups:
+            offsets, offsetErrors = quantizeQuarterLengths(offsets, quarterLengthDivisors)
+            quarterLengths, durationErrors = quantizeQuarterLengths(
+                numpy.maximum(quarterLengths, 0.0), quarterLengthDivisors)
+
+        from music21 import pitch
+        from music21 import volume
+        pitches = noteArray['pitch'].tolist()
+        velocities = noteArray['velocity'].tolist()
+        offsetsAndElements = []  # inserted at once, in order, so that s stays sorted
+        for group, offset, quarterLength, startTick, offsetError, durationError in zip(
+                groups, offsets.tolist(), quarterLengths.tolist(), startTicks.tolist(),
+                offsetErrors, durationErrors):
+            if len(group) == 1:
+                el = note.Note()
+                el.pitch.midi = pitches[group[0]]
+                el.volume.velocity = velocities[group[0]]
+                el.volume.velocityIsRelative = False  # not relative coming from MIDI
+            else:
+                el = chord.Chord()
+                chordPitches = []
+                volumes = []
+                for i in group:
+                    p = pitch.Pitch()
+                    p.midi = pitches[i]
+                    chordPitches.append(p)
+                    v = volume.Volume(velocity=velocities[i])
+                    v.velocityIsRelative = False  # velocity is absolute coming from MIDI
+                    volumes.append(v)
+                el.pitches = chordPitches
+                el.volume = volumes  # can set a list to volume property
+            el.duration.quarterLength = quarterLength
+            el.midiTickStart = startTick
+            if offsetError != 0:
+                el.editorial.offsetQuantizationError = offsetError
+            if durationError != 0:
+                el.editorial.quarterLengthQuantizationError = durationError
+            offsetsAndElements.append((offset, el))
+        s.insertMany(offsetsAndElements)
 
     if voicesRequired:
         # this procedure will make the appropriate rests
@@ -1876,23 +2229,42 @@ def packetStorageFromSubstreamList(
         trackId = i + 1
         subs = subs.flat
 
-        # get a first instrument; iterate over rest
-        instrumentStream = subs.iter.getElementsByClass('Instrument')
-
-        # if there is an Instrument object at the start, make instObj that instrument.
-        if instrumentStream and subs.elementOffset(instrumentStream[0]) == 0:
-            instObj = instrumentStream[0]
-        else:
-            instObj = None
-
         # store packets in dictionary; keys are trackIds
         packetStorage[trackId] = {
             'rawPackets': streamToPackets(subs, trackId=trackId),
-            'initInstrument': instObj,
+            'initInstrument': _getInitialInstrument(subs),
         }
     return packetStorage
 
 
+def _getInitialInstrument(s):
+    '''
+    Return the first Instrument of the flat Stream `s` if it is at offset 0,
+    otherwise None.
+    '''
+    # get a first instrument; iterate over rest
+    instrumentStream = s.iter.getElementsByClass('Instrument')
+
+    # if there is an Instrument object at the start, make instObj that instrument.
+    if instrumentStream and s.elementOffset(instrumentStream[0]) == 0:
+        return instrumentStream[0]
+    return None
+
+
+def _getInitialChannel(instObj, channelByInstrument):
+    '''
+    Return the channel for a track starting with the Instrument `instObj` (or None)
+    from the dictionary made by :func:`channelInstrumentData`.
+    '''
+    if instObj is None:
+        try:
+            return channelByInstrument[None]
+        except KeyError:  # pragma: no cover
+            return 1  # fallback, should not happen.
+    else:  # use midi program
+        return channelByInstrument[instObj.midiProgram]
+
+
 def updatePacketStorageWithChannelInfo(
         packetStorage: Dict[int, Dict[str, Any]],
         channelByInstrument: Dict[Union[int, None], int],
@@ -1904,45 +2276,24 @@ def updatePacketStorageWithChannelInfo(
     '''
     # update packets with first channel
     for unused_trackId, bundle in packetStorage.items():
-        # get instrument
-        instObj = bundle['initInstrument']
-        if instObj is None:
-            try:
-                initCh = channelByInstrument[None]
-            except KeyError:  # pragma: no cover
-                initCh = 1  # fallback, should not happen.
-        else:  # use midi program
-            initCh = channelByInstrument[instObj.midiProgram]
+        initCh = _getInitialChannel(bundle['initInstrument'], channelByInstrument)
         bundle['initChannel'] = initCh  # set for bundle too
 
         for rawPacket in bundle['rawPackets']:
             rawPacket['initChannel'] = initCh
 
 
-def streamHierarchyToMidiTracks(inputM21, acceptableChannelList=None):
+def _prepareSubstreamsForMidi(inputM21, acceptableChannelList=None):
     '''
-    Given a Stream, Score, Part, etc., that may have substreams (i.e.,
-    a hierarchy), return a list of :class:`~music21.midi.base.MidiTrack` objects.
-
-    acceptableChannelList is a list of MIDI Channel numbers that can be used or None.
-    If None, then 1-9, 11-16 are used (10 being reserved for percussion).
-
-    Called by streamToMidiFile()
-
-    The process:
-
-    1. makes a deepcopy of the Stream (Developer TODO: could this
-       be done with a shallow copy?)
-
-    2. we make a list of all instruments that are being used in the piece.
+    Make a deepcopy of the Stream `inputM21` ready for MIDI export and return a
+    tuple of the list of its substreams, one for each track, with ties stripped,
+    and the dictionary of channels by instrument program and the list of
+    dynamic channels from :func:`channelInstrumentData`.
     '''
     # makes a deepcopy
     s = _prepareStreamForMidi(inputM21)
     channelByInstrument, channelsDynamic = channelInstrumentData(s, acceptableChannelList)
 
-    # return a list of MidiTrack objects
-    midiTracks = []
-
     # TODO: may need to shift all time values to accommodate
     # Streams that do not start at same time
 
@@ -1958,6 +2309,31 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList=None):
     for subs in substreamList:
         subs.stripTies(inPlace=True, matchByPitch=False,
                         retainContainers=True)
+    return substreamList, channelByInstrument, channelsDynamic
+
+
+def streamHierarchyToMidiTracks(inputM21, acceptableChannelList=None):
+    '''
+    Given a Stream, Score, Part, etc., that may have substreams (i.e.,
+    a hierarchy), return a list of :class:`~music21.midi.base.MidiTrack` objects.
+
+    acceptableChannelList is a list of MIDI Channel numbers that can be used or None.
+    If None, then 1-9, 11-16 are used (10 being reserved for percussion).
+
+    Called by streamToMidiFile()
+
+    The process:
+
+    1. makes a deepcopy of the Stream (Developer TODO: could this
+       be done with a shallow copy?)
+
+    2. we make a list of all instruments that are being used in the piece.
+    '''
+    substreamList, channelByInstrument, channelsDynamic = _prepareSubstreamsForMidi(
+        inputM21, acceptableChannelList)
+
+    # return a list of MidiTrack objects
+    midiTracks = []
 
     packetStorage = packetStorageFromSubstreamList(substreamList)
     updatePacketStorageWithChannelInfo(packetStorage, channelByInstrument)
@@ -1994,32 +2370,424 @@ def streamHierarchyToMidiTracks(inputM21, acceptableChannelList=None):
     return midiTracks
 
 
+
+def _midiEventToArrayFields(me, payloads):
+    '''
+    Return a tuple of the `type`, `channel`, `data1`, `data2` and `payload`
+    fields of a :class:`~music21.midi.MidiTrackArray` row for the channel voice
+    message or meta event `me`, appending the data of a meta event to the
+    list `payloads`.
+
+    >>> payloads = []
+    >>> me = midi.MidiEvent(type=midi.ChannelVoiceMessages.PROGRAM_CHANGE, channel=2)
+    >>> me.data = 6
+    >>> midi.translate._midiEventToArrayFields(me, payloads)
+    (192, 2, 6, 0, -1)
+    >>> me = midi.MidiEvent(type=midi.MetaEvents.SEQUENCE_TRACK_NAME)
+    >>> me.data = 'Harpsichord'
+    >>> midi.translate._midiEventToArrayFields(me, payloads)
+    (255, 0, 3, 0, 0)
+    >>> payloads
+    [b'Harpsichord']
+    '''
+    from music21 import midi as midiModule
+    CVM = midiModule.ChannelVoiceMessages
+    if me.type in CVM:
+        if me.type in (CVM.PROGRAM_CHANGE, CVM.CHANNEL_KEY_PRESSURE):
+            return (me.type.value, me.channel, me.data, 0, -1)
+        return (me.type.value, me.channel, me.parameter1, me.parameter2, -1)
+    elif me.type in midiModule.MetaEvents:
+        payloads.append(me.data)
+        return (midiModule.METAEVENT_MARKER, 0, me.type.value, 0, len(payloads) - 1)
+    raise TranslateException(f'cannot export {me!r} in bulk')
+
+
+def _streamToNoteArray(s):
+    r'''
+    Gather what :func:`streamToPackets` makes packets from in the flat, sorted
+    Stream `s`, in bulk, and return a tuple of: a NumPy structured array of
+    the notes (one for each pitch of a Chord), a list of (tick, sequence, MidiEvent)
+    tuples for the other elements, such as TimeSignatures, and the list of
+    Instruments in `s`.
+
+    The fields of the array are `onTick` and `offTick`, the `pitch` and
+    `velocity`, the `centShift` from the MIDI pitch (0 if none), the
+    `onSequence` and `offSequence`, giving the order in which streamToPackets
+    would make the note-on and note-off packets, and the index of the
+    `instrument` before the note (-1 if none).
+
+    >>> s = stream.Stream()
+    >>> s.append(meter.TimeSignature('2/4'))
+    >>> s.append(note.Note('C4', quarterLength=0.5))
+    >>> s.append(chord.Chord(['E4', 'G`4']))
+    >>> volume.realizeVolume(s)
+    >>> notes, otherEvents, instruments = midi.translate._streamToNoteArray(s)
+    >>> notes[['onTick', 'offTick', 'pitch', 'centShift']].tolist()
+    [(0, 512, 60, 0), (512, 1536, 64, 0), (512, 1536, 67, -50)]
+    >>> notes[['onSequence', 'offSequence']].tolist()
+    [(1, 2), (3, 5), (4, 6)]
+    >>> otherEvents
+    [(0, 0, <MidiEvent TIME_SIGNATURE, t=0, track=None, channel=1, data=b'\x02\x02\x18\x08'>)]
+    '''
+    import numpy
+
+    offsets = []
+    quarterLengths = []
+    pitches = []
+    realizedVolumes = []
+    centShifts = []
+    onSequences = []
+    offSequences = []
+    instrumentIndices = []
+    otherEvents = []
+    instruments = []
+
+    lastInstrumentIndex = -1
+    sequence = 0
+    for el in s:
+        classes = el.classes
+        if 'Instrument' in classes:
+            instruments.append(el)  # store last instrument
+            lastInstrumentIndex = len(instruments) - 1
+
+        if 'Rest' in classes:
+            continue
+        elif 'Note' in classes:
+            components = [(el.pitch, el.volume)]
+        elif 'Chord' in classes:
+            if el.hasComponentVolumes():
+                components = [(n.pitch, n.volume) for n in el]
+            else:
+                chordVolume = el.volume
+                components = [(n.pitch, chordVolume) for n in el]
+        else:
+            midiEventList = elementToMidiEventList(el)
+            if midiEventList is None:
+                continue
+            o = offsetToMidiTicks(s.elementOffset(el))
+            for midiEvent in midiEventList:
+                otherEvents.append((o, sequence, midiEvent))
+                sequence += 1
+            continue
+
+        # all the note-ons of a chord are made before its note-offs
+        offset = s.elementOffset(el)
+        quarterLength = el.duration.quarterLength
+        numComponents = len(components)
+        for i, (p, vol) in enumerate(components):
+            offsets.append(offset)
+            quarterLengths.append(quarterLength)
+            pitches.append(p.midi)
+            realizedVolumes.append(vol.cachedRealized)
+            centShifts.append(0 if p.isTwelveTone() else p.getCentShiftFromMidi())
+            onSequences.append(sequence + i)
+            offSequences.append(sequence + numComponents + i)
+            instrumentIndices.append(lastInstrumentIndex)
+        sequence += 2 * numComponents
+
+    # ticks and velocities are rounded as offsetToMidiTicks,
+    # durationToMidiTicks, and noteToMidiEvents round them
+    ticksPerQuarter = defaults.ticksPerQuarter
+    onTicks = numpy.rint(numpy.array(offsets, dtype=float) * ticksPerQuarter)
+    durationTicks = numpy.rint(numpy.array(quarterLengths, dtype=float) * ticksPerQuarter)
+
+    notes = numpy.zeros(len(offsets), dtype=[('onTick', 'i8'), ('offTick', 'i8'),
+                                             ('pitch', 'i4'), ('velocity', 'i4'),
+                                             ('centShift', 'i4'),
+                                             ('onSequence', 'i8'), ('offSequence', 'i8'),
+                                             ('instrument', 'i8')])
+    notes['onTick'] = onTicks
+    notes['offTick'] = onTicks + durationTicks
+    notes['pitch'] = pitches
+    notes['velocity'] = numpy.rint(numpy.array(realizedVolumes, dtype=float) * 127)
+    notes['centShift'] = centShifts
+    notes['onSequence'] = onSequences
+    notes['offSequence'] = offSequences
+    notes['instrument'] = instrumentIndices
+    return notes, otherEvents, instruments
+
+
+def streamHierarchyToMidiTrackArrays(inputM21, acceptableChannelList=None):
+    '''
+    Given a Stream, Score, Part, etc., return a list of
+    :class:`~music21.midi.MidiTrackArray` objects with the same events, and so
+    the same bytes, as the MidiTracks from :func:`streamHierarchyToMidiTracks`.
+    Requires NumPy.
+
+    Rather than making packets and MidiEvent objects for every note, the ticks
+    of all the notes of a track are found at once and the events of each
+    track are sorted once into the rows of the array.  Channels and pitch bends
+    for microtones are assigned as :func:`assignPacketsToChannels` assigns them.
+
+    >>> s = stream.Stream()
+    >>> s.append(note.Note('C4'))
+    >>> s.append(chord.Chord(['E4', 'G~4']))
+    >>> mtaList = midi.translate.streamHierarchyToMidiTrackArrays(s)
+    >>> mtaList
+    [<music21.midi.MidiTrackArray 1 -- 11 events>]
+    >>> mtList = midi.translate.streamHierarchyToMidiTracks(s)
+    >>> mtaList[0].getBytes() == mtList[0].getBytes()
+    True
+
+    The quarter-tone is played on another channel with a pitch bend, which is
+    then reset:
+
+    >>> mta = mtaList[0]
+    >>> mta.events[['tick', 'type', 'channel', 'data1', 'data2']].tolist()
+    [(0, 255, 0, 3, 0), (0, 224, 1, 0, 64), (0, 144, 1, 60, 90),
+     (1024, 128, 1, 60, 0), (1024, 224, 2, 0, 48),
+     (1024, 144, 1, 64, 90), (1024, 144, 2, 68, 90),
+     (2048, 128, 1, 64, 0), (2048, 128, 2, 68, 0), (2048, 224, 2, 0, 64),
+     (3072, 255, 0, 47, 0)]
+    '''
+    from music21 import base
+    if 'numpy' in base._missingImport:
+        raise TranslateException(
+            'Cannot run streamHierarchyToMidiTrackArrays without numpy installed')
+    import numpy
+    from music21 import midi as midiModule
+
+    CVM = midiModule.ChannelVoiceMessages
+    # the values of MidiEvent.sortOrder
+    noteOffOrder = -20
+    pitchBendOrder = -10
+
+    substreamList, channelByInstrument, channelsDynamic = _prepareSubstreamsForMidi(
+        inputM21, acceptableChannelList)
+
+    # gather the notes and other events of each track, in the order
+    # that streamToPackets sorts them, as the rows of a table
+    trackData = []
+    for subs in substreamList:
+        subs = subs.flat
+        instObj = _getInitialInstrument(subs)
+        initChannel = _getInitialChannel(instObj, channelByInstrument)
+        notes, otherEvents, instruments = _streamToNoteArray(subs)
+
+        payloads = []
+        otherFields = [_midiEventToArrayFields(me, payloads) for unused_o, unused_seq, me
+                       in otherEvents]
+        numNotes = len(notes)
+        rows = numpy.zeros(2 * numNotes + len(otherEvents),
+                           dtype=[('tick', 'i8'), ('order', 'i8'), ('sequence', 'i8'),
+                                  ('note', 'i8'), ('type', 'u1'), ('channel', 'u1'),
+                                  ('data1', 'u1'), ('data2', 'u1'), ('payload', 'i4')])
+        noteOns = rows[:numNotes]
+        noteOffs = rows[numNotes:2 * numNotes]
+        others = rows[2 * numNotes:]
+        noteOns['tick'] = notes['onTick']
+        noteOns['sequence'] = notes['onSequence']
+        noteOns['type'] = CVM.NOTE_ON
+        noteOns['data2'] = notes['velocity']
+        noteOffs['tick'] = notes['offTick']
+        noteOffs['order'] = noteOffOrder
+        noteOffs['sequence'] = notes['offSequence']
+        noteOffs['type'] = CVM.NOTE_OFF
+        for noteRows in (noteOns, noteOffs):
+            noteRows['note'] = numpy.arange(numNotes)
+            noteRows['data1'] = notes['pitch']
+            noteRows['payload'] = -1
+        if otherEvents:
+            others['tick'] = [o for o, unused_seq, unused_me in otherEvents]
+            others['order'] = [me.sortOrder for unused_o, unused_seq, me in otherEvents]
+            others['sequence'] = [seq for unused_o, seq, unused_me in otherEvents]
+            others['note'] = -1
+            for i, field in enumerate(('type', 'channel', 'data1', 'data2', 'payload')):
+                others[field] = [fields[i] for fields in otherFields]
+            # all but note-ons and note-offs go in the initial channel
+            others['channel'][others['type'] < 0xF0] = initChannel
+
+        rows = rows[numpy.lexsort((rows['sequence'], rows['order'], rows['tick']))]
+        trackData.append({
+            'initInstrument': instObj,
+            'initChannel': initChannel,
+            'notes': notes,
+            'instruments': instruments,
+            'rows': rows,
+            'payloads': payloads,
+        })
+
+    # assign channels, with pitch bends and program changes where notes move
+    # channel, in the order that assignPacketsToChannels takes them.
+    # Without microtones, every note stays in the initial channel of its track.
+    pitchBendData = {}
+
+    def getPitchBendData(cents):
+        if cents not in pitchBendData:
+            me = midiModule.MidiEvent(type=CVM.PITCH_BEND)
+            me.setPitchBend(cents)
+            pitchBendData[cents] = (me.parameter1, me.parameter2)
+        return pitchBendData[cents]
+
+    anyCentShift = any(bundle['notes']['centShift'].any() for bundle in trackData)
+    channelEvents = {}
+    centShiftChannelEvents = set()
+    for bundle in trackData:
+        notes = bundle['notes']
+        rows = bundle['rows']
+        initChannel = bundle['initChannel']
+        channels = numpy.full(len(notes), initChannel)
+        # rows added in assignPacketsToChannels, as tuples of tick, order, and
+        # where the row is put among the other rows: the position of the
+        # row it is made for and whether it goes before (-2, -1) or after (1) it
+        addedRows = []
+        if anyCentShift:
+            onTicks = notes['onTick'].tolist()
+            offTicks = notes['offTick'].tolist()
+            centShifts = notes['centShift'].tolist()
+            instrumentIndices = notes['instrument'].tolist()
+            hasNoteOn = [False] * len(notes)
+            for position, (noteIndex, msgType) in enumerate(zip(rows['note'].tolist(),
+                                                                rows['type'].tolist())):
+                if noteIndex < 0:
+                    continue
+                centShift = centShifts[noteIndex]
+                if msgType == CVM.NOTE_ON:
+                    o = onTicks[noteIndex]
+                    ch, channelChanged = _allocateChannel(o,
+                                                          offTicks[noteIndex],
+                                                          centShift,
+                                                          initChannel,
+                                                          channelsDynamic,
+                                                          channelEvents,
+                                                          centShiftChannelEvents)
+                    channels[noteIndex] = ch
+                    hasNoteOn[noteIndex] = True
+                    if channelChanged and instrumentIndices[noteIndex] >= 0:
+                        inst = bundle['instruments'][instrumentIndices[noteIndex]]
+                        program = inst.midiProgram if inst.midiProgram is not None else 0
+                        addedRows.append((o, 0, position, -2,
+                                          CVM.PROGRAM_CHANGE, ch, program, 0))
+                    if centShift:
+                        addedRows.append((o, pitchBendOrder, position, -1,
+                                          CVM.PITCH_BEND, ch) + getPitchBendData(centShift))
+                elif centShift:
+                    # a note-off before its note-on (a note without duration)
+                    # resets the pitch bend of the channel the note-off was made in
+                    ch = channels[noteIndex] if hasNoteOn[noteIndex] else 1
+                    addedRows.append((offTicks[noteIndex], pitchBendOrder, position, 1,
+                                      CVM.PITCH_BEND, ch) + getPitchBendData(0))
+        bundle['channels'] = channels
+        bundle['addedRows'] = addedRows
+
+    midiTracks = []
+    for trackId, bundle in enumerate(trackData, start=1):
+        rows = bundle['rows']
+        payloads = bundle['payloads']
+        numRows = len(rows)
+        isNote = rows['note'] >= 0
+        rows['channel'][isNote] = bundle['channels'][rows['note'][isNote]]
+
+        addedRows = bundle['addedRows']
+        if numRows:
+            # a pitch bend of zero at the start, in the initial channel,
+            # after all the other events made for the track
+            addedRows.append((0, pitchBendOrder, numRows, 0, CVM.PITCH_BEND,
+                              bundle['initChannel']) + getPitchBendData(0))
+        tickOrder = numpy.zeros(numRows + len(addedRows),
+                                dtype=[('tick', 'i8'), ('order', 'i8'),
+                                       ('position', 'i8'), ('after', 'i8')])
+        tickOrder['tick'][:numRows] = rows['tick']
+        tickOrder['order'][:numRows] = rows['order']
+        tickOrder['position'][:numRows] = numpy.arange(numRows)
+        fieldNames = ('type', 'channel', 'data1', 'data2', 'payload')
+        fieldColumns = {name: [rows[name]] for name in fieldNames}
+        if addedRows:
+            added = numpy.array(addedRows, dtype='i8').reshape(-1, 8)
+            for i, name in enumerate(('tick', 'order', 'position', 'after')):
+                tickOrder[name][numRows:] = added[:, i]
+            for i, name in enumerate(fieldNames[:-1]):
+                fieldColumns[name].append(added[:, i + 4])
+            fieldColumns['payload'].append(numpy.full(len(addedRows), -1))
+        order = numpy.lexsort((tickOrder['after'], tickOrder['position'],
+                               tickOrder['order'], tickOrder['tick']))
+        ticks = tickOrder['tick'][order]
+        if len(ticks) and ticks[0] < 0:
+            raise TranslateException('got a negative delta time')
+
+        # the start events and end events around them, as packetsToMidiTrack has
+        startFields = [_midiEventToArrayFields(me, payloads)
+                       for me in getStartEvents(channel=bundle['initChannel'],
+                                                instrumentObj=bundle['initInstrument'])
+                       if not isinstance(me, midiModule.DeltaTime)]
+        endFields = [_midiEventToArrayFields(me, payloads)
+                     for me in getEndEvents(channel=bundle['initChannel'])
+                     if not isinstance(me, midiModule.DeltaTime)]
+        lastTick = int(ticks[-1]) if len(ticks) else 0
+
+        mta = midiModule.MidiTrackArray(trackId)
+        events = numpy.zeros(len(startFields) + len(ticks) + len(endFields),
+                             dtype=mta.dtype)
+        body = events[len(startFields):len(startFields) + len(ticks)]
+        body['tick'] = ticks
+        for i, name in enumerate(fieldNames):
+            column = numpy.concatenate(fieldColumns[name])[order]
+            body[name] = column
+            events[name][:len(startFields)] = [fields[i] for fields in startFields]
+            events[name][len(events) - len(endFields):] = [fields[i] for fields in endFields]
+        events['tick'][len(events) - len(endFields):] = lastTick + defaults.ticksAtStart
+        mta.events = events
+        mta.payloads = payloads
+        midiTracks.append(mta)
+
+    return midiTracks
+
 def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
                         inputM21=None, **keywords):
     '''
     Given a list of midiTracks, populate this Stream with a Part for each track.
+    The tracks can be :class:`~music21.midi.MidiTrack` or (compact)
+    :class:`~music21.midi.MidiTrackArray` objects.
+
+    If the keyword `parts` is a list of indices (counting only the tracks that
+    have notes) or track names, only those tracks are made into Parts.  If the
+    keyword `measureRange` is a tuple of the first and last measure numbers
+    (either can be None), only the notes that start in those measures
+    are made (see :func:`measureRangeToTickRange`), and the first measure starts at 0.
     '''
+    from music21.midi import MetaEvents
+
     if inputM21 is None:
         s = stream.Score()
     else:
         s = inputM21
+    if ticksPerQuarter is None:
+        ticksPerQuarter = defaults.ticksPerQuarter
+    partSelection = keywords.pop('parts', None)
+    measureRange = keywords.pop('measureRange', None)
+    tickRange = None
+    if measureRange is not None:
+        tickRange = measureRangeToTickRange(midiTracks, ticksPerQuarter, measureRange)
+
     # store common elements such as time sig, key sig from conductor
     conductorTrack = stream.Stream()
+    streamParts = []
+    noteTrackIndex = 0
     # environLocal.printDebug(['midi track count', len(midiTracks)])
     for mt in midiTracks:
         # not all tracks have notes defined; only creates parts for those
         # that do
         # environLocal.printDebug(['raw midi tracks', mt])
         if mt.hasNotes():
+            if partSelection is not None:
+                trackNames = [e.data.decode('utf-8', 'ignore').strip() for unused_t, e
+                              in _getTimeForEventsOfTypes(mt, (MetaEvents.SEQUENCE_TRACK_NAME,))
+                              if e.type == MetaEvents.SEQUENCE_TRACK_NAME]
+                isSelected = (noteTrackIndex in partSelection
+                              or any(name in partSelection for name in trackNames))
+                noteTrackIndex += 1
+                if not isSelected:
+                    continue
             streamPart = stream.Part()  # create a part instance for each part
             midiTrackToStream(mt,
                               ticksPerQuarter,
                               quantizePost,
                               inputM21=streamPart,
+                              tickRange=tickRange,
                               **keywords)
             # streamPart._setMidiTracksPart(mt,
             #     ticksPerQuarter=ticksPerQuarter, quantizePost=quantizePost)
-            s.insert(0, streamPart)
+            streamParts.append((0, streamPart))
         else:
             # note: in some cases a track such as this might have metadata
             # such as the time sig, tempo, or other parameters
@@ -2027,32 +2795,35 @@ def midiTracksToStreams(midiTracks, ticksPerQuarter=None, quantizePost=True,
             midiTrackToStream(mt,
                               ticksPerQuarter,
                               quantizePost,
-                              inputM21=conductorTrack, **keywords)
+                              inputM21=conductorTrack,
+                              tickRange=tickRange,
+                              **keywords)
+    s.insertMany(streamParts)
     # environLocal.printDebug(['show() conductorTrack elements'])
     # if we have time sig/key sig elements, add to each part
 
-    # TODO: this would be faster if we iterated in the other order.
+    conductorEvents = list(conductorTrack.getElementsByClass(
+        ('TimeSignature', 'KeySignature')))
     for p in s.getElementsByClass('Stream'):
-        for e in conductorTrack.getElementsByClass(
-                ('TimeSignature', 'KeySignature')):
-            # create a deepcopy of the element so a flat does not cause
-            # multiple references of the same
-            eventCopy = copy.deepcopy(e)
-            p.insert(conductorTrack.elementOffset(e), eventCopy)
+        # create a deepcopy of the element so a flat does not cause
+        # multiple references of the same
+        p.insertMany((conductorTrack.elementOffset(e), copy.deepcopy(e))
+                     for e in conductorEvents)
 
     # if there is a conductor track, add tempo only to the top-most part
     # MSC: WHY?
+    if not streamParts:
+        return s
 
     p = s.getElementsByClass('Stream')[0]
-    for e in conductorTrack.getElementsByClass('MetronomeMark'):
-        # create a deepcopy of the element so a flat does not cause
-        # multiple references of the same
-        eventCopy = copy.deepcopy(e)
-        p.insert(conductorTrack.elementOffset(e), eventCopy)
+    # create a deepcopy of the element so a flat does not cause
+    # multiple references of the same
+    p.insertMany((conductorTrack.elementOffset(e), copy.deepcopy(e))
+                 for e in conductorTrack.getElementsByClass('MetronomeMark'))
     return s
 
 
-def streamToMidiFile(inputM21):
+def streamToMidiFile(inputM21, *, asArrays=False):
     '''
     Converts a Stream hierarchy into a :class:`~music21.midi.base.MidiFile` object.
 
@@ -2075,11 +2846,25 @@ def streamToMidiFile(inputM21):
     >>> #_DOCS_SHOW mf.open('/Volumes/disc/_scratch/midi.mid', 'wb')
     >>> #_DOCS_SHOW mf.write()
     >>> #_DOCS_SHOW mf.close()
+
+    If `asArrays` is True, the tracks are compact
+    :class:`~music21.midi.MidiTrackArray` objects made in bulk by
+    :func:`streamHierarchyToMidiTrackArrays`, which is much faster for
+    large scores and writes the same bytes.  This requires NumPy.
+
+    >>> mfArrays = midi.translate.streamToMidiFile(s, asArrays=True)
+    >>> mfArrays.tracks
+    [<music21.midi.MidiTrackArray 1 -- 123 events>]
+    >>> mfArrays.writestr() == mf.writestr()
+    True
     '''
     from music21 import midi as midiModule
 
     s = inputM21
-    midiTracks = streamHierarchyToMidiTracks(s)
+    if asArrays:
+        midiTracks = streamHierarchyToMidiTrackArrays(s)
+    else:
+        midiTracks = streamHierarchyToMidiTracks(s)
 
     # update track indices
     # may need to update channel information
@@ -2107,11 +2892,15 @@ def midiFilePathToStream(filePath, inputM21=None, **keywords):
     >>> streamScore = midi.translate.midiFilePathToStream(fp)
     >>> streamScore
     <music21.stream.Score ...>
+
+    If the keyword `asArrays` is True, the file is read into compact
+    :class:`~music21.midi.MidiTrackArray` objects before being translated.
     '''
     from music21 import midi as midiModule
+    asArrays = keywords.pop('asArrays', False)
     mf = midiModule.MidiFile()
     mf.open(filePath)
-    mf.read()
+    mf.read(asArrays=asArrays)
     mf.close()
     return midiFileToStream(mf, inputM21, **keywords)
 
@@ -2194,10 +2983,14 @@ def midiAsciiStringToBinaryString(midiFormat=1, ticksPerQuarterNote=960, tracksE
     return midiBinStr
 
 
-def midiStringToStream(strData):
+def midiStringToStream(strData, **keywords):
     r'''
     Convert a string of binary midi data to a Music21 stream.Score object.
 
+    Keywords such as `measureRange` and `parts` are passed to :func:`midiFileToStream`.
+    If `asArrays` is True, the data is read into compact
+    :class:`~music21.midi.MidiTrackArray` objects first.
+
     N.B. -- this has been somewhat problematic, so use at your own risk.
 
      >>> midiBinStr = (b'MThd\x00\x00\x00\x06\x00\x01\x00\x01\x04\x00'
@@ -2211,10 +3004,11 @@ def midiStringToStream(strData):
     '''
     from music21 import midi as midiModule
 
+    asArrays = keywords.pop('asArrays', False)
     mf = midiModule.MidiFile()
     # do not need to call open or close on MidiFile instance
-    mf.readstr(strData)
-    return midiFileToStream(mf)
+    mf.readstr(strData, asArrays=asArrays)
+    return midiFileToStream(mf, **keywords)
 
 
 def midiFileToStream(mf, inputM21=None, quantizePost=True, **keywords):
@@ -3118,6 +3912,99 @@ class Test(unittest.TestCase):
                  (1024, 'END_OF_TRACK', None)]
         procCompare(mf, match)
 
+    def testMeasureRangeAndParts(self):
+        from music21 import meter
+        from music21 import note
+        from music21 import stream
+
+        s = stream.Score()
+        for partNumber in range(3):
+            p = stream.Part()
+            p.append(meter.TimeSignature('3/4'))
+            for i in range(12):
+                p.append(note.Note(60 + 12 * partNumber + i))
+            s.insert(0, p.makeMeasures())
+        midiData = streamToMidiFile(s).writestr()
+
+        s2 = midiStringToStream(midiData, measureRange=(3, 4), parts=[1])
+        self.assertEqual(len(s2.parts), 1)
+        notes = s2.parts[0].flat.notes
+        self.assertEqual([n.pitch.midi for n in notes], list(range(78, 84)))
+        self.assertEqual(notes[0].offset, 0.0)
+        timeSignatures = s2.recurse().getElementsByClass('TimeSignature')
+        self.assertEqual([(ts.ratioString, ts.getOffsetInHierarchy(s2)) for ts in timeSignatures],
+                         [('3/4', 0.0)])
+
+        s3 = midiStringToStream(midiData, measureRange=(None, 2), parts=[0])
+        self.assertEqual([n.pitch.midi for n in s3.parts[0].flat.notes], list(range(60, 66)))
+
+    def testNoteArrayFromEvents(self):
+        import random
+        from music21 import midi as midiModule
+
+        # overlapping notes of the same pitch, zero-velocity note-ons, and two channels
+        rand = random.Random(5)
+        mt = midiModule.MidiTrack(1)
+        timedEvents = []
+        for unused_i in range(400):
+            onTick = rand.randint(0, 4000)
+            for tick, velocity in ((onTick, rand.choice([0, 64, 90])),
+                                   (onTick + rand.choice([0, 10, 240]), 0)):
+                me = midiModule.MidiEvent(mt, channel=rand.choice([1, 2]))
+                me.type = rand.choice([midiModule.ChannelVoiceMessages.NOTE_ON,
+                                       midiModule.ChannelVoiceMessages.NOTE_OFF])
+                me.pitch = rand.randint(60, 63)
+                me.velocity = velocity
+                timedEvents.append((tick, me))
+        timedEvents.sort(key=lambda tickAndEvent: tickAndEvent[0])
+
+        notes = getNotesFromEvents(timedEvents)
+        noteArray = getNoteArrayFromEvents(_noteEventsToArray(timedEvents))
+        self.assertEqual([(on[0], off[0], on[1].pitch, on[1].velocity, on[1].channel)
+                          for on, off in notes],
+                         noteArray.tolist())
+
+    def testMidiTrackArrays(self):
+        fp = common.getSourceFilePath() / 'midi' / 'testPrimitive' / 'test09.mid'
+        s = midiFilePathToStream(fp)
+        sArrays = midiFilePathToStream(fp, asArrays=True)
+        self.assertEqual(len(sArrays.parts), 2)
+        for p, pArrays in zip(s.parts, sArrays.parts):
+            self.assertEqual([(n.offset, n.pitches, n.quarterLength) for n in p.flat.notes],
+                             [(n.offset, n.pitches, n.quarterLength)
+                              for n in pArrays.flat.notes])
+
+    def testMidiTrackArraysExport(self):
+        from music21 import corpus, duration, instrument, interval
+
+        # microtones moved to other channels, with program changes
+        s = corpus.parse('bwv66.6')
+        p1 = s.parts[0]
+        p1.insert(0, instrument.Viola())
+        p2 = copy.deepcopy(p1)
+        p2.transpose(interval.Interval(0.5), inPlace=True, classFilterList=('Note', 'Chord'))
+        p3 = s.parts[1]
+        p3.insert(0, instrument.Flute())
+        p3.recurse().notes[3].pitch.microtone = -25
+        grace = p3.recurse().notes[4]
+        grace.duration = duration.GraceDuration()
+        grace.pitch.microtone = 30
+        post = stream.Score()
+        for p in (p1, p2, p3):
+            post.insert(0, p)
+
+        mts = streamHierarchyToMidiTracks(post)
+        mtas = streamHierarchyToMidiTrackArrays(post)
+        self.assertEqual(len(mtas), 3)
+        for mt, mta in zip(mts, mtas):
+            self.assertEqual(mta.getBytes(), mt.getBytes())
+        self.assertEqual(sorted(set(mtas[1].events['channel'].tolist()) - {0}),
+                         mts[1].getChannels())
+
+        mf = streamToMidiFile(s)
+        mfArrays = streamToMidiFile(s, asArrays=True)
+        self.assertEqual(mfArrays.writestr(), mf.writestr())
+
 
 # ------------------------------------------------------------------------------
 _DOC_ORDER = [streamToMidiFile, midiFileToStream]
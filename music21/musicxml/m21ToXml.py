@@ -377,6 +377,39 @@ class GeneralObjectExporter:
         scoreExporter.parse()
         return scoreExporter.asBytes()
 
+    def writeIncremental(self, fileHandle, obj=None, prettyPrint=True):
+        '''
+        Like .parse() but writes the bytes to `fileHandle` a measure at a time
+        instead of returning them.
+        See :meth:`~music21.musicxml.m21ToXml.ScoreExporter.writeIncremental`.
+
+        >>> p = pitch.Pitch('D#4')
+        >>> GEX = musicxml.m21ToXml.GeneralObjectExporter(p)
+        >>> import io
+        >>> bio = io.BytesIO()
+        >>> GEX.writeIncremental(bio)
+        >>> outStr = bio.getvalue().decode('utf-8')
+        >>> print(outStr[outStr.index('<note>'):].strip())
+        <note>
+                <pitch>
+                  <step>D</step>
+                  <alter>1</alter>
+                  <octave>4</octave>
+                </pitch>
+                <duration>10080</duration>
+                <type>quarter</type>
+                <accidental>sharp</accidental>
+              </note>
+            </measure>
+          </part>
+        </score-partwise>
+        '''
+        if obj is None:
+            obj = self.generalObj
+        outObj = self.fromGeneralObject(obj)
+        scoreExporter = ScoreExporter(outObj)
+        scoreExporter.writeIncremental(fileHandle, prettyPrint=prettyPrint)
+
     def fromGeneralObject(self, obj):
         '''
         Converts any Music21Object (or a duration or a pitch) to something that
@@ -696,6 +729,22 @@ class XMLExporterBase:
         sio.close()
         return v
 
+    @staticmethod
+    def startTagBytes(el):
+        '''
+        Returns the opening tag (with attributes but no content) of an Element
+        as bytes, for writing an element's children out one at a time.
+
+        >>> from music21.musicxml.m21ToXml import Element
+        >>> e = Element('part', id='P1')
+        >>> e.append(Element('measure'))
+        >>> musicxml.m21ToXml.XMLExporterBase.startTagBytes(e)
+        b'<part id="P1">'
+        '''
+        shell = Element(el.tag, el.attrib)
+        tagBytes = ET.tostring(shell, encoding='utf-8', short_empty_elements=False)
+        return tagBytes[:-len(el.tag) - 3]
+
     def addDividerComment(self, comment=''):
         '''
         Add a divider to xmlRoot.
@@ -715,6 +764,17 @@ class XMLExporterBase:
           <accidental />
           </score-partwise>
         '''
+        self.xmlRoot.append(self.dividerComment(comment))
+
+    @staticmethod
+    def dividerComment(comment=''):
+        '''
+        Returns a divider Comment without adding it anywhere.
+
+        >>> XB = musicxml.m21ToXml.XMLExporterBase
+        >>> XB.dump(XB.dividerComment('Measure 1'))
+        <!--========================= Measure 1 ==========================-->
+        '''
         commentLength = len(comment)
         if commentLength > 60:
             commentLength = 60
@@ -724,7 +784,7 @@ class XMLExporterBase:
         commentText = ('=' * spacerLengthLow) + ' ' + comment + ' ' + ('=' * spacerLengthHigh)
 
         divider = ET.Comment(commentText)
-        self.xmlRoot.append(divider)
+        return divider
 
     # ------------------------------------------------------------------------------
     @staticmethod
@@ -1413,6 +1473,107 @@ class ScoreExporter(XMLExporterBase):
 
         return self.xmlRoot
 
+    def writeIncremental(self, fileHandle, prettyPrint=True):
+        r'''
+        An alternative to calling .parse() and then .asBytes(): writes the
+        score to `fileHandle` (a file or other object opened for writing bytes)
+        as it goes.  Each <measure> is written out as soon as its MeasureExporter
+        has finished and is then discarded, so the full tree for the score
+        is never built and no pretty-printing pass over the whole tree is needed.
+
+        The score header (which depends on every part's instrument) is
+        written first, so all parts are set up before any measures are exported.
+
+        If `prettyPrint` is True (default) each element is indented while it is written and
+        the output is identical to `.asBytes()` after `.parse()`; if False
+        no whitespace is added at all.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> import io
+        >>> bio = io.BytesIO()
+        >>> SX.writeIncremental(bio)
+        >>> outStr = bio.getvalue().decode('utf-8')
+        >>> print(outStr[outStr.index('<part id'):outStr.index('<attributes>')].strip())
+        <part id="P1">
+            <!--========================= Measure 0 ==========================-->
+            <measure number="0">
+        >>> SX2 = musicxml.m21ToXml.ScoreExporter(corpus.parse('bwv66.6'))
+        >>> SX2.parse()
+        <Element 'score-partwise' at 0x...>
+        >>> len(SX2.asBytes()) == len(bio.getvalue())
+        True
+
+        Without pretty-printing:
+
+        >>> bio = io.BytesIO()
+        >>> musicxml.m21ToXml.ScoreExporter(corpus.parse('bwv66.6')).writeIncremental(
+        ...     bio, prettyPrint=False)
+        >>> b'\n  <' in bio.getvalue()
+        False
+        '''
+        s = self.stream
+        if not s:
+            self.emptyObject()
+            if not prettyPrint:
+                fileHandle.write(self.xmlHeader())
+                ElementTree(self.xmlRoot).write(fileHandle, encoding='utf-8',
+                                                xml_declaration=False)
+            else:
+                fileHandle.write(self.asBytes())
+            return
+
+        self.scorePreliminaries()
+        if s.hasPartLikeStreams():
+            self.partExporterList = self.makePartExporters()
+        else:
+            self.partExporterList = [PartExporter(s, parent=self)]
+
+        measureStreams = [pex.partPreliminaries() for pex in self.partExporterList]
+        self.setScoreHeader()
+
+        def writeElement(el, level, isLast=False):
+            if prettyPrint:
+                self.indent(el, level)
+                if isLast:
+                    el.tail = '\n' + (level - 1) * '  '
+            fileHandle.write(ET.tostring(el, encoding='utf-8'))
+
+        root = self.xmlRoot
+        fileHandle.write(self.xmlHeader())
+        fileHandle.write(self.startTagBytes(root))
+        if prettyPrint:
+            fileHandle.write(b'\n  ')
+        for el in root:
+            writeElement(el, 1)
+
+        numParts = len(self.partExporterList)
+        for i, pex in enumerate(self.partExporterList):
+            writeElement(self.dividerComment('Part ' + str(i + 1)), 1)
+            isLastPart = (i == numParts - 1)
+            measureStream = measureStreams[i]
+            if not measureStream:
+                writeElement(pex.xmlRoot, 1, isLastPart)
+                continue
+
+            fileHandle.write(self.startTagBytes(pex.xmlRoot))
+            if prettyPrint:
+                fileHandle.write(b'\n    ')
+            numMeasures = len(measureStream)
+            for j, m in enumerate(measureStream):
+                writeElement(self.dividerComment('Measure ' + str(m.number)), 2)
+                writeElement(pex.parseMeasure(m), 2, j == numMeasures - 1)
+            fileHandle.write(b'</part>')
+            if prettyPrint:
+                fileHandle.write(b'\n' if isLastPart else b'\n  ')
+
+        fileHandle.write(b'</score-partwise>')
+        if prettyPrint:
+            fileHandle.write(b'\n')
+
+        # clean up for circular references.
+        self.partExporterList.clear()
+
     def emptyObject(self):
         '''
         Creates a cheeky "This Page Intentionally Left Blank" for a blank score
@@ -1563,12 +1724,31 @@ class ScoreExporter(XMLExporterBase):
         Calls makeRests() for the part, then creates a PartExporter for each part,
         and runs .parse() on that part.  appends the PartExporter to self.partExporterList()
         '''
+        for pp in self.makePartExporters():
+            pp.parse()
+            self.partExporterList.append(pp)
+
+    def makePartExporters(self):
+        '''
+        Calls makeRests() for each part and returns a list of (not yet parsed)
+        PartExporters for them, sharing the score's spannerBundle.
+
+        >>> b = corpus.parse('bwv66.6')
+        >>> SX = musicxml.m21ToXml.ScoreExporter(b)
+        >>> SX.scorePreliminaries()
+        >>> pexList = SX.makePartExporters()
+        >>> len(pexList)
+        4
+        >>> pexList[0].spannerBundle is SX.spannerBundle
+        True
+        '''
         # would like to do something like this but cannot
         # replace object inside of the stream
         sp = list(self.parts)
         for innerStream in sp:
             innerStream.makeRests(self.refStreamOrTimeRange, inPlace=True)
 
+        pexList = []
         count = 0
         for innerStream in sp:
             count += 1
@@ -1577,8 +1757,8 @@ class ScoreExporter(XMLExporterBase):
 
             pp = PartExporter(innerStream, parent=self)
             pp.spannerBundle = self.spannerBundle
-            pp.parse()
-            self.partExporterList.append(pp)
+            pexList.append(pp)
+        return pexList
 
     def parseFlatScore(self):
         '''
@@ -2341,6 +2521,31 @@ class PartExporter(XMLExporterBase):
 
         In other words, one-stop shopping.
         '''
+        measureStream = self.partPreliminaries()
+        for m in measureStream:
+            self.addDividerComment('Measure ' + str(m.number))
+            self.xmlRoot.append(self.parseMeasure(m))
+
+        return self.xmlRoot
+
+    def partPreliminaries(self):
+        '''
+        Everything that .parse() does before the measures are exported:
+        sets up instruments and the part id, fixes up the notation and
+        sets the idLocals on the spanner bundle.
+
+        Returns the Stream of measures to be exported.
+
+        >>> p = converter.parse('tinyNotation: 4/4 c1 d1 e1')
+        >>> PEX = musicxml.m21ToXml.PartExporter(p)
+        >>> measureStream = PEX.partPreliminaries()
+        >>> len(measureStream)
+        3
+        >>> PEX.xmlRoot.get('id') == PEX.firstInstrumentObject.partId
+        True
+        >>> len(PEX.xmlRoot)
+        0
+        '''
         self.instrumentSetup()
 
         self.xmlRoot.set('id', str(self.firstInstrumentObject.partId))
@@ -2352,14 +2557,16 @@ class PartExporter(XMLExporterBase):
             self.fixupNotationMeasured(measureStream)
         # make sure that all instances of the same class have unique ids
         self.spannerBundle.setIdLocals()
-        for m in measureStream:
-            self.addDividerComment('Measure ' + str(m.number))
-            measureExporter = MeasureExporter(m, parent=self)
-            measureExporter.spannerBundle = self.spannerBundle
-            mxMeasure = measureExporter.parse()
-            self.xmlRoot.append(mxMeasure)
+        return measureStream
 
-        return self.xmlRoot
+    def parseMeasure(self, m):
+        '''
+        Run a MeasureExporter on one measure of this part and return
+        the <measure> element.  It is not appended to self.xmlRoot.
+        '''
+        measureExporter = MeasureExporter(m, parent=self)
+        measureExporter.spannerBundle = self.spannerBundle
+        return measureExporter.parse()
 
     def instrumentSetup(self):
         '''
@@ -6111,6 +6318,30 @@ class Test(unittest.TestCase):
         self.assertEqual(1, self.getXml(s).count(u'<kind '
                                                  u'text="No Chord">none</kind>'))
 
+    def testWriteIncremental(self):
+        import re
+        from music21 import corpus
+
+        def normalize(xmlBytes):
+            # encoding dates and randomized part and instrument ids differ between runs
+            xmlBytes = re.sub(rb'<encoding-date>.*?</encoding-date>', b'', xmlBytes)
+            return re.sub(rb'"[IP][0-9a-f]{32}"', b'', xmlBytes)
+
+        SX = ScoreExporter(corpus.parse('schoenberg/opus19', 2))
+        SX.parse()
+        fullBytes = SX.asBytes()
+
+        bio = io.BytesIO()
+        ScoreExporter(corpus.parse('schoenberg/opus19', 2)).writeIncremental(bio)
+        self.assertEqual(normalize(bio.getvalue()), normalize(fullBytes))
+
+        bio = io.BytesIO()
+        ScoreExporter(corpus.parse('schoenberg/opus19', 2)).writeIncremental(
+            bio, prettyPrint=False)
+        unindented = bio.getvalue()
+        self.assertNotIn(b'\n  <', unindented)
+        self.assertEqual(unindented.count(b'<measure '), fullBytes.count(b'<measure '))
+
 
 class TestExternal(unittest.TestCase):  # pragma: no cover
     def runTest(self):
@@ -13,6 +13,7 @@ import copy
 import fractions
 import io
 import math
+import pathlib
 # import pprint
 import re
 import sys
@@ -61,6 +62,10 @@ from music21 import environment
 _MOD = 'musicxml.xmlToM21'
 environLocal = environment.Environment(_MOD)
 
+# children of <attributes> in measures skipped before a measureRange that
+# are still needed in the first measure parsed, in the order MusicXML gives them
+_SKIPPED_ATTRIBUTES_TO_KEEP = ('divisions', 'key', 'time', 'staves', 'clef', 'transpose')
+
 
 # ------------------------------------------------------------------------------
 class MusicXMLImportException(exceptions21.Music21Exception):
@@ -820,30 +825,81 @@ class MusicXMLImporter(XMLParserBase):
         self.partGroupList = []
         self.parts = []
 
+        # parse only these measure numbers (first, last) and parts; see readFile()
+        self.measureRange = None
+        self.partSelection = None
+
         self.musicXmlVersion = '3.0'
 
-    def scoreFromFile(self, filename):
+    def scoreFromFile(self, filename, incremental=False, parallel=False, lazy=False,
+                      measureRange=None, parts=None):
         '''
         main program: opens a file given by filename and returns a complete
         music21 Score from it.
+
+        `measureRange` and `parts` choose what is parsed; see :meth:`readFile`.
+
+        If `lazy` is True, the measures of each Part are only parsed when the Part
+        is first used (see :meth:`xmlRootToScore`).  Otherwise, if `incremental` is True,
+        the file is read a measure at a time
+        with :meth:`iterMeasuresFromFile`, which uses much less memory on
+        large files.  Otherwise, if `parallel` is True, the parts are
+        parsed in separate processes (see :meth:`xmlRootToScore`).
         '''
         # load filename into text
-        self.readFile(filename)
+        self.readFile(filename, incremental=incremental, parallel=parallel, lazy=lazy,
+                      measureRange=measureRange, parts=parts)
         # self.parseXMLText()
         return self.stream
 
-    def readFile(self, filename):
+    def readFile(self, filename, incremental=False, parallel=False, lazy=False,
+                 measureRange=None, parts=None):
+        '''
+        Read the file `filename` into self.stream; see :meth:`scoreFromFile`.
+
+        If `measureRange` is a tuple of the first and last measure numbers to
+        parse (None for the start or the end of the piece), the other
+        measures are skipped, except that the divisions, key, time, clef and
+        transposition in the <attributes> of the measures before the first
+        are put at the start of it.  The first measure parsed starts at offset 0.
+
+        If `parts` is a list of indices (from 0), ids, or names of <part> tags,
+        only those parts are parsed; StaffGroups keep only the parts that are parsed.
+
+        >>> fp = common.getSourceFilePath() / 'musicxml' / 'testNC.xml'
+        >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+        >>> mi.readFile(fp, measureRange=(2, 2))
+        >>> mi.stream.parts[0].getElementsByClass('Measure')[0]
+        <music21.stream.Measure 2 offset=0.0>
+        >>> mi.stream.parts[0].getElementsByClass('Measure')[0].timeSignature
+        <music21.meter.TimeSignature 4/4>
+        '''
+        self.measureRange = measureRange
+        self.partSelection = parts
+        if incremental and not lazy:
+            for unused_measure in self.iterMeasuresFromFile(filename):
+                pass
+            return
         etree = ET.parse(filename)
         self.xmlRoot = etree.getroot()
         if self.xmlRoot.tag != 'score-partwise':
             raise MusicXMLImportException('Cannot parse MusicXML files not in score-partwise. '
                                           + "Root tag was '{0}'".format(self.xmlRoot.tag))
-        self.xmlRootToScore(self.xmlRoot, self.stream)
+        self.xmlRootToScore(self.xmlRoot, self.stream, parallel=parallel, lazy=lazy)
 
-    def parseXMLText(self):
+    def parseXMLText(self, incremental=False, parallel=False, lazy=False,
+                     measureRange=None, parts=None):
         # pylint: disable=undefined-variable
+        self.measureRange = measureRange
+        self.partSelection = parts
         if isinstance(self.xmlText, bytes):
             self.xmlText = self.xmlText.decode('utf-8')
+        if incremental and not lazy:
+            # iterparse needs bytes if there is an encoding declaration
+            bio = io.BytesIO(self.xmlText.encode('utf-8'))
+            for unused_measure in self.iterMeasuresFromFile(bio):
+                pass
+            return
         sio = io.StringIO(self.xmlText)
         try:
             etree = ET.parse(sio)
@@ -855,17 +911,240 @@ class MusicXMLImporter(XMLParserBase):
         if self.xmlRoot.tag != 'score-partwise':
             raise MusicXMLImportException('Cannot parse MusicXML files not in score-partwise. '
                                           + "Root tag was '{0}'".format(self.xmlRoot.tag))
-        self.xmlRootToScore(self.xmlRoot, self.stream)
+        self.xmlRootToScore(self.xmlRoot, self.stream, parallel=parallel, lazy=lazy)
+
+    def iterMeasuresFromFile(self, source):
+        '''
+        Parse a MusicXML file (given as a filename or a binary file object) a
+        measure at a time, using `xml.etree.ElementTree.iterparse`, and yield each
+        Measure as soon as it has been made and put into its Part.  Each
+        <measure> tag is thrown away once it has been parsed, so the whole document
+        is never in memory at the same time as the Score.
+
+        Once the generator is exhausted, `self.stream` is the complete Score,
+        the same as what :meth:`readFile` makes.  Until then, the Score has only
+        the Parts that have been completely read.  The Measures of a
+        Part with more than one staff are yielded before the Part is separated
+        into PartStaff objects (which hold copies of them).
+
+        >>> fp = common.getSourceFilePath() / 'musicxml' / 'testNC.xml'
+        >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+        >>> for m in mi.iterMeasuresFromFile(fp):
+        ...     print(m.number, m.activeSite, len(mi.stream.parts))
+        1 <music21.stream.Part Piano> 0
+        2 <music21.stream.Part Piano> 0
+        >>> mi.stream.parts[0].getElementsByClass('Measure')[1]
+        <music21.stream.Measure 2 offset=4.0>
+        '''
+        if isinstance(source, pathlib.Path):
+            source = str(source)
+        s = self.stream
+        mxScore = None
+        headerParsed = False
+        mxPart = None
+        partParser = None
+        partIndex = 0
+        depth = 0
+        for event, mxElement in ET.iterparse(source, events=('start', 'end')):
+            if event == 'start':
+                depth += 1
+                if depth == 1:
+                    mxScore = mxElement
+                    if mxScore.tag != 'score-partwise':
+                        raise MusicXMLImportException(
+                            'Cannot parse MusicXML files not in score-partwise. '
+                            + "Root tag was '{0}'".format(mxScore.tag))
+                elif depth == 2 and mxElement.tag == 'part':
+                    # everything before the first part is complete now
+                    if not headerParsed:
+                        self.xmlHeaderToScore(mxScore, s)
+                        headerParsed = True
+                    # the attributes of a tag are known at its start
+                    mxPart = mxElement
+                    mxScorePart = self.getMxScorePart(mxPart)
+                    if mxScorePart is not None and self.isPartSelected(mxPart, partIndex):
+                        partParser = PartParser(mxPart, mxScorePart=mxScorePart, parent=self)
+                        partParser.parseXmlScorePart()
+                    partIndex += 1
+                continue
 
-    def xmlRootToScore(self, mxScore, inputM21=None):
+            depth -= 1
+            if depth == 2 and mxElement.tag == 'measure' and mxPart is not None:
+                if partParser is not None:
+                    m = partParser.xmlMeasureToMeasureIfSelected(mxElement)
+                    if m is not None:
+                        yield m
+                mxElement.clear()
+                mxPart.remove(mxElement)
+            elif depth == 1 and mxElement.tag == 'part':
+                if partParser is not None:
+                    partParser.stream.coreElementsChanged()
+                    partParser.postMeasuresParse()
+                    self.insertParsedPart(partParser, s)
+                mxScore.remove(mxElement)
+                mxPart = None
+                partParser = None
+
+        if not headerParsed:
+            self.xmlHeaderToScore(mxScore, s)
+        self.xmlRoot = mxScore
+        self.postPartsParse(s)
+
+    def xmlRootToScore(self, mxScore, inputM21=None, parallel=False, lazy=False):
         '''
         parse an xml file into a Score() object.
+
+        If `lazy` is True, the metadata, layout, credits, part-list and StaffGroups
+        are parsed as usual, as are the name, id and instrument of each Part,
+        but the measures of a Part are only parsed when the elements
+        of the Part are first used (see
+        :meth:`~music21.stream.core.StreamCoreMixin.coreDeferElements`).
+        Parts with more than one staff are split into PartStaffs
+        after parsing, so they are always parsed at once.  Each lazy Part
+        is parsed on its own, so a spanner left open at the end of
+        one part is dropped instead of possibly being finished by a later part.
+
+        >>> fp = common.getSourceFilePath() / 'musicxml' / 'testNC.xml'
+        >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+        >>> mi.readFile(fp, lazy=True)
+        >>> p = mi.stream.parts[0]
+        >>> p.partName, p.hasDeferredElements
+        ('Piano', True)
+        >>> p.getElementsByClass('Measure')[1]
+        <music21.stream.Measure 2 offset=4.0>
+        >>> p.hasDeferredElements
+        False
+
+        Otherwise, if `parallel` is True, the parts are parsed with
+        :meth:`parsePartsParallel` in separate processes (when more than one
+        CPU is available) and then put back together in this Score.
         '''
         if inputM21 is None:
             s = stream.Score()
         else:
             s = inputM21
 
+        self.xmlHeaderToScore(mxScore, s)
+        if lazy:
+            for p in self.xmlPartsToParse(mxScore):
+                mxScorePart = self.getMxScorePart(p)
+                if mxScorePart is None:
+                    continue
+                parser = PartParser(p, mxScorePart=mxScorePart, parent=self)
+                if p.find('measure/attributes/staves') is not None:
+                    parser.parse()
+                else:
+                    parser.deferParse()
+                self.insertParsedPart(parser, s)
+        elif parallel:
+            self.parsePartsParallel(mxScore, s)
+        else:
+            for p in self.xmlPartsToParse(mxScore):
+                mxScorePart = self.getMxScorePart(p)
+                if mxScorePart is None:
+                    continue
+                self.xmlPartToPart(p, mxScorePart, s)
+
+        self.postPartsParse(s)
+        if inputM21 is None:
+            return s
+
+    def parsePartsParallel(self, mxScore, s):
+        '''
+        Parse each <part> in `mxScore` with :func:`~music21.common.parallel.runParallel`
+        and insert the resulting Parts (or PartStaffs) into the Score `s`, in order.
+        The <part-list> must already have been parsed.
+
+        Each part is sent to the worker as bytes along with its <score-part>
+        and comes back frozen by :class:`~music21.freezeThaw.StreamFreezer`,
+        so this is only faster for scores with many parts on a machine with many
+        CPUs.  The StaffGroups from the part-groups are made afterwards
+        in :meth:`postPartsParse`, as in the serial case.
+
+        Parts are parsed independently, so a spanner that starts in one part
+        and is never finished in that part is dropped instead of possibly
+        being completed by a later part.
+
+        >>> fp = common.getSourceFilePath() / 'musicxml' / 'lilypondTestSuite' / '41g-PartNoId.xml'
+        >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+        >>> mi.readFile(fp, parallel=True)
+        >>> mi.stream.parts[0]
+        <music21.stream.Part MusicXML Part>
+        >>> mi.m21PartObjectsById
+        {'P1': <music21.stream.Part MusicXML Part>}
+        >>> len(mi.stream.parts[0].getElementsByClass('Measure'))
+        1
+        '''
+        from music21 import freezeThaw
+
+        partDataList = []
+        for mxPart in self.xmlPartsToParse(mxScore):
+            mxScorePart = self.getMxScorePart(mxPart)
+            if mxScorePart is None:
+                continue
+            partDataList.append((ET.tostring(mxPart), ET.tostring(mxScorePart),
+                                 self.measureRange))
+
+        results = common.runParallel(partDataList, _parseFrozenPart)
+        for frozenParts, partIds in results:
+            thawer = freezeThaw.StreamThawer()
+            thawer.openStr(frozenParts)
+            for partId, p in zip(partIds, thawer.stream.parts):
+                s.coreInsert(0.0, p)
+                self.m21PartObjectsById[partId] = p
+        s.coreElementsChanged()
+
+    def xmlPartsToParse(self, mxScore):
+        '''
+        Return a list of the <part> tags in `mxScore` that are chosen by
+        self.partSelection (all of them if it is None).
+        '''
+        return [mxPart for i, mxPart in enumerate(mxScore.findall('part'))
+                if self.isPartSelected(mxPart, i)]
+
+    def isPartSelected(self, mxPart, partIndex):
+        '''
+        Return True if self.partSelection is None or has the index, the id,
+        or the <part-name> of the <part> tag `mxPart`, which is the
+        `partIndex`-th part of the score.  The <part-list> must already have been parsed.
+
+        >>> from xml.etree.ElementTree import fromstring as EL
+        >>> mi = musicxml.xmlToM21.MusicXMLImporter()
+        >>> mi.mxScorePartDict['P2'] = EL('<score-part id="P2"><part-name>Alto</part-name>'
+        ...                               + '</score-part>')
+        >>> mxPart = EL('<part id="P2"/>')
+        >>> mi.isPartSelected(mxPart, 1)
+        True
+        >>> mi.partSelection = [0, 'Soprano']
+        >>> mi.isPartSelected(mxPart, 1)
+        False
+        >>> mi.partSelection = [1]
+        >>> mi.isPartSelected(mxPart, 1)
+        True
+        >>> mi.partSelection = ['P2']
+        >>> mi.isPartSelected(mxPart, 1)
+        True
+        >>> mi.partSelection = ['Alto']
+        >>> mi.isPartSelected(mxPart, 1)
+        True
+        '''
+        partSelection = self.partSelection
+        if partSelection is None:
+            return True
+        partId = mxPart.get('id')
+        if partIndex in partSelection or partId in partSelection:
+            return True
+        mxScorePart = self.mxScorePartDict.get(partId)
+        if mxScorePart is None:
+            return False
+        partName = mxScorePart.findtext('part-name')
+        return partName is not None and partName.strip() in partSelection
+
+    def xmlHeaderToScore(self, mxScore, s):
+        '''
+        Parse the tags that come before the <part> tags (the version,
+        metadata, defaults, credits, and the part-list) into the Score `s`.
+        '''
         mxVersion = mxScore.get('version')
         if mxVersion is not None:
             self.musicXmlVersion = mxVersion
@@ -883,24 +1162,36 @@ class MusicXMLImporter(XMLParserBase):
             s.coreInsert(0, credit)
 
         self.parsePartList(mxScore)
-        for p in mxScore.findall('part'):
-            partId = p.get('id')
-            if partId is None:  # pragma: no cover
-                partId = list(self.mxScorePartDict.keys())[0]
-                # Lilypond Test Suite allows for parsing w/o a part ID for one part...
-            try:
-                mxScorePart = self.mxScorePartDict[partId]
-            except KeyError:  # pragma: no cover
-                environLocal.printDebug('Cannot find info for part with name {}'.format(partId)
-                                        + ', skipping the part')
-                continue
 
-            part = self.xmlPartToPart(p, mxScorePart)
+    def getMxScorePart(self, mxPart):
+        '''
+        Return the <score-part> tag from the part-list for the <part> tag `mxPart`,
+        or None if there is none (and the part should be skipped).
+        '''
+        partId = mxPart.get('id')
+        if partId is None:  # pragma: no cover
+            partId = list(self.mxScorePartDict.keys())[0]
+            # Lilypond Test Suite allows for parsing w/o a part ID for one part...
+        try:
+            return self.mxScorePartDict[partId]
+        except KeyError:  # pragma: no cover
+            environLocal.printDebug('Cannot find info for part with name {}'.format(partId)
+                                    + ', skipping the part')
+            return None
 
-            if part is not None:  # for instance, in partStreams
-                s.coreInsert(0.0, part)
-                self.m21PartObjectsById[partId] = part
+    def insertParsedPart(self, parser, s):
+        '''
+        Put the Part made by the PartParser `parser` into the Score `s`, unless
+        the parser has already put its PartStaffs there.
+        '''
+        if parser.appendToScoreAfterParse is True:
+            s.coreInsert(0.0, parser.stream)
+            self.m21PartObjectsById[parser.partId] = parser.stream
 
+    def postPartsParse(self, s):
+        '''
+        Finish the Score `s` once all of its parts have been parsed.
+        '''
         self.partGroups()
 
         # copy spanners that are complete into the Score.
@@ -921,15 +1212,21 @@ class MusicXMLImporter(XMLParserBase):
             p.definesExplicitPageBreaks = self.definesExplicitPageBreaks
 
         s.sort()  # do this now so that if the file is cached, we can cache that it's sorted.
-        if inputM21 is None:
-            return s
 
-    def xmlPartToPart(self, mxPart, mxScorePart):
+    def xmlPartToPart(self, mxPart, mxScorePart, s=None):
         '''
         Given a <part> object and the <score-part> object, parse a complete part.
+
+        If a Score `s` is given, the part is also put into it with
+        :meth:`insertParsedPart`.
+
+        Returns the Part, or None if the part was made into PartStaffs
+        (which are already in the Score).
         '''
         parser = PartParser(mxPart, mxScorePart=mxScorePart, parent=self)
         parser.parse()
+        if s is not None:
+            self.insertParsedPart(parser, s)
         if parser.appendToScoreAfterParse is True:
             return parser.stream
         else:
@@ -1204,10 +1501,12 @@ class MusicXMLImporter(XMLParserBase):
                             staffGroup.addSpannedElements(self.m21PartObjectsById[partIdTest])
                             foundOne = True
 
-                    if foundOne is False:
+                    if foundOne is False and self.partSelection is None:
                         raise MusicXMLImportException(
                             'Cannot find part in m21PartObjectsById dictionary by Id:'
                             + ' %s \n   Full Dict:\n   %r ' % (ke, self.m21PartObjectsById))
+            if not staffGroup.getSpannedElements():
+                continue  # none of its parts were chosen
             mxPartGroup = pgObj.mxPartGroup
             seta(staffGroup, mxPartGroup, 'group-name', 'name')
             # TODO: group-name-display
@@ -1408,6 +1707,39 @@ class MusicXMLImporter(XMLParserBase):
 
 
 # -----------------------------------------------------------------------------
+def _parseFrozenPart(partData):
+    '''
+    Worker for :meth:`MusicXMLImporter.parsePartsParallel`.  Takes a tuple of
+    the bytes of a <part> and of its <score-part> and the measureRange, parses it,
+    and returns the frozen Score holding the resulting Part or PartStaffs and
+    a list of their ids in the order they appear in the Score.
+
+    >>> partBytes = (b'<part id="P1"><measure number="1"><note><rest/>'
+    ...              + b'<duration>4</duration></note></measure></part>')
+    >>> scorePartBytes = b'<score-part id="P1"><part-name>Solo</part-name></score-part>'
+    >>> partData = (partBytes, scorePartBytes, None)
+    >>> frozenParts, partIds = musicxml.xmlToM21._parseFrozenPart(partData)
+    >>> partIds
+    ['P1']
+    >>> converter.thawStr(frozenParts).parts[0].partName
+    'Solo'
+    '''
+    from music21 import freezeThaw
+
+    mxPartBytes, mxScorePartBytes, measureRange = partData
+    mxPart = ET.fromstring(mxPartBytes)
+    mxScorePart = ET.fromstring(mxScorePartBytes)
+
+    importer = MusicXMLImporter()
+    importer.measureRange = measureRange
+    importer.mxScorePartDict[mxScorePart.get('id')] = mxScorePart
+    importer.xmlPartToPart(mxPart, mxScorePart, importer.stream)
+    importer.stream.coreElementsChanged()
+
+    sf = freezeThaw.StreamFreezer(importer.stream, fastButUnsafe=True)
+    return sf.writeStr(fmt='pickle'), list(importer.m21PartObjectsById)
+
+
 class PartParser(XMLParserBase):
     '''
     parser to work with a single <part> tag.
@@ -1429,8 +1761,13 @@ class PartParser(XMLParserBase):
         self._parent = common.wrapWeakref(parent)
         if parent is not None:
             self.spannerBundle = parent.spannerBundle
+            self.measureRange = parent.measureRange
         else:
             self.spannerBundle = spanner.SpannerBundle()
+            self.measureRange = None
+        # (tag, number) of <attributes> children in measures skipped before measureRange
+        self.skippedAttributes = {}
+        self.lastMeasureWasSelected = True
         self.stream = stream.Part()
         self.atSoundingPitch = True
 
@@ -1470,6 +1807,32 @@ class PartParser(XMLParserBase):
         '''
         self.parseXmlScorePart()
         self.parseMeasures()
+        self.postMeasuresParse()
+
+    def deferParse(self):
+        '''
+        Parse the <score-part> now, so that the name, id and instrument of
+        the Part are known, but only parse the measures when the elements of the Part
+        are first used.  The Part gets its own SpannerBundle, since other parts
+        may be parsed before it.
+        '''
+        self.spannerBundle = spanner.SpannerBundle()
+        self.parseXmlScorePart(insertInstrument=False)
+        self.stream.coreDeferElements(self.parseDeferredMeasures)
+
+    def parseDeferredMeasures(self, part):
+        '''
+        The loader of a Part set up by :meth:`deferParse`; puts in the instrument
+        and parses the measures.
+        '''
+        part.coreInsert(0.0, self.activeInstrument)
+        self.parseMeasures()
+        self.postMeasuresParse()
+
+    def postMeasuresParse(self):
+        '''
+        Finish the Part once all of its measures have been parsed.
+        '''
         self.stream.atSoundingPitch = self.atSoundingPitch
 
         # TODO: this does not work with voices; there, Spanners
@@ -1477,15 +1840,11 @@ class PartParser(XMLParserBase):
 
         # copy spanners that are complete into the part, as this is the
         # highest level container that needs them
-        rm = []
-        for sp in self.spannerBundle.getByCompleteStatus(True):
-            self.stream.coreInsert(0, sp)
-            rm.append(sp)
+        rm = list(self.spannerBundle.getByCompleteStatus(True))
+        self.stream.insertMany((0, sp) for sp in rm)
         # remove from original spanner bundle
         for sp in rm:
             self.spannerBundle.remove(sp)
-        # s is the score; adding the part to the score
-        self.stream.coreElementsChanged()
 
         if self.maxStaves > 1:
             self.separateOutPartStaves()
@@ -1493,14 +1852,15 @@ class PartParser(XMLParserBase):
             self.stream.addGroupForElements(self.partId)  # set group for components
             self.stream.groups.append(self.partId)  # set group for stream itself
 
-    def parseXmlScorePart(self):
+    def parseXmlScorePart(self, insertInstrument=True):
         '''
         The <score-part> tag contains a lot of information about the
         Part itself.  It was found in the <part-list> in the ScoreParser but
         was not parsed and instead passed into the PartParser as .mxScorePart.
 
         Sets the stream.partName, stream.partAbbreviation, self.activeInstrument,
-        and inserts an instrument at the beginning of the stream.
+        and (unless `insertInstrument` is False) inserts an instrument
+        at the beginning of the stream.
 
         The instrumentObj being configured comes from self.getDefaultInstrument.
         '''
@@ -1537,7 +1897,8 @@ class PartParser(XMLParserBase):
 
         part.partName = instrumentObj.partName
         part.partAbbreviation = instrumentObj.partAbbreviation
-        part.coreInsert(0.0, instrumentObj)  # add instrument at zero offset
+        if insertInstrument:
+            part.coreInsert(0.0, instrumentObj)  # add instrument at zero offset
 
     def getDefaultInstrument(self, mxScorePart=None):
         r'''
@@ -1610,7 +1971,7 @@ class PartParser(XMLParserBase):
         '''
         part = self.stream
         for mxMeasure in self.mxPart.iterfind('measure'):
-            self.xmlMeasureToMeasure(mxMeasure)
+            self.xmlMeasureToMeasureIfSelected(mxMeasure)
 
         # self.removeEndForwardRest()
         part.coreElementsChanged()
@@ -1811,6 +2172,79 @@ class PartParser(XMLParserBase):
 
         return m
 
+    def xmlMeasureToMeasureIfSelected(self, mxMeasure):
+        '''
+        Parse `mxMeasure` with :meth:`xmlMeasureToMeasure` and return the
+        Measure if its number is in self.measureRange (or there is no measureRange),
+        otherwise return None.  The <attributes> of the measures skipped
+        before the range are kept and put at the start of the first measure in it.
+        A measure without a number is in the range if the measure before it is.
+
+        >>> from xml.etree.ElementTree import fromstring as EL
+        >>> PP = musicxml.xmlToM21.PartParser()
+        >>> PP.measureRange = (2, 2)
+        >>> mxMeasure1 = EL('<measure number="1"><attributes><divisions>2</divisions>'
+        ...                 + '<time><beats>3</beats><beat-type>4</beat-type></time>'
+        ...                 + '</attributes><note><rest/><duration>6</duration></note></measure>')
+        >>> mxMeasure2 = EL('<measure number="2"><note><rest/><duration>6</duration></note>'
+        ...                 + '</measure>')
+        >>> PP.xmlMeasureToMeasureIfSelected(mxMeasure1) is None
+        True
+        >>> m = PP.xmlMeasureToMeasureIfSelected(mxMeasure2)
+        >>> m
+        <music21.stream.Measure 2 offset=0.0>
+        >>> m.timeSignature
+        <music21.meter.TimeSignature 3/4>
+        >>> m.notesAndRests[0].quarterLength
+        3.0
+        '''
+        if self.measureRange is None:
+            return self.xmlMeasureToMeasure(mxMeasure)
+
+        numberStart, numberEnd = self.measureRange
+        mNumber, unused_suffix = common.getNumFromStr(mxMeasure.get('number', ''))
+        if mNumber:
+            mNumber = int(mNumber)
+            if numberStart is not None and mNumber < numberStart:
+                self.lastMeasureWasSelected = False
+                for mxAttributes in mxMeasure.iterfind('attributes'):
+                    for mxChild in mxAttributes:
+                        if mxChild.tag in _SKIPPED_ATTRIBUTES_TO_KEEP:
+                            self.skippedAttributes[(mxChild.tag, mxChild.get('number'))] = mxChild
+                return None
+            self.lastMeasureWasSelected = numberEnd is None or mNumber <= numberEnd
+        if not self.lastMeasureWasSelected:
+            return None
+
+        if self.skippedAttributes:
+            mxMeasure = self.measureWithSkippedAttributes(mxMeasure)
+        return self.xmlMeasureToMeasure(mxMeasure)
+
+    def measureWithSkippedAttributes(self, mxMeasure):
+        '''
+        Return a new <measure> tag like `mxMeasure` but starting with an
+        <attributes> tag holding the self.skippedAttributes that `mxMeasure`
+        does not set itself before its first note, and clear self.skippedAttributes.
+        '''
+        setAtStart = set()
+        for mxChild in mxMeasure:
+            if mxChild.tag == 'attributes':
+                setAtStart.update((mxSub.tag, mxSub.get('number')) for mxSub in mxChild)
+            elif mxChild.tag in ('note', 'backup', 'forward'):
+                break
+
+        mxAttributes = ET.Element('attributes')
+        for tag in _SKIPPED_ATTRIBUTES_TO_KEEP:
+            for (skippedTag, number), mxChild in self.skippedAttributes.items():
+                if skippedTag == tag and (skippedTag, number) not in setAtStart:
+                    mxAttributes.append(mxChild)
+        self.skippedAttributes = {}
+
+        mxNewMeasure = ET.Element('measure', mxMeasure.attrib)
+        mxNewMeasure.append(mxAttributes)
+        mxNewMeasure.extend(mxMeasure)
+        return mxNewMeasure
+
     def updateTransposition(self, newTransposition):
         '''
         As you might expect, a measureParser that reveals a change
@@ -6463,6 +6897,134 @@ class Test(unittest.TestCase):
         self.assertIsInstance(notes[3].articulations[1], articulations.FretIndication)
         self.assertEqual(notes[3].articulations[1].number, 3)
 
+    def testIncrementalImport(self):
+        from music21 import converter
+        from music21 import corpus
+
+        def describe(s):
+            post = []
+            for el in s.recurse():
+                info = [el.classes[0], el.getOffsetInHierarchy(s), el.quarterLength]
+                if 'Note' in el.classes:
+                    info.append(el.nameWithOctave)
+                post.append(tuple(info))
+            return post
+
+        # a piano part is separated into PartStaffs after its measures are read.
+        fp = corpus.getWork('schoenberg/opus19', 2)
+        xmlText = converter.ArchiveManager(str(fp)).getData()
+        MI = MusicXMLImporter()
+        MI.xmlText = xmlText
+        MI.parseXMLText()
+
+        MI2 = MusicXMLImporter()
+        measures = list(MI2.iterMeasuresFromFile(io.BytesIO(xmlText.encode('utf-8'))))
+        self.assertEqual(len(measures), 9)
+        self.assertEqual([m.number for m in measures], list(range(1, 10)))
+        # the parts have been removed; only the tags before them are left
+        self.assertEqual([el.tag for el in MI2.xmlRoot],
+                         ['identification', 'defaults', 'part-list'])
+        s1 = MI.stream
+        s2 = MI2.stream
+        self.assertEqual([type(p) for p in s2.parts], [stream.PartStaff, stream.PartStaff])
+        self.assertEqual(describe(s1), describe(s2))
+        self.assertEqual(len(s1.spannerBundle), len(s2.spannerBundle))
+        self.assertEqual(s1.metadata.composer, s2.metadata.composer)
+
+        MI3 = MusicXMLImporter()
+        MI3.readFile(common.getSourceFilePath() / 'musicxml' / 'testNC.xml', incremental=True)
+        self.assertEqual(2, len(MI3.stream.flat.getElementsByClass('NoChord')))
+
+        MI4 = MusicXMLImporter()
+        MI4.xmlText = r'''<score-timewise />'''
+        self.assertRaises(MusicXMLImportException, MI4.parseXMLText, incremental=True)
+
+    def testParallelImport(self):
+        from music21 import corpus
+
+        def describe(s):
+            post = []
+            for el in s.recurse():
+                info = [el.classes[0], el.getOffsetInHierarchy(s), el.quarterLength]
+                if 'Note' in el.classes:
+                    info.append(el.nameWithOctave)
+                    info.append(sorted(sp.classes[0] for sp in el.getSpannerSites()))
+                post.append(tuple(info))
+            return post
+
+        # two single-staff parts in a StaffGroup and a piano separated into PartStaffs
+        fp = corpus.getWork('schumann_clara/opus17', 3)
+        MI = MusicXMLImporter()
+        MI.readFile(fp)
+        MI2 = MusicXMLImporter()
+        MI2.readFile(fp, parallel=True)
+
+        s1 = MI.stream
+        s2 = MI2.stream
+        self.assertEqual([(type(p), p.id) for p in s1.parts],
+                         [(type(p), p.id) for p in s2.parts])
+        self.assertEqual(list(MI.m21PartObjectsById), list(MI2.m21PartObjectsById))
+        for p in s2.parts:
+            self.assertIs(p.activeSite, s2)
+        self.assertEqual(describe(s1), describe(s2))
+        self.assertEqual([[p.id for p in sg] for sg in s1.getElementsByClass('StaffGroup')],
+                         [[p.id for p in sg] for sg in s2.getElementsByClass('StaffGroup')])
+        for sg in s2.getElementsByClass('StaffGroup'):
+            for p in sg:
+                self.assertIn(p, s2.parts)
+        self.assertEqual(s1.metadata.title, s2.metadata.title)
+
+    def testLazyImport(self):
+        from music21 import converter
+        from music21 import corpus
+
+        fp = corpus.getWork('bach/bwv66.6')
+        s1 = converter.parse(fp, forceSource=True)
+        s2 = converter.parse(fp, lazy=True)
+
+        self.assertEqual(s1.metadata.title, s2.metadata.title)
+        self.assertEqual([p.partName for p in s1.parts], [p.partName for p in s2.parts])
+        self.assertEqual([p.id for p in s1.parts], [p.id for p in s2.parts])
+        self.assertTrue(all(p.hasDeferredElements for p in s2.parts))
+
+        soprano = s2.parts[0]
+        self.assertEqual(len(soprano.getElementsByClass('Measure')), 10)
+        self.assertFalse(soprano.hasDeferredElements)
+        self.assertTrue(s2.parts[1].hasDeferredElements)
+
+        self.assertEqual([(n.offset, n.nameWithOctave, n.quarterLength)
+                          for n in s1.flat.notes],
+                         [(n.offset, n.nameWithOctave, n.quarterLength)
+                          for n in s2.flat.notes])
+        self.assertEqual(s1.highestTime, s2.highestTime)
+
+    def testMeasureRangeAndParts(self):
+        from music21 import converter
+        from music21 import corpus
+
+        fp = corpus.getWork('bach/bwv66.6')
+        s1 = converter.parse(fp, forceSource=True)
+        s2 = converter.parse(fp, measureRange=(3, 5), parts=[0, 'Bass'])
+
+        self.assertEqual([p.partName for p in s2.parts], ['Soprano', 'Bass'])
+        for p1, p2 in zip((s1.parts[0], s1.parts[3]), s2.parts):
+            measures1 = p1.measures(3, 5).getElementsByClass('Measure')
+            measures2 = p2.getElementsByClass('Measure')
+            self.assertEqual([m.number for m in measures1], [m.number for m in measures2])
+            self.assertEqual([(n.offset, n.nameWithOctave) for m in measures1 for n in m.notes],
+                             [(n.offset, n.nameWithOctave) for m in measures2 for n in m.notes])
+            self.assertEqual(measures2[0].offset, 0.0)
+            self.assertEqual(measures2[0].keySignature.sharps, 3)
+            self.assertEqual(measures2[0].timeSignature.ratioString, '4/4')
+
+        s3 = converter.parse(fp, forceSource=True, measureRange=(None, 3))
+        self.assertEqual(len(s3.parts), len(s1.parts))
+        measures1 = s1.parts[0].getElementsByClass('Measure')
+        measures3 = s3.parts[0].getElementsByClass('Measure')
+        self.assertEqual([m.number for m in measures3], [0, 1, 2, 3])
+        self.assertEqual([n.nameWithOctave for m in measures1[:4] for n in m.notes],
+                         [n.nameWithOctave for m in measures3 for n in m.notes])
+
 
 if __name__ == '__main__':
     import music21
@@ -163,6 +163,16 @@ _NoneSiteRef.siteIndex = -2
 _singletonCounter = common.SingletonCounter()
 
 
+def _unwrapSite(siteRef):
+    '''
+    Return the site stored as `siteRef` in a Sites object, or None if the
+    site no longer exists.
+    '''
+    if WEAKREF_ACTIVE:
+        return common.unwrapWeakref(siteRef)
+    return siteRef
+
+
 class Sites(common.SlottedObjectMixin):
     '''
     An object, stored within a Music21Object, that stores (weak) references to
@@ -171,31 +181,36 @@ class Sites(common.SlottedObjectMixin):
     Most of these objects are locations (also called sites), or Streams that
     contain this object.
 
-    All defined contexts are stored as dictionaries in a dictionary. The
-    outermost dictionary stores objects.
+    Since every Music21Object has a Sites object, sites are stored compactly
+    in a dict and a list: `._siteIds` maps the id() of each site, in the order
+    added, to its position, and `._siteData` has four entries for each
+    position: the weakref to the site,
+    its class string, its siteIndex and its globalSiteIndex.  The None site
+    is always present and is not stored.  :class:`SiteRef` objects are only
+    made when `.siteDict` is asked for.
+
+    References to sites that no longer exist are removed from time to time
+    when new sites are added, or by :meth:`purgeLocations`.
     '''
 
     # CLASS VARIABLES #
 
     __slots__ = (
-        'siteDict',
-        '_lastID',
+        '_siteIds',
+        '_siteData',
         '_siteIndex',
     )
 
     # INITIALIZER #
 
     def __init__(self):
-        # .siteDict is a dictionary of siteRefs.  None is a singleton.
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
+        self._siteIds = {}
+        self._siteData = []
 
         # store an index of numbers for tagging the order of creation of defined contexts;
         # this is used to be able to discern the order of context as added
         self._siteIndex = 0
 
-        # cache for performance
-        self._lastID = -1  # cannot be None
-
     # SPECIAL METHODS #
     def __deepcopy__(self, memo=None):
         '''
@@ -228,35 +243,67 @@ class Sites(common.SlottedObjectMixin):
         # copies; this functionality is used at times in context searches, but
         # may be a performance hog.
         new = self.__class__()
-        # environLocal.printDebug(['Sites.__deepcopy__',
-        #    'self.siteDict.keys()', self.siteDict.keys()])
-        for idKey in self.siteDict:
-            if idKey is None:
-                continue
-            oldSite = self.siteDict[idKey]
-            if oldSite.isDead:
+        newIds = new._siteIds
+        newData = new._siteData
+        data = self._siteData
+        for i, idKey in enumerate(self._siteIds):
+            siteRef, classString, siteIndex, unused_globalSiteIndex = data[4 * i:4 * i + 4]
+            if _unwrapSite(siteRef) is None:
                 continue  # do not copy dead references
-            newSite = SiteRef()
-            newSite.site = oldSite.site
-            if oldSite.site is None:
-                newIdKey = None
-            else:
-                newIdKey = id(newSite.site)
-                # if newIdKey != idKey and oldSite.site != None:
-                #    print('Error! %s %s' % (newIdKey, idKey))
-            newSite.siteIndex = oldSite.siteIndex
-            newSite.globalSiteIndex = _singletonCounter()
-            newSite.classString = oldSite.classString
-            newSite.isDead = False
-            # debug
-            # originalObj = post.site
-            # if id(originalObj) != idKey and originalObj is not None:
-            #    print(idKey, id(originalObj))
-            new.siteDict[newIdKey] = newSite
+            # weakrefs cannot change, so they are shared with the copy
+            newIds[idKey] = len(newIds)
+            newData.extend((siteRef, classString, siteIndex, _singletonCounter()))
 
         new._siteIndex = self._siteIndex  # keep to stay coherent
         return new
 
+    # called before pickling.
+    def __getstate__(self):
+        '''
+        Weakrefs cannot be pickled, so each site is stored in GLOBAL_SITE_STATE_DICT,
+        as in :meth:`SiteRef.__getstate__`, and restored from it on unpickling.
+        '''
+        siteData = list(self._siteData)
+        if WEAKREF_ACTIVE:
+            for i in range(0, len(siteData), 4):
+                currentSite = _unwrapSite(siteData[i])
+                if currentSite is None:
+                    siteData[i] = None
+                    continue
+                siteIdValue = str(id(currentSite)) + '_' + str(_singletonCounter())
+                GLOBAL_SITE_STATE_DICT[siteIdValue] = currentSite
+                siteData[i] = siteIdValue
+        return {'_siteIds': list(self._siteIds),
+                '_siteData': siteData,
+                '_siteIndex': self._siteIndex}
+
+    # called on unpickling
+    def __setstate__(self, state):
+        if '_siteData' not in state:
+            # pickled by an older version, with a siteDict of SiteRefs
+            self._siteIds = {}
+            self._siteData = []
+            for idKey, siteRef in state['siteDict'].items():
+                if idKey is None:
+                    continue
+                self._siteIds[idKey] = len(self._siteIds)
+                self._siteData.extend((siteRef.siteWeakref, siteRef.classString,
+                                       siteRef.siteIndex, siteRef.globalSiteIndex))
+            self._siteIndex = state.get('_siteIndex', 0)
+            return
+
+        siteData = state['_siteData']
+        if WEAKREF_ACTIVE:
+            for i in range(0, len(siteData), 4):
+                siteIdValue = siteData[i]
+                if siteIdValue is None:
+                    continue
+                currentSite = GLOBAL_SITE_STATE_DICT.pop(siteIdValue, None)
+                siteData[i] = common.wrapWeakref(currentSite)
+        self._siteIds = {idKey: i for i, idKey in enumerate(state['_siteIds'])}
+        self._siteData = siteData
+        self._siteIndex = state['_siteIndex']
+
     def __len__(self):
         '''
         Return the total number of references.
@@ -272,7 +319,7 @@ class Sites(common.SlottedObjectMixin):
         2
 
         '''
-        return len(self.siteDict)
+        return len(self._siteIds) + 1
 
     def __contains__(self, checkSite):
         '''
@@ -292,10 +339,12 @@ class Sites(common.SlottedObjectMixin):
         >>> None in n.sites
         True
         '''
-        for unused_siteRefId, siteRef in self.siteDict.items():
-            if siteRef.site is checkSite:
-                return True
-        return False
+        if checkSite is None:
+            return True
+        i = self._siteIds.get(id(checkSite))
+        if i is None:
+            return False
+        return _unwrapSite(self._siteData[4 * i]) is checkSite
 
     def __iter__(self):
         '''
@@ -313,6 +362,37 @@ class Sites(common.SlottedObjectMixin):
         '''
         return self.yieldSites(excludeNone=True)
 
+    # PUBLIC PROPERTIES #
+
+    @property
+    def siteDict(self):
+        '''
+        Return an OrderedDict of :class:`SiteRef` objects for each site,
+        keyed by the id() of the site, with the None site first.
+
+        The SiteRefs are made new on each call, so changing them does not change
+        the Sites object.
+
+        >>> s = stream.Stream(id='hi')
+        >>> n = note.Note()
+        >>> s.append(n)
+        >>> n.sites.siteDict[id(s)].site
+        <music21.stream.Stream hi>
+        >>> list(n.sites.siteDict.values())[0]
+        <music21.sites.SiteRef Global None Index>
+        '''
+        post = collections.OrderedDict([(None, _NoneSiteRef), ])
+        data = self._siteData
+        for i, idKey in enumerate(self._siteIds):
+            siteRef = SiteRef()
+            siteRef.siteWeakref = data[4 * i]
+            siteRef.classString = data[4 * i + 1]
+            siteRef.siteIndex = data[4 * i + 2]
+            siteRef.globalSiteIndex = data[4 * i + 3]
+            siteRef.isDead = _unwrapSite(siteRef.siteWeakref) is None
+            post[idKey] = siteRef
+        return post
+
     # PUBLIC METHODS #
 
     def add(self, obj, timeValue=None, idKey=None, classString=None):
@@ -325,59 +405,96 @@ class Sites(common.SlottedObjectMixin):
         `classString` stores the class of obj.  If `None` then `obj.classes[0]`
         is used.
 
-        TODO: Tests.  Including updates.
+        Adding a site that is already there updates it, keeping its position.
+
+        >>> s1 = stream.Stream(id='s1')
+        >>> s2 = stream.Stream(id='s2')
+        >>> sitesObj = sites.Sites()
+        >>> sitesObj.add(s1)
+        >>> sitesObj.add(s2)
+        >>> sitesObj.add(s1)
+        >>> sitesObj.get()
+        [None, <music21.stream.Stream s1>, <music21.stream.Stream s2>]
+
+        Sites that no longer exist are removed once in a while when sites are
+        added, so not all seven of these are still stored:
+
+        >>> for i in range(7):
+        ...     sitesObj.add(stream.Stream())
+        >>> sitesObj.getSiteCount()
+        2
+        >>> len(sitesObj)
+        4
         '''
         if timeValue is not None:
             raise SitesException('No timeValue in sites anymore!')
         # NOTE: this is a performance critical method
 
-        # a None object will have a key of None
-        # do not need to set this as is default
-        if idKey is None and obj is not None:
+        # a None object will have a key of None, which is always present
+        if idKey is None:
+            if obj is None:
+                return
             idKey = id(obj)
 
-        updateNotAdd = False
-        if idKey in self.siteDict:
-            tempSiteRef = self.siteDict[idKey]
-            if (tempSiteRef.isDead is False
-                    and tempSiteRef.site is not None):
-                updateNotAdd = True
-
-            # if idKey is not None:
-            #    print('Updating idKey %s for object %s' % (idKey, id(obj)))
-
-        # environLocal.printDebug(['adding obj', obj, idKey])
-        # weak refs were being passed in __deepcopy__ calling this method
-        # __deepcopy__ no longer call this method, so we can assume that
-        # we will not get weakrefs
-
         if obj is not None and classString is None:
             classString = obj.classes[0]  # get most current class
 
-        if updateNotAdd is True:
-            siteRef = self.siteDict[idKey]
-            siteRef.isDead = False  # in case it used to be a dead site...
+        if WEAKREF_ACTIVE:
+            siteRef = common.wrapWeakref(obj)
         else:
-            siteRef = SiteRef()
-
-        siteRef.site = obj  # stores a weakRef
-        siteRef.classString = classString
-        # default
-        # singleContextDict.isDead = False  # store to access w/o unwrapping
+            siteRef = obj
         # time is a numeric count, not a real time measure
-        siteRef.siteIndex = self._siteIndex
+        siteIndex = self._siteIndex
         self._siteIndex += 1  # increment for next usage
-        siteRef.globalSiteIndex = _singletonCounter()  # increments
-        ##
-        if not updateNotAdd:  # add new/missing information to dictionary
-            self.siteDict[idKey] = siteRef
+
+        siteIds = self._siteIds
+        i = siteIds.get(idKey)
+        if i is None:
+            siteIds[idKey] = len(siteIds)
+            self._siteData.extend((siteRef, classString, siteIndex, _singletonCounter()))
+            # remove dead sites each time the number of sites reaches a power of two
+            numSites = len(siteIds)
+            if numSites >= 8 and not numSites & (numSites - 1):
+                self._removeDeadSites()
+        else:  # update, even if it used to be a dead site, keeping its position
+            self._siteData[4 * i:4 * i + 4] = (siteRef, classString, siteIndex,
+                                               _singletonCounter())
+
+    def _removeDeadSites(self):
+        '''
+        Remove the sites that no longer exist.
+        '''
+        data = self._siteData
+        newIds = {}
+        newData = []
+        for i, idKey in enumerate(self._siteIds):
+            if _unwrapSite(data[4 * i]) is None:
+                continue
+            newIds[idKey] = len(newIds)
+            newData.extend(data[4 * i:4 * i + 4])
+        self._siteIds = newIds
+        self._siteData = newData
+
+    def _removeAtPosition(self, idKey, i):
+        '''
+        Remove the site with id `idKey` at position `i`, and move the
+        sites after it down one position.
+        '''
+        siteIds = self._siteIds
+        del siteIds[idKey]
+        del self._siteData[4 * i:4 * i + 4]
+        if i == len(siteIds):
+            return
+        for otherIdKey, j in siteIds.items():
+            if j > i:
+                siteIds[otherIdKey] = j - 1
 
     def clear(self):
         '''
         Clear all stored data.
         '''
-        self.siteDict = collections.OrderedDict([(None, _NoneSiteRef), ])
-        self._lastID = -1  # cannot be None
+        self._siteIds = {}
+        self._siteData = []
 
     def yieldSites(self,
                    sortByCreationTime: Union[str, bool] = False,
@@ -440,31 +557,29 @@ class Sites(common.SlottedObjectMixin):
         # `sortByCreationTime='reverse'` is removed, since the ordered dict takes
         care of it and was not working
         '''
-        keyRepository = list(self.siteDict.keys())
+        # copy the weakrefs, in case sites are added or removed while yielding
+        siteRefs = self._siteData[::4]
+        # position -1 is the None site
+        positions = list(range(-1, len(siteRefs)))
         if sortByCreationTime is True:
-            keyRepository.reverse()
+            positions.reverse()
 
         if priorityTarget is not None:
-            priorityId = id(priorityTarget)
-            if priorityId in keyRepository:
-                # environLocal.printDebug(['priorityTarget found in post:', priorityTarget])
+            priorityPosition = self._siteIds.get(id(priorityTarget))
+            if priorityPosition is not None:
                 # extract object and make first
-                keyRepository.insert(0,
-                                     keyRepository.pop(keyRepository.index(priorityId)))
+                positions.remove(priorityPosition)
+                positions.insert(0, priorityPosition)
 
-        # get each dict from all defined contexts
-        for key in keyRepository:
-            siteRef = self.siteDict[key]
+        for i in positions:
             # check for None object; default location, not a weakref, keep
-            if siteRef.site is None:
+            if i == -1:
                 if not excludeNone:
-                    yield siteRef.site
-            else:
-                obj = siteRef.site
-                if obj is None:  # dead ref
-                    siteRef.isDead = True
-                else:
-                    yield obj
+                    yield None
+                continue
+            obj = _unwrapSite(siteRefs[i])
+            if obj is not None:  # not a dead ref
+                yield obj
 
     def get(self,
             *,
@@ -688,13 +803,35 @@ class Sites(common.SlottedObjectMixin):
         >>> a.sites.getById(id(s)) is s
         True
         '''
-        siteRef = self.siteDict[siteId]
-        return siteRef.site
+        if siteId is None:
+            return None
+        i = self._siteIds[siteId]
+        return _unwrapSite(self._siteData[4 * i])
+
+    def getGlobalSiteIndex(self, siteId):
+        '''
+        Return the globalSiteIndex of the site with id `siteId`, a number
+        that increases every time a site is added to any Sites object, or
+        None if there is no such site.
+
+        >>> a = note.Note()
+        >>> s1 = stream.Stream()
+        >>> s2 = stream.Stream()
+        >>> s1.append(a)
+        >>> s2.append(a)
+        >>> a.sites.getGlobalSiteIndex(id(s1)) < a.sites.getGlobalSiteIndex(id(s2))
+        True
+        >>> a.sites.getGlobalSiteIndex(id(a)) is None
+        True
+        '''
+        i = self._siteIds.get(siteId)
+        if i is None:
+            return None
+        return self._siteData[4 * i + 3]
 
     def getSiteCount(self):
         '''
-        Return the number of non-dead sites, excluding the None site.  This does not
-        unwrap weakrefs for performance.
+        Return the number of non-dead sites, excluding the None site.
 
         >>> a = note.Note()
         >>> a.sites.getSiteCount()
@@ -708,12 +845,9 @@ class Sites(common.SlottedObjectMixin):
         2
         '''
         count = 0
-        for siteRef in self.siteDict.values():
-            if siteRef.isDead is True:
-                continue
-            if siteRef.siteWeakref is None:
-                continue
-            count += 1
+        for siteRef in self._siteData[::4]:
+            if _unwrapSite(siteRef) is not None:
+                count += 1
         return count
 
     def getSiteIds(self):
@@ -729,7 +863,9 @@ class Sites(common.SlottedObjectMixin):
         True
         '''
         # may want to convert to tuple to avoid user editing?
-        return set(self.siteDict.keys())
+        post = set(self._siteIds)
+        post.add(None)
+        return post
 
     def getSitesByClass(self, className):
         '''
@@ -759,13 +895,12 @@ class Sites(common.SlottedObjectMixin):
         if not isinstance(className, str):
             className = common.classToClassStr(className)
 
-        for siteRef in self.siteDict.values():
-            if siteRef.isDead:
-                continue
-            classStr = siteRef.classString
-            if classStr == className:
-                objRef = siteRef.site
-                found.append(objRef)
+        data = self._siteData
+        for i in range(1, len(data), 4):
+            if data[i] == className:
+                objRef = _unwrapSite(data[i - 1])
+                if objRef is not None:
+                    found.append(objRef)
         return found
 
     def hasSiteId(self, siteId):
@@ -790,29 +925,26 @@ class Sites(common.SlottedObjectMixin):
         >>> dc.hasSiteId(None)
         True
         '''
-        return siteId in self.siteDict
+        return siteId is None or siteId in self._siteIds
 
     def hasSpannerSite(self):
         '''
         Return True if this object is found in any Spanner. This is determined
         by looking for a SpannerStorage Stream class as a Site.
         '''
-        for siteRef in self.siteDict.values():
-            if siteRef.isDead:
-                continue
-            if siteRef.classString == 'SpannerStorage':
-                return True
-        return False
+        return self._hasLiveSiteOfClassString('SpannerStorage')
 
     def hasVariantSite(self):
         '''
         Return True if this object is found in any Variant. This is determined
         by looking for a VariantStorage Stream class as a Site.
         '''
-        for siteRef in self.siteDict.values():
-            if siteRef.isDead:
-                continue
-            if siteRef.classString == 'VariantStorage':
+        return self._hasLiveSiteOfClassString('VariantStorage')
+
+    def _hasLiveSiteOfClassString(self, classString):
+        data = self._siteData
+        for i in range(1, len(data), 4):
+            if data[i] == classString and _unwrapSite(data[i - 1]) is not None:
                 return True
         return False
 
@@ -825,6 +957,10 @@ class Sites(common.SlottedObjectMixin):
         have the element. This results b/c Sites are shallow-copied, and then
         elements are re-added.
 
+        Finding the dead sites means unwrapping every weakref, so it is only
+        done if `rescanIsDead` is True; otherwise dead sites are left for
+        :meth:`add` to remove once in a while.
+
         >>> class Mock(base.Music21Object):
         ...     pass
         >>> aStream = stream.Stream()
@@ -839,6 +975,9 @@ class Sites(common.SlottedObjectMixin):
         We still have 3 locations -- just because aStream is gone, doesn't
         make it disappear from sites
 
+        >>> len(mySites)
+        3
+        >>> mySites.purgeLocations()
         >>> len(mySites)
         3
 
@@ -846,31 +985,8 @@ class Sites(common.SlottedObjectMixin):
         >>> len(mySites)
         2
         '''
-        # first, check if any sites are dead, and cache the results
         if rescanIsDead:
-            for idKey in self.siteDict:
-                if idKey is None:
-                    continue
-                siteRef = self.siteDict[idKey]
-                obj = siteRef.site
-                if obj is None:  # if None, it no longer exists
-                    siteRef.isDead = True
-                else:
-                    siteRef.isDead = False
-        # use previously set isDead entry, so as not to
-        # unwrap all references
-        remove = []
-        for idKey in self.siteDict:
-            if idKey is None:
-                continue
-            siteRef = self.siteDict[idKey]
-            if siteRef.isDead:
-                remove.append(idKey)
-
-        for idKey in remove:
-            # this call changes the .siteDict, and thus must be
-            # outside the loop
-            self.removeById(idKey)
+            self._removeDeadSites()
 
     def remove(self, site):
         '''
@@ -913,37 +1029,26 @@ class Sites(common.SlottedObjectMixin):
         3
 
         '''
-        # must clear
-        self._lastID = -1  # cannot be None
-
-        siteId = None
+        i = None
         if site is not None:
-            siteId = id(site)
-        try:
-            del self.siteDict[siteId]
-            # environLocal.printDebug(['removed site w/o exception:', siteId,
-            #    'self.siteDict.keys()', self.siteDict.keys()])
-        except:
+            i = self._siteIds.get(id(site))
+        if i is None:
             raise SitesException('an entry for this object '
                                  + f'({site}) is not stored in this Sites object')
+        self._removeAtPosition(id(site), i)
 
     def removeById(self, idKey):
         '''
         Remove a site entry by id key,
         which is id() of the object.
         '''
-        # must clear if removing
-        if idKey == self._lastID:
-            self._lastID = -1  # cannot be None
         if idKey is None:
             raise SitesException('trying to remove None idKey is not allowed')
 
-        # environLocal.printDebug(['removeById', idKey,
-        #    'self.siteDict.keys()', self.siteDict.keys()])
-        try:
-            del self.siteDict[idKey]
-        except KeyError:
-            pass  # could already be gone.
+        i = self._siteIds.get(idKey)
+        if i is None:
+            return  # could already be gone.
+        self._removeAtPosition(idKey, i)
 
     def setAttrByName(self, attrName, value):
         '''
@@ -1004,6 +1109,28 @@ class Test(unittest.TestCase):
         lastNoteClef = lastNote.getContextByClass(clef.Clef)
         self.assertIsInstance(lastNoteClef, clef.TrebleClef)
 
+    def testPickleSites(self):
+        import pickle
+        from music21 import note, stream
+
+        s = stream.Stream()
+        m = stream.Measure()
+        n = note.Note()
+        s.insert(0, n)
+        m.insert(0, n)
+        temp = stream.Stream()
+        n.sites.add(temp)
+        del temp
+
+        # the sites are restored if they still exist when unpickling
+        n2 = pickle.loads(pickle.dumps(n))
+        self.assertEqual(n2.sites.get(excludeNone=True), [s, m])
+        self.assertEqual(n2.sites.getSitesByClass('Measure'), [m])
+        self.assertEqual(len(n2.sites), 4)
+        n2.sites.purgeLocations(rescanIsDead=True)
+        self.assertEqual(len(n2.sites), 3)
+        self.assertLess(n2.sites.getGlobalSiteIndex(id(s)), n2.sites.getGlobalSiteIndex(id(m)))
+
 
 # ----------------------------------------------------------------------------
 _DOC_ORDER = [SiteRef, Sites]
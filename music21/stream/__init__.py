@@ -20,6 +20,7 @@ as the :class:`~music21.stream.Measure`
 and :class:`~music21.stream.Score` objects, are defined in
 this module.
 '''
+import bisect
 import collections
 import copy
 import itertools
@@ -1425,6 +1426,11 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
 
     def _deepcopySubclassable(self, memo=None, ignoreAttributes=None, removeFromIgnore=None):
         # NOTE: this is a performance critical operation
+        if '_lazyCopySource' in self.__dict__:
+            # this is itself a lazy copy not used yet: it needs its elements first
+            self.coreCopyLazyElements()
+        elif '_deferredElementsLoader' in self.__dict__:
+            self.coreLoadDeferredElements()
         defaultIgnoreSet = {'_offsetDict', 'streamStatus', '_elements', '_endElements', '_cache',
                             }
         if ignoreAttributes is None:
@@ -1453,7 +1459,38 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 newValue.client = new
                 setattr(new, 'streamStatus', newValue)
                 # self.streamStatus.client = storedClient
-        if '_elements' in ignoreAttributes:
+        copyElements = '_elements' in ignoreAttributes
+        copyEndElements = '_endElements' in ignoreAttributes
+        if (copyElements and copyEndElements
+                and isinstance(memo, core.LazyCopyMemo)):
+            # elements are copied by coreCopyLazyElements when first needed
+            if self.autoSort and not self.isSorted:
+                # sorting the copy instead would need the durations
+                # of its substreams, and so copy them too.
+                self.sort()
+                new.isSorted = True
+            del new._offsetDict
+            del new._elements
+            del new._endElements
+            new._lazyCopySource = (self, memo)
+        else:
+            self.coreCopyElementsInto(new, memo,
+                                      elements=copyElements,
+                                      endElements=copyEndElements)
+        return new
+
+    def coreCopyElementsInto(self, new, memo=None, *, elements=True, endElements=True):
+        '''
+        N.B. -- a "core" method, not to be used by general users.
+
+        Put deep copies of the elements (if `elements` is True) and
+        end elements (if `endElements` is True) of this Stream into the
+        empty Stream `new`, at the same offsets.  Substreams are copied
+        without replacing their spanners.  If `memo` is a
+        :class:`~music21.stream.core.LazyCopyMemo`, substreams are copied lazily.
+        '''
+        lazyMemo = memo if isinstance(memo, core.LazyCopyMemo) else None
+        if elements:
             # must manually add elements to new Stream
             for e in self._elements:
                 # environLocal.printDebug(['deepcopy()', e, 'old', old, 'id(old)', id(old),
@@ -1473,12 +1510,18 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                     newElement = copy.deepcopy(e, memo)
                 else:  # this prevents needing to make multiple replacements of spanner bundles
                     newElement = e._deepcopySubclassable(memo)
+                    if memo is not None:
+                        # as copy.deepcopy() would, so that later copies
+                        # of objects that refer to e refer to newElement.
+                        memo[id(e)] = newElement
 
                 # ## TEST on copying!!!!
                 # if 'Note' in newElement.classes:
                 #     newElement.pitch.ps += 2.0
                 new.coreInsert(offset, newElement, ignoreSort=True)
-        if '_endElements' in ignoreAttributes:
+                if lazyMemo is not None:
+                    lazyMemo.addCopy(e, newElement)
+        if endElements:
             # must manually add elements to
             for e in self._endElements:
                 # this will work for all with __deepcopy___
@@ -1486,9 +1529,10 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 # user here to provide new offset
 
                 # noinspection PyArgumentList
-                new.coreStoreAtEnd(copy.deepcopy(e, memo))
-
-        return new
+                newElement = copy.deepcopy(e, memo)
+                new.coreStoreAtEnd(newElement)
+                if lazyMemo is not None:
+                    lazyMemo.addCopy(e, newElement)
 
     def __deepcopy__(self, memo=None):
         '''
@@ -1496,6 +1540,9 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         '''
         # does not purgeOrphans -- q: is that a bug or by design?
         new = self._deepcopySubclassable(memo)
+        if isinstance(memo, core.LazyCopyMemo):
+            # spanners are replaced by the memo as elements are copied.
+            return new
         self._replaceSpannerBundleForDeepcopy(new)
 
         # purging these orphans works in nearly all cases, but there are a few
@@ -1504,6 +1551,72 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         # new.purgeOrphans()
         return new
 
+    def lazyDeepcopy(self):
+        '''
+        Return a deepcopy of this Stream that is made a piece at a time:
+        the elements of each Stream in the copy are copied only when
+        that Stream is first used.  Until then, nothing is copied, so
+        code that only looks at a few Parts or Measures of a large
+        Score does not pay for copying all of it.
+
+        >>> s = corpus.parse('bwv66.6')
+        >>> sCopy = s.lazyDeepcopy()
+        >>> sCopy.isLazyCopy
+        True
+        >>> sCopy.derivation.origin is s
+        True
+
+        Getting the parts copies the Score's elements, but not the
+        contents of the parts:
+
+        >>> bass = sCopy.parts[-1]
+        >>> sCopy.isLazyCopy
+        False
+        >>> bass.isLazyCopy
+        True
+        >>> bass is s.parts[-1]
+        False
+        >>> sCopy.parts[0].isLazyCopy
+        True
+
+        Once used, the copy is an ordinary deepcopy:
+
+        >>> bass.measure(1).notes[0].pitch.octave = 2
+        >>> bass.measure(1).notes[0].nameWithOctave
+        'F#2'
+        >>> s.parts[-1].measure(1).notes[0].nameWithOctave
+        'F#3'
+        >>> sCopy.parts[0].isLazyCopy
+        True
+
+        Spanners in the copy refer to the copied elements, as with `copy.deepcopy`:
+
+        >>> s2 = stream.Part()
+        >>> m1 = stream.Measure(number=1)
+        >>> m1.append(note.Note('C', type='whole'))
+        >>> m2 = stream.Measure(number=2)
+        >>> m2.append(note.Note('D', type='whole'))
+        >>> s2.append([m1, m2])
+        >>> s2.insert(0, spanner.Slur(m1.notes[0], m2.notes[0]))
+        >>> s2Copy = s2.lazyDeepcopy()
+        >>> slCopy = s2Copy.spanners[0]
+        >>> slCopy.getFirst() is s2Copy.measure(1).notes[0]
+        True
+        >>> slCopy.getLast() is s2Copy.measure(2).notes[0]
+        True
+
+        Changes made to this Stream after the copy is made may be seen in
+        the parts of the copy that have not been used yet, so do not change
+        the original while the copy is still needed; use `copy.deepcopy`
+        if that is a problem.
+        '''
+        return copy.deepcopy(self, core.LazyCopyMemo())
+
+    def __getstate__(self):
+        self.coreCopyLazyElements()
+        self.coreLoadDeferredElements()
+        return super().__getstate__()
+
     def _replaceSpannerBundleForDeepcopy(self, new):
         # perform the spanner bundle replacement on the outer stream.
         # caching this is CRUCIAL! using new.spannerBundle ever time below added
@@ -1512,6 +1625,13 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         # only proceed if there are spanners, otherwise creating semiFlat
         if not newSpannerBundle:
             return
+        # find the spanners of each old element at once instead of
+        # searching all the spanners for each element.
+        spannersBySpannedId = collections.defaultdict(list)
+        for sp in newSpannerBundle:
+            for spannedElement in sp.getSpannedElements():
+                spannersBySpannedId[id(spannedElement)].append(sp)
+
         # iterate over complete semi-flat (need containers); find
         # all new/old pairs
         for e in new.recurse(includeSelf=False):
@@ -1529,7 +1649,8 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 # environLocal.printDebug(['Stream.__deepcopy__', 'replacing component to', e])
                 # this will clear and replace the proper locations on
                 # the SpannerStorage Stream
-                newSpannerBundle.replaceSpannedElement(origin, e)
+                for sp in spannersBySpannedId.pop(id(origin), ()):
+                    sp.replaceSpannedElement(origin, e)
 
                 # need to remove the old SpannerStorage Stream from this element;
                 # however, all we have here is the new Spanner and new elements
@@ -1577,9 +1698,13 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             pass
 
         idEl = id(element)
-        if not addElement and idEl not in self._offsetDict:
-            raise StreamException(
-                'Cannot set the offset for element {}, not in Stream {}.'.format(element, self))
+        if not addElement:
+            if idEl not in self._offsetDict:
+                raise StreamException(
+                    'Cannot set the offset for element {}, not in Stream {}.'.format(
+                        element, self))
+            if 'offsetIndex' in self._cache:
+                del self._cache['offsetIndex']
         self._offsetDict[idEl] = (offset, element)  # fast
         if setActiveSite:
             self.coreSelfActiveSite(element)
@@ -1724,13 +1849,8 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             offset = offsetOrItemOrList
             item = itemOrNone
         elif itemOrNone is None and isinstance(offsetOrItemOrList, list):
-            i = 0
-            while i < len(offsetOrItemOrList):
-                offset = offsetOrItemOrList[i]
-                item = offsetOrItemOrList[i + 1]
-                # recursively calling insert() here
-                self.insert(offset, item, ignoreSort=ignoreSort)
-                i += 2
+            self.insertMany(zip(offsetOrItemOrList[0::2], offsetOrItemOrList[1::2]),
+                            ignoreSort=ignoreSort)
             return
         # assume first arg is item, and that offset is local offset of object
         else:
@@ -1770,6 +1890,102 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         if ignoreSort is False:
             self.isSorted = storeSorted
 
+    def insertMany(self, offsetsAndElements, *, ignoreSort=False, setActiveSite=True):
+        '''
+        Inserts many elements at once, given an iterable of (offset, element) pairs.
+
+        The result is the same as calling `.insert()` on each pair, but the caches
+        of the Stream are cleared only once, at the end, and if the Stream was sorted
+        and the pairs come in sorted order (as they do when importing a file
+        or copying from another sorted Stream), the Stream stays sorted.
+
+        >>> s = stream.Stream()
+        >>> s.insertMany([(2.0, note.Note('E')), (0.0, note.Note('C')), (1.0, note.Note('D'))])
+        >>> s.isSorted
+        False
+        >>> s.show('text')
+        {0.0} <music21.note.Note C>
+        {1.0} <music21.note.Note D>
+        {2.0} <music21.note.Note E>
+
+        >>> s.insertMany((float(i), note.Note('F')) for i in range(3, 6))
+        >>> s.isSorted
+        True
+        >>> s.highestTime
+        6.0
+
+        Elements at the same offset are compared by their full sortTuple:
+
+        >>> s2 = stream.Stream()
+        >>> s2.insertMany([(0, clef.TrebleClef()), (0, meter.TimeSignature('2/4'))])
+        >>> s2.isSorted
+        True
+        >>> s2.insertMany([(0, note.Note()), (0, key.KeySignature(2))])
+        >>> s2.isSorted
+        False
+        >>> s2.show('text')
+        {0.0} <music21.clef.TrebleClef>
+        {0.0} <music21.key.KeySignature of 2 sharps>
+        {0.0} <music21.meter.TimeSignature 2/4>
+        {0.0} <music21.note.Note C>
+
+        The same checks as `.insert()` are run on each element; the elements
+        before one that fails stay in the Stream:
+
+        >>> n = note.Note()
+        >>> stream.Stream().insertMany([(0, n), (1, n)])
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: the object (<music21.note.Note C>, id()=...)
+            is already found in this Stream (<music21.stream.Stream ...>, id()=...)
+        '''
+        storeSorted = self.isSorted
+        if self._elements:
+            lastElement = self._elements[-1]
+            lastOffset = self.elementOffset(lastElement)
+        else:
+            lastElement = None
+            lastOffset = None
+
+        updateIsFlat = False
+        completed = False
+        # if an element fails, the ones before it stay in, so the caches
+        # must be cleared in any case
+        try:
+            for offset, element in offsetsAndElements:
+                try:  # using float conversion instead of isNum for performance
+                    offset = float(offset)
+                except (ValueError, TypeError):
+                    if offset is None:
+                        offset = 0.0
+                    else:
+                        raise StreamException('offset %s must be a number' % offset)
+
+                if not isinstance(element, base.Music21Object):
+                    raise StreamException('to put a non Music21Object in a stream, '
+                                          + 'create a music21.ElementWrapper for the item')
+                self.coreGuardBeforeAddElement(element)
+                self.setElementOffset(element, offset, addElement=True, setActiveSite=setActiveSite)
+                element.sites.add(self)
+                self._elements.append(element)
+                if element.isStream:
+                    updateIsFlat = True
+
+                if storeSorted and not ignoreSort:
+                    # only the full sortTuples of elements at the same offset need comparing
+                    offset = self.elementOffset(element)
+                    if lastElement is not None and (
+                            offset < lastOffset
+                            or (offset == lastOffset
+                                and element.sortTuple(self) < lastElement.sortTuple(self))):
+                        storeSorted = False
+                    lastElement = element
+                    lastOffset = offset
+            completed = True
+        finally:
+            self.coreElementsChanged(updateIsFlat=updateIsFlat)
+            if completed and ignoreSort is False:
+                self.isSorted = storeSorted
+
     def insertIntoNoteOrChord(self, offset, noteOrChord, chordsOnly=False):
         '''
         Insert a Note or Chord into an offset position in this Stream.
@@ -2023,6 +2239,23 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         self.isSorted = storeSorted
         self._setHighestTime(highestTime)  # call after to store in cache
 
+    def appendMany(self, elements):
+        '''
+        Appends each element of an iterable (which, unlike for `.append()`,
+        may be a generator) one after another, clearing the caches of the
+        Stream only once.
+
+        >>> s = stream.Stream()
+        >>> s.appendMany(note.Note(p, quarterLength=2) for p in 'CDE')
+        >>> s.show('text')
+        {0.0} <music21.note.Note C>
+        {2.0} <music21.note.Note D>
+        {4.0} <music21.note.Note E>
+        >>> s.highestTime
+        6.0
+        '''
+        self.append(list(elements))
+
     def storeAtEnd(self, itemOrList, ignoreSort=False):
         '''
         Inserts an item or items at the end of the Stream,
@@ -3275,10 +3508,11 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         <music21.note.Note D>
         '''
         # NOTE: this is a performance critical method
+        offset = opFrac(offset)
+        if self.coreOffsetIndex() is not None:
+            return self._getElementAtOrBeforeSorted(offset, classList, includeOffset=True)
 
-        # TODO: switch to trees
         candidates = []
-        offset = opFrac(offset)
         nearestTrailSpan = offset  # start with max time
 
         sIterator = self.iter
@@ -3365,8 +3599,11 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         (0.0, 'z')
         '''
         # NOTE: this is a performance critical method
-        candidates = []
         offset = opFrac(offset)
+        if self.coreOffsetIndex() is not None:
+            return self._getElementAtOrBeforeSorted(offset, classList, includeOffset=False)
+
+        candidates = []
         nearestTrailSpan = offset  # start with max time
 
         sIterator = self.iter
@@ -3392,6 +3629,56 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         else:
             return None
 
+    def _getElementAtOrBeforeSorted(self, offset, classList=None, *, includeOffset=True):
+        '''
+        Does the work of getElementAtOrBefore (or, if includeOffset is False,
+        getElementBeforeOffset) on a sorted Stream, by a binary search of the
+        offset index followed by a backwards walk to the first element
+        matching `classList`.
+
+        As in the unsorted search, elements at negative offsets are only
+        found if they are exactly at `offset`.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 4)
+        >>> s.insert(2, clef.BassClef())
+        >>> s._getElementAtOrBeforeSorted(2.0)
+        <music21.note.Note C>
+        >>> s._getElementAtOrBeforeSorted(2.0, ['Clef'])
+        <music21.clef.BassClef>
+        >>> s._getElementAtOrBeforeSorted(2.0, includeOffset=False).offset
+        1.0
+        '''
+        def matchesClass(e):
+            return not classList or e.isClassOrSubclass(classList)
+
+        if self._endElements:
+            highestTime = self.highestTime
+            if highestTime < offset or (includeOffset and highestTime == offset):
+                endCandidates = [e for e in self._endElements if matchesClass(e)]
+                if endCandidates:
+                    # end elements always sort after elements at the same offset.
+                    found = max(endCandidates, key=lambda x: x.sortTuple(self))
+                    self.coreSelfActiveSite(found)
+                    return found
+
+        starts = self.coreOffsetIndex()[0]
+        if includeOffset:
+            i = bisect.bisect_right(starts, offset)
+        else:
+            i = bisect.bisect_left(starts, offset)
+
+        elements = self._elements
+        for j in range(i - 1, -1, -1):
+            elementOffset = starts[j]
+            if elementOffset < 0 and elementOffset != offset:
+                break
+            e = elements[j]
+            if matchesClass(e):
+                self.coreSelfActiveSite(e)
+                return e
+        return None
+
     # def getElementAfterOffset(self, offset, classList=None):
     #    '''Get element after a provided offset
     #
@@ -3988,7 +4275,7 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
 
             restQL = restInfo['endTime'] - restInfo['offset']
             restObj = note.Rest(quarterLength=restQL)
-            out.insert(restInfo['offset'], restObj)
+            out.coreInsert(restInfo['offset'], restObj)
             restInfo['offset'] = None
             restInfo['endTime'] = None
 
@@ -3998,7 +4285,7 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 outEl = el.template(fillWithRests=fillWithRests,
                                     removeClasses=removeClasses,
                                     retainVoices=retainVoices)
-                out.insert(el.offset, outEl)
+                out.coreInsert(el.offset, outEl)
 
             elif (removeClasses is True
                     or el.classSet.intersection(removeClasses)
@@ -4014,9 +4301,11 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             else:
                 optionalAddRest()
                 elNew = copy.deepcopy(el)
-                out.insert(el.offset, elNew)
+                out.coreInsert(el.offset, elNew)
 
         optionalAddRest()
+        # one cache clear at the end rather than one per insert.
+        out.coreElementsChanged()
 
         return out
 
@@ -5314,7 +5603,9 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                  addTies=True,
                  addPartIdAsGroup=False,
                  removeRedundantPitches=True,
-                 toSoundingPitch=True
+                 toSoundingPitch=True,
+                 sweep=True,
+                 pitchesOnly=False,
                  ):
         '''
         Create a chordal reduction of polyphonic music, where each
@@ -5440,6 +5731,37 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         >>> c.pitches[0].groups
         ['p0', 'p1']
 
+        The chords are found with a single sweep through a TimespanTree of the
+        whole score.  If `sweep` is False, each slice of measures is instead
+        extracted with `.measure()` and given its own TimespanTree, as
+        before v.6.  The results are the same, but much slower to get; the
+        option is kept for comparison.
+
+        If `pitchesOnly` is True (only with `sweep`), each Chord is made
+        directly from the pitches sounding, without copying the Notes, so ties,
+        articulations, and expressions are not transferred.  Each pitch is copied
+        only once and the copy is shared by every Chord in which it sounds.
+        This is much faster and uses much less memory, for instance for harmonic
+        analysis, but changing a pitch of one chord will change it in the others.
+
+        >>> s = stream.Score()
+        >>> p1 = stream.Part()
+        >>> p1.append(note.Note('C4', type='whole'))
+        >>> p2 = stream.Part()
+        >>> p2.append([note.Note('E4', type='half'), note.Note('G4', type='half')])
+        >>> s.insert(0, p1)
+        >>> s.insert(0, p2)
+        >>> cc = s.chordify(pitchesOnly=True)
+        >>> cc.show('text')
+        {0.0} <music21.chord.Chord C4 E4>
+        {2.0} <music21.chord.Chord C4 G4>
+        >>> cc[0].pitches[0] is cc[1].pitches[0]
+        True
+        >>> cc[0].pitches[0] is p1.notes[0].pitch
+        False
+        >>> print(cc[1].notes[0].tie)
+        None
+
         Changes in v.5:
 
         Runs a little faster for small scores and run a TON faster for big scores
@@ -5447,6 +5769,10 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
 
         no longer supported: displayTiedAccidentals=False,
 
+        Changed in v.6 -- added `sweep` and `pitchesOnly`; sweeping is now the
+        default.  `sweep=False` restores the measure-by-measure chordify of
+        earlier versions.
+
 
         OMIT_FROM_DOCS
 
@@ -5461,6 +5787,8 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         >>> cn[0].pitches
         (<music21.pitch.Pitch C4>, <music21.pitch.Pitch D#4>)
         '''
+        from music21.tree.verticality import Verticality
+
         def chordifyOneMeasure(template, streamToChordify):
             timespanTree = streamToChordify.asTimespans(classList=('GeneralNote',))
             allTimePoints = timespanTree.allTimePoints()
@@ -5489,6 +5817,155 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             template.coreElementsChanged()
             consolidateRests(template)
 
+        def sweepOneMeasure(template, timespans, templateOffset):
+            '''
+            Fill `template` with Chords and Rests from `timespans`, which must be
+            in the order of a TimespanTree, and which have offsets in the score.
+            `templateOffset` is the offset in the score of the start of the template.
+            '''
+            timePoints = {templateOffset}
+            for ts in timespans:
+                timePoints.add(ts.offset)
+                timePoints.add(ts.endTime)
+            timePoints = sorted(timePoints)
+
+            sounding = []
+            nextIndex = 0
+            numTimespans = len(timespans)
+            for offset, endTime in zip(timePoints, timePoints[1:]):
+                sounding = [ts for ts in sounding if ts.endTime > offset]
+                starting = []
+                while nextIndex < numTimespans and timespans[nextIndex].offset <= offset:
+                    starting.append(timespans[nextIndex])
+                    nextIndex += 1
+
+                if not common.almostEquals(offset, endTime):
+                    chordOrRest = makeChordOrRest(offset,
+                                                  endTime - offset,
+                                                  tuple(starting),
+                                                  tuple(sounding))
+                    template.coreInsert(opFrac(offset - templateOffset), chordOrRest)
+                sounding.extend(starting)
+            template.coreElementsChanged()
+            consolidateRests(template)
+
+        sharedPitches = {}
+
+        def makeChordOrRest(offset, quarterLength, startTimespans, overlapTimespans):
+            if not pitchesOnly:
+                vert = Verticality(offset=offset,
+                                   startTimespans=startTimespans,
+                                   overlapTimespans=overlapTimespans)
+                return vert.makeElement(quarterLength,
+                                        addTies=addTies,
+                                        addPartIdAsGroup=addPartIdAsGroup,
+                                        removeRedundantPitches=removeRedundantPitches,
+                                        )
+
+            pitches = []
+            seenPitchNames = set()
+            for ts in startTimespans + overlapTimespans:
+                try:
+                    tsPitches = sharedPitches[id(ts)]
+                except KeyError:
+                    tsPitches = timespanPitches(ts)
+                    sharedPitches[id(ts)] = tsPitches
+                for p in tsPitches:
+                    if removeRedundantPitches:
+                        if p.nameWithOctave in seenPitchNames:
+                            continue
+                        seenPitchNames.add(p.nameWithOctave)
+                    pitches.append(p)
+
+            if not pitches:
+                chordOrRest = note.Rest()
+            else:
+                pitches.sort(key=lambda p: p.ps)
+                chordOrRest = chord.Chord(pitches)
+            chordOrRest.duration.quarterLength = opFrac(quarterLength)
+            return chordOrRest
+
+        def timespanPitches(ts):
+            el = ts.element
+            if not hasattr(el, 'pitches'):
+                return ()
+            tsPitches = [copy.deepcopy(p) for p in el.pitches]
+            if addPartIdAsGroup:
+                partContext = el.getContextByClass('Part')
+                if partContext is not None:
+                    pitchGroup = str(partContext.id).replace(' ', '_')
+                    for p in tsPitches:
+                        p.groups.append(pitchGroup)
+            return tsPitches
+
+        def chordifyBySweep(template, templateOffset):
+            '''
+            Chordify all of workObj with one TimespanTree.  Returns False if
+            the measures cannot be matched up as `.measure()` would.
+            '''
+            timespanTree = workObj.asTimespans(classList=('GeneralNote',))
+            if not template.hasMeasures():
+                sweepOneMeasure(template, list(timespanTree), 0.0)
+                return True
+
+            if isinstance(workObj, Score):
+                measureSources = list(workObj.parts)
+            else:
+                measureSources = [workObj]
+
+            # the index and offset in the score of each measure;
+            # as in .measure(indicesNotNumbers=True), measures are matched by index
+            measureInfo = {}
+            for sourceIndex, source in enumerate(measureSources):
+                if source is workObj:
+                    sourceOffset = 0.0
+                else:
+                    sourceOffset = workObj.elementOffset(source)
+                sourceMeasures = source.getElementsByClass('Measure')
+                if not sourceMeasures:
+                    return False
+                for i, m in enumerate(sourceMeasures):
+                    measureInfo[id(m)] = (i,
+                                          opFrac(sourceOffset + source.elementOffset(m)),
+                                          sourceIndex)
+
+            templateMeasures = list(template.getElementsByClass('Measure'))
+            templateOffsets = [opFrac(templateOffset + template.elementOffset(m))
+                               for m in templateMeasures]
+            timespansByMeasure = [[] for _ in templateMeasures]
+            shiftedMeasures = set()
+            for ts in timespanTree:
+                for container in ts.parentage:
+                    if id(container) in measureInfo:
+                        break
+                else:
+                    continue  # not in a measure
+                i, measureOffset, sourceIndex = measureInfo[id(container)]
+                if i >= len(templateMeasures):
+                    continue
+                if measureOffset != templateOffsets[i]:
+                    # a part whose measures do not line up with the first part's
+                    shift = templateOffsets[i] - measureOffset
+                    ts = ts.new(offset=opFrac(ts.offset + shift),
+                                endTime=opFrac(ts.endTime + shift))
+                    shiftedMeasures.add(i)
+                timespansByMeasure[i].append((ts, sourceIndex))
+
+            for i, timespansAndSources in enumerate(timespansByMeasure):
+                if i in shiftedMeasures:
+                    # the order of a TimespanTree made from this measure alone
+                    timespansAndSources.sort(
+                        key=lambda tsSource: (tsSource[0].offset,
+                                              tsSource[0].endTime,
+                                              tsSource[1]))
+                timespansByMeasure[i] = [ts for ts, unused_source in timespansAndSources]
+
+            for templateMeasure, measureOffset, timespans in zip(templateMeasures,
+                                                                 templateOffsets,
+                                                                 timespansByMeasure):
+                sweepOneMeasure(templateMeasure, timespans, measureOffset)
+            return True
+
         def consolidateRests(template):
             consecutiveRests = []
             for el in list(template.getElementsByClass('GeneralNote')):
@@ -5532,7 +6009,14 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                                            removeClasses=('GeneralNote',),
                                            retainVoices=False)
 
-        if template.hasMeasures():
+        if templateStream is workObj:
+            templateOffset = 0.0
+        else:
+            templateOffset = workObj.elementOffset(templateStream)
+
+        if sweep and chordifyBySweep(template, templateOffset):
+            pass
+        elif template.hasMeasures():
             measureIterator = template.getElementsByClass('Measure')
             for i, templateMeasure in enumerate(measureIterator):
                 measurePart = workObj.measure(i, collect=(), indicesNotNumbers=True)
@@ -6493,12 +6977,15 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         # trust if this is sorted: do not sort again
         # experimental
         if (not self.isSorted and self._mutable) or force:
-            self._elements.sort(key=lambda x: x.sortTuple(self))
-            self._endElements.sort(key=lambda x: x.sortTuple(self))
+            self._elements.sort(key=self.coreSortKey)
+            self._endElements.sort(key=self.coreSortKey)
 
             # as sorting changes order, elements have changed;
-            # need to clear cache, but flat status is the same
-            self.coreElementsChanged(updateIsFlat=False, clearIsSorted=False)
+            # need to clear cache of anything depending on the order,
+            # but flat status is the same
+            self.coreElementsChanged(updateIsFlat=False,
+                                     clearIsSorted=False,
+                                     changed=(core.SORT_ORDER,))
             self.isSorted = True
             # environLocal.printDebug(['_elements', self._elements])
 
@@ -6643,27 +7130,54 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
         sNew.derivation.method = method
         # storing .elements in here necessitates
         # create a new, independent cache instance in the flat representation
-        sNew._cache = {}
+        sNew._cache = core.StreamCache()
         sNew._offsetDict = {}
         sNew._elements = []
         sNew._endElements = []
         sNew.coreElementsChanged()
 
-        ri = iterator.RecursiveIterator(self,
-                                        restoreActiveSites=False,
-                                        includeSelf=False,
-                                        ignoreSorting=True,
-                                        )
-        for e in ri:
-            if e.isStream and not retainContainers:
-                continue
-            sNew.coreInsert(ri.currentHierarchyOffset(),
-                             e,
-                             setActiveSite=False)
+        # each container is walked in its own (sorted) order, so the flat
+        # elements arrive as one sorted run per container.  The sort keys are
+        # made during the walk, and sorting them merges the runs instead of
+        # sorting from scratch.
+        sortKeys = []
+
+        def addContainer(container, containerOffset):
+            for e in container.elements:
+                offset = opFrac(containerOffset + container.elementOffset(e))
+                if e.isStream:
+                    if retainContainers:
+                        addElement(offset, e)
+                    addContainer(e, offset)
+                else:
+                    addElement(offset, e)
+
+        def addElement(offset, e):
+            sNew.coreInsert(offset, e, setActiveSite=False)
+            d = e.duration
+            if d is not None and d.isGrace:
+                isNotGrace = 0
+            else:
+                isNotGrace = 1
+            sortKeys.append((0,
+                             sNew._offsetDict[id(e)][0],
+                             e.priority,
+                             e.classSortOrder,
+                             isNotGrace,
+                             e.sites.getGlobalSiteIndex(id(sNew))))
+
+        addContainer(self, 0.0)
 
         sNew.isFlat = True
         if self.autoSort is True:
-            sNew.sort()  # sort it immediately so that cache is not invalidated
+            # sort it immediately so that cache is not invalidated
+            order = sorted(range(len(sortKeys)), key=sortKeys.__getitem__)
+            flatElements = sNew._elements
+            sNew._elements = [flatElements[i] for i in order]
+            sNew.coreElementsChanged(updateIsFlat=False,
+                                     clearIsSorted=False,
+                                     changed=(core.SORT_ORDER,))
+            sNew.isSorted = True
         else:
             sNew.coreElementsChanged()
         # here, we store the source stream from which this stream was derived
@@ -7380,8 +7894,10 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
             return self._cache['Duration']
         else:
             # environLocal.printDebug(['creating new duration based on highest time'])
+            # get the highestTime first: it might make deferred elements and clear the cache
+            highestTime = self.highestTime
             self._cache['Duration'] = duration.Duration()
-            self._cache['Duration'].quarterLength = self.highestTime
+            self._cache['Duration'].quarterLength = highestTime
             return self._cache['Duration']
 
     def _setDuration(self, durationObj):
@@ -8965,6 +9481,258 @@ class Stream(core.StreamCoreMixin, base.Music21Object):
                 post.extend(list(e.pitches))
         return post
 
+    # --------------------------------------------------------------------------
+    # array export and import
+
+    # the fields of the array returned by toArrays()
+    _arrayDtype = [('offset', 'f8'),
+                   ('quarterLength', 'f8'),
+                   ('ps', 'f8'),
+                   ('velocity', 'i2'),
+                   ('tie', 'U8'),
+                   ('part', 'i4'),
+                   ('measure', 'i4'),
+                   ('voice', 'i4'),
+                   ('pitchIndex', 'i2'),
+                   ]
+
+    def _arrayRowsAndTargets(self):
+        '''
+        Gather, in one pass through the Stream and its substreams, the rows
+        of the array returned by :meth:`toArrays` and, for each row, a tuple of the
+        Note or Chord it comes from, the index of the pitch in the Chord (-1 for
+        a Note) and the Stream that the Note or Chord is in.
+        '''
+        rows = []
+        targets = []
+
+        def gather(s, offset, partIndex, measureNumber, voiceIndex):
+            voiceCount = 0
+            partCount = 0
+            isTop = s is self and partLike
+            for e in s.elements:
+                eOffset = offset + s.elementOffset(e)
+                if e.isStream:
+                    if isTop:
+                        gather(e, eOffset, partCount, measureNumber, voiceIndex)
+                        partCount += 1
+                    elif 'Measure' in e.classes:
+                        number = e.number if e.number is not None else -1
+                        gather(e, eOffset, partIndex, number, voiceIndex)
+                    elif 'Voice' in e.classes:
+                        gather(e, eOffset, partIndex, measureNumber, voiceCount)
+                        voiceCount += 1
+                    else:
+                        gather(e, eOffset, partIndex, measureNumber, voiceIndex)
+                    continue
+                if isinstance(e, note.Note):
+                    components = ((-1, e),)
+                    chordVelocity = None
+                elif isinstance(e, chord.Chord):
+                    components = enumerate(e.notes)
+                    if e.hasComponentVolumes():
+                        chordVelocity = None
+                    elif e.hasVolumeInformation() and e.volume.velocity is not None:
+                        chordVelocity = e.volume.velocity
+                    else:
+                        chordVelocity = -1
+                else:
+                    continue
+                quarterLength = float(e.duration.quarterLength)
+                for pitchIndex, n in components:
+                    if chordVelocity is not None:
+                        velocity = chordVelocity
+                    elif n.hasVolumeInformation() and n.volume.velocity is not None:
+                        velocity = n.volume.velocity
+                    else:
+                        velocity = -1
+                    if n.tie is not None:
+                        tieType = n.tie.type
+                    else:
+                        tieType = ''
+                    rows.append((float(eOffset), quarterLength, n.pitch.ps, velocity, tieType,
+                                 partIndex, measureNumber, voiceIndex, pitchIndex))
+                    targets.append((e, pitchIndex, s))
+
+        partLike = self.hasPartLikeStreams()
+        gather(self, 0.0, 0, -1, -1)
+        return rows, targets
+
+    def toArrays(self):
+        '''
+        Return the data of all the Notes and Chords in this Stream and its
+        substreams as a NumPy record array, with one row for each Note or
+        pitch of a Chord, in the order of `.recurse()`.  Analyses can then be
+        run on whole columns at once, and the results put back into the Stream
+        with :meth:`fromArrays`.
+
+        The fields are:
+
+        * `offset`: the offset in this Stream (not in the Measure)
+        * `quarterLength`: the quarterLength of the Note or Chord
+        * `ps`: the `pitch.ps`
+        * `velocity`: the MIDI velocity, or -1 if not set
+        * `tie`: the tie type, such as 'start', or '' if not tied
+        * `part`: the index of the Part if this is a Score (or other Stream
+          of Part-like Streams), otherwise 0
+        * `measure`: the Measure number, or -1 if not in a Measure
+        * `voice`: the index of the Voice in its Measure, or -1 if not in a Voice
+        * `pitchIndex`: the index of the pitch in its Chord, or -1 for a Note
+
+        Requires NumPy.
+
+        >>> s = stream.Score()
+        >>> p1 = stream.Part()
+        >>> m = stream.Measure(number=1)
+        >>> m.append([note.Note('C4', type='half'), chord.Chord('E4 G4', type='half')])
+        >>> m.notes[0].tie = tie.Tie('start')
+        >>> p1.append(m)
+        >>> p2 = stream.Part()
+        >>> p2.append(note.Note('C3', type='whole'))
+        >>> p2.notes[0].volume.velocity = 80
+        >>> s.insert(0, p1)
+        >>> s.insert(0, p2)
+
+        >>> arr = s.toArrays()
+        >>> len(arr)
+        4
+        >>> arr.dtype.names
+        ('offset', 'quarterLength', 'ps', 'velocity', 'tie', 'part', 'measure', 'voice',
+         'pitchIndex')
+        >>> arr.offset
+        array([0., 2., 2., 0.])
+        >>> arr.ps
+        array([60., 64., 67., 48.])
+        >>> arr.velocity
+        array([-1, -1, -1, 80], dtype=int16)
+        >>> arr.tie
+        array(['start', '', '', ''], dtype='<U8')
+        >>> arr.part
+        array([0, 0, 0, 1], dtype=int32)
+        >>> arr.measure
+        array([ 1,  1,  1, -1], dtype=int32)
+        >>> arr.pitchIndex
+        array([-1,  0,  1, -1], dtype=int16)
+
+        Columns can be used as in any NumPy array:
+
+        >>> round(float(arr.ps[arr.part == 0].mean()), 2)
+        63.67
+        '''
+        if 'numpy' in base._missingImport:
+            raise StreamException('Cannot run toArrays without numpy installed')
+        import numpy
+
+        rows, unused_targets = self._arrayRowsAndTargets()
+        return numpy.rec.array(rows, dtype=self._arrayDtype) if rows else numpy.recarray(
+            (0,), dtype=self._arrayDtype)
+
+    def fromArrays(self, arrays):
+        '''
+        Put the values of an array made by :meth:`toArrays` (and then changed)
+        back into the Notes and Chords of this Stream, which must have
+        the same Notes and Chords as when the array was made.
+
+        Only values that differ from the Stream are set: `offset`, `quarterLength`,
+        `ps`, `velocity` (-1 removes nothing) and `tie` ('' removes the tie).
+        The offset and quarterLength of a Chord are taken from the row of its
+        first pitch; `part`, `measure`, `voice`, and `pitchIndex` are ignored.
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note('C4'), chord.Chord('E4 G4'), note.Note('B4')])
+        >>> arr = s.toArrays()
+        >>> arr.ps += 2
+        >>> arr.quarterLength[arr.ps > 70] = 2.0
+        >>> arr.velocity = 90
+        >>> arr.tie[0] = 'start'
+        >>> s.fromArrays(arr)
+        >>> s.show('text')
+        {0.0} <music21.note.Note D>
+        {1.0} <music21.chord.Chord F#4 A4>
+        {2.0} <music21.note.Note C#>
+        >>> s.notes[-1].quarterLength
+        2.0
+        >>> s.notes[1].volume.velocity
+        90
+        >>> s.notes[0].tie
+        <music21.tie.Tie start>
+
+        Offsets are set relative to the Stream that the array was made from,
+        even for Notes in Measures:
+
+        >>> p = stream.Part()
+        >>> m1 = stream.Measure(number=1)
+        >>> m1.append([note.Note('C', type='half'), note.Note('D', type='half')])
+        >>> m2 = stream.Measure(number=2)
+        >>> m2.append(note.Note('E', type='whole'))
+        >>> p.append([m1, m2])
+        >>> arr = p.toArrays()
+        >>> arr.offset
+        array([0., 2., 4.])
+        >>> arr.offset[2] = 5.0
+        >>> p.fromArrays(arr)
+        >>> p.measure(2).notes[0].offset
+        1.0
+
+        The array must have one row for each Note or pitch of a Chord:
+
+        >>> s.append(note.Note())
+        >>> s.fromArrays(arr)
+        Traceback (most recent call last):
+        music21.exceptions21.StreamException: the array has 3 rows, but the Stream
+            has 5 Notes and Chord pitches
+        '''
+        if 'numpy' in base._missingImport:
+            raise StreamException('Cannot run fromArrays without numpy installed')
+        import numpy
+
+        rows, targets = self._arrayRowsAndTargets()
+        if len(rows) != len(arrays):
+            raise StreamException(
+                f'the array has {len(arrays)} rows, but the Stream '
+                + f'has {len(rows)} Notes and Chord pitches')
+        if not rows:
+            return
+        current = numpy.rec.array(rows, dtype=self._arrayDtype)
+
+        changedContainers = {}
+        for field in ('offset', 'quarterLength', 'ps', 'velocity', 'tie'):
+            newValues = arrays[field]
+            for i in numpy.nonzero(current[field] != newValues)[0]:
+                el, pitchIndex, container = targets[i]
+                value = newValues[i]
+                if pitchIndex == -1:
+                    n = el
+                else:
+                    n = el.notes[pitchIndex]
+                if field == 'offset':
+                    if pitchIndex > 0:
+                        continue
+                    newOffset = container.elementOffset(el) + (value - current.offset[i])
+                    container.setElementOffset(el, opFrac(float(newOffset)))
+                    changedContainers[id(container)] = container
+                elif field == 'quarterLength':
+                    if pitchIndex <= 0:
+                        el.duration.quarterLength = opFrac(float(value))
+                elif field == 'ps':
+                    n.pitch.ps = float(value)
+                elif field == 'velocity':
+                    if value < 0:
+                        continue
+                    if pitchIndex == -1 or el.hasComponentVolumes():
+                        n.volume.velocity = int(value)
+                    else:
+                        el.volume.velocity = int(value)
+                else:  # tie
+                    if value:
+                        n.tie = tie.Tie(str(value))
+                    else:
+                        n.tie = None
+
+        for container in changedContainers.values():
+            container.coreElementsChanged(updateIsFlat=False,
+                                          changed=(core.OFFSETS, core.SORT_ORDER))
+
     # --------------------------------------------------------------------------
     # interval routines
 
@@ -13264,6 +14032,28 @@ class SpannerStorage(Stream):
         '''
         pass
 
+    def coreAppend(self, element, setActiveSite=True):
+        '''
+        A Stream whose elements have not been made yet (see
+        :meth:`~music21.stream.core.StreamCoreMixin.coreDeferElements`), and
+        everything after it, is stored at the end, since appending needs the
+        duration of the element, which would make them.  The offsets in a
+        SpannerStorage do not mean anything, only the order does.
+
+        >>> p1 = stream.Part()
+        >>> p1.coreDeferElements(lambda p: p.coreAppend(note.Note(type='whole')))
+        >>> p2 = stream.Part()
+        >>> sg = layout.StaffGroup([p1, p2])
+        >>> p1.hasDeferredElements
+        True
+        >>> sg.getSpannedElements() == [p1, p2]
+        True
+        '''
+        if self._endElements or (element.isStream and element.hasDeferredElements):
+            self.coreStoreAtEnd(element, setActiveSite=setActiveSite)
+        else:
+            super().coreAppend(element, setActiveSite=setActiveSite)
+
 
 class VariantStorage(Stream):
     '''
@@ -23,16 +23,281 @@ All functions here will eventually begin with `.core`.
 '''
 # pylint: disable=attribute-defined-outside-init
 
+import collections
 import unittest
 
+from music21 import common
 from music21 import spanner
 from music21 import tree
+from music21.common.numberTools import opFrac
 from music21.exceptions21 import StreamException, ImmutableStreamException
+from music21.sites import SitesException
+
+# -----------------------------------------------------------------------------
+# Every value cached in Stream._cache depends upon one or more aspects of
+# the Stream.  coreElementsChanged() is told which aspects have changed and
+# removes only the cached values that depend upon them.
+
+# the set of elements directly in the Stream
+ELEMENTS = 'elements'
+# the offsets of the elements directly in the Stream
+OFFSETS = 'offsets'
+# the durations of the elements directly in the Stream
+DURATIONS = 'durations'
+# the order of the elements directly in the Stream
+SORT_ORDER = 'sortOrder'
+# anything contained in a substream
+DESCENDANTS = 'descendants'
+
+ALL_ASPECTS = frozenset([ELEMENTS, OFFSETS, DURATIONS, SORT_ORDER, DESCENDANTS])
+
+# what a site needs to know when a Stream in it has changed.  Only
+# the duration of the substream is visible in the site, unless the
+# elements of the substream have changed, in which case everything
+# computed from the descendants of the site is wrong.
+_SITE_DURATIONS_CHANGED = frozenset([DURATIONS])
+_SITE_DESCENDANTS_CHANGED = frozenset([DURATIONS, DESCENDANTS])
+_STRUCTURE_ASPECTS = frozenset([ELEMENTS, OFFSETS, DESCENDANTS])
+
+cacheDependencies = {
+    'elements': frozenset([ELEMENTS, SORT_ORDER]),
+    'index': frozenset([ELEMENTS, SORT_ORDER]),
+    'offsetIndex': frozenset([ELEMENTS, OFFSETS, DURATIONS, SORT_ORDER]),
+    'classIndex': frozenset([ELEMENTS, SORT_ORDER]),
+    'sorted': frozenset([ELEMENTS, OFFSETS]),
+    'flat': frozenset([ELEMENTS, OFFSETS, DESCENDANTS]),
+    'semiFlat': frozenset([ELEMENTS, OFFSETS, DESCENDANTS]),
+    'spannerBundle': frozenset([ELEMENTS, DESCENDANTS]),
+    'HighestOffset': frozenset([ELEMENTS, OFFSETS]),
+    'LowestOffset': frozenset([ELEMENTS, OFFSETS]),
+    'HighestTime': frozenset([ELEMENTS, OFFSETS, DURATIONS]),
+    'Duration': frozenset([ELEMENTS, OFFSETS, DURATIONS]),
+    'GapStream': frozenset([ELEMENTS, OFFSETS, DURATIONS]),
+    'Gapless': frozenset([ELEMENTS, OFFSETS, DURATIONS]),
+    'hasMeasures': frozenset([ELEMENTS]),
+    'hasVoices': frozenset([ELEMENTS]),
+    'hasPartLikeStreams': frozenset([ELEMENTS, OFFSETS, DESCENDANTS]),
+    'variants': frozenset([ELEMENTS, OFFSETS]),
+    'notes': frozenset([ELEMENTS, SORT_ORDER]),
+    'notesAndRests': frozenset([ELEMENTS, SORT_ORDER]),
+    'parts': frozenset([ELEMENTS, SORT_ORDER]),
+    '_partName': frozenset([ELEMENTS, DESCENDANTS]),
+    '_partAbbreviation': frozenset([ELEMENTS, DESCENDANTS]),
+}
+
+# statistics are only collected after resetCacheStatistics()
+_collectCacheStatistics = False
+_cacheHits = collections.Counter()
+_cacheMisses = collections.Counter()
+_cacheInvalidations = collections.Counter()
+
+
+def cacheKeyDependencies(key):
+    '''
+    Return the frozenset of aspects of a Stream that the value cached
+    under `key` depends upon.  Keys that have not been declared in
+    `cacheDependencies` (such as the keys for trees) depend upon everything.
+
+    >>> sorted(stream.core.cacheKeyDependencies('HighestTime'))
+    ['durations', 'elements', 'offsets']
+    >>> treeKey = ('timespanTree', (), True)
+    >>> stream.core.cacheKeyDependencies(treeKey) == stream.core.ALL_ASPECTS
+    True
+    '''
+    return cacheDependencies.get(key, ALL_ASPECTS)
+
+
+def cacheStatistics():
+    '''
+    Return a dictionary mapping each key that has been looked up in
+    or removed from a Stream cache to a dictionary of the number of 'hits',
+    'misses', 'invalidations', and the 'hitRate' (or None if the key was never
+    looked up).  Counts are for all Streams since the last call to
+    :func:`resetCacheStatistics`, which also starts collecting them; nothing
+    is counted before it is first called.
+
+    >>> stream.core.resetCacheStatistics()
+    >>> s = stream.Stream()
+    >>> s.append(note.Note())
+    >>> s.hasMeasures()
+    False
+    >>> s.hasMeasures()
+    False
+    >>> s.append(note.Note())
+    >>> stream.core.cacheStatistics()['hasMeasures']
+    {'hits': 1, 'misses': 1, 'invalidations': 1, 'hitRate': 0.5}
+    >>> stream.core.resetCacheStatistics(collect=False)
+    >>> s.hasMeasures()
+    False
+    >>> stream.core.cacheStatistics()
+    {}
+    '''
+    allKeys = set(_cacheHits) | set(_cacheMisses) | set(_cacheInvalidations)
+    stats = {}
+    for key in allKeys:
+        hits = _cacheHits[key]
+        misses = _cacheMisses[key]
+        if hits + misses:
+            hitRate = hits / (hits + misses)
+        else:
+            hitRate = None
+        stats[key] = {'hits': hits,
+                      'misses': misses,
+                      'invalidations': _cacheInvalidations[key],
+                      'hitRate': hitRate}
+    return stats
+
+
+def resetCacheStatistics(collect=True):
+    '''
+    Set all the counts of :func:`cacheStatistics` to zero, and start
+    collecting them (or stop, if `collect` is False).  While they are not
+    collected, looking up a key in a Stream cache is a plain dict lookup.
+    '''
+    global _collectCacheStatistics
+    _cacheHits.clear()
+    _cacheMisses.clear()
+    _cacheInvalidations.clear()
+    _collectCacheStatistics = collect
+    if collect:
+        StreamCache.__contains__ = StreamCache.countingContains
+    elif '__contains__' in StreamCache.__dict__:
+        del StreamCache.__contains__
+
+
+class StreamCache(dict):
+    '''
+    The dictionary used for `Stream._cache`.  It works like any dict,
+    but once :func:`resetCacheStatistics` has been called, looking up a key
+    with `in` counts a hit or a miss for :func:`cacheStatistics`.
+
+    >>> sc = stream.core.StreamCache()
+    >>> 'flat' in sc
+    False
+    >>> sc['flat'] = stream.Stream()
+    >>> 'flat' in sc
+    True
+    '''
+    __slots__ = ()
+
+    def countingContains(self, key):
+        '''
+        The `__contains__` of StreamCache while statistics are collected.
+        '''
+        if dict.__contains__(self, key):
+            _cacheHits[key] += 1
+            return True
+        _cacheMisses[key] += 1
+        return False
+
+
+class LazyCopyMemo(dict):
+    '''
+    The memo dictionary of a lazy deepcopy (see :meth:`~music21.stream.Stream.lazyDeepcopy`).
+    When a Stream is deep-copied with a LazyCopyMemo, the Streams of the copy
+    get their elements copied only when they are first used.
+
+    Since the copy is made a piece at a time, spanners cannot be pointed at the
+    copies of their spanned elements in one pass at the end, as
+    `Stream.__deepcopy__` does.  Instead the memo remembers the elements copied
+    so far and which copied spanners still span original elements, and replaces
+    each original with its copy as soon as both have been made.
+
+    >>> import copy
+    >>> n1 = note.Note('C')
+    >>> n2 = note.Note('D')
+    >>> sl = spanner.Slur(n1, n2)
+    >>> memo = stream.core.LazyCopyMemo()
+    >>> n1Copy = copy.deepcopy(n1, memo)
+    >>> memo.addCopy(n1, n1Copy)
+    >>> slCopy = copy.deepcopy(sl, memo)
+    >>> memo.addCopy(sl, slCopy)
+    >>> slCopy.getFirst() is n1Copy
+    True
+    >>> slCopy.getLast() is n2
+    True
+    >>> n2Copy = copy.deepcopy(n2, memo)
+    >>> memo.addCopy(n2, n2Copy)
+    >>> slCopy.getLast() is n2Copy
+    True
+    >>> sl.getLast() is n2
+    True
+    '''
+    def __init__(self):
+        super().__init__()
+        # id(original) => (original, copy); keeping the original here
+        # guarantees that its id is not reused.
+        self.copies = {}
+        # id(original spanned element) => copied spanners that still span it
+        self.spannersToUpdate = collections.defaultdict(list)
+        # spanned elements of copied spanners whose copies are not made yet
+        self.pendingSpannedElements = []
+        self._copyingPending = False
+
+    def addCopy(self, original, new):
+        '''
+        Record that `new` is the copy of the element `original` and update
+        the spanners copied so far (or, if `new` is a spanner, update `new`).
+        '''
+        self.copies[id(original)] = (original, new)
+        if isinstance(new, spanner.Spanner):
+            for spannedElement in new.getSpannedElements():
+                entry = self.copies.get(id(spannedElement))
+                if entry is not None:
+                    new.replaceSpannedElement(spannedElement, entry[1])
+                    entry[1].purgeOrphans(excludeStorageStreams=False)
+                else:
+                    self.spannersToUpdate[id(spannedElement)].append(new)
+                    self.pendingSpannedElements.append(spannedElement)
+        else:
+            spannersToUpdate = self.spannersToUpdate.pop(id(original), None)
+            if spannersToUpdate:
+                for sp in spannersToUpdate:
+                    sp.replaceSpannedElement(original, new)
+                new.purgeOrphans(excludeStorageStreams=False)
+
+    def copyPendingSpannedElements(self):
+        '''
+        A copied spanner must never be seen pointing at an original element, so
+        once the Stream being copied is done, copy the Streams that contain the
+        elements spanned by its spanners (which replaces them in the spanners).
+        '''
+        if self._copyingPending:
+            # called again while copying a container: the loop below
+            # will get to whatever that container adds.
+            return
+        self._copyingPending = True
+        try:
+            while self.pendingSpannedElements:
+                original = self.pendingSpannedElements.pop()
+                if id(original) in self.spannersToUpdate:
+                    self.copyContainersOf(original)
+        finally:
+            self._copyingPending = False
+
+    def copyContainersOf(self, original, _seen=None):
+        '''
+        Copy the elements of the not yet copied Streams of the copy that contain
+        `original`, directly or within other Streams.
+        '''
+        if _seen is None:
+            _seen = set()
+        for site in original.sites.get(excludeNone=True):
+            if id(site) in _seen:
+                continue
+            _seen.add(id(site))
+            entry = self.copies.get(id(site))
+            if entry is None:
+                # perhaps in a Voice or Measure not yet copied itself
+                self.copyContainersOf(site, _seen)
+                entry = self.copies.get(id(site))
+            if entry is not None and entry[0] is site and entry[1].isStream:
+                entry[1].coreCopyLazyElements()
 
 
 class StreamCoreMixin:
     def __init__(self):
-        self._cache = {}
+        self._cache = StreamCache()
 
         # hugely important -- keeps track of where the _elements are
         # the _offsetDict is a dictionary where id(element) is the
@@ -49,6 +314,129 @@ class StreamCoreMixin:
         # v4!
         # self._elementTree = tree.trees.ElementTree(source=self)
 
+    def __getattr__(self, name):
+        # only called when the normal lookup fails: a Stream made by
+        # a lazy deepcopy does not have its element lists until first used.
+        if name in ('_elements', '_endElements', '_offsetDict'):
+            if '_lazyCopySource' in self.__dict__:
+                self.coreCopyLazyElements()
+                return self.__dict__[name]
+            if '_deferredElementsLoader' in self.__dict__:
+                self.coreLoadDeferredElements()
+                return self.__dict__[name]
+        raise AttributeError(f'{self.__class__.__name__!r} object has no attribute {name!r}')
+
+    def coreCopyLazyElements(self):
+        '''
+        N.B. -- a "core" method, not to be used by general users.
+
+        If this Stream was made by a lazy deepcopy and its elements have
+        not been copied yet, copy them now.  Substreams of this Stream are again
+        copied lazily.  Called automatically the first time that the elements
+        of the Stream are used.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> sCopy = s.lazyDeepcopy()
+        >>> sCopy.isLazyCopy
+        True
+        >>> sCopy.coreCopyLazyElements()
+        >>> sCopy.isLazyCopy
+        False
+        >>> sCopy[0] is s[0]
+        False
+        '''
+        lazyCopySource = self.__dict__.pop('_lazyCopySource', None)
+        if lazyCopySource is None:
+            return
+        source, memo = lazyCopySource
+        self.isSorted = source.isSorted
+        self._offsetDict = {}
+        self._elements = []
+        self._endElements = []
+        source.coreCopyElementsInto(self, memo)
+        memo.copyPendingSpannedElements()
+
+    @property
+    def isLazyCopy(self):
+        '''
+        Return True if this Stream was made by a lazy deepcopy and its elements
+        have not been copied yet.
+
+        >>> s = stream.Stream()
+        >>> s.isLazyCopy
+        False
+        '''
+        return '_lazyCopySource' in self.__dict__
+
+    def coreDeferElements(self, loader):
+        '''
+        N.B. -- a "core" method, not to be used by general users.
+
+        Put off making the elements of this (empty) Stream until they are first
+        used; then `loader` is called with the Stream as its only argument and
+        must put the elements in, with `coreInsert()` etc.  Everything about the
+        Stream that does not depend on its elements (id, groups, its offset in
+        other Streams, etc.) can be used without calling the loader.  Used
+        for lazy parsing, see :func:`~music21.converter.parse`.
+
+        >>> def loader(s):
+        ...     print('loading', s.id)
+        ...     s.coreAppend(note.Note('D'))
+        ...     s.coreElementsChanged()
+        >>> p = stream.Part(id='lazy')
+        >>> p.coreDeferElements(loader)
+        >>> p.hasDeferredElements
+        True
+        >>> isinstance(p._cache, stream.core.StreamCache)
+        True
+        >>> p.id
+        'lazy'
+        >>> p.notes[0]
+        loading lazy
+        <music21.note.Note D>
+        >>> p.hasDeferredElements
+        False
+        >>> len(p)
+        1
+        '''
+        if self._elements or self._endElements:
+            raise StreamException('can only defer the elements of an empty Stream')
+        del self._offsetDict
+        del self._elements
+        del self._endElements
+        # anything cached so far was found from no elements
+        self._cache = StreamCache()
+        self._deferredElementsLoader = loader
+
+    def coreLoadDeferredElements(self):
+        '''
+        N.B. -- a "core" method, not to be used by general users.
+
+        If the elements of this Stream were deferred with `coreDeferElements()`
+        and have not been made yet, make them now.  Called automatically the first
+        time that the elements of the Stream are used.
+        '''
+        loader = self.__dict__.pop('_deferredElementsLoader', None)
+        if loader is None:
+            return
+        self._offsetDict = {}
+        self._elements = []
+        self._endElements = []
+        loader(self)
+
+    @property
+    def hasDeferredElements(self):
+        '''
+        Return True if the elements of this Stream were deferred with
+        `coreDeferElements()` and have not been made yet.
+
+        >>> s = stream.Stream()
+        >>> s.hasDeferredElements
+        False
+        '''
+        return '_deferredElementsLoader' in self.__dict__
+
     def coreInsert(self, offset, element,
                    *,
                    ignoreSort=False, setActiveSite=True
@@ -138,7 +526,8 @@ class StreamCoreMixin:
             updateIsFlat=True,
             clearIsSorted=True,
             memo=None,
-            keepIndex=False):
+            keepIndex=False,
+            changed=None):
         '''
         NB -- a "core" stream method that is not necessary for most users.
 
@@ -164,6 +553,43 @@ class StreamCoreMixin:
         >>> a.coreElementsChanged()
         >>> a.isFlat
         False
+
+        `changed` is a collection of the aspects of the Stream that have changed
+        (see `stream.core.ALL_ASPECTS`); only cached values that depend upon one
+        of them (see `stream.core.cacheDependencies`) are removed.  The default,
+        None, means that anything may have changed.  A change of offsets is
+        also a change of the sort order.  Sites of this Stream are
+        told that a descendant has changed, unless only durations have changed.
+
+        >>> p = stream.Part()
+        >>> m = stream.Measure()
+        >>> p.append(m)
+        >>> pFlat = p.flat
+        >>> p.highestOffset
+        0.0
+        >>> m.coreElementsChanged(changed=['durations'])
+        >>> p.flat is pFlat
+        True
+        >>> m.insert(0, note.Note())
+        >>> p.flat is pFlat
+        False
+
+        A Stream in a site does not change the highest offset of the site:
+
+        >>> 'HighestOffset' in p._cache
+        True
+
+        Values that depend on the order of the elements are removed when
+        offsets change:
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note('C'), note.Note('D')])
+        >>> [n.name for n in s.notes]
+        ['C', 'D']
+        >>> s.setElementOffset(s.notes[0], 5.0)
+        >>> s.coreElementsChanged(changed=['offsets'])
+        >>> [n.name for n in s.notes]
+        ['D', 'C']
         '''
         # experimental
         if not self._mutable:
@@ -175,6 +601,14 @@ class StreamCoreMixin:
             memo = []
         memo.append(id(self))
 
+        if changed is None:
+            changed = ALL_ASPECTS
+        elif not isinstance(changed, frozenset):
+            changed = frozenset(changed)
+        # moving elements can change their order
+        if OFFSETS in changed and SORT_ORDER not in changed:
+            changed = changed | {SORT_ORDER}
+
         # WHY??? THIS SEEMS OVERKILL, esp. since the first call to .sort() in .flat will
         # invalidate it! TODO: Investigate if this is necessary and then remove if not necessary
         # should not need to do this...
@@ -184,18 +618,28 @@ class StreamCoreMixin:
         # ancestor so that subsequent calls get a new representation of this derivation;
         # we can do that by calling coreElementsChanged on
         # the derivation.origin
-        if self._derivation is not None:
+        if self._derivation is not None and (ELEMENTS in changed or OFFSETS in changed):
             sdm = self._derivation.method
             if sdm in ('flat', 'semiflat'):
                 origin = self._derivation.origin
-                if sdm in origin._cache and origin._cache[sdm] is self:
+                if origin._cache.get(sdm) is self:
                     del origin._cache[sdm]
 
-        # may not always need to clear cache of all living sites, but may
-        # always be a good idea since .flat has changed etc.
+        # the elements of living sites have not changed, but what they
+        # know about their descendants (such as .flat) may have.
         # should not need to do derivation.origin sites.
-        for livingSite in self.sites:
-            livingSite.coreElementsChanged()
+        # The order of elements (that is, sorting) does not affect sites.
+        if not changed.isdisjoint(_STRUCTURE_ASPECTS):
+            siteChanged = _SITE_DESCENDANTS_CHANGED
+        elif DURATIONS in changed:
+            siteChanged = _SITE_DURATIONS_CHANGED
+        else:
+            siteChanged = None
+        if siteChanged is not None:
+            for livingSite in self.sites:
+                livingSite.coreElementsChanged(updateIsFlat=False,
+                                               clearIsSorted=False,
+                                               changed=siteChanged)
 
         # clear these attributes for setting later
         if clearIsSorted:
@@ -214,14 +658,186 @@ class StreamCoreMixin:
         # resetting the cache removes lowest and highest time storage
         # a slight performance optimization: not creating unless needed
         if self._cache:
-            indexCache = None
-            if keepIndex and 'index' in self._cache:
-                indexCache = self._cache['index']
-            # always clear cache when elements have changed
-            # for instance, Duration will change.
-            self._cache = {}
-            if keepIndex and indexCache is not None:
-                self._cache['index'] = indexCache
+            # a new dict is made, since copy.copy() of a Stream shares the cache.
+            newCache = StreamCache()
+            for key, value in self._cache.items():
+                if keepIndex and key == 'index':
+                    newCache[key] = value
+                elif changed.isdisjoint(cacheDependencies.get(key, ALL_ASPECTS)):
+                    newCache[key] = value
+                elif _collectCacheStatistics:
+                    _cacheInvalidations[key] += 1
+            self._cache = newCache
+
+    def coreOffsetIndex(self):
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns a tuple of two lists parallel to `._elements`: the offset of
+        each element and the running maximum of the element end times.  Both lists
+        are non-decreasing, so they can be searched with the `bisect` module to
+        find the elements that can possibly fall within an offset range
+        without looking at every element.
+
+        The Stream is sorted first if `autoSort` is True.  The index is stored
+        in the cache and thus is only rebuilt after `coreElementsChanged` has
+        been called.  If the Stream is not sorted by offset, None is returned
+        and callers need to look at every element.
+
+        >>> s = stream.Stream()
+        >>> s.insert(0, note.Note(type='whole'))
+        >>> s.insert(1, note.Note())
+        >>> s.insert(6, note.Note(type='half'))
+        >>> s.coreOffsetIndex()
+        ([0.0, 1.0, 6.0], [4.0, 4.0, 8.0])
+
+        >>> s.autoSort = False
+        >>> s.insert(2, note.Note())
+        >>> s.coreOffsetIndex() is None
+        True
+        '''
+        if 'offsetIndex' in self._cache:
+            return self._cache['offsetIndex']
+
+        if not self.isSorted and self.autoSort:
+            self.sort()
+
+        offsetIndex = None
+        if self.isSorted:
+            offsetDict = self._offsetDict
+            starts = []
+            maxEnds = []
+            maxEnd = None
+            for e in self._elements:
+                offset = offsetDict[id(e)][0]
+                if starts and offset < starts[-1]:
+                    # an offset was changed without re-sorting
+                    break
+                if e.isStream and e.hasDeferredElements:
+                    # its duration would need all of its elements to be made
+                    break
+                end = opFrac(offset + e.duration.quarterLength)
+                if maxEnd is None or end > maxEnd:
+                    maxEnd = end
+                starts.append(offset)
+                maxEnds.append(maxEnd)
+            else:
+                offsetIndex = (starts, maxEnds)
+
+        self._cache['offsetIndex'] = offsetIndex
+        return offsetIndex
+
+    def coreClassPositions(self, classList):
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns a list of the positions in `.elements` of the elements that
+        match `classList` (a class, a class name, or a list of them, as in
+        `getElementsByClass`).
+
+        The positions for each `classList` are found once and kept in the
+        class index of the Stream until its elements change, so that
+        repeated class-filtered iteration only touches the matching elements.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('C'))
+        >>> s.append(note.Rest())
+        >>> s.append(note.Note('D'))
+        >>> s.storeAtEnd(bar.Barline())
+        >>> s.coreClassPositions('Note')
+        [0, 2]
+        >>> s.coreClassPositions([note.Rest, 'Barline'])
+        [1, 3]
+        >>> s.coreClassPositions('Note') is s.coreClassPositions('Note')
+        True
+
+        >>> s.insert(0, clef.TrebleClef())
+        >>> s.coreClassPositions('Note')
+        [1, 3]
+        '''
+        if not common.isListLike(classList):
+            classList = (classList,)
+        key = tuple(classList)
+
+        if not self.isSorted and self.autoSort:
+            self.sort()  # sort first, since sorting clears the index
+        if 'classIndex' not in self._cache:
+            self._cache['classIndex'] = {}
+        classIndex = self._cache['classIndex']
+        try:
+            return classIndex[key]
+        except KeyError:
+            positions = [i for i, e in enumerate(self._elements + self._endElements)
+                         if e.isClassOrSubclass(classList)]
+            classIndex[key] = positions
+            return positions
+
+    def coreSortKey(self, element):
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns a plain tuple that sorts `element` within this Stream exactly as
+        `element.sortTuple(self)` would: (atEnd, offset, priority, classSortOrder,
+        isNotGrace, insertIndex).
+
+        Plain tuples are compared in C, while a :class:`~music21.sorting.SortTuple`
+        compares in Python, so this is the key used by `.sort()`.
+
+        >>> s = stream.Stream()
+        >>> n = note.Note()
+        >>> n.priority = -3
+        >>> s.insert(4, n)
+        >>> s.storeAtEnd(bar.Barline())
+        >>> key = s.coreSortKey(n)
+        >>> key[:5]
+        (0, 4.0, -3, 20, 1)
+        >>> key == tuple(n.sortTuple(s))
+        True
+        >>> s.coreSortKey(s[-1])[:5]
+        (1, 0.0, 0, -5, 1)
+
+        The key of an element that is not in the Stream uses its naive offset:
+
+        >>> n2 = note.Note()
+        >>> n2.offset = 2.0
+        >>> s.coreSortKey(n2)[:5]
+        (0, 2.0, 0, 20, 1)
+        '''
+        try:
+            offset = self._offsetDict[id(element)][0]
+        except KeyError:
+            try:
+                offset = self.elementOffset(element, stringReturns=True)
+            except SitesException:
+                offset = element._naiveOffset
+
+        if offset == 'highestTime':
+            atEnd = 1
+            offset = 0.0
+        else:
+            atEnd = 0
+
+        if element.isStream:
+            # see Music21Object.sortTuple
+            isNotGrace = 1
+        else:
+            d = element.duration
+            if d is not None and d.isGrace:
+                isNotGrace = 0
+            else:
+                isNotGrace = 1
+
+        sites = element.sites
+        insertIndex = sites.getGlobalSiteIndex(id(self))
+        if insertIndex is None:
+            activeSite = element.activeSite
+            if activeSite is not None:
+                insertIndex = sites.getGlobalSiteIndex(id(activeSite))
+            if insertIndex is None:
+                insertIndex = 0
+
+        return (atEnd, offset, element.priority, element.classSortOrder,
+                isNotGrace, insertIndex)
 
     def coreHasElementByMemoryLocation(self, objId):
         '''
@@ -382,8 +998,7 @@ class StreamCoreMixin:
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
             <ElementTimespan (8.0 to 8.0) <music21.bar.Barline type=final>>
         '''
-        hashedAttributes = hash((tuple(classList or ()), flatten))
-        cacheKey = "timespanTree" + str(hashedAttributes)
+        cacheKey = ('timespanTree', tuple(classList or ()), flatten)
         if cacheKey not in self._cache or self._cache[cacheKey] is None:
             hashedTimespanTree = tree.fromStream.asTimespans(self,
                                                              flatten=flatten,
@@ -411,11 +1026,7 @@ class StreamCoreMixin:
         >>> scoreTree
         <ElementTree {20} (0.0 <0.-25...> to 8.0) <music21.stream.Score exampleScore>>
         '''
-        hashedAttributes = hash((tuple(classList or ()),
-                                  flatten,
-                                  useTimespans,
-                                  groupOffsets))
-        cacheKey = "elementTree" + str(hashedAttributes)
+        cacheKey = ('elementTree', tuple(classList or ()), flatten, useTimespans, groupOffsets)
         if cacheKey not in self._cache or self._cache[cacheKey] is None:
             hashedElementTree = tree.fromStream.asTree(self,
                                                        flatten=flatten,
@@ -425,6 +1036,35 @@ class StreamCoreMixin:
             self._cache[cacheKey] = hashedElementTree
         return self._cache[cacheKey]
 
+    def coreCachedTrees(self):
+        '''
+        NB -- a "core" stream method that is not necessary for most users.
+
+        Returns a dictionary of the trees made by :meth:`asTimespans` and
+        :meth:`asTree` that are still in the cache, keyed by their cache key.
+        The keys are tuples of the kind of tree and the arguments used to make it,
+        so the trees can be saved (see :class:`~music21.freezeThaw.StreamFreezer`)
+        and put back into the cache of the restored Stream.
+
+        >>> score = tree.makeExampleScore()
+        >>> score.coreCachedTrees()
+        {}
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> score.coreCachedTrees()
+        {('timespanTree', (<class 'music21.note.Note'>,), True):
+            <TimespanTree {12} (0.0 to 8.0) <music21.stream.Score exampleScore>>}
+
+        Changing the Stream removes the tree from the cache:
+
+        >>> score.parts[0].measure(1).insert(0, note.Note('E'))
+        >>> score.coreCachedTrees()
+        {}
+        '''
+        return {key: value for key, value in self._cache.items()
+                if isinstance(key, tuple)
+                and key[0] in ('timespanTree', 'elementTree')
+                and value is not None}
+
     def coreGatherMissingSpanners(self, recurse=True, requireAllPresent=True, insert=True):
         '''
         find all spanners that are referenced by elements in the
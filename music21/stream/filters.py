@@ -18,6 +18,7 @@ filtered.  Filters are used by methods on streams such as
 '''
 
 # import inspect
+import bisect
 import unittest
 from music21 import common
 from music21.common.numberTools import opFrac
@@ -261,6 +262,20 @@ class ClassFilter(StreamFilter):
     def __call__(self, item, iterator):
         return item.isClassOrSubclass(self.classList)
 
+    def matchingPositions(self, s):
+        '''
+        Returns the positions in `s.elements` of the elements matching
+        this filter, from the class index of the Stream.
+
+        >>> s = stream.Stream()
+        >>> s.append(note.Note('C'))
+        >>> s.append(note.Rest())
+        >>> s.append(note.Note('D'))
+        >>> stream.filters.ClassFilter('Note').matchingPositions(s)
+        [0, 2]
+        '''
+        return s.coreClassPositions(self.classList)
+
     def _reprInternal(self):
         if len(self.classList) == 1:
             return str(self.classList[0])
@@ -291,6 +306,12 @@ class ClassNotFilter(ClassFilter):
     def __call__(self, item, iterator):
         return not item.isClassOrSubclass(self.classList)
 
+    def matchingPositions(self, s):
+        '''
+        The class index only knows what does match.
+        '''
+        return None
+
 
 class GroupFilter(StreamFilter):
     '''
@@ -389,6 +410,37 @@ class OffsetFilter(StreamFilter):
         else:
             return self.isElementOffsetInRange(e, offset, stopAfterEnd=False)
 
+    def firstPossibleIndex(self, s) -> int:
+        '''
+        Return the index in `s._elements` of the first element that could possibly
+        be in the range, found by a binary search of the offset index of the Stream
+        (see :meth:`~music21.stream.core.StreamCoreMixin.coreOffsetIndex`).
+        Returns 0 if the Stream is not sorted.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 8)
+        >>> stream.filters.OffsetFilter(3, 5).firstPossibleIndex(s)
+        3
+
+        When elements sounding at the start of the range are allowed,
+        the search is made on the end times:
+
+        >>> s.insert(0, note.Note(type='whole'))
+        >>> stream.filters.OffsetFilter(3, 5, mustBeginInSpan=False).firstPossibleIndex(s)
+        1
+        >>> stream.filters.OffsetFilter(4.5, 5, mustBeginInSpan=False).firstPossibleIndex(s)
+        5
+        '''
+        offsetIndex = s.coreOffsetIndex()
+        if offsetIndex is None:
+            return 0
+        starts, maxEnds = offsetIndex
+        if self.mustBeginInSpan:
+            return bisect.bisect_left(starts, self.offsetStart)
+        else:
+            # anything that finishes before the span starts is definitely out
+            return bisect.bisect_left(maxEnds, self.offsetStart)
+
     def isElementOffsetInRange(self, e, offset, *, stopAfterEnd=False) -> bool:
         '''
         Given an element, offset, and stream, return
@@ -476,6 +528,124 @@ class OffsetHierarchyFilter(OffsetFilter):
         offset = s.elementOffset(e) + iterator.iteratorStartOffsetInHierarchy
         return self.isElementOffsetInRange(e, offset, stopAfterEnd=False)
 
+    def firstPossibleIndex(self, s) -> int:
+        '''
+        Offsets are measured from the top of the hierarchy, so no
+        elements can be skipped.
+        '''
+        return 0
+
+
+# -----------------------------------------------------------------------------
+
+
+def _matchAll(item, iterator):
+    return True
+
+
+def _compileClassFilters(classFilters):
+    '''
+    Return a function that checks a run of ClassFilters and ClassNotFilters at once.
+    Whether an element matches depends only on its class, so the answer is
+    found once for each class and kept in a dict.
+    '''
+    includeSets = []
+    excludeSet = set()
+    for f in classFilters:
+        if isinstance(f, ClassNotFilter):
+            excludeSet.update(f.classList)
+        else:
+            includeSets.append(frozenset(f.classList))
+    excludeSet = frozenset(excludeSet)
+
+    matchesByClass = {}
+
+    def matchesClasses(item, iterator):
+        try:
+            return matchesByClass[item.__class__]
+        except KeyError:
+            classSet = item.classSet
+            matches = (excludeSet.isdisjoint(classSet)
+                       and not any(includeSet.isdisjoint(classSet)
+                                   for includeSet in includeSets))
+            matchesByClass[item.__class__] = matches
+            return matches
+
+    return matchesClasses
+
+
+def _compileCallable(f):
+    '''
+    Return a function of (item, iterator) for a filter.  Plain functions of only
+    the item are acceptable as filters.
+    '''
+    if isinstance(f, StreamFilter):
+        return f
+
+    def callFilter(item, iterator):
+        try:
+            return f(item, iterator)
+        except TypeError:  # one element filters are acceptable.
+            return f(item)
+
+    return callFilter
+
+
+def compileFilters(filterList):
+    '''
+    Fuse a list of filters into a single function of (item, iterator) that
+    returns False if any filter returns False, as
+    :meth:`~music21.stream.iterator.StreamIterator.matchesFilters` does.
+    The filters are still checked in order, so StopIteration and the state of
+    filters such as IsFilter work as before.
+
+    ClassFilters and ClassNotFilters next to each other are checked together,
+    and only once for each class of element:
+
+    >>> s = stream.Stream()
+    >>> s.append([note.Note('C'), note.Rest(), chord.Chord('C E G')])
+    >>> notRests = stream.filters.compileFilters([stream.filters.ClassFilter('NotRest'),
+    ...                                          stream.filters.ClassNotFilter('Chord')])
+    >>> [notRests(el, None) for el in s]
+    [True, False, False]
+
+    Functions of one or two arguments can be used as filters also:
+
+    >>> isC = stream.filters.compileFilters([lambda el: el.pitches[0].name == 'C'])
+    >>> [isC(el, None) for el in s.notes]
+    [True, True]
+
+    With no filters, everything matches:
+
+    >>> stream.filters.compileFilters([])(s[0], None)
+    True
+    '''
+    steps = []
+    classRun = []
+    for f in filterList:
+        if type(f) in (ClassFilter, ClassNotFilter):
+            classRun.append(f)
+            continue
+        if classRun:
+            steps.append(_compileClassFilters(classRun))
+            classRun = []
+        steps.append(_compileCallable(f))
+    if classRun:
+        steps.append(_compileClassFilters(classRun))
+
+    if not steps:
+        return _matchAll
+    if len(steps) == 1:
+        return steps[0]
+
+    def matchesAll(item, iterator):
+        for step in steps:
+            if step(item, iterator) is False:
+                return False
+        return True
+
+    return matchesAll
+
 
 class Test(unittest.TestCase):
     pass
@@ -14,6 +14,7 @@ this class contains iterators and filters for walking through streams
 
 StreamIterators are explicitly allowed to access private methods on streams.
 '''
+import bisect
 import unittest
 import warnings
 from music21 import common
@@ -117,8 +118,15 @@ class StreamIterator(prebase.ProtoM21Object):
         # return True or False for an element for
         # whether it should be yielded.
         self.filters = filterList
+        # all the filters fused into one function; see compiledFilter()
+        self._compiledFilter = None
+        self._compiledFilterSource = None
         self._len = None
         self._matchingElements = None
+        # sorted positions in srcStreamElements of the only elements
+        # that can match the filters, or None to look at every element.
+        # Set on reset()
+        self.candidatePositions = None
 
         # keep track of where we are in the parse.
         # esp important for recursive streams...
@@ -150,7 +158,18 @@ class StreamIterator(prebase.ProtoM21Object):
         return self
 
     def __next__(self):
+        positions = self.candidatePositions
+        matches = self._compiledFilter
+        if matches is None:
+            matches = self.compiledFilter()
         while self.index < self.streamLength:
+            if positions is not None:
+                # skip to the next element that can match.
+                nextPosition = bisect.bisect_left(positions, self.index)
+                if nextPosition >= len(positions):
+                    break
+                self.index = positions[nextPosition]
+
             if self.index >= self.elementsLength:
                 self.iterSection = '_endElements'
                 self.sectionIndex = self.index - self.elementsLength
@@ -165,7 +184,7 @@ class StreamIterator(prebase.ProtoM21Object):
                 # this may happen in the number of elements has changed
                 continue
 
-            if self.matchesFilters(e) is False:
+            if matches(e, self) is False:
                 continue
 
             if self.restoreActiveSites is True:
@@ -435,6 +454,98 @@ class StreamIterator(prebase.ProtoM21Object):
         for f in self.filters:
             if hasattr(f, 'reset'):
                 f.reset()
+        self.compiledFilter()
+        self.index = self.firstPossibleIndex()
+        self.candidatePositions = self.findCandidatePositions()
+
+    def compiledFilter(self):
+        '''
+        Returns the filters of the iterator fused into a single function of
+        (element, iterator) made by :func:`~music21.stream.filters.compileFilters`.
+        It is made again only if `.filters` has changed.
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note('C'), note.Rest()])
+        >>> sIter = s.iter.notes
+        >>> matches = sIter.compiledFilter()
+        >>> [matches(el, sIter) for el in s]
+        [True, False]
+        >>> sIter.compiledFilter() is matches
+        True
+        >>> sIter.filters.append(stream.filters.ClassFilter('Chord'))
+        >>> sIter.compiledFilter() is matches
+        False
+        '''
+        filterTuple = tuple(self.filters)
+        if self._compiledFilter is None or filterTuple != self._compiledFilterSource:
+            self._compiledFilter = filters.compileFilters(filterTuple)
+            self._compiledFilterSource = filterTuple
+        return self._compiledFilter
+
+    def findCandidatePositions(self):
+        '''
+        Returns a sorted list of the positions in the source Stream's elements
+        of the only elements that can match the filters, or None if every element
+        needs to be checked.  Class filters use the class index of the Stream
+        (see :meth:`~music21.stream.core.StreamCoreMixin.coreClassPositions`)
+        so that iterating touches only elements of the right class.  When more
+        than one filter can give positions, the shortest list is used; all
+        filters are still checked for each candidate.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 3)
+        >>> s.insert(1, clef.BassClef())
+        >>> sIter = s.iter
+        >>> print(sIter.findCandidatePositions())
+        None
+        >>> sIter.getElementsByClass('Clef').findCandidatePositions()
+        [1]
+        '''
+        ss = self.srcStream
+        if ss is None or (not ss.isSorted and ss.autoSort):
+            # getting the positions would sort the stream and change the positions
+            return None
+        # the stream has changed since the iterator was created.
+        if len(ss._elements) + len(ss._endElements) != self.streamLength:
+            return None
+
+        positions = None
+        for f in self.filters:
+            if not hasattr(f, 'matchingPositions'):
+                continue
+            filterPositions = f.matchingPositions(ss)
+            if filterPositions is None:
+                continue
+            if positions is None or len(filterPositions) < len(positions):
+                positions = filterPositions
+        return positions
+
+    def firstPossibleIndex(self):
+        '''
+        Returns the index of the first element of the source Stream that can
+        match the filters.  Offset filters can use the sorted offset index of
+        the Stream to skip all the elements that are before the range being
+        searched, so that iteration starts near the first match.
+
+        >>> s = stream.Stream()
+        >>> s.repeatAppend(note.Note(), 20)
+        >>> sIter = s.iter
+        >>> sIter.firstPossibleIndex()
+        0
+        >>> sIter.getElementsByOffset(15, 16).firstPossibleIndex()
+        15
+        '''
+        ss = self.srcStream
+        if ss is None or not ss.isSorted:
+            return 0
+        startIndex = 0
+        for f in self.filters:
+            if hasattr(f, 'firstPossibleIndex'):
+                startIndex = max(startIndex, f.firstPossibleIndex(ss))
+        if startIndex > self.elementsLength:
+            # the stream has changed since the iterator was created.
+            return 0
+        return startIndex
 
     def resetCaches(self):
         '''
@@ -518,18 +629,10 @@ class StreamIterator(prebase.ProtoM21Object):
     def matchesFilters(self, e):
         '''
         returns False if any filter returns False, True otherwise.
+
+        Filters can raise StopIteration.
         '''
-        for f in self.filters:
-            try:
-                try:
-                    if f(e, self) is False:
-                        return False
-                except TypeError:  # one element filters are acceptable.
-                    if f(e) is False:
-                        return False
-            except StopIteration:  # pylint: disable=try-except-raise
-                raise  # clearer this way to see that this can happen...
-        return True
+        return self.compiledFilter()(e, self) is not False
 
     def _newBaseStream(self):
         '''
@@ -1338,6 +1441,43 @@ class RecursiveIterator(StreamIterator):
         # not yet used.
         # self.parentIterator = None
 
+    def firstPossibleIndex(self):
+        '''
+        Filters are shared with the iterators of substreams, so
+        no elements can be skipped at the start of a recursive iteration.
+        '''
+        return 0
+
+    def findCandidatePositions(self):
+        '''
+        Substreams need to be visited even if they do not match the
+        filters, so a ClassFilter can only skip elements that are neither of
+        its classes nor Streams.  This makes `.recurse().notes` and
+        `.recurse().getElementsByClass()` touch only the matching elements and
+        the substreams.
+
+        >>> s = stream.Stream()
+        >>> s.append([note.Note(), note.Rest(), stream.Voice(), note.Note()])
+        >>> print(s.recurse().findCandidatePositions())
+        None
+        >>> s.recurse().notes.findCandidatePositions()
+        [0, 2, 3]
+        '''
+        ss = self.srcStream
+        if ss is None or (not ss.isSorted and ss.autoSort):
+            return None
+        if len(ss._elements) + len(ss._endElements) != self.streamLength:
+            return None
+
+        positions = None
+        for f in self.filters:
+            if type(f) is not filters.ClassFilter:
+                continue
+            filterPositions = ss.coreClassPositions(tuple(f.classList) + ('Stream',))
+            if positions is None or len(filterPositions) < len(positions):
+                positions = filterPositions
+        return positions
+
     def reset(self):
         '''
         reset prior to iteration
@@ -1353,6 +1493,9 @@ class RecursiveIterator(StreamIterator):
 
         The same __iter__ as the superclass is used.
         '''
+        matches = self._compiledFilter
+        if matches is None:
+            matches = self.compiledFilter()
         while self.index < self.streamLength:
             # wrap this in a while loop instead of
             # returning self.__next__() because
@@ -1376,6 +1519,14 @@ class RecursiveIterator(StreamIterator):
             elif self.returnSelf is True:
                 self.returnSelf = False
 
+            positions = self.candidatePositions
+            if positions is not None:
+                # skip to the next element that can match or is a Stream.
+                nextPosition = bisect.bisect_left(positions, self.index)
+                if nextPosition >= len(positions):
+                    break
+                self.index = positions[nextPosition]
+
             if self.index >= self.elementsLength:
                 self.iterSection = '_endElements'
                 self.sectionIndex = self.index - self.elementsLength
@@ -1405,7 +1556,12 @@ class RecursiveIterator(StreamIterator):
                 newStartOffset = (self.iteratorStartOffsetInHierarchy
                                   + self.srcStream.elementOffset(e))
                 self.childRecursiveIterator.iteratorStartOffsetInHierarchy = newStartOffset
-            if self.matchesFilters(e) is False:
+                # child iterators are not reset, so give them what reset() would
+                self.childRecursiveIterator._compiledFilter = matches
+                self.childRecursiveIterator._compiledFilterSource = self._compiledFilterSource
+                self.childRecursiveIterator.candidatePositions = (
+                    self.childRecursiveIterator.findCandidatePositions())
+            if matches(e, self) is False:
                 continue
 
             if self.restoreActiveSites is True:
@@ -0,0 +1,81 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         benchmarkAbcTokenize.py
+# Purpose:      Timings of tokenizing and processing the ABC corpus
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2020 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Times :meth:`~music21.abcFormat.ABCHandler.tokenize` and
+:meth:`~music21.abcFormat.ABCHandler.tokenProcess` on every .abc file
+in the bundled corpus (or in a directory given on the command line),
+and prints the number of tokens made per second.
+
+    python -m music21.test.benchmarkAbcTokenize [directory]
+
+This file is not run with the standard test battery.
+'''
+import pathlib
+import sys
+import timeit
+
+from music21 import abcFormat
+from music21 import common
+
+
+def getAbcData(directory=None):
+    '''
+    Return a list of the decoded contents of every .abc file in `directory`
+    and its subdirectories, by default the corpus.
+    '''
+    if directory is None:
+        directory = common.getCorpusFilePath()
+    paths = sorted(fp for fp in pathlib.Path(directory).rglob('*')
+                   if fp.suffix.lower() == '.abc')
+    return [fp.read_text(encoding='utf-8', errors='replace') for fp in paths]
+
+
+def tokenizeAll(dataList):
+    '''
+    Tokenize each string in `dataList` and return the number of tokens made.
+    '''
+    numTokens = 0
+    for data in dataList:
+        ah = abcFormat.ABCHandler()
+        ah.tokenize(data)
+        numTokens += len(ah.tokens)
+    return numTokens
+
+
+def processAll(dataList):
+    '''
+    Tokenize and process each string in `dataList`.
+    '''
+    for data in dataList:
+        ah = abcFormat.ABCHandler()
+        ah.process(data)
+
+
+def run(directory=None, repeat=3):
+    '''
+    Tokenize all the ABC files in `directory` `repeat` times, then tokenize and
+    process them once, and print the times.
+    '''
+    dataList = getAbcData(directory)
+    if not dataList:
+        print(f'no ABC files in {directory}')
+        return
+    numTokens = tokenizeAll(dataList)
+    best = min(timeit.repeat(lambda: tokenizeAll(dataList), number=1, repeat=repeat))
+    numChars = sum(len(data) for data in dataList)
+    print(f'{len(dataList)} files, {numChars:,} characters, {numTokens:,} tokens: '
+          + f'tokenized in {best:.3f} s, {numTokens / best:,.0f} tokens/s')
+    processTime = timeit.timeit(lambda: processAll(dataList), number=1)
+    print(f'tokenized and processed in {processTime:.3f} s')
+
+
+if __name__ == '__main__':
+    run(sys.argv[1] if len(sys.argv) > 1 else None)
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         benchmarkIterators.py
+# Purpose:      Timings of filtered and recursive stream iteration
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2020 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Times the common ways of iterating over a Stream with filters, such as
+`.recurse().notes` and `.recurse().getElementsByClass()`, on a large score.
+
+Run from the command line; prints the best time of each:
+
+    python -m music21.test.benchmarkIterators
+
+This file is not run with the standard test battery.
+'''
+import timeit
+
+from music21 import corpus
+
+
+def getBenchmarks(s):
+    '''
+    Return a list of (description, function) pairs to time on the Score `s`.
+    '''
+    sFlat = s.flat
+    part = s.parts[0]
+
+    def longerThanQuarter(el, unused_iterator):
+        return el.duration.quarterLength > 1
+
+    def isQuarter(el):
+        return el.quarterLength == 1
+
+    return [
+        ('recurse()',
+            lambda: list(s.recurse())),
+        ('recurse().notes',
+            lambda: list(s.recurse().notes)),
+        ("recurse().getElementsByClass('Note')",
+            lambda: list(s.recurse().getElementsByClass('Note'))),
+        ("recurse().getElementsByClass('TimeSignature')",
+            lambda: list(s.recurse().getElementsByClass('TimeSignature'))),
+        ("recurse().notes.getElementsNotOfClass('Chord')",
+            lambda: list(s.recurse().notes.getElementsNotOfClass('Chord'))),
+        ('recurse() with a function filter',
+            lambda: list(s.recurse().addFilter(longerThanQuarter))),
+        ("part.recurse().getElementsByClass('Measure')",
+            lambda: list(part.recurse().getElementsByClass('Measure'))),
+        ('flat.notes',
+            lambda: list(sFlat.notes)),
+        ('flat.notesAndRests with a function filter',
+            lambda: list(sFlat.iter.notesAndRests.addFilter(isQuarter))),
+        ('flat.getElementsByOffset(100, 200)',
+            lambda: list(sFlat.iter.getElementsByOffset(100, 200))),
+    ]
+
+
+def run(workName='beethoven/opus132', number=5, repeat=3):
+    '''
+    Parse `workName` from the corpus and print the best time of
+    each benchmark in milliseconds.
+    '''
+    s = corpus.parse(workName)
+    for description, function in getBenchmarks(s):
+        function()  # fill caches
+        best = min(timeit.repeat(function, number=number, repeat=repeat)) / number
+        print('{:50s} {:8.1f} ms'.format(description, best * 1000))
+
+
+if __name__ == '__main__':
+    run()
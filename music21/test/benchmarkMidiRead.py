@@ -0,0 +1,79 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         benchmarkMidiRead.py
+# Purpose:      Timings of reading MIDI files into MidiTracks and MidiEvents
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2020 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Times reading every MIDI file in a directory (recursively) with
+:class:`~music21.midi.MidiFile`, and prints the number of events read per second.
+Only the binary MIDI reading is timed, not the translation to streams.
+
+Run from the command line, optionally giving a directory of (large) MIDI files;
+the default is the small files in `music21/midi/testPrimitive`:
+
+    python -m music21.test.benchmarkMidiRead [directory]
+
+This file is not run with the standard test battery.
+'''
+import os
+import pathlib
+import sys
+import timeit
+
+from music21 import midi
+
+
+def getMidiPaths(directory):
+    '''
+    Return a sorted list of the paths to .mid and .midi files in `directory`
+    and its subdirectories.
+    '''
+    directory = pathlib.Path(directory)
+    return sorted(fp for fp in directory.rglob('*')
+                  if fp.suffix.lower() in ('.mid', '.midi'))
+
+
+def readMidiFile(fp):
+    '''
+    Read the MIDI file at `fp` from disk and return the number of events in it.
+    '''
+    mf = midi.MidiFile()
+    mf.open(fp)
+    try:
+        mf.read()
+    finally:
+        mf.close()
+    return sum(len(trk.events) for trk in mf.tracks)
+
+
+def run(directory=None, repeat=3):
+    '''
+    Read all the MIDI files in `directory` `repeat` times and print
+    the best time and the events read per second.
+    '''
+    if directory is None:
+        directory = os.path.join(os.path.dirname(midi.__file__), 'testPrimitive')
+    paths = getMidiPaths(directory)
+    if not paths:
+        print(f'no MIDI files in {directory}')
+        return
+
+    numEvents = 0
+
+    def readAll():
+        nonlocal numEvents
+        numEvents = sum(readMidiFile(fp) for fp in paths)
+
+    readAll()  # warm the file system cache
+    best = min(timeit.repeat(readAll, number=1, repeat=repeat))
+    print(f'{len(paths)} files, {numEvents} events in {best:.3f} s: '
+          + f'{numEvents / best:,.0f} events/s')
+
+
+if __name__ == '__main__':
+    run(sys.argv[1] if len(sys.argv) > 1 else None)
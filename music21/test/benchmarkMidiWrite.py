@@ -0,0 +1,59 @@
+# -*- coding: utf-8 -*-
+# ------------------------------------------------------------------------------
+# Name:         benchmarkMidiWrite.py
+# Purpose:      Timings of translating streams to MIDI bytes
+#
+# Authors:      Michael Scott Cuthbert
+#
+# Copyright:    Copyright © 2020 Michael Scott Cuthbert and the music21 Project
+# License:      BSD, see license.txt
+# ------------------------------------------------------------------------------
+'''
+Times translating scores from the corpus to MIDI bytes with
+:func:`~music21.midi.translate.streamToMidiFile`, making MidiTracks from
+packets and MidiEvents, and making MidiTrackArrays in bulk
+(`asArrays=True`), and checks that both write the same bytes.
+
+Run from the command line, optionally giving corpus works to translate:
+
+    python -m music21.test.benchmarkMidiWrite [work ...]
+
+This file is not run with the standard test battery.
+'''
+import sys
+import timeit
+
+from music21 import corpus
+from music21.midi import translate
+
+defaultWorks = ['bach/bwv66.6', 'beethoven/opus18no1/movement1',
+                'schumann_clara/opus17/movement3']
+
+
+def writeMidiBytes(s, asArrays=False):
+    '''
+    Translate the Stream `s` to a MidiFile and return its bytes.
+    '''
+    return translate.streamToMidiFile(s, asArrays=asArrays).writestr()
+
+
+def run(works=None, repeat=3):
+    '''
+    Translate each of `works` to MIDI `repeat` times in each way and
+    print the best times.
+    '''
+    if not works:
+        works = defaultWorks
+    for work in works:
+        s = corpus.parse(work)
+        if writeMidiBytes(s) != writeMidiBytes(s, asArrays=True):
+            print(f'{work}: MidiTrackArrays wrote different bytes')
+        best = min(timeit.repeat(lambda: writeMidiBytes(s), number=1, repeat=repeat))
+        bestArrays = min(timeit.repeat(lambda: writeMidiBytes(s, asArrays=True),
+                                       number=1, repeat=repeat))
+        print(f'{work}: {best:.3f} s with MidiTracks, '
+              + f'{bestArrays:.3f} s with MidiTrackArrays')
+
+
+if __name__ == '__main__':
+    run(sys.argv[1:])
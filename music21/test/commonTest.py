@@ -144,6 +144,10 @@ class ModuleGather:
             'testInstallation.py',
             'testLint.py',
             'testPerformance.py',
+            'benchmarkAbcTokenize.py',
+            'benchmarkIterators.py',
+            'benchmarkMidiRead.py',
+            'benchmarkMidiWrite.py',
             'timeGraphs.py',
             'timeGraphImportStar.py',
             'multiprocessTest.py',
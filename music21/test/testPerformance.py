@@ -105,6 +105,80 @@ class Test(unittest.TestCase):
             post = s.flat.getElementsByClass(['Rest', 'Note'])
             self.assertEqual(len(post), 1500)
 
+    def runGetElementsByOffsetLongPart(self):
+        '''
+        Offset-range queries and getElementAtOrBefore on a 50000-note part
+        '''
+        from music21 import note, stream
+        p = stream.Part()
+        for i in range(50000):
+            p.coreInsert(i * 0.5, note.Note(quarterLength=0.5))
+        p.coreElementsChanged()
+
+        for i in range(0, 25000, 25):
+            post = p.getElementsByOffset(i, i + 4,
+                                         mustBeginInSpan=False,
+                                         includeElementsThatEndAtStart=False)
+            self.assertEqual(len(post), 9)
+            post = p.getElementAtOrBefore(i + 0.25)
+            self.assertEqual(p.elementOffset(post), i)
+
+    def runGetElementsByClassLongPart(self):
+        '''
+        Repeated getElementsByClass calls for a rare class on a 20000-note part
+        '''
+        from music21 import clef, note, stream
+        p = stream.Part()
+        for i in range(20000):
+            p.coreInsert(i, note.Note())
+        for i in range(0, 20000, 2000):
+            p.coreInsert(i, clef.TrebleClef())
+        p.coreElementsChanged()
+
+        for unused in range(200):
+            self.assertEqual(len(p.getElementsByClass('Clef')), 10)
+
+    def runLazyDeepcopyPartialRead(self):
+        '''
+        Copying a 12-part score and reading 10 measures of one part
+        '''
+        import copy
+        from music21 import stream
+        src = corpus.parse('beethoven/opus132')
+        s = stream.Score()
+        for unused in range(3):
+            for p in copy.deepcopy(src).parts:
+                s.insert(0, p)
+
+        sCopy = s.lazyDeepcopy()
+        self.assertGreater(len(sCopy.parts[3].measures(1, 10).recurse().notes), 0)
+
+    def runCreateNotesInMeasures(self):
+        '''
+        Creating 100,000 notes in 1000 measures and flattening them, so that each
+        note has two sites; the increase in resident memory is printed in debug mode.
+        '''
+        import gc
+        from music21 import note, stream
+
+        def rss():
+            with open('/proc/self/statm') as f:
+                return int(f.read().split()[1]) * 4096
+
+        gc.collect()
+        before = rss()
+        p = stream.Part()
+        for i in range(1000):
+            m = stream.Measure(number=i + 1)
+            for j in range(100):
+                m.append(note.Note(60 + j % 12, quarterLength=0.25))
+            p.append(m)
+        pFlat = p.flat
+        gc.collect()
+        environLocal.printDebug(['resident memory per 100,000 notes (MB):',
+                                 (rss() - before) / 2 ** 20])
+        self.assertEqual(len(pFlat.notes), 100000)
+
     def runParseBeethoven(self):
         '''Loading file: beethoven/opus59no2/movement3
         '''
@@ -34,6 +34,7 @@ from music21 import metadata
 from music21 import meter
 from music21 import note
 from music21 import pitch
+from music21 import spanner
 
 from music21.musicxml import m21ToXml
 
@@ -7649,6 +7650,322 @@ class Test(unittest.TestCase):
             self.assertEqual(el.getOffsetBySite(s2),
                              el.getOffsetBySite(s))
 
+    def testGetElementsByOffsetIndexed(self):
+        '''
+        getElementsByOffset and getElementAtOrBefore use the offset index
+        on sorted streams; results must match a check of every element.
+        '''
+        from music21.stream import filters
+        random.seed(7)
+        s = Stream()
+        for unused in range(300):
+            n = note.Note(quarterLength=random.choice([0, 0.5, 1, 3, 8]))
+            s.insert(random.choice(range(60)) * 0.5, n)
+        s.storeAtEnd(bar.Barline('final'))
+
+        for unused in range(100):
+            start = random.choice(range(70)) * 0.5
+            end = start + random.choice([0, 0.5, 1, 4])
+            for mustBeginInSpan in (True, False):
+                for includeEndBoundary in (True, False):
+                    kw = {'mustBeginInSpan': mustBeginInSpan,
+                          'includeEndBoundary': includeEndBoundary}
+                    found = list(s.getElementsByOffset(start, end, **kw))
+                    oFilter = filters.OffsetFilter(start, end, **kw)
+                    expected = [e for e in s.elements
+                                if oFilter.isElementOffsetInRange(e, s.elementOffset(e))]
+                    self.assertEqual(found, expected)
+
+            found = s.getElementAtOrBefore(start)
+            before = [e for e in s.elements if s.elementOffset(e) <= start]
+            self.assertIs(found, before[-1] if before else None)
+            found = s.getElementBeforeOffset(start)
+            before = [e for e in s.elements if s.elementOffset(e) < start]
+            self.assertIs(found, before[-1] if before else None)
+
+        # changing an offset drops the index
+        n = s.notes[0]
+        self.assertIsNotNone(s.coreOffsetIndex())
+        s.setElementOffset(n, 100.0)
+        self.assertNotIn('offsetIndex', s._cache)
+
+    def testCacheInvalidationByAspect(self):
+        '''
+        changes only drop the cached values that depend upon them.
+        '''
+        sc = Score()
+        p = Part()
+        m = Measure()
+        n = note.Note()
+        m.append(n)
+        p.append(m)
+        sc.insert(0, p)
+
+        scFlat = sc.flat
+        scParts = sc.parts
+        self.assertEqual(sc.highestTime, 1.0)
+
+        n.duration.quarterLength = 2.0
+        self.assertIs(sc.flat, scFlat)
+        self.assertIs(sc.parts, scParts)
+        self.assertEqual(sc.highestTime, 2.0)
+        self.assertEqual(scFlat.highestTime, 2.0)
+
+        n.priority = 3
+        self.assertIs(sc.flat, scFlat)
+
+        m.append(note.Note())
+        self.assertIsNot(sc.flat, scFlat)
+        self.assertIs(sc.parts, scParts)
+        self.assertEqual(len(sc.flat.notes), 2)
+
+        p.append(Measure())
+        self.assertIs(sc.parts, scParts)
+        sc.insert(0, Part())
+        self.assertIsNot(sc.parts, scParts)
+
+    def testGetElementsByClassIndexed(self):
+        '''
+        class-filtered iteration through the class index matches
+        a brute-force scan, before and after the stream changes.
+        '''
+        s = Stream()
+        for i in range(30):
+            if i % 7 == 0:
+                s.insert(i, clef.BassClef())
+            if i % 5 == 0:
+                s.insert(i, note.Rest())
+            else:
+                s.insert(i, note.Note())
+
+        def check():
+            for classList in ('Note', 'Clef', ['Rest', 'Clef'], 'Chord'):
+                expected = [e for e in s if e.isClassOrSubclass(
+                    classList if common.isListLike(classList) else [classList])]
+                self.assertEqual(list(s.getElementsByClass(classList)), expected)
+                self.assertEqual(len(s.getElementsByClass(classList)), len(expected))
+
+        check()
+        s.insert(3.5, clef.TrebleClef())
+        check()
+        s.remove(s.getElementsByClass('Rest')[0])
+        check()
+        s.getElementsByClass('Note')[0].offset = 100
+        check()
+        s.append(note.Rest())
+        check()
+
+    def testInsertManyMatchesInsert(self):
+        '''
+        insertMany gives the same stream as inserting one element at a time.
+        '''
+        from music21 import stream
+        pairs = [(0, clef.TrebleClef()), (0, note.Note('C')), (2, note.Note('E')),
+                 (1, note.Note('D')), (1, note.Rest()), (0, meter.TimeSignature('3/4'))]
+        s1 = Stream()
+        for o, e in pairs:
+            s1.insert(o, copy.deepcopy(e))
+        s2 = Stream()
+        s2.insertMany((o, copy.deepcopy(e)) for o, e in pairs)
+
+        self.assertEqual([(s1.elementOffset(e), e.classes[0]) for e in s1],
+                         [(s2.elementOffset(e), e.classes[0]) for e in s2])
+        self.assertEqual(s1.highestTime, s2.highestTime)
+        for e in s2:
+            self.assertIs(e.activeSite, s2)
+
+        # sorted input into a sorted stream keeps it sorted
+        s3 = Stream()
+        s3.insertMany((float(i), note.Note()) for i in range(10))
+        self.assertTrue(s3.isSorted)
+        s3.insertMany([(10.0, note.Note()), (11.0, note.Note())])
+        self.assertTrue(s3.isSorted)
+        s3.insertMany([(5.0, note.Rest())])
+        self.assertFalse(s3.isSorted)
+        self.assertEqual(len(s3.getElementsByOffset(5.0)), 2)
+
+        # an element that cannot be inserted leaves the ones before it in,
+        # with the caches and sorting up to date
+        s4 = Stream()
+        s4.append(note.Note('C'))
+        self.assertEqual(s4.highestTime, 1.0)
+        with self.assertRaises(stream.StreamException):
+            s4.insertMany([(1, note.Note('D')), (2, note.Note('E')), (3, 'x')])
+        self.assertEqual(len(s4), 3)
+        self.assertEqual(s4.highestTime, 3.0)
+
+        s5 = Stream()
+        s5.insertMany([(0, note.Note('C')), (1, note.Note('D'))])
+        self.assertTrue(s5.isSorted)
+        with self.assertRaises(stream.StreamException):
+            s5.insertMany([(0.5, note.Note('E')), (2, 'x')])
+        self.assertFalse(s5.isSorted)
+        self.assertEqual([n.name for n in s5.notes], ['C', 'E', 'D'])
+
+    def testLazyDeepcopyMatchesDeepcopy(self):
+        '''
+        a lazy deepcopy, once used, has the same contents as a deepcopy
+        and shares nothing with the original, spanners included.
+        '''
+        from music21 import corpus
+        s = corpus.parse('bwv66.6')
+        p = s.parts[0]
+        p.insert(0, spanner.Slur(p.measure(1).notes[0], p.measure(2).notes[0]))
+
+        def describe(score):
+            return [(e.classes[0], e.activeSite.classes[0], e.offset, e.quarterLength)
+                    for e in score.recurse()]
+
+        sLazy = s.lazyDeepcopy()
+        self.assertTrue(sLazy.isLazyCopy)
+        self.assertTrue(sLazy.parts[1].isLazyCopy)
+        # getting a spanner copies the elements it spans
+        slCopy = sLazy.parts[0].spanners[0]
+        self.assertIs(slCopy.getFirst(), sLazy.parts[0].measure(1).notes[0])
+        self.assertIs(slCopy.getLast(), sLazy.parts[0].measure(2).notes[0])
+
+        self.assertEqual(describe(sLazy), describe(copy.deepcopy(s)))
+        originalIds = {id(e) for e in s.recurse()}
+        for e in sLazy.recurse():
+            self.assertNotIn(id(e), originalIds)
+        self.assertFalse(any(e.isLazyCopy for e in sLazy.recurse(streamsOnly=True)))
+
+    def testToArraysFromArrays(self):
+        '''
+        toArrays has one row per Note or Chord pitch in recurse() order,
+        and fromArrays writes changes back, keeping the Stream's caches correct.
+        '''
+        import numpy
+        from music21 import corpus
+        s = corpus.parse('bwv66.6')
+        arr = s.toArrays()
+        notes = list(s.recurse().notes)
+        self.assertEqual(len(arr), len(notes))
+        self.assertEqual(list(arr.ps), [n.pitch.ps for n in notes])
+        self.assertEqual(list(arr.offset), [float(n.getOffsetInHierarchy(s)) for n in notes])
+        self.assertEqual(list(arr.measure), [n.measureNumber for n in notes])
+        self.assertEqual(sorted(set(arr.part)), list(range(len(s.parts))))
+
+        # unchanged arrays change nothing
+        before = [(n.offset, n.quarterLength, n.pitch.ps, n.tie) for n in notes]
+        s.fromArrays(arr)
+        self.assertEqual([(n.offset, n.quarterLength, n.pitch.ps, n.tie) for n in notes],
+                         before)
+
+        bass = s.parts[3]
+        firstBass = bass.recurse().notes[0]
+        lastMeasure = bass.getElementsByClass(Measure)[-1]
+        self.assertEqual(len(lastMeasure.getElementsByOffset(2.5)), 0)
+        arr.ps[arr.part == 3] -= 12
+        arr.offset[numpy.nonzero(arr.part == 3)[0][-1]] += 0.5
+        s.fromArrays(arr)
+        self.assertEqual(firstBass.pitch.ps, before[notes.index(firstBass)][2] - 12)
+        self.assertEqual(len(lastMeasure.getElementsByOffset(2.5)), 1)
+        self.assertEqual(list(s.toArrays().ps), list(arr.ps))
+        self.assertEqual(list(s.toArrays().offset), list(arr.offset))
+
+        # moving a note re-sorts the Stream, even for cached order-dependent values
+        s = Stream()
+        s.append([note.Note('C'), note.Note('D'), note.Note('E')])
+        self.assertEqual([n.name for n in s.notes], ['C', 'D', 'E'])
+        arr = s.toArrays()
+        arr['offset'][0] = 5.0
+        s.fromArrays(arr)
+        self.assertEqual([n.name for n in s.notes], ['D', 'E', 'C'])
+        self.assertEqual([n.name for n in s.elements], ['D', 'E', 'C'])
+        self.assertEqual([n.name for n in s], ['D', 'E', 'C'])
+
+    def testRecurseFiltersMatchUnfiltered(self):
+        '''
+        compiled filters and the class index give the same results as
+        checking each element of an unfiltered recursion.
+        '''
+        from music21 import corpus
+        s = corpus.parse('bwv66.6')
+        allElements = list(s.recurse())
+
+        def check():
+            self.assertEqual(list(s.recurse().notes),
+                             [e for e in allElements if isinstance(e, note.NotRest)])
+            self.assertEqual(list(s.recurse().getElementsByClass(['Rest', 'KeySignature'])),
+                             [e for e in allElements
+                              if isinstance(e, (note.Rest, key.KeySignature))])
+            self.assertEqual(list(s.recurse().notes.getElementsNotOfClass('Chord')),
+                             [e for e in allElements if isinstance(e, note.Note)])
+            self.assertEqual(list(s.recurse().notes.addFilter(lambda el: el.pitch.name == 'A')),
+                             [e for e in allElements
+                              if isinstance(e, note.Note) and e.pitch.name == 'A'])
+
+        check()
+        # changes to substreams clear their class index
+        m = s.parts[1].getElementsByClass('Measure')[3]
+        r = note.Rest(quarterLength=0.5)
+        m.insert(0.25, r)
+        allElements = list(s.recurse())
+        self.assertIn(r, allElements)
+        check()
+
+    def testSortKeysMatchSortTuples(self):
+        '''
+        sorting and flattening with plain sort keys gives the order of sortTuple
+        '''
+        from music21 import corpus
+        from music21 import expressions
+        s = corpus.parse('bwv66.6')
+        # a grace note and a higher priority element tie on offset with others
+        m = s.parts[0].getElementsByClass('Measure')[2]
+        grace = note.Note('E5').getGrace()
+        m.insert(0, grace)
+        te = expressions.TextExpression('fast')
+        te.priority = -2
+        m.insert(0, te)
+
+        for flatStream in (s.flat, s.semiFlat):
+            elements = list(flatStream)
+            self.assertEqual(elements,
+                             sorted(elements, key=lambda e: e.sortTuple(flatStream)))
+            self.assertEqual(len(elements), len(set(id(e) for e in elements)))
+        self.assertLess(s.flat.index(te), s.flat.index(grace))
+
+        p = s.parts[1].flat
+        p.autoSort = False
+        shuffled = list(reversed(p._elements))
+        p._elements = shuffled
+        p.coreElementsChanged()
+        p.sort()
+        self.assertEqual(list(p),
+                         sorted(shuffled, key=lambda e: e.sortTuple(p)))
+
+    def testChordifySweepMatchesOld(self):
+        '''
+        the sweep engine gives the same chords, ties, and measures as the old one
+        '''
+        from music21 import corpus
+
+        def describe(s):
+            post = []
+            for el in s.recurse():
+                info = [el.classes[0], float(el.getOffsetInHierarchy(s)), el.quarterLength]
+                if 'NotRest' in el.classes:
+                    info.append(tuple(p.nameWithOctave for p in el.pitches))
+                    info.append(el.tie.type if el.tie is not None else None)
+                post.append(tuple(info))
+            return post
+
+        s = corpus.parse('bach/bwv1.6')
+        for kw in ({}, {'addPartIdAsGroup': True},
+                   {'removeRedundantPitches': False, 'addTies': False}):
+            self.assertEqual(describe(s.chordify(sweep=True, **kw)),
+                             describe(s.chordify(sweep=False, **kw)))
+        p = s.parts[0]
+        self.assertEqual(describe(p.chordify()), describe(p.chordify(sweep=False)))
+        sFlat = s.flat
+        self.assertEqual(describe(sFlat.chordify()), describe(sFlat.chordify(sweep=False)))
+
+        pitchSets = s.chordify(pitchesOnly=True)
+        self.assertEqual([c.pitches for c in pitchSets.recurse().getElementsByClass('Chord')],
+                         [c.pitches for c in s.chordify().recurse().getElementsByClass('Chord')])
+
     def testGetElementAfterElement(self):
         n1 = note.Note('A3')
         n2 = note.Note('B3')
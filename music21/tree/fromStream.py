@@ -91,6 +91,10 @@ def listOfTreesByClass(inputStream,
         classLists = []
     else:
         outputTrees = [treeClass(source=lastParentage) for _ in classLists]
+    # positions and items for each output tree, inserted all at once at the end:
+    # each call to insert() updates every node of the tree.
+    outputPositions = [[] for _ in outputTrees]
+    outputItems = [[] for _ in outputTrees]
     # do this to avoid munging activeSites
     inputStreamElements = inputStream._elements[:] + inputStream._endElements
     for element in inputStreamElements:
@@ -105,11 +109,14 @@ def listOfTreesByClass(inputStream,
                                                 flatten=flatten,
                                                 classLists=classLists,
                                                 useTimespans=useTimespans)
-            for outputTree, subTree in zip(outputTrees, containedTrees):
+            for i, subTree in enumerate(containedTrees):
                 if flatten is not False:  # True or semiFlat
-                    outputTree.insert(subTree[:])
+                    subItems = subTree[:]
+                    outputPositions[i].extend(outputTrees[i]._getPositionsFromElements(subItems))
+                    outputItems[i].extend(subItems)
                 else:
-                    outputTree.insert(subTree.lowestPosition(), subTree)
+                    outputPositions[i].append(subTree.lowestPosition())
+                    outputItems[i].append(subTree)
             wasStream = True
 
         if not wasStream or flatten == 'semiFlat':
@@ -117,7 +124,7 @@ def listOfTreesByClass(inputStream,
             parentEndTime = initialOffset + lastParentage.duration.quarterLength
             endTime = offset + element.duration.quarterLength
 
-            for classBasedTree, classList in zip(outputTrees, classLists):
+            for i, classList in enumerate(classLists):
                 if classList and not element.isClassOrSubclass(classList):
                     continue
                 if useTimespans:
@@ -131,9 +138,15 @@ def listOfTreesByClass(inputStream,
                                                 parentEndTime=parentEndTime,
                                                 offset=offset,
                                                 endTime=endTime)
-                    classBasedTree.insert(elementTimespan)
+                    outputPositions[i].append(elementTimespan.offset)
+                    outputItems[i].append(elementTimespan)
                 else:
-                    classBasedTree.insert(offset, element)
+                    outputPositions[i].append(offset)
+                    outputItems[i].append(element)
+
+    for outputTree, positions, items in zip(outputTrees, outputPositions, outputItems):
+        if items:
+            outputTree.insert(positions, items)
 
     return outputTrees
 
@@ -570,6 +570,121 @@ class TimespanTree(trees.OffsetTree):
                 if len(verticalities) == n:
                     yield VerticalitySequence(reversed(verticalities))
 
+    def verticalityArrays(self):
+        r'''
+        Finds the pitches sounding at every verticality of the tree at once,
+        with a sweep over the sorted start and end offsets of the timespans,
+        rather than by making each Verticality.  Requires numpy.
+
+        Returns a tuple of three items, one entry or row per verticality in the
+        order of `.iterateVerticalities()`: a tuple of the offsets, a numpy
+        array of 12-bit pitch-class masks (bit 0 is C), and a numpy boolean
+        array of 128 columns that is True for each MIDI number sounding.
+
+        As in `Verticality.pitchSet`, a pitch is sounding if its timespan starts at
+        the offset or starts before the offset and ends after it.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> offsets, pitchClassMasks, sounding = scoreTree.verticalityArrays()
+        >>> offsets[:4]
+        (0.0, 0.5, 1.0, 2.0)
+        >>> [bin(mask) for mask in pitchClassMasks[:2]]
+        ['0b1000010010', '0b100100010000']
+        >>> sounding.shape
+        (51, 128)
+        >>> [int(m) for m in sounding[1].nonzero()[0]]
+        [56, 59, 64, 71]
+        >>> scoreTree.getVerticalityAt(0.5)
+        <music21.tree.verticality.Verticality 0.5 {G#3 B3 E4 B4}>
+
+        An empty tree has no verticalities:
+
+        >>> emptyTree = tree.timespanTree.TimespanTree()
+        >>> emptyTree.verticalityArrays()[2].shape
+        (0, 128)
+        '''
+        from music21 import base
+        if 'numpy' in base._missingImport:
+            raise TimespanTreeException(
+                'numpy is required for verticalityArrays; use iterateVerticalities instead')
+        import numpy
+
+        offsets = self.allOffsets()
+        numOffsets = len(offsets)
+        floatOffsets = numpy.array(offsets, dtype=numpy.float64)
+
+        starts = []
+        ends = []
+        midiNumbers = []
+        for timespan in self:
+            if not hasattr(timespan, 'pitches'):
+                continue
+            for p in timespan.pitches:
+                starts.append(timespan.offset)
+                ends.append(timespan.endTime)
+                midiNumbers.append(p.midi)
+
+        # counts of each sounding MIDI number, as +1 at the verticality where a
+        # pitch starts and -1 at the first verticality after it stops;
+        # the running sum is the number of timespans sounding the pitch.
+        changes = numpy.zeros((numOffsets + 1, 128), dtype=numpy.int32)
+        if midiNumbers:
+            startIndices = numpy.searchsorted(
+                floatOffsets, numpy.array(starts, dtype=numpy.float64), side='left')
+            endIndices = numpy.searchsorted(
+                floatOffsets, numpy.array(ends, dtype=numpy.float64), side='left')
+            # zero-length timespans sound at their own start
+            endIndices = numpy.maximum(endIndices, startIndices + 1)
+            midiArray = numpy.array(midiNumbers, dtype=numpy.intp)
+            numpy.add.at(changes, (startIndices, midiArray), 1)
+            numpy.add.at(changes, (endIndices, midiArray), -1)
+        sounding = numpy.cumsum(changes[:numOffsets], axis=0, dtype=numpy.int32) > 0
+
+        pitchClassMasks = numpy.zeros(numOffsets, dtype=numpy.uint16)
+        for pitchClass in range(12):
+            hasPitchClass = sounding[:, pitchClass::12].any(axis=1)
+            pitchClassMasks |= hasPitchClass.astype(numpy.uint16) << pitchClass
+
+        return (offsets, pitchClassMasks, sounding)
+
+    def iterateVerticalityPitchSets(self):
+        r'''
+        Iterates the pitches of all vertical moments in this offset-tree as
+        :class:`~music21.tree.verticality.VerticalityPitchSet` objects, which
+        are found in bulk by `.verticalityArrays()` and are much faster to make
+        than Verticality objects.  Call `.toVerticality()` on any of them
+        to get the full Verticality.  Requires numpy.
+
+        Unlike `.iterateVerticalities()`, changes to the tree during iteration are
+        not seen.
+
+        >>> score = corpus.parse('bwv66.6')
+        >>> scoreTree = score.asTimespans(classList=(note.Note,))
+        >>> for vps in list(scoreTree.iterateVerticalityPitchSets())[:3]:
+        ...     print(vps, vps.pitchClasses)
+        <music21.tree.verticality.VerticalityPitchSet 0.0 [57, 64, 73]> [1, 4, 9]
+        <music21.tree.verticality.VerticalityPitchSet 0.5 [56, 59, 64, 71]> [4, 8, 11]
+        <music21.tree.verticality.VerticalityPitchSet 1.0 [54, 61, 66, 69]> [1, 6, 9]
+
+        How many verticalities of the chorale are major triads?
+
+        >>> majorTriads = {0b10010001 << i & 0xfff | 0b10010001 >> (12 - i) for i in range(12)}
+        >>> sum(1 for vps in scoreTree.iterateVerticalityPitchSets()
+        ...     if vps.pitchClassMask in majorTriads)
+        24
+        '''
+        from music21.tree.verticality import VerticalityPitchSet
+
+        offsets, pitchClassMasks, sounding = self.verticalityArrays()
+        rowIndices, midiColumns = sounding.nonzero()
+        rowStarts = rowIndices.searchsorted(range(len(offsets) + 1)).tolist()
+        midiColumns = midiColumns.tolist()
+        pitchClassMasks = pitchClassMasks.tolist()
+        for i, offset in enumerate(offsets):
+            midi = tuple(midiColumns[rowStarts[i]:rowStarts[i + 1]])
+            yield VerticalityPitchSet(offset, pitchClassMasks[i], midi, self)
+
     def splitAt(self, offsets):
         r'''
         Splits all timespans in this offset-tree at `offsets`, operating in
@@ -810,6 +925,33 @@ class Test(unittest.TestCase):
                     # pylint: disable=consider-using-enumerate
                     for i in range(len(currentTimespansInTree)):
                         self.assertEqual(currentTimespansInList[i], currentTimespansInTree[i])
+
+    def testVerticalityPitchSetsMatchVerticalities(self):
+        from music21 import stream, note, chord, clef
+        s = stream.Stream()
+        s.insert(0, clef.BassClef())
+        s.insert(0, note.Note('C4', quarterLength=2))
+        s.insert(0, note.Note('C5', quarterLength=1))
+        s.insert(1, chord.Chord('E4 G4 B-4', quarterLength=0.5))
+        s.insert(1.5, note.Note('F#4').getGrace())
+        s.insert(1.5, note.Note('G-4', quarterLength=1 / 3))
+        s.insert(2, note.Rest())
+        s.insert(4, note.Note('D8'))  # above MIDI 127
+        scoreTree = s.asTimespans()
+
+        verticalities = list(scoreTree.iterateVerticalities())
+        pitchSets = list(scoreTree.iterateVerticalityPitchSets())
+        self.assertEqual(len(pitchSets), len(verticalities))
+        for v, vps in zip(verticalities, pitchSets):
+            self.assertEqual(vps.offset, v.offset)
+            pitches = v.pitchSet
+            self.assertEqual(vps.midi, tuple(sorted({p.midi for p in pitches})))
+            self.assertEqual(vps.pitchClasses, sorted({p.pitchClass for p in pitches}))
+            self.assertEqual(vps.toVerticality().startTimespans, v.startTimespans)
+
+        self.assertEqual(pitchSets[2].midi, (60, 66))  # grace note and G-4
+        self.assertEqual(pitchSets[2].pitchClasses, [0, 6])
+        self.assertEqual(pitchSets[3].midi, ())  # ends of notes only
 # -----------------------------------------------------------------------------
 
 
@@ -400,6 +400,48 @@ class ElementTree(core.AVLTree):
         for node in self.iterNodes():
             yield node.payload
 
+    def __getstate__(self):
+        r'''
+        Trees are pickled (and deep-copied) as their source and a list of
+        the position and payload of each node, in order, rather than as linked nodes.
+        Unpickling rebuilds a balanced tree from the list in linear time, without
+        looking at the source again, so a tree pickled together with its
+        source Stream is restored much faster than it can be made anew.
+
+        >>> import pickle
+        >>> score = tree.makeExampleScore()
+        >>> scoreTree = score.asTimespans()
+        >>> scoreTree.__getstate__()[1][0]
+        (0.0, [<ElementTimespan (0.0 to 0.0) <music21.clef.BassClef>>, ...])
+
+        >>> scoreTree2, score2 = pickle.loads(pickle.dumps((scoreTree, score)))
+        >>> scoreTree2
+        <TimespanTree {20} (0.0 to 8.0) <music21.stream.Score exampleScore>>
+        >>> scoreTree2.source is score2
+        True
+        >>> scoreTree2[-3]
+        <PitchedTimespan (7.0 to 8.0) <music21.note.Note C>>
+        >>> scoreTree2[-3].element in score2.recurse()
+        True
+        >>> [ts.offset for ts in scoreTree2.elementsOverlappingOffset(1.5)]
+        [0.0, 1.0]
+        '''
+        return (self.source, [(node.position, node.payload) for node in self.iterNodes()])
+
+    def __setstate__(self, state):
+        source, nodeTuples = state
+        self.parentTrees = weakref.WeakSet()
+        self._source = None
+        self.rootNode = None
+        if nodeTuples:
+            self.populateFromSortedList(nodeTuples)
+            # OffsetNodes always begin with an empty payload list
+            for node, (unused_position, payload) in zip(self.iterNodes(), nodeTuples):
+                node.payload = payload
+            self.rootNode.updateIndices()
+            self.rootNode.updateEndTimes()
+        self.source = source
+
     # PRIVATE METHODS #
 
     def _updateNodes(self, initialPosition=None, initialEndTime=None, visitedParents=None):
@@ -1067,6 +1067,65 @@ class VerticalitySequence(prebase.ProtoM21Object, collections.abc.Sequence):
         return unwrapped
 
 
+class VerticalityPitchSet(prebase.ProtoM21Object):
+    r'''
+    The pitches sounding at one verticality of a TimespanTree, given as
+    a 12-bit mask of pitch classes (bit 0 is C, bit 11 is B) and a tuple of
+    the distinct MIDI numbers.  Made in bulk by
+    :meth:`~music21.tree.timespanTree.TimespanTree.iterateVerticalityPitchSets`;
+    the full Verticality is only made if `.toVerticality()` is called.
+
+    >>> score = corpus.parse('bwv66.6')
+    >>> scoreTree = score.asTimespans(classList=(note.Note,))
+    >>> vps = next(scoreTree.iterateVerticalityPitchSets())
+    >>> vps
+    <music21.tree.verticality.VerticalityPitchSet 0.0 [57, 64, 73]>
+    >>> vps.offset
+    0.0
+    >>> vps.midi
+    (57, 64, 73)
+    >>> bin(vps.pitchClassMask)
+    '0b1000010010'
+    >>> vps.pitchClasses
+    [1, 4, 9]
+    >>> vps.toVerticality()
+    <music21.tree.verticality.Verticality 0.0 {A3 E4 C#5}>
+    '''
+    __slots__ = ('offset', 'pitchClassMask', 'midi', 'timespanTree')
+
+    def __init__(self, offset, pitchClassMask, midi, timespanTree=None):
+        self.offset = offset
+        self.pitchClassMask = pitchClassMask
+        self.midi = midi
+        self.timespanTree = timespanTree
+
+    def _reprInternal(self):
+        return f'{self.offset} {list(self.midi)}'
+
+    @property
+    def pitchClasses(self):
+        '''
+        The sorted list of pitch classes in `.pitchClassMask`.
+
+        >>> tree.verticality.VerticalityPitchSet(0.0, 0b10010001, (60, 64, 67)).pitchClasses
+        [0, 4, 7]
+        '''
+        mask = self.pitchClassMask
+        return [pc for pc in range(12) if mask & (1 << pc)]
+
+    def toVerticality(self):
+        '''
+        Return the :class:`Verticality` at this offset in the timespanTree, or
+        None if there is no timespanTree.
+
+        >>> print(tree.verticality.VerticalityPitchSet(0.0, 1, (60,)).toVerticality())
+        None
+        '''
+        if self.timespanTree is None:
+            return None
+        return self.timespanTree.getVerticalityAt(self.offset)
+
+
 # -----------------------------------------------------------------------------
 
 class Test(unittest.TestCase):
@@ -1077,7 +1136,7 @@ class Test(unittest.TestCase):
 # -----------------------------------------------------------------------------
 
 
-_DOC_ORDER = (Verticality, VerticalitySequence)
+_DOC_ORDER = (Verticality, VerticalitySequence, VerticalityPitchSet)
 
 
 # -----------------------------------------------------------------------------